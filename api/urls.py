@@ -65,6 +65,20 @@ urlpatterns_v1 = [
     # 기능: GET (상세 조회), PUT (수정), DELETE (삭제)
     path('technologies/<int:pk>/', views.TechnologyAPIView.as_view(), name='api_technology_detail'),
     
+    # 태그 클라우드 (기술 수 많은 순)
+    # URL: /api/v1/technologies/tags/
+    # 뷰: views.TechnologyTagAPIView.as_view()
+    # 이름: 'api_technology_tags'
+    # 기능: GET (?limit=)
+    path('technologies/tags/', views.TechnologyTagAPIView.as_view(), name='api_technology_tags'),
+    
+    # 태그를 공유하는 기술 (공유 태그 수 많은 순)
+    # URL: /api/v1/technologies/<pk>/related/
+    # 뷰: views.TechnologyTagAPIView.as_view()
+    # 이름: 'api_technology_related'
+    # 기능: GET (?limit=)
+    path('technologies/<int:pk>/related/', views.TechnologyTagAPIView.as_view(), name='api_technology_related'),
+    
     # =============================================================================
     # 통합 검색 API 엔드포인트
     # =============================================================================
@@ -95,6 +109,92 @@ urlpatterns_v1 = [
     # 이름: 'api_health'
     # 기능: GET (API 상태 확인, 시스템 건강 상태 점검)
     path('health/', views.StatsAPIView.as_view(), name='api_health'),
+    
+    # =============================================================================
+    # 내보내기 API 엔드포인트
+    # =============================================================================
+    # 대용량 내보내기 (NDJSON/CSV 스트리밍)
+    # URL: /api/v1/export/<resource>/  (resource: clients, notices, technologies, commute)
+    # 뷰: views.ExportAPIView.as_view()
+    # 이름: 'api_export'
+    # 기능: GET (?format=ndjson|csv, 목록 API 와 같은 필터)
+    path('export/<str:resource>/', views.ExportAPIView.as_view(), name='api_export'),
+    
+    # =============================================================================
+    # 근태 집계 API 엔드포인트
+    # =============================================================================
+    # 월간 근태 집계 (사용자별/부서별)
+    # URL: /api/v1/commute/monthly/
+    # 뷰: views.AttendanceReportAPIView.as_view()
+    # 이름: 'api_commute_monthly'
+    # 기능: GET (?month=YYYY-MM, group=user|department, user=사용자명)
+    path('commute/monthly/', views.AttendanceReportAPIView.as_view(), name='api_commute_monthly'),
+    
+    # 근태 추이 (요약 테이블 기반, 관리자 전용)
+    # URL: /api/v1/commute/trend/
+    # 뷰: views.AttendanceTrendAPIView.as_view()
+    # 이름: 'api_commute_trend'
+    # 기능: GET (?from=YYYY-MM, to=YYYY-MM, period=month|day)
+    path('commute/trend/', views.AttendanceTrendAPIView.as_view(), name='api_commute_trend'),
+    
+    # 출퇴근 타각 일괄 등록 (키오스크/사원증 리더기)
+    # URL: /api/v1/commute/punches/
+    # 뷰: views.CommutePunchBatchAPIView.as_view()
+    # 이름: 'api_commute_punches'
+    # 기능: POST (타각 목록을 (사용자, 근무일) 별 기록으로 upsert)
+    path('commute/punches/', views.CommutePunchBatchAPIView.as_view(), name='api_commute_punches'),
+    
+    # 휴가 신청 목록/신청, 상세/결재/수정
+    # URL: /api/v1/commute/leaves/, /api/v1/commute/leaves/<pk>/
+    # 뷰: views.LeaveRequestAPIView.as_view()
+    # 기능: GET (?status=, from=, to=, user=), POST (신청, 겹치면 409), PUT (action=approve|reject|cancel 또는 수정)
+    path('commute/leaves/', views.LeaveRequestAPIView.as_view(), name='api_commute_leaves'),
+    path('commute/leaves/<int:pk>/', views.LeaveRequestAPIView.as_view(), name='api_commute_leave_detail'),
+    
+    # 출장 신청 목록/신청, 상세/결재/수정
+    # URL: /api/v1/commute/trips/, /api/v1/commute/trips/<pk>/
+    # 뷰: views.BusinessTripAPIView.as_view()
+    # 기능: 휴가 신청 API 와 같음
+    path('commute/trips/', views.BusinessTripAPIView.as_view(), name='api_commute_trips'),
+    path('commute/trips/<int:pk>/', views.BusinessTripAPIView.as_view(), name='api_commute_trip_detail'),
+    
+    # 팀 월간 달력 (휴가, 출장, 근무 스케줄)
+    # URL: /api/v1/commute/team-calendar/
+    # 뷰: views.TeamCalendarAPIView.as_view()
+    # 이름: 'api_commute_team_calendar'
+    # 기능: GET (?month=YYYY-MM, department=부서명 관리자 전용)
+    path('commute/team-calendar/', views.TeamCalendarAPIView.as_view(), name='api_commute_team_calendar'),
+    
+    # =============================================================================
+    # 캘린더 피드 API 엔드포인트
+    # =============================================================================
+    # 근무 스케줄, 휴가, 출장, 공지 마감일 통합 일정 (ETag/304 지원)
+    # URL: /api/v1/calendar/
+    # 뷰: views.CalendarFeedAPIView.as_view()
+    # 이름: 'api_calendar'
+    # 기능: GET (?from=, to=, scope=me|team|all, sources=, format=json|ics)
+    path('calendar/', views.CalendarFeedAPIView.as_view(), name='api_calendar'),
+    
+    # =============================================================================
+    # 거래처 조회 API 엔드포인트
+    # =============================================================================
+    # 거래처 빠른 조회 (정규화 열 인덱스 사용)
+    # URL: /api/v1/clients/lookup/
+    # 뷰: views.ClientLookupAPIView.as_view()
+    # 이름: 'api_client_lookup'
+    # 기능: GET (?brn=, ?phone=, ?name= 정확/접두어 조회, match=prefix|exact)
+    path('clients/lookup/', views.ClientLookupAPIView.as_view(), name='api_client_lookup'),
+    
+    # =============================================================================
+    # 모니터링 API 엔드포인트
+    # =============================================================================
+    # CPU 프로파일러 (관리자 전용)
+    # URL: /api/v1/monitoring/profiler/
+    # 뷰: views.ProfilerAPIView.as_view()
+    # 이름: 'api_profiler'
+    # 기능: GET (상태/결과 조회, ?format=collapsed 로 flamegraph 입력 텍스트, ?format=allocations 로 뷰별 메모리 할당),
+    #       POST (start/stop/reset_allocations)
+    path('monitoring/profiler/', views.ProfilerAPIView.as_view(), name='api_profiler'),
 ]
 
 # =============================================================================
@@ -18,13 +18,16 @@ JSON 응답, 에러 처리, 인증, 권한 관리 등을 포함합니다.
 - 거래처 정보 API
 - 사용자 관리 API
 - 검색 및 필터링 API
+- 대용량 내보내기 API (NDJSON/CSV 스트리밍)
+- 거래처 번호/기업명 인덱스 조회 API
+- 비동기 뷰 (공지사항, 기술, 통합 검색, 통계 - async ORM)
 """
 
 # =============================================================================
 # 임포트 구역
 # =============================================================================
 # Django HTTP 응답 클래스 임포트
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponse
 # CSRF 보호 데코레이터 임포트
 from django.views.decorators.csrf import csrf_exempt
 # HTTP 메서드 제한 데코레이터 임포트
@@ -34,17 +37,40 @@ from django.contrib.auth.decorators import login_required
 # 페이지네이터 임포트
 from django.core.paginator import Paginator
 # 복잡한 데이터베이스 쿼리를 위한 Q 객체 임포트
-from django.db.models import Q
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
 # 메서드 데코레이터 임포트
 from django.utils.decorators import method_decorator
 # Django 뷰 클래스 임포트
 from django.views import View
 # Django 직렬화 임포트
 from django.core import serializers
+# 비동기 뷰에서 동기 코드를 스레드로 실행하기 위한 어댑터 임포트
+from asgiref.sync import sync_to_async
+# 로그인 페이지 리다이렉트 헬퍼 임포트
+from django.contrib.auth.views import redirect_to_login
 # 표준 라이브러리 임포트
+import heapq
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from django.utils.dateparse import parse_date
+# 조건부 GET 및 응답 캐시 유틸리티 임포트
+from utils.cache import ResponseCache
+# JSON 렌더러 임포트 (orjson 이 있으면 사용)
+from utils.renderers import (
+    STREAM_PLACEHOLDER, render_json_response, stream_export_response, stream_ics_response, stream_json_response,
+)
+# Django 설정 임포트
+from django.conf import settings
+# 스택 샘플링/메모리 할당 프로파일러 임포트
+from utils.monitoring import StackSampler, stack_sampler, allocation_profiler
+# 원본별 병렬 조회 임포트
+from utils.fanout import FanOut
+# 거래처 조회용 정규화 함수 임포트
+from client_inform.validators import digits_only, fold_name, prefix_range
 
 # =============================================================================
 # 모델 임포트 (동적 임포트)
@@ -52,8 +78,14 @@ from datetime import datetime
 # Django 설정이 로드된 후에만 모델을 임포트하여 순환 참조 방지
 try:
     from 공지사항.models import Notice
-    from 기술.models import Technology
+    from 기술.models import Tag, Technology, TechnologyTag
     from client_inform.models import customer_information
+    from commute.models import BusinessTrip, CommuteRecord, LeaveRequest
+    from commute.reports import AttendanceReportError, AttendanceTrend, MonthlyAttendance
+    from commute.punches import PunchBatch, PunchBatchError
+    from commute.absences import AbsenceConflict, AbsenceError, TeamCalendar, change_status, save_request
+    from commute.forms import BusinessTripForm, LeaveRequestForm
+    from home.calendar_feed import CalendarFeed, CalendarFeedError
     from django.contrib.auth import get_user_model
     User = get_user_model()
     MODELS_AVAILABLE = True
@@ -81,6 +113,7 @@ class APIResponse:
     Methods:
         success: 성공 응답 생성
         error: 오류 응답 생성
+        stream: 대용량 배열 스트리밍 응답 생성
         paginated: 페이지네이션 응답 생성
         
     Response Format:
@@ -90,6 +123,9 @@ class APIResponse:
         - error_code: 오류 코드 (string, optional)
         - details: 상세 오류 정보 (object, optional)
         - timestamp: 응답 시간 (ISO 8601 format)
+        
+    본문은 utils.renderers 의 JSON 렌더러로 직렬화하므로 한글이 UTF-8 그대로 출력되고
+    datetime 값은 isoformat() 호출 없이 그대로 넘겨도 됩니다.
     """
     
     @staticmethod
@@ -103,7 +139,7 @@ class APIResponse:
             status (int): HTTP 상태 코드
             
         Returns:
-            JsonResponse: 표준화된 성공 응답
+            HttpResponse: 표준화된 성공 응답
             
         Description:
             - API 호출 성공 시 표준 응답 생성
@@ -115,9 +151,9 @@ class APIResponse:
             'success': True,
             'message': message,
             'data': data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
         }
-        return JsonResponse(response_data, status=status)
+        return render_json_response(response_data, status=status)
     
     @staticmethod
     def error(message="오류 발생", status=400, error_code=None, details=None):
@@ -131,7 +167,7 @@ class APIResponse:
             details (object): 상세 오류 정보
             
         Returns:
-            JsonResponse: 표준화된 오류 응답
+            HttpResponse: 표준화된 오류 응답
             
         Description:
             - API 호출 실패 시 표준 오류 응답 생성
@@ -144,9 +180,31 @@ class APIResponse:
             'message': message,
             'error_code': error_code,
             'details': details,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
+        }
+        return render_json_response(response_data, status=status)
+    
+    @staticmethod
+    def stream(data, items, message="성공", status=200):
+        """
+        스트리밍 성공 응답 생성 메서드
+        
+        Args:
+            data (object): 응답 데이터 (배열 자리에 STREAM_PLACEHOLDER 지정)
+            items (iterable): 배열 항목 이터레이터
+            message (str): 성공 메시지
+            status (int): HTTP 상태 코드
+            
+        Returns:
+            StreamingHttpResponse: success 와 같은 형식의 스트리밍 응답
+        """
+        response_data = {
+            'success': True,
+            'message': message,
+            'data': data,
+            'timestamp': datetime.now()
         }
-        return JsonResponse(response_data, status=status)
+        return stream_json_response(response_data, items, status=status)
     
     @staticmethod
     def paginated(queryset, page=1, per_page=10):
@@ -159,51 +217,145 @@ class APIResponse:
             per_page (int): 페이지당 항목 수
             
         Returns:
-            JsonResponse: 페이지네이션된 응답
+            HttpResponse: 페이지네이션된 응답
             
         Description:
             - 대용량 데이터를 페이지별로 제공
             - 페이지네이션 정보 포함
             - 이전/다음 페이지 링크 제공
             - 총 항목 수 및 페이지 수 정보
+            - 페이지 크기가 API_JSON_STREAM_THRESHOLD 이상이면 스트리밍 응답
         """
         paginator = Paginator(queryset, per_page)
         page_obj = paginator.get_page(page)
+        items = page_obj.object_list.values()
+        stream = per_page >= getattr(settings, 'API_JSON_STREAM_THRESHOLD', 1000)
         
         data = {
-            'items': list(page_obj.object_list.values()),
-            'pagination': {
-                'current_page': page_obj.number,
-                'total_pages': paginator.num_pages,
-                'total_items': paginator.count,
-                'has_next': page_obj.has_next(),
-                'has_previous': page_obj.has_previous(),
-                'next_page': page_obj.next_page_number() if page_obj.has_next() else None,
-                'previous_page': page_obj.previous_page_number() if page_obj.has_previous() else None,
-                'per_page': per_page
-            }
+            'items': STREAM_PLACEHOLDER if stream else list(items),
+            'pagination': APIResponse.pagination_info(paginator, page_obj, per_page)
         }
         
+        if stream:
+            return APIResponse.stream(data, items.iterator(chunk_size=1000))
         return APIResponse.success(data)
+    
+    @staticmethod
+    async def apaginated(queryset, page=1, per_page=10):
+        """
+        페이지네이션 응답 생성 메서드 (비동기 뷰용)
+        
+        paginated 와 같은 응답을 만들되 행 수는 acount(), 페이지 행은 비동기 순회로 조회합니다.
+        스트리밍 응답의 행은 ASGI 핸들러가 스레드에서 읽습니다.
+        """
+        paginator = Paginator(queryset, per_page)
+        # count 를 미리 채워 두면 get_page() 의 페이지 번호 검증이 쿼리를 실행하지 않음
+        paginator.count = await queryset.acount()
+        page_obj = paginator.get_page(page)
+        items = page_obj.object_list.values()
+        stream = per_page >= getattr(settings, 'API_JSON_STREAM_THRESHOLD', 1000)
+        
+        data = {
+            'items': STREAM_PLACEHOLDER if stream else [item async for item in items],
+            'pagination': APIResponse.pagination_info(paginator, page_obj, per_page)
+        }
+        
+        if stream:
+            return APIResponse.stream(data, items.iterator(chunk_size=1000))
+        return APIResponse.success(data)
+    
+    @staticmethod
+    def pagination_info(paginator, page_obj, per_page):
+        """페이지네이션 정보 (count 가 이미 계산된 paginator 기준)"""
+        return {
+            'current_page': page_obj.number,
+            'total_pages': paginator.num_pages,
+            'total_items': paginator.count,
+            'has_next': page_obj.has_next(),
+            'has_previous': page_obj.has_previous(),
+            'next_page': page_obj.next_page_number() if page_obj.has_next() else None,
+            'previous_page': page_obj.previous_page_number() if page_obj.has_previous() else None,
+            'per_page': per_page
+        }
+
 
+def parse_deadline(value):
+    """마감일 문자열 변환 (비어 있으면 None, 형식이 틀리면 False)"""
+    if not value:
+        return None
+    try:
+        return parse_date(str(value)) or False
+    except ValueError:
+        return False
 
-class NoticeAPIView(View):
-    """공지사항 API 뷰"""
+
+class AsyncAPIView(View):
+    """
+    비동기 API 뷰 기반 클래스
+    
+    모든 HTTP 메서드 핸들러가 async def 이므로 ASGI 서버(uvicorn 워커)에서는 이벤트 루프에서 실행되어
+    쿼리 결과를 기다리는 동안 같은 워커가 다른 요청을 받습니다. WSGI 에서는 Django 가 동기로 감싸 실행합니다.
+    
+    Django 4.2 의 login_required 는 request.user 를 동기로 평가하므로(비동기 컨텍스트에서는
+    SynchronousOnlyOperation) 세션/사용자 조회를 스레드에서 한 번 실행한 뒤 로그인을 확인합니다.
+    평가된 request.user 는 이후 쿼리 없이 사용할 수 있습니다.
+    """
     
     @method_decorator(csrf_exempt)
-    @method_decorator(login_required)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
+    async def dispatch(self, request, *args, **kwargs):
+        if not await sync_to_async(lambda: request.user.is_authenticated)():
+            return redirect_to_login(request.get_full_path())
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class NoticeAPIView(AsyncAPIView):
+    """공지사항 API 뷰 (비동기)"""
     
-    def get(self, request, pk=None):
-        """공지사항 목록 또는 상세 조회"""
+    def get_queryset(self, request):
+        """검색/필터/권한이 적용된 공지사항 목록 쿼리셋"""
+        queryset = Notice.objects.all()
+        
+        # 검색
+        search = request.GET.get('search', '')
+        if search:
+            queryset = queryset.filter(
+                Q(title__icontains=search) | Q(content__icontains=search)
+            )
+        
+        # 필터링
+        importance = request.GET.get('importance', '')
+        if importance:
+            queryset = queryset.filter(importance=importance)
+        
+        status = request.GET.get('status', '')
+        if status:
+            queryset = queryset.filter(status=status)
+        
+        # 일반 사용자는 게시된 공지만 볼 수 있음
+        if not request.user.is_staff:
+            queryset = queryset.filter(status='published')
+        
+        # 정렬
+        return queryset.order_by('-created_at')
+    
+    async def get(self, request, pk=None):
+        """공지사항 목록 또는 상세 조회 (ETag/304 지원)"""
         try:
             if not MODELS_AVAILABLE:
                 return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
             
             if pk:
-                # 상세 조회
-                notice = Notice.objects.get(pk=pk)
+                # 상세 조회 - 권한 필드가 사용자별로 다르므로 사용자 ID를 ETag에 반영
+                etag, total = await ResponseCache.aqueryset_etag(
+                    Notice.objects.filter(pk=pk), request.user.pk
+                )
+                if total:
+                    cached = await ResponseCache.aconditional_response(request, 'notice', etag)
+                    if cached is not None:
+                        return cached
+                
+                notice = await Notice.objects.select_related('author').aget(pk=pk)
+                can_manage = notice.author_id == request.user.pk or request.user.is_staff
                 data = {
                     'id': notice.id,
                     'title': notice.title,
@@ -214,49 +366,37 @@ class NoticeAPIView(View):
                     'status': notice.status,
                     'status_display': notice.get_status_display(),
                     'view_count': notice.view_count,
-                    'created_at': notice.created_at.isoformat(),
-                    'updated_at': notice.updated_at.isoformat(),
-                    'published_at': notice.published_at.isoformat() if notice.published_at else None,
+                    'created_at': notice.created_at,
+                    'updated_at': notice.updated_at,
+                    'published_at': notice.published_at,
+                    'deadline': notice.deadline,
                     'is_published': notice.is_published,
                     'is_urgent': notice.is_urgent,
-                    'can_edit': notice.author == request.user or request.user.is_staff,
-                    'can_delete': notice.author == request.user or request.user.is_staff,
-                    'can_publish': notice.author == request.user or request.user.is_staff,
-                    'can_archive': notice.author == request.user or request.user.is_staff,
+                    'can_edit': can_manage,
+                    'can_delete': can_manage,
+                    'can_publish': can_manage,
+                    'can_archive': can_manage,
                 }
-                return APIResponse.success(data)
+                return await ResponseCache.afinalize('notice', etag, APIResponse.success(data))
             else:
                 # 목록 조회
-                queryset = Notice.objects.all()
-                
-                # 검색
-                search = request.GET.get('search', '')
-                if search:
-                    queryset = queryset.filter(
-                        Q(title__icontains=search) | Q(content__icontains=search)
-                    )
-                
-                # 필터링
-                importance = request.GET.get('importance', '')
-                if importance:
-                    queryset = queryset.filter(importance=importance)
-                
-                status = request.GET.get('status', '')
-                if status:
-                    queryset = queryset.filter(status=status)
-                
-                # 일반 사용자는 게시된 공지만 볼 수 있음
-                if not request.user.is_staff:
-                    queryset = queryset.filter(status='published')
-                
-                # 정렬
-                queryset = queryset.order_by('-created_at')
+                queryset = self.get_queryset(request)
                 
                 # 페이지네이션
                 page = int(request.GET.get('page', 1))
                 per_page = int(request.GET.get('per_page', 10))
                 
-                return APIResponse.paginated(queryset, page, per_page)
+                # 역할과 쿼리 파라미터가 같으면 같은 응답이므로 ETag에 반영
+                etag, _ = await ResponseCache.aqueryset_etag(
+                    queryset, ResponseCache.get_role(request.user), request.GET.urlencode()
+                )
+                cached = await ResponseCache.aconditional_response(request, 'notice', etag)
+                if cached is not None:
+                    return cached
+                
+                return await ResponseCache.afinalize(
+                    'notice', etag, await APIResponse.apaginated(queryset, page, per_page)
+                )
                 
         except Notice.DoesNotExist:
             return APIResponse.error("공지사항을 찾을 수 없습니다.", 404, "NOTICE_NOT_FOUND")
@@ -264,7 +404,7 @@ class NoticeAPIView(View):
             api_logger.error(f"공지사항 조회 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def post(self, request):
+    async def post(self, request):
         """공지사항 생성"""
         try:
             data = json.loads(request.body)
@@ -273,19 +413,24 @@ class NoticeAPIView(View):
             if not data.get('title') or not data.get('content'):
                 return APIResponse.error("제목과 내용은 필수입니다.", 400, "MISSING_REQUIRED_FIELDS")
             
+            deadline = parse_deadline(data.get('deadline'))
+            if deadline is False:
+                return APIResponse.error("마감일은 YYYY-MM-DD 형식이어야 합니다.", 400, "INVALID_DATE")
+            
             # 공지사항 생성
-            notice = Notice.objects.create(
+            notice = await Notice.objects.acreate(
                 title=data['title'],
                 content=data['content'],
                 author=request.user,
                 importance=data.get('importance', 'medium'),
-                status=data.get('status', 'draft')
+                status=data.get('status', 'draft'),
+                deadline=deadline
             )
             
             # 자동 게시 옵션
             if data.get('auto_publish'):
                 notice.status = 'published'
-                notice.save()
+                await notice.asave()
             
             return APIResponse.success(
                 {'id': notice.id, 'message': '공지사항이 성공적으로 생성되었습니다.'},
@@ -298,13 +443,13 @@ class NoticeAPIView(View):
             api_logger.error(f"공지사항 생성 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def put(self, request, pk):
+    async def put(self, request, pk):
         """공지사항 수정"""
         try:
-            notice = Notice.objects.get(pk=pk)
+            notice = await Notice.objects.aget(pk=pk)
             
             # 권한 확인
-            if notice.author != request.user and not request.user.is_staff:
+            if notice.author_id != request.user.pk and not request.user.is_staff:
                 return APIResponse.error("수정 권한이 없습니다.", 403, "PERMISSION_DENIED")
             
             data = json.loads(request.body)
@@ -318,8 +463,12 @@ class NoticeAPIView(View):
                 notice.importance = data['importance']
             if 'status' in data:
                 notice.status = data['status']
+            if 'deadline' in data:
+                notice.deadline = parse_deadline(data['deadline'])
+                if notice.deadline is False:
+                    return APIResponse.error("마감일은 YYYY-MM-DD 형식이어야 합니다.", 400, "INVALID_DATE")
             
-            notice.save()
+            await notice.asave()
             
             return APIResponse.success(
                 {'id': notice.id, 'message': '공지사항이 성공적으로 수정되었습니다.'}
@@ -333,16 +482,16 @@ class NoticeAPIView(View):
             api_logger.error(f"공지사항 수정 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def delete(self, request, pk):
+    async def delete(self, request, pk):
         """공지사항 삭제"""
         try:
-            notice = Notice.objects.get(pk=pk)
+            notice = await Notice.objects.aget(pk=pk)
             
             # 권한 확인
-            if notice.author != request.user and not request.user.is_staff:
+            if notice.author_id != request.user.pk and not request.user.is_staff:
                 return APIResponse.error("삭제 권한이 없습니다.", 403, "PERMISSION_DENIED")
             
-            notice.delete()
+            await notice.adelete()
             
             return APIResponse.success(
                 {'message': '공지사항이 성공적으로 삭제되었습니다.'}
@@ -355,20 +504,58 @@ class NoticeAPIView(View):
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
 
 
-class TechnologyAPIView(View):
-    """기술 관리 API 뷰"""
+class TechnologyAPIView(AsyncAPIView):
+    """기술 관리 API 뷰 (비동기)"""
     
-    @method_decorator(csrf_exempt)
-    @method_decorator(login_required)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self, request):
+        """검색/필터가 적용된 기술 목록 쿼리셋"""
+        queryset = Technology.objects.all()
+        
+        # 검색
+        search = request.GET.get('search', '')
+        if search:
+            queryset = queryset.filter(
+                Q(name__icontains=search) | 
+                Q(description__icontains=search) |
+                Q(pk__in=TechnologyTag.technology_ids(search))
+            )
+        
+        # 필터링
+        tag = request.GET.get('tag', '')
+        if tag:
+            # 정규화 태그 정확 일치 (TechnologyTag 인덱스 조인)
+            queryset = queryset.filter(pk__in=TechnologyTag.technology_ids(tag))
+        
+        category = request.GET.get('category', '')
+        if category:
+            queryset = queryset.filter(category=category)
+        
+        proficiency = request.GET.get('proficiency', '')
+        if proficiency:
+            queryset = queryset.filter(proficiency=proficiency)
+        
+        status = request.GET.get('status', '')
+        if status:
+            queryset = queryset.filter(status=status)
+        
+        # 정렬
+        return queryset.order_by('-created_at')
     
-    def get(self, request, pk=None):
-        """기술 목록 또는 상세 조회"""
+    async def get(self, request, pk=None):
+        """기술 목록 또는 상세 조회 (ETag/304 지원)"""
         try:
             if pk:
-                # 상세 조회
-                tech = Technology.objects.get(pk=pk)
+                # 상세 조회 - 권한 필드가 사용자별로 다르므로 사용자 ID를 ETag에 반영
+                etag, total = await ResponseCache.aqueryset_etag(
+                    Technology.objects.filter(pk=pk), request.user.pk
+                )
+                if total:
+                    cached = await ResponseCache.aconditional_response(request, 'technology', etag)
+                    if cached is not None:
+                        return cached
+                
+                tech = await Technology.objects.select_related('author').aget(pk=pk)
+                can_manage = tech.author_id == request.user.pk or request.user.is_staff
                 data = {
                     'id': tech.id,
                     'name': tech.name,
@@ -386,46 +573,31 @@ class TechnologyAPIView(View):
                     'tag_list': tech.tag_list,
                     'is_completed': tech.is_completed,
                     'proficiency_level': tech.proficiency_level,
-                    'created_at': tech.created_at.isoformat(),
-                    'updated_at': tech.updated_at.isoformat(),
-                    'can_edit': tech.author == request.user or request.user.is_staff,
-                    'can_delete': tech.author == request.user or request.user.is_staff,
+                    'created_at': tech.created_at,
+                    'updated_at': tech.updated_at,
+                    'can_edit': can_manage,
+                    'can_delete': can_manage,
                 }
-                return APIResponse.success(data)
+                return await ResponseCache.afinalize('technology', etag, APIResponse.success(data))
             else:
                 # 목록 조회
-                queryset = Technology.objects.all()
-                
-                # 검색
-                search = request.GET.get('search', '')
-                if search:
-                    queryset = queryset.filter(
-                        Q(name__icontains=search) | 
-                        Q(description__icontains=search) |
-                        Q(tags__icontains=search)
-                    )
-                
-                # 필터링
-                category = request.GET.get('category', '')
-                if category:
-                    queryset = queryset.filter(category=category)
-                
-                proficiency = request.GET.get('proficiency', '')
-                if proficiency:
-                    queryset = queryset.filter(proficiency=proficiency)
-                
-                status = request.GET.get('status', '')
-                if status:
-                    queryset = queryset.filter(status=status)
-                
-                # 정렬
-                queryset = queryset.order_by('-created_at')
+                queryset = self.get_queryset(request)
                 
                 # 페이지네이션
                 page = int(request.GET.get('page', 1))
                 per_page = int(request.GET.get('per_page', 10))
                 
-                return APIResponse.paginated(queryset, page, per_page)
+                # 역할과 쿼리 파라미터가 같으면 같은 응답이므로 ETag에 반영
+                etag, _ = await ResponseCache.aqueryset_etag(
+                    queryset, ResponseCache.get_role(request.user), request.GET.urlencode()
+                )
+                cached = await ResponseCache.aconditional_response(request, 'technology', etag)
+                if cached is not None:
+                    return cached
+                
+                return await ResponseCache.afinalize(
+                    'technology', etag, await APIResponse.apaginated(queryset, page, per_page)
+                )
                 
         except Technology.DoesNotExist:
             return APIResponse.error("기술 정보를 찾을 수 없습니다.", 404, "TECHNOLOGY_NOT_FOUND")
@@ -433,7 +605,7 @@ class TechnologyAPIView(View):
             api_logger.error(f"기술 조회 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def post(self, request):
+    async def post(self, request):
         """기술 생성"""
         try:
             data = json.loads(request.body)
@@ -443,7 +615,7 @@ class TechnologyAPIView(View):
                 return APIResponse.error("기술명은 필수입니다.", 400, "MISSING_REQUIRED_FIELDS")
             
             # 기술 생성
-            tech = Technology.objects.create(
+            tech = await Technology.objects.acreate(
                 name=data['name'],
                 category=data.get('category', 'etc'),
                 description=data.get('description', ''),
@@ -466,13 +638,13 @@ class TechnologyAPIView(View):
             api_logger.error(f"기술 생성 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def put(self, request, pk):
+    async def put(self, request, pk):
         """기술 수정"""
         try:
-            tech = Technology.objects.get(pk=pk)
+            tech = await Technology.objects.aget(pk=pk)
             
             # 권한 확인
-            if tech.author != request.user and not request.user.is_staff:
+            if tech.author_id != request.user.pk and not request.user.is_staff:
                 return APIResponse.error("수정 권한이 없습니다.", 403, "PERMISSION_DENIED")
             
             data = json.loads(request.body)
@@ -495,7 +667,7 @@ class TechnologyAPIView(View):
             if 'tags' in data:
                 tech.tags = data['tags']
             
-            tech.save()
+            await tech.asave()
             
             return APIResponse.success(
                 {'id': tech.id, 'message': '기술 정보가 성공적으로 수정되었습니다.'}
@@ -509,16 +681,16 @@ class TechnologyAPIView(View):
             api_logger.error(f"기술 수정 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
     
-    def delete(self, request, pk):
+    async def delete(self, request, pk):
         """기술 삭제"""
         try:
-            tech = Technology.objects.get(pk=pk)
+            tech = await Technology.objects.aget(pk=pk)
             
             # 권한 확인
-            if tech.author != request.user and not request.user.is_staff:
+            if tech.author_id != request.user.pk and not request.user.is_staff:
                 return APIResponse.error("삭제 권한이 없습니다.", 403, "PERMISSION_DENIED")
             
-            tech.delete()
+            await tech.adelete()
             
             return APIResponse.success(
                 {'message': '기술 정보가 성공적으로 삭제되었습니다.'}
@@ -531,88 +703,195 @@ class TechnologyAPIView(View):
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
 
 
-class SearchAPIView(View):
-    """통합 검색 API 뷰"""
+class SearchAPIView(AsyncAPIView):
+    """
+    통합 검색 API 뷰 (비동기)
     
-    @method_decorator(csrf_exempt)
-    @method_decorator(login_required)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
+    공지사항, 기술, 거래처 검색을 utils.fanout 의 공유 스레드 풀에서 동시에 실행합니다
+    (Django 4.2 의 async ORM 은 요청 하나의 쿼리를 한 스레드에서 차례로 실행하므로 원본별로 연결을 나눔).
+    원본마다 정렬 기준(최신순 또는 관련도순)으로 정렬된 상위 page * per_page 건만 읽고,
+    heapq.merge 로 필요한 페이지까지만 합치므로 전체 결과를 다시 정렬하지 않습니다.
+    원본별 전체 건수는 상위 건수를 다 채운 경우에만 COUNT 쿼리로 구합니다 (덜 채웠으면 읽은 건수가 전체).
+    제한 시간(SEARCH_SOURCE_TIMEOUT_MS)을 넘기거나 실패한 원본은 빼고 partial=true 로 응답합니다.
+    page * per_page 가 MAX_WINDOW 를 넘으면 400(WINDOW_EXCEEDED)으로 응답합니다.
     
-    def get(self, request):
+    Query Parameters:
+        q: 검색어
+        type: all | notice | technology | client
+        sort: date (기본값, 최신순) | score (제목 일치 > 제목 접두사 > 제목 포함 > 본문 포함, 같으면 최신순)
+        page, per_page: 페이지 (page * per_page 는 최대 MAX_WINDOW)
+    """
+    
+    SORTS = ('date', 'score')
+    # 원본별로 읽는 최대 건수 (page * per_page 상한)
+    MAX_WINDOW = 100
+    
+    fanout = FanOut('search')
+    
+    @staticmethod
+    def preview(text):
+        """본문 미리보기 (100자)"""
+        return text[:100] + '...' if len(text) > 100 else text
+    
+    @staticmethod
+    def ranked(queryset, query, title_field, date_field, sort, limit):
+        """
+        정렬 기준으로 정렬한 상위 limit 건 쿼리셋 (score 는 제목 일치 정도)
+
+        날짜가 없는 행은 DB 와 상관없이 맨 뒤에 두어 응답의 date('')가 가장 작은 값이 되게 하므로
+        원본별 결과가 heapq.merge 의 내림차순 전제를 지킵니다 (PostgreSQL 은 DESC 에서 NULL 이 맨 앞).
+        """
+        latest = F(date_field).desc(nulls_last=True)
+        if sort == 'score':
+            queryset = queryset.annotate(score=Case(
+                When(**{f'{title_field}__iexact': query}, then=Value(3)),
+                When(**{f'{title_field}__istartswith': query}, then=Value(2)),
+                When(**{f'{title_field}__icontains': query}, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )).order_by('-score', latest, '-id')
+        else:
+            queryset = queryset.order_by(latest, '-id')
+        return queryset[:limit]
+    
+    @classmethod
+    def ranked_with_total(cls, queryset, query, title_field, date_field, sort, limit):
+        """상위 limit 건 목록과 전체 건수 (limit 건을 다 채운 경우에만 COUNT 쿼리)"""
+        rows = list(cls.ranked(queryset, query, title_field, date_field, sort, limit))
+        return rows, (len(rows) if len(rows) < limit else queryset.count())
+    
+    def search_notices(self, query, sort, limit):
+        """공지사항 검색 (게시된 공지) - (상위 limit 건, 전체 건수)"""
+        notices = Notice.objects.select_related('author').filter(
+            Q(title__icontains=query) | Q(content__icontains=query)
+        ).filter(status='published')
+        rows, total = self.ranked_with_total(notices, query, 'title', 'created_at', sort, limit)
+        return [
+            {
+                'type': 'notice',
+                'id': notice.id,
+                'title': notice.title,
+                'preview': self.preview(notice.content),
+                'url': f'/공지사항/{notice.id}/',
+                'date': notice.created_at.isoformat(),
+                'author': notice.author.username,
+                **({'score': notice.score} if sort == 'score' else {}),
+            }
+            for notice in rows
+        ], total
+    
+    def search_technologies(self, query, sort, limit):
+        """기술 검색 (이름, 설명, 정규화 태그) - (상위 limit 건, 전체 건수)"""
+        technologies = Technology.objects.select_related('author').filter(
+            Q(name__icontains=query) | 
+            Q(description__icontains=query) |
+            Q(pk__in=TechnologyTag.technology_ids(query))
+        )
+        rows, total = self.ranked_with_total(technologies, query, 'name', 'created_at', sort, limit)
+        return [
+            {
+                'type': 'technology',
+                'id': tech.id,
+                'title': tech.name,
+                'preview': self.preview(tech.description),
+                'url': f'/기술/{tech.id}/',
+                'date': tech.created_at.isoformat(),
+                'author': tech.author.username,
+                'category': tech.get_category_display(),
+                **({'score': tech.score} if sort == 'score' else {}),
+            }
+            for tech in rows
+        ], total
+    
+    def search_clients(self, query, sort, limit):
+        """거래처 검색 (기업명, 대표자, 업종) - (상위 limit 건, 전체 건수)"""
+        clients = customer_information.objects.filter(
+            Q(company_name__icontains=query) |
+            Q(representative__icontains=query) |
+            Q(sectors__icontains=query)
+        )
+        rows, total = self.ranked_with_total(clients, query, 'company_name', 'registration_date', sort, limit)
+        return [
+            {
+                'type': 'client',
+                'id': client.id,
+                'title': client.company_name,
+                'preview': f"대표자: {client.representative}, 업종: {client.sectors}",
+                'url': f'/client_inform/{client.id}/',
+                'date': client.registration_date.isoformat() if client.registration_date else '',
+                'region': client.region,
+                **({'score': client.score} if sort == 'score' else {}),
+            }
+            for client in rows
+        ], total
+    
+    @staticmethod
+    def source_timeout(source):
+        """원본별 제한 시간(초)"""
+        timeouts = getattr(settings, 'SEARCH_SOURCE_TIMEOUTS', {})
+        return timeouts.get(source, getattr(settings, 'SEARCH_SOURCE_TIMEOUT_MS', 2000)) / 1000
+    
+    async def get(self, request):
         """통합 검색"""
         try:
             query = request.GET.get('q', '')
             search_type = request.GET.get('type', 'all')  # all, notice, technology, client
-            page = int(request.GET.get('page', 1))
-            per_page = int(request.GET.get('per_page', 10))
+            sort = request.GET.get('sort', 'date')
+            try:
+                page = max(int(request.GET.get('page', 1)), 1)
+                per_page = max(int(request.GET.get('per_page', 10)), 1)
+            except ValueError:
+                return APIResponse.error("page, per_page 는 정수여야 합니다.", 400, "INVALID_PAGE")
+            if sort not in self.SORTS:
+                return APIResponse.error("sort 는 date, score 중 하나여야 합니다.", 400, "INVALID_SORT")
             
-            results = []
+            offset = (page - 1) * per_page
+            limit = offset + per_page
+            if limit > self.MAX_WINDOW:
+                return APIResponse.error(
+                    f"검색 결과는 앞에서부터 {self.MAX_WINDOW}건까지만 조회할 수 있습니다. 검색어를 좁혀 주세요.",
+                    400, "WINDOW_EXCEEDED", {'max_window': self.MAX_WINDOW},
+                )
+            sources = {
+                'notice': self.search_notices,
+                'technology': self.search_technologies,
+                'client': self.search_clients,
+            }
+            tasks = {
+                source: (partial(search, query, sort, limit), self.source_timeout(source))
+                for source, search in sources.items()
+                if search_type in ['all', source]
+            }
+            # 풀에 제출하고 기다리는 동안 이벤트 루프를 막지 않도록 요청 스레드에서 실행
+            outcomes = await sync_to_async(self.fanout.run)(tasks)
             
-            if search_type in ['all', 'notice']:
-                # 공지사항 검색
-                notices = Notice.objects.filter(
-                    Q(title__icontains=query) | Q(content__icontains=query)
-                ).filter(status='published')[:10]
-                
-                for notice in notices:
-                    results.append({
-                        'type': 'notice',
-                        'id': notice.id,
-                        'title': notice.title,
-                        'preview': notice.content[:100] + '...' if len(notice.content) > 100 else notice.content,
-                        'url': f'/공지사항/{notice.id}/',
-                        'date': notice.created_at.isoformat(),
-                        'author': notice.author.username
-                    })
-            
-            if search_type in ['all', 'technology']:
-                # 기술 검색
-                technologies = Technology.objects.filter(
-                    Q(name__icontains=query) | 
-                    Q(description__icontains=query) |
-                    Q(tags__icontains=query)
-                )[:10]
-                
-                for tech in technologies:
-                    results.append({
-                        'type': 'technology',
-                        'id': tech.id,
-                        'title': tech.name,
-                        'preview': tech.description[:100] + '...' if len(tech.description) > 100 else tech.description,
-                        'url': f'/기술/{tech.id}/',
-                        'date': tech.created_at.isoformat(),
-                        'author': tech.author.username,
-                        'category': tech.get_category_display()
-                    })
-            
-            if search_type in ['all', 'client']:
-                # 거래처 검색
-                clients = customer_information.objects.filter(
-                    Q(company_name__icontains=query) |
-                    Q(representative__icontains=query) |
-                    Q(sectors__icontains=query)
-                )[:10]
-                
-                for client in clients:
-                    results.append({
-                        'type': 'client',
-                        'id': client.id,
-                        'title': client.company_name,
-                        'preview': f"대표자: {client.representative}, 업종: {client.sectors}",
-                        'url': f'/client_inform/{client.id}/',
-                        'date': client.registration_date.isoformat() if client.registration_date else '',
-                        'region': client.region
-                    })
-            
-            # 결과 정렬 (최신순)
-            results.sort(key=lambda x: x['date'], reverse=True)
+            for source, outcome in outcomes.items():
+                if not outcome.ok:
+                    detail = f": {outcome.error}" if outcome.error else ''
+                    api_logger.warning(f"검색 원본 {source} {outcome.status} ({outcome.elapsed_ms:.0f}ms){detail}")
+            lists = [outcome.value[0] for outcome in outcomes.values() if outcome.ok]
+            
+            # 원본별 정렬 결과를 필요한 페이지까지만 병합 (최신순 또는 관련도순)
+            key = itemgetter('date') if sort == 'date' else itemgetter('score', 'date')
+            merged = heapq.merge(*lists, key=key, reverse=True)
+            results = list(islice(merged, offset, limit))
             
             return APIResponse.success({
                 'query': query,
                 'type': search_type,
-                'results': results[:per_page],
-                'total': len(results)
+                'sort': sort,
+                'results': results,
+                'total': sum(outcome.value[1] for outcome in outcomes.values() if outcome.ok),
+                'max_window': self.MAX_WINDOW,
+                'partial': any(not outcome.ok for outcome in outcomes.values()),
+                'sources': {
+                    source: {
+                        'status': outcome.status,
+                        'count': outcome.value[1] if outcome.ok else 0,
+                        'time_ms': round(outcome.elapsed_ms, 2),
+                    }
+                    for source, outcome in outcomes.items()
+                },
             })
             
         except Exception as e:
@@ -620,73 +899,788 @@ class SearchAPIView(View):
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
 
 
-class StatsAPIView(View):
-    """통계 API 뷰"""
+class StatsAPIView(AsyncAPIView):
+    """
+    통계 API 뷰 (비동기)
     
-    @method_decorator(csrf_exempt)
-    @method_decorator(login_required)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
+    건수는 acount(), 선택지별 분포는 GROUP BY 한 번을 비동기 순회해 집계합니다.
+    """
     
-    def get(self, request):
+    @staticmethod
+    async def group_counts(queryset, field, choices=None):
+        """
+        field 값별 건수 (GROUP BY 한 번, order_by() 로 기본 정렬 제거)
+        
+        choices 를 주면 표시 이름을 키로 쓰고 건수가 없는 선택지는 0 으로 채웁니다.
+        """
+        rows = queryset.order_by().values(field).annotate(total=Count('id'))
+        counts = {row[field]: row['total'] async for row in rows}
+        if choices is None:
+            return counts
+        return {display: counts.get(value, 0) for value, display in choices}
+    
+    async def get(self, request):
         """시스템 통계"""
         try:
+            now = datetime.now()
             stats = {
                 'notices': {
-                    'total': Notice.objects.count(),
-                    'published': Notice.objects.filter(status='published').count(),
-                    'draft': Notice.objects.filter(status='draft').count(),
-                    'urgent': Notice.objects.filter(importance='urgent').count(),
-                    'this_month': Notice.objects.filter(
-                        created_at__month=datetime.now().month,
-                        created_at__year=datetime.now().year
-                    ).count()
+                    'total': await Notice.objects.acount(),
+                    'published': await Notice.objects.filter(status='published').acount(),
+                    'draft': await Notice.objects.filter(status='draft').acount(),
+                    'urgent': await Notice.objects.filter(importance='urgent').acount(),
+                    'this_month': await Notice.objects.filter(
+                        created_at__month=now.month,
+                        created_at__year=now.year
+                    ).acount()
                 },
                 'technologies': {
-                    'total': Technology.objects.count(),
-                    'by_category': {},
-                    'by_proficiency': {},
-                    'by_status': {},
-                    'this_month': Technology.objects.filter(
-                        created_at__month=datetime.now().month,
-                        created_at__year=datetime.now().year
-                    ).count()
+                    'total': await Technology.objects.acount(),
+                    'by_category': await self.group_counts(
+                        Technology.objects, 'category', Technology.CATEGORY_CHOICES
+                    ),
+                    'by_proficiency': await self.group_counts(
+                        Technology.objects, 'proficiency', Technology.PROFICIENCY_CHOICES
+                    ),
+                    'by_status': await self.group_counts(
+                        Technology.objects, 'status', Technology.STATUS_CHOICES
+                    ),
+                    'this_month': await Technology.objects.filter(
+                        created_at__month=now.month,
+                        created_at__year=now.year
+                    ).acount()
                 },
                 'clients': {
-                    'total': customer_information.objects.count(),
-                    'by_region': {},
-                    'by_sector': {},
-                    'active_contracts': customer_information.objects.filter(
+                    'total': await customer_information.objects.acount(),
+                    'by_region': await self.group_counts(customer_information.objects, 'region'),
+                    'by_sector': await self.group_counts(customer_information.objects, 'sectors'),
+                    'active_contracts': await customer_information.objects.filter(
                         contract_status='진행중'
-                    ).count(),
-                    'this_month': customer_information.objects.filter(
-                        registration_date__month=datetime.now().month,
-                        registration_date__year=datetime.now().year
-                    ).count()
+                    ).acount(),
+                    'this_month': await customer_information.objects.filter(
+                        registration_date__month=now.month,
+                        registration_date__year=now.year
+                    ).acount()
                 }
             }
             
-            # 기술 통계 계산
-            for category, display in Technology.CATEGORY_CHOICES:
-                stats['technologies']['by_category'][display] = Technology.objects.filter(category=category).count()
+            return APIResponse.success(stats)
             
-            for proficiency, display in Technology.PROFICIENCY_CHOICES:
-                stats['technologies']['by_proficiency'][display] = Technology.objects.filter(proficiency=proficiency).count()
+        except Exception as e:
+            api_logger.error(f"통계 조회 오류: {str(e)}")
+            return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
+
+
+class ExportAPIView(View):
+    """
+    대용량 내보내기 API 뷰
+    
+    거래처, 공지사항, 기술, 출퇴근 기록 전체를 NDJSON(기본) 또는 CSV(?format=csv) 로
+    스트리밍합니다. values_list().iterator(chunk_size) 로 서버측 커서에서 읽으므로
+    행 수와 관계없이 메모리 사용량이 일정합니다. 필터는 목록 API 와 같습니다.
+    """
+    
+    CHUNK_SIZE = 2000
+    FORMATS = ('ndjson', 'csv')
+    
+    # 리소스별 (열 이름, ORM 조회 경로)
+    COLUMNS = {
+        'notices': [
+            ('id', 'id'), ('title', 'title'), ('content', 'content'), ('author', 'author__username'),
+            ('importance', 'importance'), ('status', 'status'), ('view_count', 'view_count'),
+            ('created_at', 'created_at'), ('updated_at', 'updated_at'), ('published_at', 'published_at'),
+        ],
+        'technologies': [
+            ('id', 'id'), ('name', 'name'), ('category', 'category'), ('description', 'description'),
+            ('proficiency', 'proficiency'), ('status', 'status'), ('author', 'author__username'),
+            ('tags', 'tags'), ('created_at', 'created_at'), ('updated_at', 'updated_at'),
+        ],
+        'commute': [
+            ('id', 'id'), ('user', 'user__username'), ('work_date', 'work_date'),
+            ('check_in_time', 'check_in_time'), ('check_out_time', 'check_out_time'),
+            ('total_work_hours', 'total_work_hours'), ('status', 'status'), ('notes', 'notes'),
+        ],
+    }
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get_columns(self, resource):
+        """리소스의 (열 이름, ORM 조회 경로) 목록"""
+        if resource == 'clients':
+            return [
+                (field.attname, field.attname) for field in customer_information._meta.concrete_fields
+                if field.name not in customer_information.LOOKUP_FIELDS
+            ]
+        return self.COLUMNS[resource]
+    
+    def get_queryset(self, request, resource):
+        """필터/권한이 적용된 리소스 쿼리셋"""
+        if resource == 'notices':
+            return NoticeAPIView().get_queryset(request)
+        if resource == 'technologies':
+            return TechnologyAPIView().get_queryset(request)
+        if resource == 'clients':
+            return self.get_client_queryset(request)
+        return self.get_commute_queryset(request)
+    
+    @staticmethod
+    def get_client_queryset(request):
+        """검색/필터가 적용된 거래처 쿼리셋"""
+        queryset = customer_information.objects.all()
+        
+        # 검색 (통합 검색 API 와 같은 필드)
+        search = request.GET.get('search', '')
+        if search:
+            queryset = queryset.filter(
+                Q(company_name__icontains=search) |
+                Q(representative__icontains=search) |
+                Q(sectors__icontains=search)
+            )
+        
+        # 필터링
+        for field in ('region', 'division', 'contract_status'):
+            value = request.GET.get(field, '')
+            if value:
+                queryset = queryset.filter(**{field: value})
+        
+        return queryset.order_by('id')
+    
+    @staticmethod
+    def get_commute_queryset(request):
+        """기간/상태 필터가 적용된 출퇴근 기록 쿼리셋 (일반 사용자는 본인 기록만)"""
+        queryset = CommuteRecord.objects.all()
+        
+        if not request.user.is_staff:
+            queryset = queryset.filter(user=request.user)
+        elif request.GET.get('user'):
+            queryset = queryset.filter(user__username=request.GET['user'])
+        
+        date_from = request.GET.get('date_from', '')
+        if date_from:
+            queryset = queryset.filter(work_date__gte=date_from)
+        
+        date_to = request.GET.get('date_to', '')
+        if date_to:
+            queryset = queryset.filter(work_date__lte=date_to)
+        
+        status = request.GET.get('status', '')
+        if status:
+            queryset = queryset.filter(status=status)
+        
+        return queryset.order_by('work_date', 'id')
+    
+    def get(self, request, resource):
+        """리소스 내보내기"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        
+        if resource not in ('clients', *self.COLUMNS):
+            return APIResponse.error("지원하지 않는 내보내기 대상입니다.", 404, "UNKNOWN_RESOURCE")
+        
+        output_format = request.GET.get('format', 'ndjson')
+        if output_format not in self.FORMATS:
+            return APIResponse.error("format 은 ndjson 또는 csv 여야 합니다.", 400, "INVALID_FORMAT")
+        
+        try:
+            columns = self.get_columns(resource)
+            queryset = self.get_queryset(request, resource)
+            # 필터 값 오류(잘못된 날짜 등)를 스트리밍 시작 전에 잡기 위해 쿼리 컴파일
+            str(queryset.query)
+        except Exception as e:
+            api_logger.error(f"내보내기 오류: {str(e)}")
+            return APIResponse.error("잘못된 필터 값입니다.", 400, "INVALID_FILTER")
+        
+        rows = queryset.values_list(*(lookup for _, lookup in columns)).iterator(chunk_size=self.CHUNK_SIZE)
+        api_logger.info(f"내보내기 시작: {resource} ({output_format}) - {request.user.username}")
+        return stream_export_response(
+            [name for name, _ in columns], rows, output_format, filename=f"{resource}_{datetime.now():%Y%m%d}"
+        )
+
+
+class TechnologyTagAPIView(View):
+    """
+    기술 태그 API 뷰
+    
+    태그 클라우드는 Tag.technology_count 인덱스 순으로, 태그 공유 기술은
+    TechnologyTag 인덱스 조인으로 조회합니다.
+    
+    파라미터: limit (태그 클라우드 기본 30, 공유 기술 기본 5, 최대 100)
+    """
+    
+    MAX_LIMIT = 100
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get(self, request, pk=None):
+        """태그 클라우드 또는 태그를 공유하는 기술 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        
+        try:
+            limit = min(max(int(request.GET.get('limit', 5 if pk else 30)), 1), self.MAX_LIMIT)
+        except ValueError:
+            return APIResponse.error("limit 은 숫자여야 합니다.", 400, "INVALID_LIMIT")
+        
+        if pk is None:
+            tags = [
+                {'name': tag.name, 'label': tag.label, 'count': tag.technology_count}
+                for tag in Tag.cloud(limit)
+            ]
+            return APIResponse.success({'tags': tags})
+        
+        try:
+            tech = Technology.objects.only('pk').get(pk=pk)
+        except Technology.DoesNotExist:
+            return APIResponse.error("기술 정보를 찾을 수 없습니다.", 404, "TECHNOLOGY_NOT_FOUND")
+        related = [
+            {'id': item.id, 'name': item.name, 'category': item.category, 'shared_tags': item.shared_tags}
+            for item in tech.related_by_tags(limit).only('id', 'name', 'category', 'created_at')
+        ]
+        return APIResponse.success({'id': tech.id, 'results': related})
+
+
+class AttendanceReportAPIView(View):
+    """
+    월간 근태 집계 API 뷰
+    
+    사용자별 합계는 (사용자, 월) 단위로 캐시되고 부서별 합계는 사용자별 합계를 묶어 계산합니다.
+    일반 사용자는 본인 합계만, 관리자는 전체 사용자와 부서별 합계를 조회할 수 있습니다.
+    
+    파라미터: month (YYYY-MM, 기본 이번 달), group (user 기본 | department), user (관리자 전용 사용자명)
+    """
+    
+    GROUPS = ('user', 'department')
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    @staticmethod
+    def format_totals(values):
+        """근무 시간(초)을 시간 단위로 함께 표시"""
+        return {**values, 'work_hours': round(values['work_seconds'] / 3600, 2)}
+    
+    def get(self, request):
+        """월간 근태 집계 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        
+        group = request.GET.get('group', 'user')
+        if group not in self.GROUPS:
+            return APIResponse.error("group 은 user 또는 department 여야 합니다.", 400, "INVALID_GROUP")
+        if group == 'department' and not request.user.is_staff:
+            return APIResponse.error("부서별 집계 조회 권한이 없습니다.", 403, "PERMISSION_DENIED")
+        
+        try:
+            report = MonthlyAttendance.from_string(request.GET.get('month', ''))
+        except AttendanceReportError as e:
+            return APIResponse.error(str(e), 400, "INVALID_MONTH")
+        
+        user_ids = None
+        if not request.user.is_staff:
+            user_ids = [request.user.pk]
+        elif request.GET.get('user'):
+            user_ids = list(User.objects.filter(username=request.GET['user']).values_list('pk', flat=True))
+        totals = report.user_totals(user_ids)
+        
+        if group == 'department':
+            results = [
+                {'department': name, **self.format_totals(values)}
+                for name, values in sorted(report.department_totals(totals).items())
+            ]
+        else:
+            usernames = dict(User.objects.filter(pk__in=list(totals)).values_list('pk', 'username'))
+            results = [
+                {'user_id': user_id, 'username': usernames.get(user_id, ''), **self.format_totals(values)}
+                for user_id, values in totals.items()
+            ]
+        return APIResponse.success({'month': report.label, 'group': group, 'results': results})
+
+
+class AttendanceTrendAPIView(View):
+    """
+    근태 추이 API 뷰 (관리자 전용)
+    
+    미리 계산된 일자별/월별 요약 테이블만 읽으므로 여러 해 범위도 원본 기록을 조회하지 않습니다.
+    
+    파라미터: from, to (YYYY-MM, 기본 전년 같은 달 ~ 이번 달), period (month 기본 | day)
+    """
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get(self, request):
+        """근태 추이 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        if not request.user.is_staff:
+            return APIResponse.error("근태 추이 조회 권한이 없습니다.", 403, "PERMISSION_DENIED")
+        
+        period = request.GET.get('period', 'month')
+        if period not in AttendanceTrend.PERIODS:
+            return APIResponse.error("period 는 month 또는 day 여야 합니다.", 400, "INVALID_PERIOD")
+        
+        try:
+            end = MonthlyAttendance.from_string(request.GET.get('to', '')).start
+            if request.GET.get('from'):
+                start = MonthlyAttendance.from_string(request.GET['from']).start
+            else:
+                start = end.replace(year=end.year - 1)
+            trend = AttendanceTrend(start, end)
+        except AttendanceReportError as e:
+            return APIResponse.error(str(e), 400, "INVALID_MONTH")
+        
+        results = trend.monthly() if period == 'month' else trend.daily()
+        return APIResponse.success({
+            'from': f"{trend.start:%Y-%m}", 'to': f"{end:%Y-%m}", 'period': period, 'results': results,
+        })
+
+
+class CommutePunchBatchAPIView(View):
+    """
+    출퇴근 타각 일괄 등록 API 뷰
+    
+    키오스크/사원증 리더기가 모아 둔 타각을 한 번에 받아 (사용자, 근무일) 별 근태 기록으로 upsert 합니다.
+    잘못된 타각은 errors 로 돌려주고 나머지는 그대로 처리합니다.
+    관리자 또는 근태 기록 추가 권한(commute.add_commuterecord)이 있는 단말기 계정만 사용할 수 있습니다.
+    
+    본문: {"punches": [{"user": 1, "time": "2024-05-02T08:57:00+09:00", "type": "in"}, ...]} 또는 타각 목록
+    """
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def post(self, request):
+        """타각 일괄 등록"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        if not (request.user.is_staff or request.user.has_perm('commute.add_commuterecord')):
+            return APIResponse.error("타각 등록 권한이 없습니다.", 403, "PERMISSION_DENIED")
+        
+        try:
+            data = json.loads(request.body)
+            punches = data.get('punches') if isinstance(data, dict) else data
+            result = PunchBatch(punches).save()
+        except json.JSONDecodeError:
+            return APIResponse.error("잘못된 JSON 형식입니다.", 400, "INVALID_JSON")
+        except PunchBatchError as e:
+            return APIResponse.error(str(e), 400, "INVALID_PUNCHES")
+        except Exception as e:
+            api_logger.error(f"타각 일괄 등록 오류: {str(e)}")
+            return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
+        
+        api_logger.info(
+            f"타각 일괄 등록: {request.user.username} - 타각 {result['accepted']}/{result['received']}건, "
+            f"기록 {result['records']}건"
+        )
+        return APIResponse.success(result)
+
+
+class AbsenceRequestAPIView(View):
+    """
+    휴가/출장 신청 API 공통 뷰
+    
+    일반 사용자는 본인 신청만 조회/신청/취소할 수 있고, 승인/반려는 관리자만 할 수 있습니다.
+    신청/승인 상태인 기간이 기존 휴가, 출장(휴가는 근무 스케줄 포함)과 겹치면 409 와 함께
+    겹치는 일정 목록을 details 로 돌려줍니다.
+    
+    GET: 목록 (?status=, ?from=, ?to= 기간 겹침, 관리자는 ?user=사용자명, ?page=, ?per_page= 최대 MAX_PER_PAGE) 또는 상세
+    POST: 신청
+    PUT: {"action": "approve" | "reject" | "cancel"} 또는 신청 상태일 때 내용 수정
+    """
+    
+    model = None
+    form_class = None
+    label = '신청'
+    not_found_code = 'REQUEST_NOT_FOUND'
+    # 페이지 크기 상한 (ListEngine.MAX_PER_PAGE 와 같음)
+    MAX_PER_PAGE = 100
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get_queryset(self, request):
+        """권한이 적용된 신청 쿼리셋"""
+        queryset = self.model.objects.all()
+        if not request.user.is_staff:
+            queryset = queryset.filter(user=request.user)
+        return queryset
+    
+    def detail(self, obj):
+        data = self.model.objects.filter(pk=obj.pk).values().first()
+        data['username'] = obj.user.username
+        data['status_display'] = obj.get_status_display()
+        return data
+    
+    def save(self, request, obj, message, status=200):
+        try:
+            save_request(obj)
+        except AbsenceConflict as e:
+            return APIResponse.error(str(e), 409, "CONFLICT", e.conflicts)
+        return APIResponse.success({**self.detail(obj), 'message': message}, status=status)
+    
+    def get(self, request, pk=None):
+        """신청 목록 또는 상세 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        queryset = self.get_queryset(request)
+        if pk:
+            obj = queryset.select_related('user').filter(pk=pk).first()
+            if obj is None:
+                return APIResponse.error(f"{self.label}을 찾을 수 없습니다.", 404, self.not_found_code)
+            return APIResponse.success(self.detail(obj))
+        
+        try:
+            start = parse_date(request.GET['from']) if request.GET.get('from') else None
+            end = parse_date(request.GET['to']) if request.GET.get('to') else None
+        except ValueError:
+            start = end = None
+        if (request.GET.get('from') and start is None) or (request.GET.get('to') and end is None):
+            return APIResponse.error("from/to 는 YYYY-MM-DD 형식이어야 합니다.", 400, "INVALID_DATE")
+        if start:
+            queryset = queryset.filter(end_date__gte=start)
+        if end:
+            queryset = queryset.filter(start_date__lte=end)
+        if request.GET.get('status'):
+            queryset = queryset.filter(status=request.GET['status'])
+        if request.user.is_staff and request.GET.get('user'):
+            queryset = queryset.filter(user__username=request.GET['user'])
+        
+        try:
+            # 범위를 넘는 페이지는 Paginator.get_page 가 마지막 페이지로 맞춤
+            page = max(int(request.GET.get('page', 1)), 1)
+            per_page = min(max(int(request.GET.get('per_page', 10)), 1), self.MAX_PER_PAGE)
+        except ValueError:
+            return APIResponse.error("page, per_page 는 정수여야 합니다.", 400, "INVALID_PAGE")
+        return APIResponse.paginated(queryset.order_by('-start_date', '-pk'), page, per_page)
+    
+    def post(self, request):
+        """신청"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        try:
+            form = self.form_class(json.loads(request.body))
+        except json.JSONDecodeError:
+            return APIResponse.error("잘못된 JSON 형식입니다.", 400, "INVALID_JSON")
+        if not form.is_valid():
+            return APIResponse.error("입력값이 올바르지 않습니다.", 400, "INVALID_REQUEST", form.errors)
+        obj = form.save(commit=False)
+        obj.user = request.user
+        return self.save(request, obj, f"{self.label}이 등록되었습니다.", status=201)
+    
+    def put(self, request, pk):
+        """승인/반려/취소 또는 내용 수정"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        obj = self.model.objects.select_related('user').filter(pk=pk).first()
+        if obj is None or not (request.user.is_staff or obj.user_id == request.user.pk):
+            return APIResponse.error(f"{self.label}을 찾을 수 없습니다.", 404, self.not_found_code)
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return APIResponse.error("잘못된 JSON 형식입니다.", 400, "INVALID_JSON")
+        if not isinstance(data, dict):
+            return APIResponse.error("입력값이 올바르지 않습니다.", 400, "INVALID_REQUEST")
+        
+        action = data.get('action')
+        if action:
+            if action != 'cancel' and not request.user.is_staff:
+                return APIResponse.error("결재 권한이 없습니다.", 403, "PERMISSION_DENIED")
+            try:
+                change_status(obj, action, request.user)
+            except AbsenceError as e:
+                return APIResponse.error(str(e), 400, "INVALID_ACTION")
+            api_logger.info(f"{self.label} {action}: {request.user.username} - {obj.pk}")
+            return APIResponse.success(self.detail(obj))
+        
+        if obj.user_id != request.user.pk or obj.status != 'pending':
+            return APIResponse.error("신청 상태인 본인 신청만 수정할 수 있습니다.", 403, "PERMISSION_DENIED")
+        fields = self.form_class._meta.fields
+        form = self.form_class({**{name: getattr(obj, name) for name in fields}, **data}, instance=obj)
+        if not form.is_valid():
+            return APIResponse.error("입력값이 올바르지 않습니다.", 400, "INVALID_REQUEST", form.errors)
+        return self.save(request, form.save(commit=False), f"{self.label}이 수정되었습니다.")
+
+
+class LeaveRequestAPIView(AbsenceRequestAPIView):
+    """휴가 신청 API 뷰 (사용 일수는 주말/공휴일을 뺀 영업일 기준)"""
+    
+    model = LeaveRequest if MODELS_AVAILABLE else None
+    form_class = LeaveRequestForm if MODELS_AVAILABLE else None
+    label = '휴가 신청'
+    not_found_code = 'LEAVE_NOT_FOUND'
+
+
+class BusinessTripAPIView(AbsenceRequestAPIView):
+    """출장 신청 API 뷰"""
+    
+    model = BusinessTrip if MODELS_AVAILABLE else None
+    form_class = BusinessTripForm if MODELS_AVAILABLE else None
+    label = '출장 신청'
+    not_found_code = 'TRIP_NOT_FOUND'
+
+
+class TeamCalendarAPIView(View):
+    """
+    팀 월간 달력 API 뷰
+    
+    팀원의 휴가, 출장, 근무 스케줄과 일자별 휴가/출장 인원을 돌려줍니다.
+    원본별로 그 달과 겹치는 범위 쿼리 한 번씩만 실행합니다.
+    일반 사용자는 소속 부서만, 관리자는 ?department= 로 다른 부서나 전체(생략 시)를 조회합니다.
+    
+    파라미터: month (YYYY-MM, 기본 이번 달), department (관리자 전용)
+    """
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get(self, request):
+        """팀 월간 달력 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        try:
+            month = MonthlyAttendance.from_string(request.GET.get('month', ''))
+        except AttendanceReportError as e:
+            return APIResponse.error(str(e), 400, "INVALID_MONTH")
+        
+        if request.user.is_staff:
+            department = request.GET.get('department') or None
+        else:
+            from login.models import UserProfile
+            department = UserProfile.objects.filter(user=request.user).values_list('department', flat=True).first()
+            if not department:
+                return APIResponse.error("소속 부서가 없습니다.", 400, "NO_DEPARTMENT")
+        return APIResponse.success(TeamCalendar(month, department).build())
+
+
+class CalendarFeedAPIView(View):
+    """
+    캘린더 피드 API 뷰
+    
+    근무 스케줄, 휴가, 출장, 게시된 공지 마감일을 요청 기간의 일정 목록으로 합쳐 JSON 또는 ICS 로
+    스트리밍합니다. 원본별 (최종 수정일, 행 수) 로 ETag 를 만들므로 폴링하는 캘린더 클라이언트는
+    바뀐 것이 없으면 304 를 받습니다.
+    
+    파라미터:
+        from, to (YYYY-MM-DD, 기본 이번 달)
+        scope (me 기본 | team 소속 부서, 관리자는 department= 지정 | all 관리자 전용)
+        sources (쉼표 구분: schedule, leave, trip, notice)
+        format (json 기본 | ics)
+    """
+    
+    SCOPES = ('me', 'team', 'all')
+    FORMATS = ('json', 'ics')
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def user_ids(self, request, scope):
+        """scope 에 해당하는 사용자 id 목록 (전체면 None)"""
+        if scope == 'me':
+            return [request.user.pk]
+        if scope == 'all':
+            return None
+        from login.models import UserProfile
+        department = request.GET.get('department') if request.user.is_staff else None
+        if not department:
+            department = UserProfile.objects.filter(user=request.user).values_list('department', flat=True).first()
+        if not department:
+            return [request.user.pk]
+        return list(UserProfile.objects.filter(department=department).values_list('user_id', flat=True))
+    
+    def get(self, request):
+        """캘린더 일정 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        
+        scope = request.GET.get('scope', 'me')
+        output_format = request.GET.get('format', 'json')
+        if scope not in self.SCOPES:
+            return APIResponse.error("scope 는 me, team, all 중 하나여야 합니다.", 400, "INVALID_SCOPE")
+        if output_format not in self.FORMATS:
+            return APIResponse.error("format 은 json 또는 ics 여야 합니다.", 400, "INVALID_FORMAT")
+        if scope == 'all' and not request.user.is_staff:
+            return APIResponse.error("전체 일정 조회 권한이 없습니다.", 403, "PERMISSION_DENIED")
+        
+        try:
+            month = MonthlyAttendance.from_string('')
+            start = parse_date(request.GET['from']) if request.GET.get('from') else month.start
+            end = parse_date(request.GET['to']) if request.GET.get('to') else month.end - timedelta(days=1)
+        except ValueError:
+            start = end = None
+        if start is None or end is None:
+            return APIResponse.error("from/to 는 YYYY-MM-DD 형식이어야 합니다.", 400, "INVALID_DATE")
+        sources = [source for source in request.GET.get('sources', '').split(',') if source] or None
+        
+        try:
+            feed = CalendarFeed(start, end, self.user_ids(request, scope), sources)
+        except CalendarFeedError as e:
+            return APIResponse.error(str(e), 400, "INVALID_RANGE")
+        
+        etag = feed.etag(output_format)
+        cached = ResponseCache.conditional_response(request, 'calendar', etag)
+        if cached is not None:
+            return cached
+        
+        if output_format == 'ics':
+            response = stream_ics_response(feed.events(), name='업무 캘린더', filename=f'calendar-{start:%Y%m%d}')
+        else:
+            response = APIResponse.stream(
+                {'from': start, 'to': end, 'scope': scope, 'sources': feed.sources, 'events': STREAM_PLACEHOLDER},
+                feed.events(),
+            )
+        return ResponseCache.finalize('calendar', etag, response)
+
+
+class ClientLookupAPIView(View):
+    """
+    거래처 빠른 조회 API 뷰
+    
+    icontains 대신 조회용 정규화 열(brn_digits, phone_digits, company_name_folded)의
+    정확 일치 또는 범위(접두어) 조건으로 조회하므로 B-tree 인덱스 탐색으로 처리됩니다.
+    하이픈/공백/대소문자는 입력과 저장 값 모두 정규화되어 무시됩니다.
+    
+    파라미터: brn, phone, name 중 하나 이상, match (prefix 기본 | exact), limit (기본 20, 최대 100)
+    """
+    
+    # 파라미터 -> (조회 열, 정규화 함수)
+    LOOKUPS = {
+        'brn': ('brn_digits', digits_only),
+        'phone': ('phone_digits', digits_only),
+        'name': ('company_name_folded', fold_name),
+    }
+    MATCHES = ('prefix', 'exact')
+    MAX_LIMIT = 100
+    FIELDS = (
+        'id', 'company_name', 'representative', 'business_registration_number',
+        'phone_number', 'region', 'contract_status',
+    )
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get_terms(self, request):
+        """요청 파라미터를 (조회 열, 정규화 값) 목록으로 변환 (정규화 후 빈 값은 무시)"""
+        terms = []
+        for param, (column, normalize) in self.LOOKUPS.items():
+            value = normalize(request.GET.get(param, ''))
+            if value:
+                terms.append((column, value))
+        return terms
+    
+    def get(self, request):
+        """거래처 조회"""
+        if not MODELS_AVAILABLE:
+            return APIResponse.error("모델을 사용할 수 없습니다.", status=500)
+        
+        match = request.GET.get('match', 'prefix')
+        if match not in self.MATCHES:
+            return APIResponse.error("match 는 prefix 또는 exact 여야 합니다.", 400, "INVALID_MATCH")
+        
+        try:
+            limit = min(max(int(request.GET.get('limit', 20)), 1), self.MAX_LIMIT)
+        except ValueError:
+            return APIResponse.error("limit 은 숫자여야 합니다.", 400, "INVALID_LIMIT")
+        
+        terms = self.get_terms(request)
+        if not terms:
+            return APIResponse.error("brn, phone, name 중 하나 이상을 입력하세요.", 400, "MISSING_QUERY")
+        
+        filters = {}
+        for column, value in terms:
+            if match == 'exact':
+                filters[column] = value
+            else:
+                filters[f'{column}__gte'], filters[f'{column}__lt'] = prefix_range(value)
+        
+        # 첫 조회 열 순서로 정렬해 인덱스 범위 탐색 결과를 그대로 잘라 씀
+        clients = list(
+            customer_information.objects.filter(**filters)
+            .order_by(terms[0][0], 'id').values(*self.FIELDS)[:limit]
+        )
+        return APIResponse.success({'match': match, 'results': clients, 'count': len(clients)})
+
+
+class ProfilerAPIView(View):
+    """
+    CPU 프로파일러 API 뷰 (관리자 전용)
+    
+    요청을 처리한 워커 프로세스의 스택 샘플러를 켜고 끄며 결과를 조회합니다.
+    응답의 pid 로 어느 워커의 결과인지 확인할 수 있습니다.
+    """
+    
+    @method_decorator(csrf_exempt)
+    @method_decorator(login_required)
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_superuser:
+            return APIResponse.error("관리자만 사용할 수 있습니다.", 403, "PERMISSION_DENIED")
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get(self, request):
+        """
+        프로파일러 상태 조회
+        
+        format=collapsed 이면 flamegraph 입력 텍스트를, format=allocations 이면
+        뷰별 메모리 할당 보고서(ALLOCATION_PROFILER_SAMPLE_RATE 로 수집)를 반환합니다.
+        """
+        output_format = request.GET.get('format')
+        if output_format == 'collapsed':
+            return HttpResponse(stack_sampler.collapsed(), content_type='text/plain; charset=utf-8')
+        if output_format == 'allocations':
+            return APIResponse.success(allocation_profiler.get_report())
+        return APIResponse.success(stack_sampler.status())
+    
+    def post(self, request):
+        """프로파일러 시작/종료"""
+        try:
+            data = json.loads(request.body or '{}')
+            action = data.get('action', 'start')
             
-            for status, display in Technology.STATUS_CHOICES:
-                stats['technologies']['by_status'][display] = Technology.objects.filter(status=status).count()
+            if action == 'stop':
+                stack_sampler.stop()
+                return APIResponse.success(stack_sampler.status(), "프로파일링을 종료했습니다.")
             
-            # 거래처 통계 계산
-            regions = customer_information.objects.values('region').distinct()
-            for region in regions:
-                stats['clients']['by_region'][region['region']] = customer_information.objects.filter(region=region['region']).count()
+            if action == 'reset_allocations':
+                allocation_profiler.reset()
+                return APIResponse.success(None, "메모리 할당 보고서를 초기화했습니다.")
             
-            sectors = customer_information.objects.values('sectors').distinct()
-            for sector in sectors:
-                stats['clients']['by_sector'][sector['sectors']] = customer_information.objects.filter(sectors=sector['sectors']).count()
+            if action != 'start':
+                return APIResponse.error("action 은 start, stop, reset_allocations 중 하나여야 합니다.", 400, "INVALID_ACTION")
             
-            return APIResponse.success(stats)
+            started = stack_sampler.start(
+                interval_ms=int(data.get('interval_ms', StackSampler.DEFAULT_INTERVAL_MS)),
+                duration=int(data.get('duration', 30)),
+                mode=data.get('mode', 'auto'),
+            )
+            if not started:
+                return APIResponse.error("이미 프로파일링 중입니다.", 409, "ALREADY_RUNNING")
+            
+            api_logger.info(f"CPU 프로파일링 시작: {request.user.username} (pid {stack_sampler.status()['pid']})")
+            return APIResponse.success(stack_sampler.status(), "프로파일링을 시작했습니다.")
             
+        except json.JSONDecodeError:
+            return APIResponse.error("잘못된 JSON 형식입니다.", 400, "INVALID_JSON")
+        except ValueError as e:
+            return APIResponse.error(str(e), 400, "INVALID_PARAMETER")
         except Exception as e:
-            api_logger.error(f"통계 조회 오류: {str(e)}")
+            api_logger.error(f"프로파일러 제어 오류: {str(e)}")
             return APIResponse.error("서버 오류가 발생했습니다.", 500, "SERVER_ERROR")
@@ -0,0 +1,217 @@
+"""
+영업일 계산 모듈
+
+두 날짜 사이의 영업일 수를 하루씩 세지 않고 닫힌 식으로 계산합니다.
+월요일을 기준으로 한 일련번호 x 에 대해 [0, x) 의 평일 수는 (x // 7) * 5 + min(x % 7, 5) 이므로
+구간의 평일 수는 두 값의 차이이고, 평일에 해당하는 공휴일 수는 정렬해 둔 공휴일 배열에서
+bisect 로 구합니다. 구간 길이와 관계없이 O(log 공휴일 수) 입니다.
+
+공휴일은 KOREAN_PUBLIC_HOLIDAYS(대체/임시 공휴일 포함)와 settings.BUSINESS_HOLIDAYS
+(회사 지정 휴일, 'YYYY-MM-DD' 목록)를 합친 것입니다. 음력 공휴일과 대체/임시 공휴일은
+해마다 정해지므로 새 연도의 공휴일은 목록에 추가해야 합니다.
+
+주요 기능:
+- 영업일 여부 및 구간 영업일 수
+- 여러 구간 일괄 계산 (NumPy 가 있으면 벡터 연산, 없으면 순수 파이썬)
+- 영업일 더하기/빼기
+
+@version 1.0.0
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from django.conf import settings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 이 크기 이상일 때만 NumPy 사용 (작은 묶음은 배열 변환 비용이 더 큼)
+NUMPY_MIN_BATCH = 1000
+
+
+def _dates(*values):
+    return [date(*value) for value in values]
+
+
+# 대한민국 공휴일 (관공서의 공휴일에 관한 규정, 대체/임시 공휴일과 선거일 포함)
+KOREAN_PUBLIC_HOLIDAYS = (
+    # 2023
+    *_dates((2023, 1, 1), (2023, 1, 21), (2023, 1, 22), (2023, 1, 23), (2023, 1, 24), (2023, 3, 1),
+            (2023, 5, 5), (2023, 5, 27), (2023, 5, 29), (2023, 6, 6), (2023, 8, 15), (2023, 9, 28),
+            (2023, 9, 29), (2023, 9, 30), (2023, 10, 2), (2023, 10, 3), (2023, 10, 9), (2023, 12, 25)),
+    # 2024
+    *_dates((2024, 1, 1), (2024, 2, 9), (2024, 2, 10), (2024, 2, 11), (2024, 2, 12), (2024, 3, 1),
+            (2024, 4, 10), (2024, 5, 5), (2024, 5, 6), (2024, 5, 15), (2024, 6, 6), (2024, 8, 15),
+            (2024, 9, 16), (2024, 9, 17), (2024, 9, 18), (2024, 10, 1), (2024, 10, 3), (2024, 10, 9),
+            (2024, 12, 25)),
+    # 2025
+    *_dates((2025, 1, 1), (2025, 1, 27), (2025, 1, 28), (2025, 1, 29), (2025, 1, 30), (2025, 3, 1),
+            (2025, 3, 3), (2025, 5, 5), (2025, 5, 6), (2025, 6, 3), (2025, 6, 6), (2025, 8, 15),
+            (2025, 10, 3), (2025, 10, 5), (2025, 10, 6), (2025, 10, 7), (2025, 10, 8), (2025, 10, 9),
+            (2025, 12, 25)),
+    # 2026
+    *_dates((2026, 1, 1), (2026, 2, 16), (2026, 2, 17), (2026, 2, 18), (2026, 3, 1), (2026, 3, 2),
+            (2026, 5, 5), (2026, 5, 24), (2026, 5, 25), (2026, 6, 3), (2026, 6, 6), (2026, 8, 15),
+            (2026, 8, 17), (2026, 9, 24), (2026, 9, 25), (2026, 9, 26), (2026, 10, 3), (2026, 10, 5),
+            (2026, 10, 9), (2026, 12, 25)),
+)
+
+
+def to_date(value):
+    """date, datetime, 'YYYY-MM-DD' 문자열을 date 로 변환"""
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _serial(day):
+    """월요일이 7의 배수가 되는 일련번호 (0001-01-01 은 월요일)"""
+    return day.toordinal() - 1
+
+
+def _weekdays_before(serial):
+    """일련번호 [0, serial) 구간의 평일 수"""
+    weeks, rest = divmod(serial, 7)
+    return weeks * 5 + min(rest, 5)
+
+
+class BusinessCalendar:
+    """
+    영업일 달력
+
+    주말과 공휴일을 제외한 날을 영업일로 봅니다. 평일에 해당하는 공휴일만 정렬된
+    일련번호 배열로 미리 만들어 두므로 조회는 bisect 두 번입니다.
+
+    사용 예:
+        calendar = BusinessCalendar.default()
+        calendar.business_days('2024-05-01', '2024-05-31')        # 20
+        calendar.business_days_batch([(start, end), ...])          # [..]
+        calendar.add_business_days(date(2024, 5, 3), 1)            # 2024-05-07
+    """
+
+    _default = None
+
+    def __init__(self, holidays=()):
+        serials = {_serial(to_date(day)) for day in holidays}
+        # 주말 공휴일은 이미 평일 계산에서 빠지므로 평일 공휴일만 보관
+        self.holidays = sorted(serial for serial in serials if serial % 7 < 5)
+        self._holiday_array = None
+
+    @classmethod
+    def default(cls):
+        """대한민국 공휴일 + settings.BUSINESS_HOLIDAYS 달력 (프로세스당 한 번 생성)"""
+        if cls._default is None:
+            cls._default = cls([*KOREAN_PUBLIC_HOLIDAYS, *getattr(settings, 'BUSINESS_HOLIDAYS', ())])
+        return cls._default
+
+    @classmethod
+    def reset_default(cls):
+        """설정 변경 후 기본 달력 다시 만들기"""
+        cls._default = None
+
+    def is_business_day(self, day):
+        serial = _serial(to_date(day))
+        if serial % 7 >= 5:
+            return False
+        index = bisect_left(self.holidays, serial)
+        return index == len(self.holidays) or self.holidays[index] != serial
+
+    def business_days(self, start, end):
+        """
+        start ~ end (양 끝 포함) 영업일 수 (end 가 start 보다 이르면 0)
+        """
+        first, last = _serial(to_date(start)), _serial(to_date(end))
+        if last < first:
+            return 0
+        weekdays = _weekdays_before(last + 1) - _weekdays_before(first)
+        return weekdays - (bisect_right(self.holidays, last) - bisect_left(self.holidays, first))
+
+    def business_days_batch(self, ranges, use_numpy=None):
+        """
+        여러 구간의 영업일 수 일괄 계산
+
+        Args:
+            ranges (iterable): (시작일, 종료일) 쌍
+            use_numpy (bool): None 이면 NumPy 가 있고 NUMPY_MIN_BATCH 이상일 때 사용
+
+        Returns:
+            list: 구간별 영업일 수 (입력 순서와 같음)
+        """
+        bounds = [(_serial(to_date(start)), _serial(to_date(end))) for start, end in ranges]
+        if use_numpy is None:
+            use_numpy = np is not None and len(bounds) >= NUMPY_MIN_BATCH
+        if use_numpy and np is None:
+            raise ImportError('NumPy 가 설치되어 있지 않습니다.')
+
+        if use_numpy:
+            return self._business_days_numpy(bounds)
+        holidays = self.holidays
+        result = []
+        for first, last in bounds:
+            if last < first:
+                result.append(0)
+                continue
+            weekdays = _weekdays_before(last + 1) - _weekdays_before(first)
+            result.append(weekdays - (bisect_right(holidays, last) - bisect_left(holidays, first)))
+        return result
+
+    def _business_days_numpy(self, bounds):
+        """구간별 영업일 수 (NumPy 벡터 연산)"""
+        if not bounds:
+            return []
+        if self._holiday_array is None:
+            self._holiday_array = np.array(self.holidays, dtype=np.int64)
+        serials = np.array(bounds, dtype=np.int64).reshape(-1, 2)
+        first, last = serials[:, 0], serials[:, 1] + 1
+
+        def weekdays_before(values):
+            return values // 7 * 5 + np.minimum(values % 7, 5)
+
+        holidays = (
+            np.searchsorted(self._holiday_array, last, side='left')
+            - np.searchsorted(self._holiday_array, first, side='left')
+        )
+        counts = weekdays_before(last) - weekdays_before(first) - holidays
+        return np.where(last > first, counts, 0).tolist()
+
+    def add_business_days(self, day, count):
+        """
+        day 에서 영업일 count 일 뒤 (음수면 앞) 날짜
+
+        day 가 영업일이 아니어도 다음(이전) 영업일부터 셉니다. count 가 0 이면 day 를 그대로 반환합니다.
+        """
+        day = to_date(day)
+        if count == 0:
+            return day
+        step = 1 if count > 0 else -1
+        serial = _serial(day)
+        # 공휴일을 무시한 평일 위치에서 시작해 건너뛴 공휴일 수만큼 다시 이동
+        target = _weekdays_before(serial + (1 if step > 0 else 0)) + count - (1 if step > 0 else 0)
+        skipped = 0
+        while True:
+            position = target + skipped * step
+            candidate = position // 5 * 7 + position % 5
+            if step > 0:
+                holidays = bisect_right(self.holidays, candidate) - bisect_right(self.holidays, serial)
+            else:
+                holidays = bisect_left(self.holidays, serial) - bisect_left(self.holidays, candidate)
+            if holidays == skipped:
+                return date.fromordinal(candidate + 1)
+            skipped = holidays
+
+
+def business_day_range(start, end):
+    """start ~ end 의 영업일 목록 (기본 달력, 짧은 구간 표시용)"""
+    calendar = BusinessCalendar.default()
+    start, end = to_date(start), to_date(end)
+    days = []
+    while start <= end:
+        if calendar.is_business_day(start):
+            days.append(start)
+        start += timedelta(days=1)
+    return days
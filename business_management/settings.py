@@ -25,6 +25,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 # 운영체제 관련 기능 임포트
 import os
+import sys
 from django.core.exceptions import ImproperlyConfigured
 
 # =============================================================================
@@ -113,8 +114,29 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',     # 인증 미들웨어
     'django.contrib.messages.middleware.MessageMiddleware',       # 메시지 처리
     'django.middleware.clickjacking.XFrameOptionsMiddleware',     # 클릭재킹 보호
+    # 모니터링 미들웨어
+    'utils.monitoring.QueryProfilerMiddleware',                   # 요청 시간/쿼리 프로파일링, N+1 탐지
 ]
 
+# 쿼리 프로파일러 설정 - 프로파일링할 요청 비율과 N+1 판단 기준 (DEBUG 모드에서는 항상 프로파일링)
+QUERY_PROFILER_SAMPLE_RATE = float(os.environ.get('QUERY_PROFILER_SAMPLE_RATE', '1.0'))
+QUERY_PROFILER_N_PLUS_ONE_THRESHOLD = 5
+
+# 메모리 할당 프로파일러 - tracemalloc 으로 추적할 요청 비율 (0이면 사용 안 함, 추적 중인 요청은 느려짐)
+ALLOCATION_PROFILER_SAMPLE_RATE = float(os.environ.get('ALLOCATION_PROFILER_SAMPLE_RATE', '0'))
+
+# 느린 쿼리 로그 설정 - 임계값(ms) 이상 걸린 쿼리를 실행 계획과 함께 utils.SlowQueryLog 에 저장
+SLOW_QUERY_THRESHOLD_MS = int(os.environ.get('SLOW_QUERY_THRESHOLD_MS', '500'))
+SLOW_QUERY_LOG_MAX_ROWS = 1000
+# 느린 쿼리는 백그라운드 스레드가 요청 트랜잭션 커밋 뒤에 모아서 저장 (테스트 실행 중에는 바로 저장)
+SLOW_QUERY_LOG_ASYNC = sys.argv[1:2] != ['test']
+
+# 병렬 조회(utils.fanout) 설정 - 공유 스레드 풀 크기 (워커 프로세스당 추가 DB 연결 수의 상한)
+FANOUT_MAX_WORKERS = int(os.environ.get('FANOUT_MAX_WORKERS', '8'))
+# 통합 검색 원본별 제한 시간(ms) - 초과한 원본은 빼고 부분 결과로 응답, 원본별 재정의 예: {'client': 3000}
+SEARCH_SOURCE_TIMEOUT_MS = int(os.environ.get('SEARCH_SOURCE_TIMEOUT_MS', '2000'))
+SEARCH_SOURCE_TIMEOUTS = {}
+
 ROOT_URLCONF = 'business_management.urls'
 # URL 설정의 최상위 모듈 경로를 지정합니다.
 
@@ -154,9 +176,11 @@ DATABASES = {
 # LOGGING configuration (defined further below).
 
 # Cache settings - 성능을 위한 캐시 설정
+# default 캐시는 계측 백엔드로 감싸 네임스페이스별 적중률/지연 시간을 수집합니다.
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': 'utils.cache.InstrumentedCache',
+        'WRAPPED_BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',
         'TIMEOUT': 300,
         'OPTIONS': {
@@ -175,6 +199,24 @@ CACHES = {
     },
 }
 
+# API 응답 캐시 설정 - ETag 기반 서버측 응답 캐시 시간(초), 0이면 비활성화
+# ETag가 데이터 변경 시 바뀌므로 캐시된 응답이 오래된 데이터를 돌려주지 않습니다.
+API_RESPONSE_CACHE_TIMEOUT = int(os.environ.get('API_RESPONSE_CACHE_TIMEOUT', '0'))
+
+# 월간 근태 집계 캐시 시간(초) - 기록 저장/삭제 시 해당 (사용자, 월) 캐시만 무효화
+ATTENDANCE_CACHE_TIMEOUT = int(os.environ.get('ATTENDANCE_CACHE_TIMEOUT', '86400'))
+
+# 출퇴근 타각 일괄 등록 API 한 번에 받는 최대 타각 수
+COMMUTE_PUNCH_BATCH_LIMIT = int(os.environ.get('COMMUTE_PUNCH_BATCH_LIMIT', '20000'))
+
+# 회사 지정 휴일 (쉼표로 구분한 YYYY-MM-DD 목록) - 영업일 계산에서 공휴일과 함께 제외
+BUSINESS_HOLIDAYS = [day.strip() for day in os.environ.get('BUSINESS_HOLIDAYS', '').split(',') if day.strip()]
+
+# API JSON 렌더러 설정 - 'auto'는 orjson 이 설치되어 있으면 사용하고 없으면 표준 json 사용
+API_JSON_RENDERER = os.environ.get('API_JSON_RENDERER', 'auto')
+# 페이지 크기가 이 값 이상이면 목록 응답을 청크 단위로 스트리밍
+API_JSON_STREAM_THRESHOLD = 1000
+
 # Security settings
 # 보안 설정 - 운영/개발 환경에 따라 일부 값은 동적으로 설정
 SECURE_SSL_REDIRECT = False
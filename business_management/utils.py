@@ -190,38 +190,25 @@ class DateFormatter:
             return date_obj.strftime('%Y-%m-%d')
     
     @staticmethod
-    def get_business_days(start_date, end_date):
+    def get_business_days(start_date, end_date, exclude_holidays=True):
         """
-        평일 계산 (주말 제외)
+        영업일 계산 (주말, 공휴일 제외)
         
-        두 날짜 사이의 평일 수를 계산합니다.
-        주말(토요일, 일요일)은 제외합니다.
+        두 날짜 사이(양 끝 포함)의 영업일 수를 계산합니다.
+        하루씩 세지 않고 BusinessCalendar 의 닫힌 식으로 계산하므로 구간 길이와 관계없이 빠릅니다.
         
         Args:
             start_date: 시작일 (datetime, date, string)
             end_date: 종료일 (datetime, date, string)
+            exclude_holidays (bool): False 면 주말만 제외한 평일 수
             
         Returns:
-            int: 평일 수
+            int: 영업일 수
         """
-        from datetime import timedelta
+        from .business_calendar import BusinessCalendar
         
-        # 문자열 날짜를 date 객체로 변환
-        if isinstance(start_date, str):
-            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-        if isinstance(end_date, str):
-            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        business_days = 0
-        current_date = start_date
-        
-        # 시작일부터 종료일까지 순회하며 평일 계산
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # 월요일(0) ~ 금요일(4)
-                business_days += 1
-            current_date += timedelta(days=1)
-        
-        return business_days
+        calendar = BusinessCalendar.default() if exclude_holidays else BusinessCalendar()
+        return calendar.business_days(start_date, end_date)
 
 class NumberFormatter:
     """
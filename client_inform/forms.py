@@ -15,6 +15,8 @@ from django import forms
 from django.core.validators import MinLengthValidator, RegexValidator
 # 현재 앱의 모델 임포트
 from .models import customer_information
+# 폼/모델/대량 가져오기 공용 검증 함수 임포트
+from . import validators
 
 # =============================================================================
 # 거래처 정보 등록/수정 폼 클래스
@@ -347,105 +349,30 @@ class CustomerInformationForm(forms.ModelForm):
                 raise forms.ValidationError('대표자명에 허용되지 않는 문자가 포함되어 있습니다.')
             
             # 한글/영문/숫자만 허용
-            import re
-            if not re.match(r'^[가-힣a-zA-Z0-9\s]+$', representative.strip()):
+            if not validators.REPRESENTATIVE_PATTERN.match(representative.strip()):
                 raise forms.ValidationError('대표자명은 한글, 영문, 숫자만 입력할 수 있습니다.')
         
         return representative.strip()
     
     def clean_business_registration_number(self):
-        """사업자등록번호 검증"""
+        """사업자등록번호 검증 (형식, 길이, 검증번호)"""
         brn = self.cleaned_data.get('business_registration_number')
         
         if brn:
-            # 공백만 있는지 확인
-            if brn.strip() == '':
-                raise forms.ValidationError('사업자등록번호에 내용이 포함되어야 합니다.')
-            
-            # 형식 검증 (숫자와 하이픈만 허용)
-            import re
-            if not re.match(r'^[\d-]+$', brn.strip()):
-                raise forms.ValidationError('사업자등록번호는 숫자와 하이픈만 포함할 수 있습니다.')
-            
-            # 길이 검증 (10자 또는 12자)
-            clean_brn = brn.replace('-', '')
-            if len(clean_brn) not in [10, 12]:
-                raise forms.ValidationError('사업자등록번호는 10자 또는 12자여야 합니다.')
-            
-            # 사업자등록번호 유효성 검증 (간단한 검증)
-            if len(clean_brn) == 10:
-                # 10자 사업자등록번호 검증
-                if not self._validate_brn_10(clean_brn):
-                    raise forms.ValidationError('유효하지 않은 사업자등록번호입니다.')
-            elif len(clean_brn) == 12:
-                # 12자 사업자등록번호 검증
-                if not self._validate_brn_12(clean_brn):
-                    raise forms.ValidationError('유효하지 않은 사업자등록번호입니다.')
+            error = validators.brn_error(brn)
+            if error:
+                raise forms.ValidationError(error)
         
         return brn.strip()
     
-    def _validate_brn_10(self, brn):
-        """10자 사업자등록번호 유효성 검증"""
-        try:
-            # 사업자등록번호 유효성 검증 알고리즘
-            check_digit = int(brn[0])
-            multiply = 9
-            total = 0
-            
-            for i in range(1, 10):
-                total += int(brn[i]) * multiply
-                multiply -= 1
-            
-            check_digit = (10 - (total % 10)) % 10
-            
-            return check_digit == int(brn[9])
-        except:
-            return False
-    
-    def _validate_brn_12(self, brn):
-        """12자 사업자등록번호 유효성 검증"""
-        try:
-            # 사업자등록번호 유효성 검증 알고리즘
-            multipliers = [2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 5, 7]
-            total = 0
-            
-            for i in range(12):
-                total += int(brn[i]) * multipliers[i]
-            
-            check_digit = (11 - (total % 11)) % 10
-            
-            return check_digit == int(brn[11])
-        except:
-            return False
-    
     def clean_phone_number(self):
         """전화번호 검증"""
         phone = self.cleaned_data.get('phone_number')
         
         if phone:
-            # 형식 검증
-            import re
-            if not re.match(r'^[\d-]+$', phone.strip()):
-                raise forms.ValidationError('전화번호는 숫자와 하이픈만 포함할 수 있습니다.')
-            
-            # 전화번호 길이 검증 (최소 10자, 최대 15자)
-            clean_phone = phone.replace('-', '')
-            if len(clean_phone) < 10 or len(clean_phone) > 15:
-                raise forms.ValidationError('전화번호는 10자에서 15자 사이여야 합니다.')
-            
-            # 휴대폰 번호 형식 검증
-            if clean_phone.startswith('010'):
-                # 휴대폰 번호인 경우 11자여야 함
-                if len(clean_phone) != 11:
-                    raise forms.ValidationError('휴대폰 번호는 11자여야 합니다.')
-            elif clean_phone.startswith('02'):
-                # 지역번호인 경우 10자 또는 11자여야 함
-                if len(clean_phone) not in [10, 11]:
-                    raise forms.ValidationError('지역번호는 10자 또는 11자여야 합니다.')
-            else:
-                # 일반 번호는 10자여야 함
-                if len(clean_phone) != 10:
-                    raise forms.ValidationError('일반 번호는 10자여야 합니다.')
+            error = validators.phone_error(phone)
+            if error:
+                raise forms.ValidationError(error)
         
         return phone.strip()
     
@@ -0,0 +1,446 @@
+# =============================================================================
+# 비즈니스 관리 시스템 거래처 정보 대량 가져오기
+# =============================================================================
+# 설명: CSV/XLSX 파일의 거래처 정보를 검증해 일괄 저장(upsert)
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+거래처 정보 대량 가져오기 모듈
+
+파일을 한 번에 읽지 않고 행 단위로 읽어 chunk_size 행씩 처리합니다.
+각 묶음은 열 단위로 검증한 뒤 사업자등록번호 기준으로
+bulk_create(update_conflicts=True) 로 저장하므로, 이미 있는 거래처는 갱신됩니다.
+이미 있는 거래처는 파일에 있는 열만 갱신하고, 파일에 없는 열의 기본값('', 0, 오늘 날짜 등)은
+새로 만드는 거래처에만 채웁니다.
+오류가 있는 행은 건너뛰고 행 번호와 함께 보고하며 나머지 행은 계속 처리합니다.
+
+주요 기능:
+- CSV(UTF-8, BOM 허용) / XLSX 행 스트리밍
+- 필드명 또는 폼 레이블(한글) 헤더 인식
+- 폼과 같은 규칙의 열 단위 검증 (validators 모듈 공용)
+- 사업자등록번호 기준 일괄 upsert 및 행별 오류 보고
+- 조회용 정규화 열(brn_digits 등) 동시 갱신
+"""
+
+import csv
+import io
+import logging
+import os
+from datetime import date, datetime
+
+from django.db import DatabaseError, transaction
+from django.db.models import BooleanField, CharField, DateField, IntegerField
+
+from . import validators
+from .models import customer_information
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# 로거 설정
+import_logger = logging.getLogger('client_inform.import')
+
+
+class ClientImportError(Exception):
+    """파일 전체를 처리할 수 없는 오류 (형식 미지원, 필수 열 누락 등)"""
+
+
+class ImportResult:
+    """가져오기 결과"""
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+        self.ignored_columns = []
+
+    @property
+    def skipped(self):
+        return len({error['row'] for error in self.errors})
+
+    def add_error(self, row, field, value, message):
+        self.errors.append({'row': row, 'field': field, 'value': '' if value is None else str(value), 'message': message})
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'created': self.created,
+            'updated': self.updated,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'ignored_columns': self.ignored_columns,
+        }
+
+
+class ClientImporter:
+    """
+    거래처 정보 대량 가져오기
+
+    사용 예:
+        with open('clients.csv', 'rb') as upload:
+            result = ClientImporter().run(upload, 'clients.csv')
+    """
+
+    UNIQUE_FIELD = 'business_registration_number'
+    REQUIRED_FIELDS = ('company_name', 'representative', 'business_registration_number')
+    TRUE_VALUES = frozenset(['true', '1', 'y', 'yes', 'o', '사용', '예'])
+    FALSE_VALUES = frozenset(['false', '0', 'n', 'no', 'x', '미사용', '아니오', ''])
+    DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y%m%d')
+    # SQLite 파라미터 수 제한을 넘지 않도록 기존 행 조회를 나누는 크기
+    LOOKUP_BATCH = 900
+
+    def __init__(self, chunk_size=2000, dry_run=False):
+        self.chunk_size = max(1, chunk_size)
+        self.dry_run = dry_run
+        # 조회용 정규화 열은 파일에서 받지 않고 저장 직전에 계산
+        self.fields = [
+            field for field in customer_information._meta.concrete_fields
+            if not field.primary_key and field.name not in customer_information.LOOKUP_FIELDS
+        ]
+        self.use_columns(field.name for field in self.fields)
+
+    def use_columns(self, names):
+        """
+        파일에 있는 열로 검증/갱신 대상 설정
+
+        Args:
+            names: 파일 헤더에서 인식한 필드명
+        """
+        present = set(names)
+        self.columns = [field for field in self.fields if field.name in present]
+        # 기존 거래처는 파일에 있는 열(과 그 열에서 계산하는 조회용 열)만 갱신
+        self.update_fields = [field.name for field in self.columns if field.name != self.UNIQUE_FIELD]
+        self.update_fields.extend(
+            lookup_field for lookup_field, (source_field, _) in customer_information.LOOKUP_FIELDS.items()
+            if source_field in present
+        )
+        # 파일에 없는 열은 새 거래처에만 기본값으로 채움
+        self.defaults = {
+            field.name: self.get_converter(field)(field, None)
+            for field in self.fields if field.name not in present
+        }
+
+    # =========================================================================
+    # 파일 읽기
+    # =========================================================================
+
+    @classmethod
+    def get_header_map(cls):
+        """헤더(필드명 또는 폼 레이블, 대소문자/공백 무시) -> 필드명"""
+        from .forms import CustomerInformationForm
+
+        header_map = {}
+        for name, form_field in CustomerInformationForm().fields.items():
+            header_map[name.lower()] = name
+            header_map[str(form_field.label).replace(' ', '').lower()] = name
+        return header_map
+
+    def read_rows(self, file, filename):
+        """
+        (행 번호, {필드명: 값}) 이터레이터 반환
+
+        행 번호는 헤더를 1행으로 센 파일 기준 번호입니다.
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == '.csv':
+            raw_rows = self._read_csv(file)
+        elif extension in ('.xlsx', '.xlsm'):
+            raw_rows = self._read_xlsx(file)
+        else:
+            raise ClientImportError(f"지원하지 않는 파일 형식입니다: {extension or filename}")
+
+        try:
+            header = next(raw_rows)
+        except StopIteration:
+            raise ClientImportError('빈 파일입니다.')
+
+        header_map = self.get_header_map()
+        columns = []
+        for cell in header:
+            key = str(cell or '').replace(' ', '').lower()
+            columns.append(header_map.get(key))
+            if key and key not in header_map:
+                self.result.ignored_columns.append(str(cell))
+
+        missing = [name for name in self.REQUIRED_FIELDS if name not in columns]
+        if missing:
+            raise ClientImportError(f"필수 열이 없습니다: {', '.join(missing)}")
+        self.use_columns(name for name in columns if name)
+
+        for row_number, values in enumerate(raw_rows, start=2):
+            if not any(value not in (None, '') for value in values):
+                continue
+            yield row_number, {field: value for field, value in zip(columns, values) if field}
+
+    @staticmethod
+    def _read_csv(file):
+        if isinstance(file, io.TextIOBase):
+            text = file
+        else:
+            text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        return iter(csv.reader(text))
+
+    @staticmethod
+    def _read_xlsx(file):
+        if openpyxl is None:
+            raise ClientImportError('XLSX 파일을 읽으려면 openpyxl 이 필요합니다.')
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        return workbook.active.iter_rows(values_only=True)
+
+    # =========================================================================
+    # 값 변환 (열 단위)
+    # =========================================================================
+
+    def _convert_char(self, field, value):
+        value = '' if value is None else str(value).strip()
+        if len(value) > field.max_length:
+            raise ValueError(f"{field.max_length}자 이하여야 합니다.")
+        return value
+
+    def _convert_int(self, field, value):
+        if value in (None, ''):
+            return 0
+        if isinstance(value, str):
+            value = value.replace(',', '').strip()
+        try:
+            number = int(float(value))
+        except (TypeError, ValueError):
+            raise ValueError('숫자여야 합니다.')
+        if number < 0:
+            raise ValueError('0 이상이어야 합니다.')
+        return number
+
+    def _convert_bool(self, field, value):
+        if isinstance(value, bool):
+            return value
+        text = '' if value is None else str(value).strip().lower()
+        if text in self.TRUE_VALUES:
+            return True
+        if text in self.FALSE_VALUES:
+            return False
+        raise ValueError('예/아니오(O/X, Y/N, 1/0) 중 하나여야 합니다.')
+
+    def _convert_date(self, field, value):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        text = '' if value is None else str(value).strip()
+        if not text:
+            return date.today()
+        for date_format in self.DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format).date()
+            except ValueError:
+                continue
+        raise ValueError('날짜 형식(YYYY-MM-DD)이 아닙니다.')
+
+    def get_converter(self, field):
+        if isinstance(field, BooleanField):
+            return self._convert_bool
+        if isinstance(field, IntegerField):
+            return self._convert_int
+        if isinstance(field, DateField):
+            return self._convert_date
+        if isinstance(field, CharField):
+            return self._convert_char
+        return lambda field, value: value
+
+    # 필드별 추가 검증 (변환된 값이 비어 있지 않을 때만, 오류 메시지 또는 None 반환)
+    @staticmethod
+    def _check_company_name(value):
+        return '기업명은 최소 2자 이상이어야 합니다.' if len(value) < 2 else None
+
+    @staticmethod
+    def _check_representative(value):
+        if len(value) < 2:
+            return '대표자명은 최소 2자 이상이어야 합니다.'
+        if not validators.REPRESENTATIVE_PATTERN.match(value):
+            return '대표자명은 한글, 영문, 숫자만 입력할 수 있습니다.'
+        return None
+
+    @staticmethod
+    def _check_e_mail(value):
+        return None if validators.EMAIL_PATTERN.match(value) else '유효하지 않은 이메일 주소입니다.'
+
+    @staticmethod
+    def _check_v3_contract_status(value):
+        return None if value in ('O', 'X') else 'V3 계약 상태는 O 또는 X만 입력할 수 있습니다.'
+
+    @staticmethod
+    def _check_company_evaluation(value):
+        return None if value in ('A', 'B', 'C') else '업체 평가는 A, B, C만 입력할 수 있습니다.'
+
+    CHECKS = {
+        'company_name': _check_company_name,
+        'representative': _check_representative,
+        'phone_number': validators.phone_error,
+        'e_mail': _check_e_mail,
+        'v3_contract_status': _check_v3_contract_status,
+        'company_evaluation': _check_company_evaluation,
+    }
+    # 검증 전 정규화
+    NORMALIZERS = {
+        'e_mail': str.lower,
+        'v3_contract_status': str.upper,
+        'company_evaluation': str.upper,
+    }
+
+    # =========================================================================
+    # 검증 및 저장
+    # =========================================================================
+
+    def validate_chunk(self, chunk):
+        """
+        묶음 검증
+
+        행 단위가 아니라 열 단위로 변환기와 검증 함수를 파일에 있는 열에만 적용합니다.
+
+        Returns:
+            list: 검증을 통과한 (행 번호, 값 딕셔너리) 목록
+        """
+        row_numbers = [row_number for row_number, _ in chunk]
+        cleaned = [{} for _ in chunk]
+        failed = set()
+
+        for field in self.columns:
+            name = field.name
+            convert = self.get_converter(field)
+            normalize = self.NORMALIZERS.get(name)
+            check = self.CHECKS.get(name)
+            required = name in self.REQUIRED_FIELDS
+            if name == self.UNIQUE_FIELD:
+                # 검증번호는 열 전체를 한 번에 확인 (오류 메시지는 실패한 행만 생성)
+                brn_valid = validators.validate_brn_batch(
+                    str(raw.get(name) or '') for _, raw in chunk
+                )
+
+            for index, (_, raw) in enumerate(chunk):
+                value = raw.get(name)
+                try:
+                    if normalize is not None and isinstance(value, str):
+                        value = normalize(value)
+                    if name == self.UNIQUE_FIELD and value not in (None, ''):
+                        # 검증번호 확인은 원래 값으로, 저장은 정규화한 값으로
+                        if not brn_valid[index]:
+                            raise ValueError(
+                                validators.brn_error(str(value)) or '유효하지 않은 사업자등록번호입니다.'
+                            )
+                        value = validators.normalize_brn(str(value))
+                    value = convert(field, value)
+                except ValueError as error:
+                    self.result.add_error(row_numbers[index], name, raw.get(name), str(error))
+                    failed.add(index)
+                    continue
+
+                if value in (None, ''):
+                    if required:
+                        self.result.add_error(row_numbers[index], name, value, '필수 항목입니다.')
+                        failed.add(index)
+                elif check is not None:
+                    error = check(value)
+                    if error:
+                        self.result.add_error(row_numbers[index], name, value, error)
+                        failed.add(index)
+                cleaned[index][name] = value
+
+        valid = []
+        seen = {}
+        for index, values in enumerate(cleaned):
+            if index in failed:
+                continue
+            error = self._cross_field_error(values)
+            if error:
+                self.result.add_error(row_numbers[index], '', '', error)
+                continue
+            # 같은 묶음 안에서 사업자등록번호가 겹치면 마지막 행만 저장
+            brn = values[self.UNIQUE_FIELD]
+            if brn in seen:
+                previous = seen[brn]
+                self.result.add_error(
+                    valid[previous][0], self.UNIQUE_FIELD, brn,
+                    f"{row_numbers[index]}행에 같은 사업자등록번호가 있어 이 행은 건너뜁니다."
+                )
+                valid[previous] = (row_numbers[index], values)
+                continue
+            seen[brn] = len(valid)
+            valid.append((row_numbers[index], values))
+        return valid
+
+    @staticmethod
+    def _cross_field_error(values):
+        """폼 전체 검증(CustomerInformationForm.clean)과 같은 규칙 (파일에 있는 열끼리만 확인)"""
+        contract_status = values.get('contract_status')
+        erp_usage = values.get('erp_usage_status')
+        if contract_status == '완료' and erp_usage and '사용' in erp_usage:
+            return '계약이 완료된 경우 ERP 사용 상태가 "사용"일 수 없습니다.'
+        if values.get('v3_contract_status') == 'O' and 'contract_status' in values and not contract_status:
+            return 'V3 계약이 있는 경우 계약 상태를 반드시 입력해야 합니다.'
+        return None
+
+    def save_chunk(self, valid):
+        """검증된 묶음을 사업자등록번호 기준으로 upsert"""
+        brns = [values[self.UNIQUE_FIELD] for _, values in valid]
+        existing = set()
+        for start in range(0, len(brns), self.LOOKUP_BATCH):
+            existing.update(customer_information.objects.filter(
+                business_registration_number__in=brns[start:start + self.LOOKUP_BATCH]
+            ).values_list(self.UNIQUE_FIELD, flat=True))
+
+        if not self.dry_run:
+            try:
+                with transaction.atomic():
+                    objects = [customer_information(**self.defaults, **values) for _, values in valid]
+                    for client in objects:
+                        client.sync_lookup_fields()
+                    customer_information.objects.bulk_create(
+                        objects,
+                        update_conflicts=True,
+                        unique_fields=[self.UNIQUE_FIELD],
+                        update_fields=self.update_fields,
+                    )
+            except DatabaseError as error:
+                import_logger.error(f"거래처 가져오기 저장 오류: {error}")
+                for row_number, _ in valid:
+                    self.result.add_error(row_number, '', '', f"저장 실패: {error}")
+                return
+
+        self.result.updated += len(existing)
+        self.result.created += len(valid) - len(existing)
+
+    def run(self, file, filename):
+        """
+        파일 가져오기 실행
+
+        Returns:
+            ImportResult: 처리 건수와 행별 오류
+
+        Raises:
+            ClientImportError: 파일 형식이 잘못되었거나 필수 열이 없는 경우
+        """
+        self.result = ImportResult()
+        chunk = []
+        for row in self.read_rows(file, filename):
+            self.result.total += 1
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self._process(chunk)
+                chunk = []
+        if chunk:
+            self._process(chunk)
+
+        import_logger.info(
+            f"거래처 가져오기 완료: {filename} - 전체 {self.result.total}, 생성 {self.result.created}, "
+            f"갱신 {self.result.updated}, 건너뜀 {self.result.skipped}"
+        )
+        return self.result
+
+    def _process(self, chunk):
+        valid = self.validate_chunk(chunk)
+        if valid:
+            self.save_chunk(valid)
@@ -0,0 +1,187 @@
+# =============================================================================
+# 비즈니스 관리 시스템 거래처 목록 엔진
+# =============================================================================
+# 설명: 거래처 목록 페이지와 JSON 목록 API 가 함께 쓰는 서버측 필터/페이지 처리
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+거래처 목록 엔진 모듈
+
+전체 거래처를 한 번에 읽지 않고 CustomerInformationSearchForm 의 필터를 적용한 뒤
+(utils.listing.ListEngine 기반)
+(등록일, id) 키셋 페이지네이션으로 필요한 열만 limit 행씩 읽습니다.
+OFFSET 을 쓰지 않으므로 몇 번째 페이지든 인덱스 탐색 한 번으로 처리되어
+테이블 크기와 관계없이 응답 시간이 일정합니다.
+
+주요 기능:
+- 검색/지역/업종/계약 상태 필터 (숫자 검색어는 정규화 열 인덱스 사용)
+- 불투명 커서 기반 키셋 페이지네이션
+- 요청 열만 조회하는 열 선택(projection)
+"""
+
+import base64
+from datetime import date
+from functools import lru_cache
+
+from django.db.models import Q
+
+from utils.listing import ListEngine, ListError
+
+from .forms import CustomerInformationForm, CustomerInformationSearchForm
+from .models import customer_information
+from .validators import DIGITS_AND_HYPHENS, digits_only, fold_name, prefix_range
+
+
+@lru_cache(maxsize=1)
+def _form_labels():
+    """거래처 입력 폼의 필드 레이블 (한 번만 생성)"""
+    return {name: str(field.label) for name, field in CustomerInformationForm().fields.items()}
+
+
+# 잘못된 필터, 커서, 열 요청 (목록 엔진 공용 예외)
+ClientListError = ListError
+
+
+class ClientListEngine(ListEngine):
+    """
+    거래처 목록 엔진
+
+    사용 예:
+        engine = ClientListEngine(request.GET)
+        page = engine.page(cursor=request.GET.get('cursor'))
+        # {'columns': [...], 'results': [...], 'next_cursor': '...' 또는 None, 'has_more': bool}
+    """
+
+    form_class = CustomerInformationSearchForm
+
+    # 목록 화면에서 쓸 수 있는 열 (화면 표시 순서)
+    COLUMNS = (
+        'id', 'registration_date', 'company_name', 'representative', 'business_registration_number',
+        'region', 'division', 'sectors', 'contract_status', 'v3_contract_status',
+        'staff_in_charge', 'phone_number', 'e_mail', 'company_evaluation',
+    )
+    # 기본 표시 열
+    DEFAULT_COLUMNS = (
+        'id', 'registration_date', 'company_name', 'representative', 'business_registration_number',
+        'region', 'sectors', 'contract_status', 'phone_number',
+    )
+    # 커서 생성에 필요해 항상 조회하는 열
+    KEY_COLUMNS = ('registration_date', 'id')
+    # 정확히 일치해야 하는 필터 (검색 폼 필드)
+    EXACT_FILTERS = ('region', 'sectors', 'contract_status')
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+
+    # =========================================================================
+    # 필터
+    # =========================================================================
+
+    def get_base_queryset(self):
+        """등록일 최신순, 같은 날짜는 id 역순"""
+        return customer_information.objects.order_by('-registration_date', '-id')
+
+    def apply_filters(self, queryset, filters):
+        """검색어/지역/업종/계약 상태 필터"""
+        search = filters.get('search')
+        if search:
+            digits = digits_only(search)
+            if digits and DIGITS_AND_HYPHENS.match(search):
+                # 숫자 검색어는 사업자등록번호/전화번호 접두어 (정규화 열 인덱스 범위 조회)
+                lower, upper = prefix_range(digits)
+                queryset = queryset.filter(
+                    Q(brn_digits__gte=lower, brn_digits__lt=upper)
+                    | Q(phone_digits__gte=lower, phone_digits__lt=upper)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(company_name_folded__contains=fold_name(search)) | Q(representative__icontains=search)
+                )
+
+        for name in self.EXACT_FILTERS:
+            if name in filters:
+                queryset = queryset.filter(**{name: filters[name]})
+        return queryset
+
+    # =========================================================================
+    # 열 선택 및 커서
+    # =========================================================================
+
+    def get_columns(self, fields=None):
+        """요청 열 목록 (쉼표 구분 문자열 또는 목록, 없으면 기본 열)"""
+        if not fields:
+            return list(self.DEFAULT_COLUMNS)
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+        unknown = [field for field in fields if field not in self.COLUMNS]
+        if unknown:
+            raise ClientListError(f"지원하지 않는 열입니다: {', '.join(unknown)}")
+        return list(dict.fromkeys(fields))
+
+    @staticmethod
+    def get_labels(columns):
+        """[(열 이름, 화면 레이블), ...] (레이블은 거래처 입력 폼과 같음)"""
+        labels = _form_labels()
+        return [(name, labels.get(name, '번호' if name == 'id' else name)) for name in columns]
+
+    @staticmethod
+    def encode_cursor(row):
+        """마지막 행의 (등록일, id) 를 불투명 커서 문자열로 변환"""
+        raw = f"{row['registration_date'].isoformat()}|{row['id']}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """커서 문자열을 (등록일, id) 로 변환"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            registration_date, pk = raw.split('|')
+            return date.fromisoformat(registration_date), int(pk)
+        except (ValueError, UnicodeDecodeError):
+            raise ClientListError('잘못된 커서입니다.')
+
+    # =========================================================================
+    # 페이지 조회
+    # =========================================================================
+
+    def page(self, cursor=None, limit=None, fields=None):
+        """
+        키셋 페이지 조회
+
+        Args:
+            cursor (str): 이전 페이지의 next_cursor (없으면 첫 페이지)
+            limit (int): 페이지 크기 (최대 MAX_LIMIT)
+            fields (str|list): 조회할 열 (COLUMNS 중 선택)
+
+        Returns:
+            dict: columns, results, next_cursor, has_more
+
+        Raises:
+            ClientListError: 필터, 커서, 열, 페이지 크기가 잘못된 경우
+        """
+        try:
+            limit = min(max(int(limit or self.DEFAULT_LIMIT), 1), self.MAX_LIMIT)
+        except (TypeError, ValueError):
+            raise ClientListError('limit 은 숫자여야 합니다.')
+        columns = self.get_columns(fields)
+        queryset = self.get_queryset()
+
+        if cursor:
+            registration_date, pk = self.decode_cursor(cursor)
+            # 선행 열 범위 조건을 함께 두어 (등록일, id) 인덱스에서 커서 위치로 바로 탐색
+            queryset = queryset.filter(registration_date__lte=registration_date).filter(
+                Q(registration_date__lt=registration_date) | Q(id__lt=pk)
+            )
+
+        select = list(dict.fromkeys([*columns, *self.KEY_COLUMNS]))
+        rows = list(queryset.values(*select)[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = self.encode_cursor(rows[-1]) if has_more else None
+        hidden = [name for name in self.KEY_COLUMNS if name not in columns]
+        for row in rows:
+            for name in hidden:
+                del row[name]
+        return {'columns': columns, 'results': rows, 'next_cursor': next_cursor, 'has_more': has_more}
@@ -0,0 +1,105 @@
+"""
+거래처 사업자등록번호 점검 관리 명령
+
+customer_information 전체를 한 번 읽으면서 검증번호가 틀린 번호와
+하이픈 제거 후 같은 번호(정규화 중복)를 함께 찾습니다.
+
+사용 예:
+    python manage.py audit_brn
+    python manage.py audit_brn --output brn_issues.csv
+    python manage.py audit_brn --strict
+"""
+
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from client_inform import validators
+from client_inform.models import customer_information
+
+
+class Command(BaseCommand):
+    help = '거래처 사업자등록번호의 검증번호 오류와 정규화 후 중복을 점검합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 검증할 행 수')
+        parser.add_argument('--output', help='문제 행을 저장할 CSV 경로')
+        parser.add_argument('--limit', type=int, default=20, help='화면에 출력할 최대 문제 행 수')
+        parser.add_argument('--strict', action='store_true', help='문제가 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        invalid = []
+        # 정규화한 번호 -> [(id, 기업명, 원래 번호), ...]
+        by_digits = {}
+        total = 0
+
+        rows = customer_information.objects.order_by('pk').values_list(
+            'pk', 'company_name', 'business_registration_number'
+        ).iterator(chunk_size=options['batch_size'])
+
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= options['batch_size']:
+                total += self.check_batch(batch, invalid, by_digits)
+                batch = []
+        if batch:
+            total += self.check_batch(batch, invalid, by_digits)
+
+        issues = [
+            {'id': pk, 'company_name': name, 'business_registration_number': value,
+             'issue': 'invalid', 'detail': validators.brn_error(value) or ''}
+            for pk, name, value in invalid
+        ]
+        duplicate_groups = 0
+        for digits, entries in by_digits.items():
+            if len(entries) < 2:
+                continue
+            duplicate_groups += 1
+            ids = ', '.join(str(pk) for pk, _, _ in entries)
+            issues.extend(
+                {'id': pk, 'company_name': name, 'business_registration_number': value,
+                 'issue': 'duplicate', 'detail': f"{digits} (id {ids})"}
+                for pk, name, value in entries
+            )
+        elapsed = time.perf_counter() - started
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8-sig', newline='') as output:
+                writer = csv.DictWriter(
+                    output, fieldnames=['id', 'company_name', 'business_registration_number', 'issue', 'detail']
+                )
+                writer.writeheader()
+                writer.writerows(issues)
+        else:
+            for issue in issues[:options['limit']]:
+                self.stdout.write(
+                    f"  [{issue['issue']}] id={issue['id']} {issue['company_name']} "
+                    f"{issue['business_registration_number']}: {issue['detail']}"
+                )
+            if len(issues) > options['limit']:
+                self.stdout.write(f"  ... 외 {len(issues) - options['limit']}건 (--output 으로 전체 저장)")
+
+        summary = (
+            f"전체 {total}행 - 검증번호 오류 {len(invalid)}건, "
+            f"정규화 중복 {duplicate_groups}그룹 ({elapsed:.1f}초)"
+        )
+        if issues and options['strict']:
+            raise CommandError(summary)
+        style = self.style.WARNING if issues else self.style.SUCCESS
+        self.stdout.write(style(summary))
+
+    @staticmethod
+    def check_batch(batch, invalid, by_digits):
+        """한 묶음의 검증번호를 일괄 확인하고 정규화 번호별로 모음"""
+        values = [value for _, _, value in batch]
+        mask = validators.validate_brn_batch(values)
+        for row, valid in zip(batch, mask):
+            if not valid:
+                invalid.append(row)
+            digits = validators.normalize_brn_digits(row[2])
+            if digits:
+                by_digits.setdefault(digits, []).append(row)
+        return len(batch)
@@ -0,0 +1,55 @@
+"""
+거래처 정보 대량 가져오기 관리 명령
+
+사용 예:
+    python manage.py import_clients clients.xlsx
+    python manage.py import_clients clients.csv --chunk-size 5000 --errors errors.csv
+    python manage.py import_clients clients.csv --dry-run
+"""
+
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from client_inform.importer import ClientImporter, ClientImportError
+
+
+class Command(BaseCommand):
+    help = 'CSV/XLSX 파일의 거래처 정보를 사업자등록번호 기준으로 일괄 저장(upsert)합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='가져올 CSV 또는 XLSX 파일 경로')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='검증/저장 묶음 크기')
+        parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+        parser.add_argument('--errors', help='행별 오류를 저장할 CSV 경로')
+
+    def handle(self, *args, **options):
+        importer = ClientImporter(chunk_size=options['chunk_size'], dry_run=options['dry_run'])
+        started = time.perf_counter()
+        try:
+            with open(options['path'], 'rb') as source:
+                result = importer.run(source, options['path'])
+        except (ClientImportError, OSError) as error:
+            raise CommandError(str(error))
+        elapsed = time.perf_counter() - started
+
+        if result.ignored_columns:
+            self.stdout.write(self.style.WARNING(f"인식하지 못한 열: {', '.join(result.ignored_columns)}"))
+
+        if options['errors'] and result.errors:
+            with open(options['errors'], 'w', encoding='utf-8-sig', newline='') as errors_file:
+                writer = csv.DictWriter(errors_file, fieldnames=['row', 'field', 'value', 'message'])
+                writer.writeheader()
+                writer.writerows(result.errors)
+        else:
+            for error in result.errors[:20]:
+                self.stdout.write(f"  {error['row']}행 {error['field']}: {error['message']}")
+            if len(result.errors) > 20:
+                self.stdout.write(f"  ... 외 {len(result.errors) - 20}건 (--errors 로 전체 저장)")
+
+        prefix = '[검증만] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}전체 {result.total}행 - 생성 {result.created}, 갱신 {result.updated}, "
+            f"건너뜀 {result.skipped} ({elapsed:.1f}초)"
+        ))
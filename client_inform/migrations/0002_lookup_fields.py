@@ -0,0 +1,77 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:40
+
+from django.db import migrations, models
+
+from client_inform.validators import digits_only, fold_name
+
+
+BACKFILL_BATCH = 2000
+
+
+def backfill_lookup_fields(apps, schema_editor):
+    """
+    기존 거래처의 조회용 정규화 열 채우기 (인덱스 생성 전에 실행)
+
+    bulk_update 의 CASE WHEN 문은 행이 많으면 느려서 (10만 행 약 50초)
+    행별 UPDATE 를 executemany 로 묶어 실행합니다 (약 2초).
+    """
+    customer_information = apps.get_model('client_inform', 'customer_information')
+    connection = schema_editor.connection
+    quote_name = connection.ops.quote_name
+    sql = (
+        f"UPDATE {quote_name(customer_information._meta.db_table)} "
+        f"SET brn_digits = %s, phone_digits = %s, company_name_folded = %s WHERE id = %s"
+    )
+    rows = customer_information.objects.using(connection.alias).values_list(
+        'pk', 'business_registration_number', 'phone_number', 'company_name'
+    ).iterator(chunk_size=BACKFILL_BATCH)
+
+    with connection.cursor() as cursor:
+        batch = []
+        for pk, business_registration_number, phone_number, company_name in rows:
+            batch.append((
+                digits_only(business_registration_number), digits_only(phone_number), fold_name(company_name), pk
+            ))
+            if len(batch) >= BACKFILL_BATCH:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('client_inform', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer_information',
+            name='brn_digits',
+            field=models.CharField(blank=True, default='', editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='customer_information',
+            name='company_name_folded',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='customer_information',
+            name='phone_digits',
+            field=models.CharField(blank=True, default='', editable=False, max_length=50),
+        ),
+        migrations.RunPython(backfill_lookup_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='customer_information',
+            index=models.Index(fields=['brn_digits'], name='client_brn_digits_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer_information',
+            index=models.Index(fields=['phone_digits'], name='client_phone_digits_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer_information',
+            index=models.Index(fields=['company_name_folded'], name='client_name_folded_idx'),
+        ),
+    ]
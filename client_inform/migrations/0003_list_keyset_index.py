@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('client_inform', '0002_lookup_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer_information',
+            index=models.Index(fields=['-registration_date', '-id'], name='client_reg_date_id_idx'),
+        ),
+    ]
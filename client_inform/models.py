@@ -16,10 +16,13 @@ customer_information 모델은 거래처의 모든 주요 정보를 저장합니
 - 거래처 기본 정보 저장 (기업명, 대표자, 사업자등록번호 등)
 - 비즈니스 정보 저장 (업종, 매출, 계약 상태 등)
 - 시스템 정보 저장 (ERP 사용 여부, 담당자 등)
+- 조회용 정규화 열 (숫자만 남긴 사업자등록번호/전화번호, 접은 기업명) 및 인덱스
 """
 
 # Django 데이터베이스 모델 임포트
 from django.db import models
+# 미리 컴파일한 검증 정규식 임포트
+from .validators import DIGITS_AND_HYPHENS, EMAIL_PATTERN, digits_only, fold_name
 
 class customer_information(models.Model):
     """
@@ -52,7 +55,17 @@ class customer_information(models.Model):
         groupware (Boolean): 그룹웨어 사용 여부
         company_evaluation (Char): 업체 평가
         note (Char): 비고/메모
+        brn_digits (Char): 숫자만 남긴 사업자등록번호 (조회용, 자동 갱신)
+        phone_digits (Char): 숫자만 남긴 전화번호 (조회용, 자동 갱신)
+        company_name_folded (Char): 대소문자/공백을 접은 기업명 (조회용, 자동 갱신)
     """
+
+    # 원본 필드에서 계산되는 조회용 열 (조회 열 -> (원본 필드, 정규화 함수))
+    LOOKUP_FIELDS = {
+        'brn_digits': ('business_registration_number', digits_only),
+        'phone_digits': ('phone_number', digits_only),
+        'company_name_folded': ('company_name', fold_name),
+    }
     
     # =============================================================================
     # 기본 정보 필드들
@@ -147,6 +160,18 @@ class customer_information(models.Model):
     # 비고 또는 추가 메모 (자유 형식 메모)
     note = models.CharField(max_length=200)
 
+    # =============================================================================
+    # 조회용 정규화 열 (save 및 대량 가져오기에서 자동 갱신, 직접 수정하지 않음)
+    # =============================================================================
+    # 하이픈 등을 제거한 사업자등록번호 (정확/접두어 조회)
+    brn_digits = models.CharField(max_length=32, blank=True, default='', editable=False)
+    
+    # 숫자만 남긴 전화번호 (정확/접두어 조회)
+    phone_digits = models.CharField(max_length=50, blank=True, default='', editable=False)
+    
+    # 대소문자/공백을 접은 기업명 (NFKC 정규화로 길이가 늘 수 있어 원본보다 길게)
+    company_name_folded = models.CharField(max_length=100, blank=True, default='', editable=False)
+
     # =============================================================================
     # 모델 메타데이터 클래스
     # =============================================================================
@@ -172,6 +197,15 @@ class customer_information(models.Model):
                 name='unique_business_registration_number'
             )  # 사업자등록번호 고유 제약 조건
         ]
+        
+        # 조회용 정규화 열 B-tree 인덱스 (정확 일치 및 범위/접두어 조회)
+        indexes = [
+            models.Index(fields=['brn_digits'], name='client_brn_digits_idx'),
+            models.Index(fields=['phone_digits'], name='client_phone_digits_idx'),
+            models.Index(fields=['company_name_folded'], name='client_name_folded_idx'),
+            # 목록 키셋 페이지네이션 (등록일 최신순, 같은 날짜는 id 역순)
+            models.Index(fields=['-registration_date', '-id'], name='client_reg_date_id_idx'),
+        ]
 
     def __str__(self):
         """
@@ -197,15 +231,12 @@ class customer_information(models.Model):
         # 사업자등록번호 형식 검증 (간단한 검증)
         if self.business_registration_number:
             # 숫자와 하이픈만 허용
-            import re
-            if not re.match(r'^[\d-]+$', self.business_registration_number):
+            if not DIGITS_AND_HYPHENS.match(self.business_registration_number):
                 raise ValidationError('사업자등록번호는 숫자와 하이픈만 포함할 수 있습니다.')
         
         # 이메일 형식 검증
         if self.e_mail:
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, self.e_mail):
+            if not EMAIL_PATTERN.match(self.e_mail):
                 raise ValidationError('유효하지 않은 이메일 주소입니다.')
         
         # 종업원수와 매출액은 음수일 수 없음
@@ -239,8 +270,23 @@ class customer_information(models.Model):
             if value:
                 setattr(self, field, value.strip())
         
+        # 조회용 정규화 열 갱신 (update_fields 로 일부만 저장할 때도 함께 저장)
+        self.sync_lookup_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | set(self.LOOKUP_FIELDS)
+        
         super().save(*args, **kwargs)  # 실제 저장 실행
 
+    def sync_lookup_fields(self):
+        """
+        조회용 정규화 열을 원본 필드 값으로 갱신
+        
+        save() 를 거치지 않는 bulk_create/bulk_update 전에 직접 호출해야 합니다.
+        """
+        for lookup_field, (source_field, normalize) in self.LOOKUP_FIELDS.items():
+            setattr(self, lookup_field, normalize(getattr(self, source_field)))
+
     # =============================================================================
     # 프로퍼티 메서드들
     # =============================================================================
@@ -1,5 +1,10 @@
 window.onload = function()
 {
+    // 탭 메뉴가 없는 페이지(거래처 목록 페이지)에서는 실행하지 않음.
+    if (!document.getElementById("depart")) {
+        return;
+    }
+
     // 시작 할 때 바로 실행 되는 code
     document.getElementById("depart").innerHTML = "신사업 본부";
 
@@ -276,4 +281,78 @@ function create_vaccine_table()
         table_data.push(temp);
         table.innerHTML += temp;
     }
-}
\ No newline at end of file
+}
+// =============================================================================
+// 거래처 목록 지연 로딩 (client_list JSON, 키셋 페이지네이션)
+// =============================================================================
+// 첫 페이지는 서버에서 렌더링되고, 목록 끝(sentinel)이 화면에 보이면 다음 페이지를 불러옴.
+var client_list_loading = false;
+
+// 다음 페이지를 불러와 표에 행을 추가.
+function load_more_clients()
+{
+    var table = document.getElementById("client-table");
+    var sentinel = document.getElementById("client-list-sentinel");
+    var cursor = table.dataset.nextCursor;
+    if (!cursor || client_list_loading) {
+        return;
+    }
+    client_list_loading = true;
+    sentinel.innerText = "불러오는 중...";
+
+    // 현재 검색 조건 + 커서 + 표시 열
+    var params = new URLSearchParams(new FormData(document.getElementById("client-filters")));
+    params.set("cursor", cursor);
+    params.set("fields", table.dataset.columns);
+
+    fetch(table.dataset.url + "?" + params.toString(), {headers: {"Accept": "application/json"}})
+        .then(function(response) {
+            if (!response.ok) {
+                throw new Error(response.status);
+            }
+            return response.json();
+        })
+        .then(function(page) {
+            var body = table.tBodies[0];
+            page.results.forEach(function(client) {
+                var tr = document.createElement("tr");
+                page.columns.forEach(function(name) {
+                    var td = document.createElement("td");
+                    // innerText 로 넣어 HTML 이 해석되지 않도록 함.
+                    td.innerText = client[name] === null ? "" : client[name];
+                    tr.appendChild(td);
+                });
+                body.appendChild(tr);
+            });
+            table.dataset.nextCursor = page.next_cursor || "";
+            sentinel.innerText = page.has_more ? "" : "마지막 거래처입니다.";
+        })
+        .catch(function() {
+            sentinel.innerText = "목록을 불러오지 못했습니다.";
+        })
+        .finally(function() {
+            client_list_loading = false;
+        });
+}
+
+// 목록 끝이 보이면 다음 페이지 로드.
+document.addEventListener("DOMContentLoaded", function()
+{
+    var sentinel = document.getElementById("client-list-sentinel");
+    if (!sentinel || !document.getElementById("client-table")) {
+        return;
+    }
+    if ("IntersectionObserver" in window) {
+        new IntersectionObserver(function(entries) {
+            if (entries[0].isIntersecting) {
+                load_more_clients();
+            }
+        }, {rootMargin: "400px"}).observe(sentinel);
+    } else {
+        window.addEventListener("scroll", function() {
+            if (sentinel.getBoundingClientRect().top < window.innerHeight + 400) {
+                load_more_clients();
+            }
+        });
+    }
+});
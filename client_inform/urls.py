@@ -21,4 +21,10 @@ urlpatterns = [
     # 뷰 함수: views.index
     # 이름: 'index' (템플릿에서 URL 역참에 사용)
     path('', views.index, name='index'),
+    
+    # 거래처 목록 JSON (키셋 페이지네이션, 스크롤 지연 로딩)
+    # URL: /client_inform/list/?cursor=...&search=...
+    # 뷰 함수: views.client_list
+    # 이름: 'client_list'
+    path('list/', views.client_list, name='client_list'),
 ]
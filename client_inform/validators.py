@@ -0,0 +1,197 @@
+# =============================================================================
+# 비즈니스 관리 시스템 거래처 정보 검증 모듈
+# =============================================================================
+# 설명: 거래처 정보 폼, 모델, 대량 가져오기가 함께 쓰는 검증 함수를 정의
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+거래처 정보 검증 모듈
+
+정규식은 모듈 로드 시 한 번만 컴파일하며, 폼(CustomerInformationForm),
+모델(customer_information.clean) 과 대량 가져오기(importer) 가 같은 규칙을 사용합니다.
+
+주요 기능:
+- 사업자등록번호 형식/검증번호 확인 및 정규화
+- 사업자등록번호 일괄 검증 (NumPy 가 있으면 벡터 연산, 없으면 순수 파이썬)
+- 전화번호, 이메일, 대표자명 형식 확인
+- 조회용 정규화 값 생성 (숫자만 남긴 번호, 대소문자/공백을 접은 기업명)
+"""
+
+import re
+import unicodedata
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# =============================================================================
+# 미리 컴파일한 정규식
+# =============================================================================
+DIGITS_AND_HYPHENS = re.compile(r'^[\d-]+$')
+NON_DIGITS = re.compile(r'[^0-9]')
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+REPRESENTATIVE_PATTERN = re.compile(r'^[가-힣a-zA-Z0-9\s]+$')
+
+# 사업자등록번호(10자리) 검증 가중치 (국세청 검증번호 산식)
+BRN_WEIGHTS = (1, 3, 7, 1, 3, 7, 1, 3, 5)
+# 12자리 번호 검증 가중치
+BRN_12_WEIGHTS = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 5, 7)
+
+
+# 숫자 문자 바이트(ord('0') = 48)에 가중치를 곱한 합에서 빼 줄 보정값
+_BRN_OFFSET = 48 * sum(BRN_WEIGHTS)
+# 이 크기 이상일 때만 NumPy 사용 (작은 묶음은 배열 변환 비용이 더 큼)
+NUMPY_MIN_BATCH = 1000
+
+
+def normalize_brn_digits(value):
+    """사업자등록번호에서 하이픈과 앞뒤 공백을 제거한 문자열"""
+    return (value or '').replace('-', '').strip()
+
+
+def validate_brn_10(digits):
+    """
+    10자리 사업자등록번호 검증번호 확인
+
+    앞 9자리에 가중치를 곱해 더하고, 9번째 자리 x 5 의 십의 자리를 더한 합으로
+    마지막 자리(검증번호)를 계산합니다.
+
+    Args:
+        digits (str): 하이픈을 제거한 10자리 숫자 문자열
+    """
+    if len(digits) != 10 or not (digits.isascii() and digits.isdigit()):
+        return False
+    codes = digits.encode('ascii')
+    total = sum(map(mul, codes, BRN_WEIGHTS)) - _BRN_OFFSET + (codes[8] - 48) * 5 // 10
+    return (10 - total % 10) % 10 == codes[9] - 48
+
+
+def validate_brn_12(digits):
+    """12자리 번호 검증번호 확인"""
+    if len(digits) != 12 or not (digits.isascii() and digits.isdigit()):
+        return False
+    total = sum(int(digit) * weight for digit, weight in zip(digits, BRN_12_WEIGHTS))
+    return (11 - total % 11) % 10 == int(digits[11])
+
+
+def _brn_10_mask_numpy(digit_strings):
+    """10자리 검증번호 일괄 확인 (NumPy 벡터 연산)"""
+    count = len(digit_strings)
+    well_formed = np.fromiter(
+        (len(digits) == 10 and digits.isascii() and digits.isdigit() for digits in digit_strings),
+        dtype=bool, count=count,
+    )
+    joined = ''.join(
+        digits if ok else '0000000000' for digits, ok in zip(digit_strings, well_formed)
+    ).encode('ascii')
+    matrix = np.frombuffer(joined, dtype=np.uint8).reshape(count, 10).astype(np.int32) - 48
+    total = matrix[:, :9] @ np.array(BRN_WEIGHTS, dtype=np.int32) + matrix[:, 8] * 5 // 10
+    return (well_formed & ((10 - total % 10) % 10 == matrix[:, 9])).tolist()
+
+
+def validate_brn_batch(values, use_numpy=None):
+    """
+    사업자등록번호 일괄 검증
+
+    하이픈을 제거한 뒤 10자리는 국세청 산식, 12자리는 12자리 산식으로 확인합니다.
+    그 외 길이나 숫자가 아닌 값은 False 입니다.
+
+    Args:
+        values (iterable): 사업자등록번호 문자열 (None 허용)
+        use_numpy (bool): None 이면 NumPy 가 있고 NUMPY_MIN_BATCH 이상일 때 사용
+
+    Returns:
+        list: 행별 유효 여부 (입력 순서와 같음)
+    """
+    digit_strings = [normalize_brn_digits(value) for value in values]
+    if use_numpy is None:
+        use_numpy = np is not None and len(digit_strings) >= NUMPY_MIN_BATCH
+    if use_numpy and np is None:
+        raise ImportError('NumPy 가 설치되어 있지 않습니다.')
+
+    if use_numpy:
+        mask = _brn_10_mask_numpy(digit_strings)
+    else:
+        mask = [validate_brn_10(digits) for digits in digit_strings]
+
+    # 12자리 번호는 드물어 개별 확인
+    for index, digits in enumerate(digit_strings):
+        if len(digits) == 12:
+            mask[index] = validate_brn_12(digits)
+    return mask
+
+
+def brn_error(value):
+    """
+    사업자등록번호 오류 메시지 반환 (올바르면 None)
+
+    폼과 대량 가져오기가 같은 메시지를 쓰도록 한 곳에서 검사합니다.
+    """
+    value = (value or '').strip()
+    if not value:
+        return '사업자등록번호에 내용이 포함되어야 합니다.'
+    if not DIGITS_AND_HYPHENS.match(value):
+        return '사업자등록번호는 숫자와 하이픈만 포함할 수 있습니다.'
+    digits = normalize_brn_digits(value)
+    if len(digits) == 10:
+        valid = validate_brn_10(digits)
+    elif len(digits) == 12:
+        valid = validate_brn_12(digits)
+    else:
+        return '사업자등록번호는 10자 또는 12자여야 합니다.'
+    return None if valid else '유효하지 않은 사업자등록번호입니다.'
+
+
+def normalize_brn(value):
+    """사업자등록번호를 저장 형식으로 정규화 (10자리는 XXX-XX-XXXXX, 그 외는 숫자만)"""
+    digits = normalize_brn_digits(value)
+    if len(digits) == 10:
+        return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+    return digits
+
+
+def phone_error(value):
+    """전화번호 오류 메시지 반환 (올바르면 None)"""
+    value = (value or '').strip()
+    if not DIGITS_AND_HYPHENS.match(value):
+        return '전화번호는 숫자와 하이픈만 포함할 수 있습니다.'
+    digits = value.replace('-', '')
+    if len(digits) < 10 or len(digits) > 15:
+        return '전화번호는 10자에서 15자 사이여야 합니다.'
+    if digits.startswith('010'):
+        if len(digits) != 11:
+            return '휴대폰 번호는 11자여야 합니다.'
+    elif digits.startswith('02'):
+        if len(digits) not in (10, 11):
+            return '지역번호는 10자 또는 11자여야 합니다.'
+    elif len(digits) != 10:
+        return '일반 번호는 10자여야 합니다.'
+    return None
+
+
+# =============================================================================
+# 조회용 정규화 (customer_information 의 조회 열)
+# =============================================================================
+
+def digits_only(value):
+    """숫자만 남긴 문자열 (사업자등록번호/전화번호 조회 열)"""
+    return NON_DIGITS.sub('', value or '')
+
+
+def fold_name(value):
+    """NFKC 정규화 후 대소문자와 공백을 접은 문자열 (기업명 조회 열)"""
+    return ''.join(unicodedata.normalize('NFKC', value or '').casefold().split())
+
+
+def prefix_range(prefix):
+    """
+    접두어 검색용 (이상, 미만) 범위
+
+    LIKE 'x%' 는 DB 콜레이션에 따라 인덱스를 타지 않을 수 있으므로
+    column >= prefix AND column < 다음 접두어 형태의 범위 조건으로 B-tree 인덱스를 탑니다.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -6,17 +6,29 @@
 # 버전: 1.0.0
 # =============================================================================
 
+# 표준 라이브러리 임포트
+from datetime import date
 # Django 렌더링 함수 임포트
 from django.shortcuts import render
-# 현재 앱의 모델 임포트
-from .models import customer_information
+# HTTP 메서드 제한 데코레이터 임포트
+from django.views.decorators.http import require_GET
+# JSON 렌더러 임포트 (orjson 이 있으면 사용)
+from utils.renderers import render_json_response
+# 거래처 목록 엔진 임포트
+from .listing import ClientListEngine, ClientListError
+
+def _display(value):
+    """표시 값 (날짜는 JSON 목록과 같은 ISO 형식)"""
+    return value.isoformat() if isinstance(value, date) else value
+
 
 def index(request):
     """
     거래처 관리 메인 페이지 뷰 함수
     
     거래처 정보 관리 메인 페이지를 렌더링합니다.
-    모든 거래처 목록을 등록일 최신순으로 표시합니다.
+    첫 페이지(키셋 페이지 한 개)만 서버에서 렌더링하고, 나머지는
+    client_inform.js 가 스크롤에 따라 client_list JSON 을 이어서 불러옵니다.
     
     Args:
         request (HttpRequest): 클라이언트의 HTTP 요청 객체
@@ -25,21 +37,56 @@ def index(request):
         HttpResponse: 렌더링된 거래처 관리 페이지 HTML 응답
         
     Description:
-        - 거래처 관리 메인 페이지를 렌더링
-        - 모든 거래처 목록을 데이터베이스에서 조회
-        - 등록일 기준 내림차순 정렬 (최신순)
-        - 거래처 정보 템플릿에 데이터 전달
-        - 검색, 필터링, 정렬 기능 지원
-        
-    Database Query:
-        - customer_information.objects.all(): 모든 거래처 레코드 조회
-        - order_by('-registration_date'): 등록일 내림차순 정렬
+        - 검색 폼(CustomerInformationSearchForm) 필터 적용 (search, region, sectors, contract_status)
+        - 등록일 최신순, 기본 표시 열만 조회
+        - 전체 행 수와 관계없이 limit 행만 읽으므로 첫 응답 시간이 일정
         
     Template Context:
-        - clients: 정렬된 거래처 목록 객체
+        - form: 검색 폼
+        - columns: [(열 이름, 레이블), ...] 표시 열 목록
+        - clients: 첫 페이지 거래처 목록 (열 순서의 값 목록)
+        - next_cursor: 다음 페이지 커서 (없으면 None)
+        - error: 필터 오류 메시지
+    """
+    engine = ClientListEngine(request.GET)
+    try:
+        page = engine.page()
+        error = None
+    except ClientListError as e:
+        page = {'columns': engine.get_columns(), 'results': [], 'next_cursor': None, 'has_more': False}
+        error = str(e)
+    
+    # 거래처 관리 템플릿에 첫 페이지 데이터를 전달하여 렌더링
+    return render(request, 'client_inform.html', {
+        'form': engine.form,
+        'columns': engine.get_labels(page['columns']),
+        'clients': [[_display(row[name]) for name in page['columns']] for row in page['results']],
+        'next_cursor': page['next_cursor'],
+        'error': error,
+    })
+
+
+@require_GET
+def client_list(request):
     """
-    # 모든 거래처를 데이터베이스에서 조회하여 등록일 최신순으로 정렬
-    clients = customer_information.objects.all().order_by('-registration_date')
+    거래처 목록 JSON 뷰 함수 (스크롤 지연 로딩용)
     
-    # 거래처 관리 템플릿에 거래처 목록 데이터를 전달하여 렌더링
-    return render(request, 'client_inform.html', {'clients': clients})
+    Query Parameters:
+        - search, region, sectors, contract_status: 검색 폼 필터
+        - cursor: 이전 응답의 next_cursor
+        - limit: 페이지 크기 (기본 50, 최대 200)
+        - fields: 쉼표로 구분한 조회 열
+        
+    Returns:
+        HttpResponse: {'columns', 'results', 'next_cursor', 'has_more'} JSON (오류 시 400 과 {'error'})
+    """
+    engine = ClientListEngine(request.GET)
+    try:
+        page = engine.page(
+            cursor=request.GET.get('cursor'),
+            limit=request.GET.get('limit'),
+            fields=request.GET.get('fields'),
+        )
+    except ClientListError as e:
+        return render_json_response({'error': str(e)}, status=400)
+    return render_json_response(page)
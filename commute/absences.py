@@ -0,0 +1,292 @@
+# =============================================================================
+# 비즈니스 관리 시스템 휴가/출장 일정
+# =============================================================================
+# 설명: 휴가/출장 신청의 기간 겹침 검사, 결재 상태 변경, 팀 월간 달력
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+휴가/출장 일정 모듈
+
+신청 기간 겹침은 기존 신청을 하나씩 비교하지 않습니다. 검사 창과 겹치는 휴가, 출장, 근무 스케줄을
+원본별 범위 쿼리 한 번씩((user, start_date, end_date) 인덱스)으로 읽어 사용자별 IntervalIndex 를 만들고,
+각 신청 기간은 정렬된 시작일 배열에서 bisect 로 후보만 잘라 확인합니다.
+팀 월간 달력도 팀원 목록 한 번, 원본별로 그 달과 겹치는 범위 쿼리 한 번씩으로 만듭니다.
+
+차단 기준:
+    - 휴가/출장은 같은 사용자의 신청/승인 상태 휴가/출장과 겹칠 수 없습니다.
+    - 휴가는 휴일이 아닌 근무 스케줄이 잡힌 날과 겹칠 수 없습니다 (스케줄을 먼저 조정).
+
+주요 기능:
+- 날짜 구간 색인 (IntervalIndex)
+- 겹침 검사 후 저장 (같은 사용자의 동시 신청은 사용자 행 잠금으로 직렬화)
+- 승인/반려/취소 상태 변경
+- 팀 월간 달력 (일정 목록, 일자별 휴가/출장 인원)
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from business_management.business_calendar import BusinessCalendar
+
+from .models import BusinessTrip, LeaveRequest, WorkSchedule
+
+
+class AbsenceError(ValueError):
+    """처리할 수 없는 휴가/출장 요청"""
+
+
+class AbsenceConflict(AbsenceError):
+    """기존 일정과 겹치는 신청 (conflicts 에 겹치는 일정 목록)"""
+
+    def __init__(self, conflicts):
+        super().__init__('신청 기간이 기존 일정과 겹칩니다.')
+        self.conflicts = conflicts
+
+
+# 신청 종류 -> 모델
+REQUEST_MODELS = {'leave': LeaveRequest, 'trip': BusinessTrip}
+KIND_OF = {model: kind for kind, model in REQUEST_MODELS.items()}
+# 일정 표시 이름 열
+LABEL_FIELDS = {'leave': 'leave_type', 'trip': 'destination'}
+LEAVE_TYPES = dict(LeaveRequest._meta.get_field('leave_type').choices)
+SCHEDULE_TYPES = dict(WorkSchedule._meta.get_field('schedule_type').choices)
+
+# 상태 변경 처리 -> (바뀔 상태, 처리할 수 있는 현재 상태)
+TRANSITIONS = {
+    'approve': ('approved', ('pending',)),
+    'reject': ('rejected', ('pending',)),
+    'cancel': ('cancelled', ('pending', 'approved')),
+}
+
+
+class IntervalIndex:
+    """
+    닫힌 날짜 구간 [start, end] 색인
+
+    구간을 시작일로 정렬하고 가장 긴 구간 길이 L 을 기억해 둡니다. [s, e] 와 겹치는 구간은
+    시작일이 s - L 이상 e 이하인 구간 중 종료일이 s 이상인 것뿐이므로 bisect 두 번으로 후보를 자릅니다.
+
+    사용 예:
+        index = IntervalIndex([{'start': date(2024, 5, 1), 'end': date(2024, 5, 3), ...}, ...])
+        index.overlapping(date(2024, 5, 2), date(2024, 5, 2))  # [{...}]
+    """
+
+    def __init__(self, entries=()):
+        self.entries = sorted(entries, key=lambda entry: (entry['start'], entry['end']))
+        self.starts = [entry['start'] for entry in self.entries]
+        self.span = max((entry['end'] - entry['start'] for entry in self.entries), default=timedelta(0))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def overlapping(self, start, end):
+        """[start, end] 와 겹치는 구간 (시작일 순)"""
+        low = bisect_left(self.starts, start - self.span)
+        high = bisect_right(self.starts, end)
+        return [entry for entry in self.entries[low:high] if entry['end'] >= start]
+
+
+def request_entries(model, start, end, user_ids=None):
+    """
+    [start, end] 와 겹치는 신청/승인 상태 휴가 또는 출장 (범위 쿼리 한 번)
+
+    user_ids 가 None 이면 전체 사용자입니다.
+    """
+    kind = KIND_OF[model]
+    queryset = model.active_between(start, end).order_by()
+    if user_ids is not None:
+        queryset = queryset.filter(user_id__in=user_ids)
+    rows = queryset.values_list('pk', 'user_id', 'start_date', 'end_date', 'status', LABEL_FIELDS[kind])
+    return [
+        {
+            'kind': kind, 'id': pk, 'user_id': user_id, 'start': start_date, 'end': end_date, 'status': status,
+            'label': LEAVE_TYPES.get(label, label) if kind == 'leave' else label,
+        }
+        for pk, user_id, start_date, end_date, status, label in rows
+    ]
+
+
+def schedule_entries(start, end, user_ids=None):
+    """[start, end] 의 근무 스케줄 (범위 쿼리 한 번, 하루짜리 구간)"""
+    queryset = WorkSchedule.objects.filter(work_date__gte=start, work_date__lte=end).order_by()
+    if user_ids is not None:
+        queryset = queryset.filter(user_id__in=user_ids)
+    rows = queryset.values_list('pk', 'user_id', 'work_date', 'schedule_type', 'is_holiday')
+    return [
+        {
+            'kind': 'schedule', 'id': pk, 'user_id': user_id, 'start': work_date, 'end': work_date,
+            'label': SCHEDULE_TYPES.get(schedule_type, schedule_type), 'is_holiday': is_holiday,
+        }
+        for pk, user_id, work_date, schedule_type, is_holiday in rows
+    ]
+
+
+class ConflictChecker:
+    """
+    신청 기간 겹침 검사
+
+    [start, end] 창 안의 휴가/출장/근무 스케줄을 한 번 읽어 사용자별 IntervalIndex 로 만들어 두므로
+    같은 창 안의 신청 여러 건을 추가 쿼리 없이 검사할 수 있습니다.
+
+    사용 예:
+        checker = ConflictChecker([user.pk], date(2024, 5, 1), date(2024, 5, 31))
+        checker.conflicts(user.pk, 'leave', date(2024, 5, 2), date(2024, 5, 3))  # [{'kind': 'trip', ...}]
+    """
+
+    def __init__(self, user_ids, start, end):
+        grouped = {}
+        entries = [
+            *request_entries(LeaveRequest, start, end, user_ids),
+            *request_entries(BusinessTrip, start, end, user_ids),
+            *schedule_entries(start, end, user_ids),
+        ]
+        for entry in entries:
+            grouped.setdefault(entry['user_id'], []).append(entry)
+        self.indexes = {user_id: IntervalIndex(items) for user_id, items in grouped.items()}
+
+    @staticmethod
+    def blocks(kind, entry):
+        """entry 가 kind 신청을 막는지 (근무 스케줄은 휴가만, 휴일 스케줄은 막지 않음)"""
+        if entry['kind'] == 'schedule':
+            return kind == 'leave' and not entry['is_holiday']
+        return True
+
+    def conflicts(self, user_id, kind, start, end, exclude=None):
+        """
+        겹치는 일정 목록
+
+        Args:
+            exclude (tuple): 검사에서 뺄 (종류, id) - 수정 중인 신청 자신
+        """
+        index = self.indexes.get(user_id)
+        if index is None:
+            return []
+        return [
+            entry for entry in index.overlapping(start, end)
+            if (entry['kind'], entry['id']) != exclude and self.blocks(kind, entry)
+        ]
+
+
+def save_request(instance):
+    """
+    겹침 검사 후 휴가/출장 신청 저장
+
+    신청자 행을 잠근 채 검사하고 저장하므로 같은 사용자가 동시에 겹치는 신청을 보내도 하나만 저장됩니다.
+
+    Raises:
+        AbsenceConflict: 기존 일정과 겹칠 때
+    """
+    kind = KIND_OF[type(instance)]
+    with transaction.atomic():
+        list(get_user_model().objects.select_for_update().filter(pk=instance.user_id).values_list('pk', flat=True))
+        if instance.is_active:
+            checker = ConflictChecker([instance.user_id], instance.start_date, instance.end_date)
+            conflicts = checker.conflicts(
+                instance.user_id, kind, instance.start_date, instance.end_date,
+                exclude=None if instance.pk is None else (kind, instance.pk),
+            )
+            if conflicts:
+                raise AbsenceConflict(conflicts)
+        instance.save()
+    return instance
+
+
+def change_status(instance, action, actor):
+    """
+    승인/반려/취소 처리
+
+    Args:
+        action (str): approve | reject | cancel
+        actor (User): 처리자 (승인/반려 시 결재자로 기록)
+    """
+    if action not in TRANSITIONS:
+        raise AbsenceError('action 은 approve, reject, cancel 중 하나여야 합니다.')
+    status, allowed = TRANSITIONS[action]
+    if instance.status not in allowed:
+        raise AbsenceError(f'{instance.get_status_display()} 상태에서는 처리할 수 없습니다.')
+    instance.status = status
+    if action != 'cancel':
+        instance.approver = actor
+        instance.decided_at = timezone.now()
+    instance.save(update_fields=['status', 'approver', 'decided_at', 'updated_at'])
+    return instance
+
+
+class TeamCalendar:
+    """
+    팀 월간 달력
+
+    팀원 목록 한 번, 원본(휴가, 출장, 근무 스케줄)별로 그 달과 겹치는 범위 쿼리 한 번씩만 실행합니다.
+    일자별 휴가/출장 인원은 구간 시작/끝 차분 배열을 누적해 계산합니다.
+
+    사용 예:
+        calendar = TeamCalendar(MonthlyAttendance.from_string('2024-05'), department='개발팀')
+        calendar.build()  # {'members': [...], 'events': [...], 'days': [...]}
+    """
+
+    COUNTED_KINDS = ('leave', 'trip')
+
+    def __init__(self, month, department=None):
+        """
+        Args:
+            month (MonthlyAttendance): 대상 월
+            department (str): 부서 (None 이면 전체 활성 사용자)
+        """
+        self.month = month
+        self.department = department
+
+    def members(self):
+        """팀원 {user_id: username}"""
+        if self.department is None:
+            return dict(get_user_model().objects.filter(is_active=True).values_list('pk', 'username'))
+        from login.models import UserProfile
+        return dict(
+            UserProfile.objects.filter(department=self.department, user__is_active=True)
+            .values_list('user_id', 'user__username')
+        )
+
+    def build(self):
+        first, last = self.month.start, self.month.end - timedelta(days=1)
+        members = self.members()
+        user_ids = None if self.department is None else list(members)
+        events = []
+        if members:
+            events = [
+                *request_entries(LeaveRequest, first, last, user_ids),
+                *request_entries(BusinessTrip, first, last, user_ids),
+                *schedule_entries(first, last, user_ids),
+            ]
+            events = [event for event in events if event['user_id'] in members]
+            events.sort(key=lambda event: (event['start'], event['user_id'], event['kind']))
+
+        size = (last - first).days + 1
+        changes = {kind: [0] * (size + 1) for kind in self.COUNTED_KINDS}
+        for event in events:
+            event['username'] = members[event['user_id']]
+            if event['kind'] in changes:
+                counts = changes[event['kind']]
+                counts[(max(event['start'], first) - first).days] += 1
+                counts[(min(event['end'], last) - first).days + 1] -= 1
+
+        business = BusinessCalendar.default()
+        running = dict.fromkeys(self.COUNTED_KINDS, 0)
+        days = []
+        for offset in range(size):
+            day = first + timedelta(days=offset)
+            for kind in self.COUNTED_KINDS:
+                running[kind] += changes[kind][offset]
+            days.append({'date': day, 'business_day': business.is_business_day(day), **running})
+
+        return {
+            'month': self.month.label,
+            'department': self.department,
+            'members': [{'user_id': user_id, 'username': name} for user_id, name in sorted(members.items())],
+            'events': events,
+            'days': days,
+        }
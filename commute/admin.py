@@ -0,0 +1,68 @@
+# =============================================================================
+# 비즈니스 관리 시스템 근태 관리 앱 관리자 설정
+# =============================================================================
+# 설명: Django 관리자 사이트에서 근무 규칙과 휴가/출장 신청을 관리하는 설정
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+# Django 관리자 모듈 임포트
+from django.contrib import admin
+# 현재 앱의 모델 임포트
+from .models import BusinessTrip, LeaveRequest, WorkRule
+
+# =============================================================================
+# 관리자 클래스 정의
+# =============================================================================
+@admin.register(WorkRule)
+class WorkRuleAdmin(admin.ModelAdmin):
+    """
+    근무 규칙 관리자 클래스
+
+    저장/삭제하면 규칙 엔진이 무효화되어 이후 저장되는 기록부터 새 규칙이 적용됩니다.
+    이미 있는 기록은 reevaluate_commute_status 명령으로 다시 판정합니다.
+    """
+
+    # 관리자 목록 페이지에 표시할 필드 목록
+    list_display = [
+        'name',                       # 규칙 이름
+        'department',                 # 적용 부서
+        'schedule_type',              # 적용 근무 유형
+        'start_time',                 # 기준 출근 시각
+        'end_time',                   # 기준 퇴근 시각
+        'late_grace_minutes',         # 지각 유예
+        'early_leave_grace_minutes',  # 조퇴 유예
+        'is_active',                  # 사용 여부
+    ]
+
+    # 필터링 옵션을 제공할 필드 목록
+    list_filter = ['schedule_type', 'is_active']
+
+    # 검색 기능을 제공할 필드 목록
+    search_fields = ['name', 'department']
+
+
+@admin.register(LeaveRequest)
+class LeaveRequestAdmin(admin.ModelAdmin):
+    """
+    휴가 신청 관리자 클래스
+
+    관리자 화면에서 바꾼 기간은 겹침 검사를 거치지 않으므로 결재는 API 로 처리합니다.
+    """
+
+    list_display = ['user', 'leave_type', 'start_date', 'end_date', 'days', 'status', 'approver']
+    list_filter = ['leave_type', 'status']
+    search_fields = ['user__username', 'reason']
+    date_hierarchy = 'start_date'
+    readonly_fields = ['days', 'decided_at']
+
+
+@admin.register(BusinessTrip)
+class BusinessTripAdmin(admin.ModelAdmin):
+    """출장 신청 관리자 클래스"""
+
+    list_display = ['user', 'destination', 'start_date', 'end_date', 'status', 'approver']
+    list_filter = ['status']
+    search_fields = ['user__username', 'destination', 'purpose']
+    date_hierarchy = 'start_date'
+    readonly_fields = ['decided_at']
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class CommuteConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'commute'
+
+    def ready(self):
+        # 월간 근태 집계 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,39 @@
+# =============================================================================
+# 비즈니스 관리 시스템 근태 관리 앱 폼
+# =============================================================================
+# 설명: 휴가/출장 신청 API 가 사용하는 검증 폼
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+# Django 폼 모듈 임포트
+from django import forms
+# 현재 앱의 모델 임포트
+from .models import BusinessTrip, LeaveRequest
+
+
+class LeaveRequestForm(forms.ModelForm):
+    """
+    휴가 신청 폼
+
+    기간 순서와 최대 기간은 모델 clean() 에서, 반차는 하루만 신청할 수 있는지는 여기서 검증합니다.
+    """
+
+    class Meta:
+        model = LeaveRequest
+        fields = ['leave_type', 'start_date', 'end_date', 'reason', 'notes']
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if (cleaned_data.get('leave_type') in LeaveRequest.HALF_DAY_TYPES
+                and cleaned_data.get('start_date') != cleaned_data.get('end_date')):
+            raise forms.ValidationError('반차는 하루만 신청할 수 있습니다.')
+        return cleaned_data
+
+
+class BusinessTripForm(forms.ModelForm):
+    """출장 신청 폼 (기간 검증은 모델 clean())"""
+
+    class Meta:
+        model = BusinessTrip
+        fields = ['destination', 'purpose', 'start_date', 'end_date', 'depart_time', 'return_time', 'notes']
@@ -0,0 +1,50 @@
+"""
+근태 요약 재구성 관리 명령
+
+지정한 월 범위의 일자별/월별 근태 요약과 기록별 초과 근무를 출퇴근 기록과 근무 스케줄로
+다시 계산합니다. 범위를 주지 않으면 기록이 있는 전체 기간을 재구성합니다.
+
+사용 예:
+    python manage.py rebuild_commute_summary
+    python manage.py rebuild_commute_summary --from 2023-01 --to 2024-12
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from commute.models import CommuteRecord
+from commute.reports import AttendanceReportError, MonthlyAttendance
+from commute.summaries import SummaryRebuilder
+
+
+class Command(BaseCommand):
+    help = '월 범위의 일자별/월별 근태 요약을 출퇴근 기록으로 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='start', help='시작 월 (YYYY-MM, 기본 첫 기록 월)')
+        parser.add_argument('--to', dest='end', help='종료 월 (YYYY-MM, 기본 마지막 기록 월)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='읽기/저장 묶음 크기')
+
+    def handle(self, *args, **options):
+        try:
+            start = MonthlyAttendance.from_string(options['start']).start if options['start'] else None
+            end = MonthlyAttendance.from_string(options['end']).start if options['end'] else None
+        except AttendanceReportError as error:
+            raise CommandError(str(error))
+
+        dates = CommuteRecord.objects.order_by()
+        start = start or dates.order_by('work_date').values_list('work_date', flat=True).first()
+        end = end or dates.order_by('-work_date').values_list('work_date', flat=True).first()
+        if start is None or end is None:
+            self.stdout.write('재구성할 출퇴근 기록이 없습니다.')
+            return
+        if start > end:
+            raise CommandError('시작 월이 종료 월보다 늦습니다.')
+
+        started = time.perf_counter()
+        result = SummaryRebuilder(batch_size=options['batch_size']).rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(
+            f"{start:%Y-%m} ~ {end:%Y-%m} ({result['months']}개월) - 기록 {result['records']}건, "
+            f"초과 근무 수정 {result['overtime_updated']}건 ({time.perf_counter() - started:.1f}초)"
+        ))
@@ -0,0 +1,55 @@
+"""
+근태 상태 재판정 관리 명령
+
+근무 규칙을 바꾼 뒤 지정한 월 범위의 출퇴근 기록을 현재 규칙과 근무 스케줄로 다시 판정합니다.
+기록을 pk 순서 묶음으로 읽고 바뀐 기록만 묶음별 UPDATE 로 고치며, 요약 테이블과
+월간 집계 캐시도 함께 반영합니다. 범위를 주지 않으면 기록이 있는 전체 기간을 재판정합니다.
+
+사용 예:
+    python manage.py reevaluate_commute_status --dry-run
+    python manage.py reevaluate_commute_status --from 2024-01 --to 2024-12
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from commute.models import CommuteRecord
+from commute.reports import AttendanceReportError, MonthlyAttendance
+from commute.rules import StatusReevaluator
+
+
+class Command(BaseCommand):
+    help = '월 범위의 출퇴근 기록 근태 상태와 초과 근무를 현재 근무 규칙으로 다시 판정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='start', help='시작 월 (YYYY-MM, 기본 첫 기록 월)')
+        parser.add_argument('--to', dest='end', help='종료 월 (YYYY-MM, 기본 마지막 기록 월)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='읽기/저장 묶음 크기')
+        parser.add_argument('--dry-run', action='store_true', help='바뀔 건수만 출력하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        try:
+            start = MonthlyAttendance.from_string(options['start']).start if options['start'] else None
+            end = MonthlyAttendance.from_string(options['end']).end - timedelta(days=1) if options['end'] else None
+        except AttendanceReportError as error:
+            raise CommandError(str(error))
+
+        dates = CommuteRecord.objects.order_by()
+        start = start or dates.order_by('work_date').values_list('work_date', flat=True).first()
+        end = end or dates.order_by('-work_date').values_list('work_date', flat=True).first()
+        if start is None or end is None:
+            self.stdout.write('재판정할 출퇴근 기록이 없습니다.')
+            return
+        if start > end:
+            raise CommandError('시작 월이 종료 월보다 늦습니다.')
+
+        started = time.perf_counter()
+        result = StatusReevaluator(batch_size=options['batch_size']).run(start, end, dry_run=options['dry_run'])
+        statuses = ', '.join(f"{status} {count}건" for status, count in sorted(result['statuses'].items()))
+        prefix = '[미저장] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}{start} ~ {end} - 기록 {result['records']}건 중 {result['changed']}건 변경"
+            f"{f' ({statuses})' if statuses else ''} ({time.perf_counter() - started:.1f}초)"
+        ))
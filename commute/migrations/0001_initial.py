@@ -0,0 +1,59 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('work_date', models.DateField(verbose_name='근무일')),
+                ('start_time', models.TimeField(verbose_name='시작 시간')),
+                ('end_time', models.TimeField(verbose_name='종료 시간')),
+                ('is_holiday', models.BooleanField(default=False, verbose_name='휴일 여부')),
+                ('schedule_type', models.CharField(choices=[('regular', '정규근무'), ('overtime', '연장근무'), ('holiday', '휴일근무'), ('remote', '재택근무')], default='regular', max_length=20, verbose_name='근무 유형')),
+                ('notes', models.TextField(blank=True, verbose_name='비고')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '근무 스케줄',
+                'verbose_name_plural': '근무 스케줄들',
+                'ordering': ['work_date', 'start_time'],
+                'unique_together': {('user', 'work_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CommuteRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('check_in_time', models.DateTimeField(blank=True, null=True, verbose_name='출근 시간')),
+                ('check_out_time', models.DateTimeField(blank=True, null=True, verbose_name='퇴근 시간')),
+                ('work_date', models.DateField(verbose_name='근무일')),
+                ('total_work_hours', models.DurationField(blank=True, null=True, verbose_name='총 근무시간')),
+                ('status', models.CharField(choices=[('normal', '정상'), ('late', '지각'), ('early_leave', '조퇴'), ('absence', '결근')], default='normal', max_length=20, verbose_name='근태 상태')),
+                ('notes', models.TextField(blank=True, verbose_name='비고')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '근태 기록',
+                'verbose_name_plural': '근태 기록들',
+                'ordering': ['-work_date', '-check_in_time'],
+                'unique_together': {('user', 'work_date')},
+            },
+        ),
+    ]
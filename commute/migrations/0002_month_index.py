@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commute', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='commuterecord',
+            index=models.Index(fields=['work_date', 'user', 'status', 'total_work_hours'], name='commute_month_idx'),
+        ),
+    ]
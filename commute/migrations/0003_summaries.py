@@ -0,0 +1,74 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from commute.summaries import SummaryRebuilder
+
+
+def backfill_summaries(apps, schema_editor):
+    """기존 출퇴근 기록 전체로 초과 근무와 일자별/월별 요약 채우기"""
+    CommuteRecord = apps.get_model('commute', 'CommuteRecord')
+    first = CommuteRecord.objects.order_by('work_date').values_list('work_date', flat=True).first()
+    last = CommuteRecord.objects.order_by('-work_date').values_list('work_date', flat=True).first()
+    if first:
+        SummaryRebuilder(apps).rebuild(first, last)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('commute', '0002_month_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommuteDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('records', models.IntegerField(default=0, verbose_name='기록 수')),
+                ('worked_minutes', models.IntegerField(default=0, verbose_name='근무 시간(분)')),
+                ('overtime_minutes', models.IntegerField(default=0, verbose_name='초과 근무(분)')),
+                ('normal', models.IntegerField(default=0, verbose_name='정상')),
+                ('late', models.IntegerField(default=0, verbose_name='지각')),
+                ('early_leave', models.IntegerField(default=0, verbose_name='조퇴')),
+                ('absence', models.IntegerField(default=0, verbose_name='결근')),
+                ('work_date', models.DateField(unique=True, verbose_name='근무일')),
+            ],
+            options={
+                'verbose_name': '일자별 근태 요약',
+                'verbose_name_plural': '일자별 근태 요약들',
+                'ordering': ['work_date'],
+            },
+        ),
+        migrations.AddField(
+            model_name='commuterecord',
+            name='overtime_minutes',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='초과 근무(분)'),
+        ),
+        migrations.CreateModel(
+            name='CommuteMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('records', models.IntegerField(default=0, verbose_name='기록 수')),
+                ('worked_minutes', models.IntegerField(default=0, verbose_name='근무 시간(분)')),
+                ('overtime_minutes', models.IntegerField(default=0, verbose_name='초과 근무(분)')),
+                ('normal', models.IntegerField(default=0, verbose_name='정상')),
+                ('late', models.IntegerField(default=0, verbose_name='지각')),
+                ('early_leave', models.IntegerField(default=0, verbose_name='조퇴')),
+                ('absence', models.IntegerField(default=0, verbose_name='결근')),
+                ('month', models.DateField(verbose_name='월')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '월별 근태 요약',
+                'verbose_name_plural': '월별 근태 요약들',
+                'ordering': ['month', 'user'],
+                'indexes': [models.Index(fields=['month'], name='commute_summary_month_idx')],
+                'unique_together': {('user', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
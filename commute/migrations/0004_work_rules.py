@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:14
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commute', '0003_summaries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='규칙 이름')),
+                ('department', models.CharField(blank=True, max_length=100, verbose_name='적용 부서')),
+                ('schedule_type', models.CharField(blank=True, choices=[('regular', '정규근무'), ('overtime', '연장근무'), ('holiday', '휴일근무'), ('remote', '재택근무')], max_length=20, verbose_name='적용 근무 유형')),
+                ('start_time', models.TimeField(default=datetime.time(9, 0), verbose_name='기준 출근 시각')),
+                ('end_time', models.TimeField(default=datetime.time(18, 0), verbose_name='기준 퇴근 시각')),
+                ('late_grace_minutes', models.PositiveSmallIntegerField(default=0, verbose_name='지각 유예(분)')),
+                ('early_leave_grace_minutes', models.PositiveSmallIntegerField(default=0, verbose_name='조퇴 유예(분)')),
+                ('check_late', models.BooleanField(default=True, verbose_name='지각 판정')),
+                ('check_early_leave', models.BooleanField(default=True, verbose_name='조퇴 판정')),
+                ('use_schedule_times', models.BooleanField(default=True, verbose_name='스케줄 시각 기준')),
+                ('is_active', models.BooleanField(default=True, verbose_name='사용 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '근무 규칙',
+                'verbose_name_plural': '근무 규칙들',
+                'ordering': ['department', 'schedule_type'],
+                'unique_together': {('department', 'schedule_type')},
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('commute', '0004_work_rules'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaveRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField(verbose_name='시작일')),
+                ('end_date', models.DateField(verbose_name='종료일')),
+                ('status', models.CharField(choices=[('pending', '신청'), ('approved', '승인'), ('rejected', '반려'), ('cancelled', '취소')], default='pending', max_length=20, verbose_name='상태')),
+                ('decided_at', models.DateTimeField(blank=True, null=True, verbose_name='결재일시')),
+                ('notes', models.TextField(blank=True, verbose_name='비고')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('leave_type', models.CharField(choices=[('annual', '연차'), ('half_am', '오전 반차'), ('half_pm', '오후 반차'), ('sick', '병가'), ('special', '경조사'), ('unpaid', '무급 휴가')], default='annual', max_length=20, verbose_name='휴가 종류')),
+                ('days', models.DecimalField(decimal_places=1, default=0, max_digits=5, verbose_name='사용 일수')),
+                ('reason', models.TextField(blank=True, verbose_name='사유')),
+                ('approver', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='결재자')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='신청자')),
+            ],
+            options={
+                'verbose_name': '휴가 신청',
+                'verbose_name_plural': '휴가 신청들',
+                'ordering': ['-start_date'],
+                'indexes': [models.Index(fields=['user', 'start_date', 'end_date'], name='commute_leave_user_idx'), models.Index(fields=['start_date', 'end_date'], name='commute_leave_period_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='BusinessTrip',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField(verbose_name='시작일')),
+                ('end_date', models.DateField(verbose_name='종료일')),
+                ('status', models.CharField(choices=[('pending', '신청'), ('approved', '승인'), ('rejected', '반려'), ('cancelled', '취소')], default='pending', max_length=20, verbose_name='상태')),
+                ('decided_at', models.DateTimeField(blank=True, null=True, verbose_name='결재일시')),
+                ('notes', models.TextField(blank=True, verbose_name='비고')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('destination', models.CharField(max_length=200, verbose_name='출장지')),
+                ('purpose', models.TextField(blank=True, verbose_name='출장 목적')),
+                ('depart_time', models.TimeField(blank=True, null=True, verbose_name='출발 시각')),
+                ('return_time', models.TimeField(blank=True, null=True, verbose_name='복귀 시각')),
+                ('approver', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='결재자')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='신청자')),
+            ],
+            options={
+                'verbose_name': '출장 신청',
+                'verbose_name_plural': '출장 신청들',
+                'ordering': ['-start_date'],
+                'indexes': [models.Index(fields=['user', 'start_date', 'end_date'], name='commute_trip_user_idx'), models.Index(fields=['start_date', 'end_date'], name='commute_trip_period_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commute', '0005_leave_and_trips'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workschedule',
+            index=models.Index(fields=['work_date'], name='commute_schedule_date_idx'),
+        ),
+    ]
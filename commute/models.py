@@ -17,14 +17,29 @@
 - 근무 시간 자동 계산
 - 근태 상태 분류 (정상, 지각, 조퇴, 결근)
 - 근무 스케줄 관리
+- 부서/근무 유형별 근무 규칙
+- 휴가/출장 신청
+- 일자별/사용자 월별 근태 요약 (기록 저장 시 증감분만 반영)
 """
 
+from datetime import timedelta
+from decimal import Decimal
+
+# Django 모델 검증 예외 임포트
+from django.core.exceptions import ValidationError
 # Django 데이터베이스 모델 임포트
-from django.db import models
+from django.db import models, transaction
+# 요약 카운터 증감용 표현식 임포트
+from django.db.models import F
 # Django 기본 사용자 모델 임포트
 from django.contrib.auth.models import User
-# Django 시간대 관련 유틸리티 임포트
-from django.utils import timezone
+
+# 근태 요약 기여분 계산 함수 임포트
+from .summaries import (
+    COUNTER_FIELDS, DERIVED_FIELDS, SOURCE_FIELDS, STANDARD_END, STANDARD_START, overtime_minutes, summary_deltas, worked_minutes,
+)
+# 근무 규칙 엔진 임포트
+from .rules import ANY, SCHEDULE_FIELDS, WorkRuleEngine
 
 class CommuteRecord(models.Model):
     """
@@ -39,6 +54,7 @@ class CommuteRecord(models.Model):
         check_out_time (DateTime): 퇴근 시간
         work_date (Date): 근무일
         total_work_hours (Duration): 총 근무시간
+        overtime_minutes (PositiveInteger): 근무 스케줄 대비 초과 근무(분, 자동 계산)
         status (Char): 근태 상태 (normal, late, early_leave, absence)
         notes (TextField): 비고/메모
         created_at (DateTime): 생성일시
@@ -67,6 +83,9 @@ class CommuteRecord(models.Model):
     # 총 근무시간 (선택사항 - 자동 계산)
     total_work_hours = models.DurationField(null=True, blank=True, verbose_name='총 근무시간')
     
+    # 초과 근무 분 (자동 계산 - 같은 날 근무 스케줄, 없으면 9시~18시 기준)
+    overtime_minutes = models.PositiveIntegerField(default=0, editable=False, verbose_name='초과 근무(분)')
+    
     # =============================================================================
     # 근태 상태 필드
     # =============================================================================
@@ -118,6 +137,13 @@ class CommuteRecord(models.Model):
         
         # 복합 유니크 제약조건 - 사용자와 근무일의 조합은 고유해야 함
         unique_together = ['user', 'work_date']
+        
+        # 월간 집계용 커버링 인덱스 - 기간 조건 후 집계 열을 테이블 접근 없이 읽음
+        indexes = [
+            models.Index(
+                fields=['work_date', 'user', 'status', 'total_work_hours'], name='commute_month_idx'
+            ),
+        ]
 
     def __str__(self):
         """
@@ -128,33 +154,105 @@ class CommuteRecord(models.Model):
         """
         return f"{self.user.username} - {self.work_date}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        DB 에서 읽은 인스턴스 생성
+        
+        읽을 때의 요약 기여 값(사용자, 근무일, 상태, 근무 분, 초과 근무 분)을 기억해 두어
+        저장/삭제 시 추가 조회 없이 요약 증감분을 계산하고,
+        근무월이 바뀌면 이전 달의 집계 캐시도 함께 무효화할 수 있게 합니다.
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if all(name in loaded for name in ('user_id', 'work_date', 'status', 'total_work_hours', 'overtime_minutes')):
+            instance._loaded_values = instance.summary_values()
+        return instance
+
+    def summary_values(self):
+        """요약 기여 값 (user_id, work_date, status, 근무 분, 초과 근무 분)"""
+        return (
+            self.user_id, self.work_date, self.status,
+            worked_minutes(self.total_work_hours), self.overtime_minutes,
+        )
+
+    def previous_summary_values(self):
+        """저장 전 DB 의 요약 기여 값 (새 기록이면 None, 읽을 때 값이 없으면 한 번 조회)"""
+        if self._state.adding:
+            return None
+        loaded = self.__dict__.get('_loaded_values')
+        if loaded is not None:
+            return loaded
+        row = CommuteRecord.objects.filter(pk=self.pk).values_list(
+            'user_id', 'work_date', 'status', 'total_work_hours', 'overtime_minutes'
+        ).first()
+        if row is None:
+            return None
+        return (*row[:3], worked_minutes(row[3]), row[4])
+
+    def load_schedule(self):
+        """같은 날 근무 스케줄 (start_time, end_time, is_holiday, schedule_type), 없으면 None"""
+        return WorkSchedule.objects.filter(user_id=self.user_id, work_date=self.work_date).values_list(
+            *SCHEDULE_FIELDS
+        ).first()
+
+    def calculate_overtime(self, schedule=None):
+        """근무 스케줄 대비 초과 근무 분 (schedule 은 load_schedule() 결과)"""
+        worked = worked_minutes(self.total_work_hours)
+        if not worked:
+            return 0
+        return overtime_minutes(worked, schedule[:3] if schedule else None)
+
+    def evaluate_status(self, schedule=None, engine=None):
+        """
+        근무 규칙으로 근태 상태 판정
+        
+        부서별 규칙이 있을 때만 사용자 부서를 조회합니다.
+        """
+        engine = engine or WorkRuleEngine.current()
+        department = ANY
+        if engine.by_department:
+            from login.models import UserProfile
+            department = UserProfile.objects.filter(user_id=self.user_id).values_list(
+                'department', flat=True
+            ).first() or ANY
+        return engine.evaluate(
+            self.work_date, self.check_in_time, self.check_out_time, department, schedule, self.status
+        )
+
     def save(self, *args, **kwargs):
         """
         모델 저장 메서드
         
-        저장 시 근무 시간과 근태 상태를 자동으로 계산합니다.
+        저장 시 근무 시간을 계산하고, 근무 규칙(부서/근무 유형별)과 같은 날 근무 스케줄로
+        근태 상태와 초과 근무를 판정한 뒤 일자별/월별 요약 행에 수정 전후 차이만 더합니다.
         
         Args:
             *args: 위치 인자
             **kwargs: 키워드 인자
         """
-        # 출근과 퇴근 시간이 모두 있으면 총 근무시간 계산
+        # 요약과 관계없는 필드만 저장하면 판정과 요약 갱신 생략
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not set(update_fields) & set(SOURCE_FIELDS):
+            super().save(*args, **kwargs)
+            return
+        
+        schedule = self.load_schedule()
+        
+        # 출근과 퇴근 시간이 모두 있으면 총 근무시간과 근태 상태 계산
         if self.check_in_time and self.check_out_time:
             self.total_work_hours = self.check_out_time - self.check_in_time
-            
-            # 근태 상태 자동 계산
-            # 기준 시간: 9시 출근, 18시 퇴근
-            standard_start = timezone.datetime.strptime('09:00', '%H:%M').time()
-            standard_end = timezone.datetime.strptime('18:00', '%H:%M').time()
-            
-            if self.check_in_time.time() > standard_start:
-                self.status = 'late'  # 9시 이후 출근은 지각
-            elif self.check_out_time.time() < standard_end:
-                self.status = 'early_leave'  # 18시 이전 퇴근은 조퇴
-            else:
-                self.status = 'normal'  # 그 외는 정상
+            self.status = self.evaluate_status(schedule)
         
-        super().save(*args, **kwargs)
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *DERIVED_FIELDS}
+        self.overtime_minutes = self.calculate_overtime(schedule)
+        previous = self.previous_summary_values()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = self.summary_values()
+            apply_summary_deltas(summary_deltas(previous, current))
+        self._loaded_values = current
 
     # =============================================================================
     # 프로퍼티 메서드들
@@ -291,6 +389,11 @@ class WorkSchedule(models.Model):
         
         # 복합 유니크 제약조건 - 사용자와 근무일의 조합은 고유해야 함
         unique_together = ['user', 'work_date']
+        
+        # 기간 조회 인덱스 (캘린더 피드 등 사용자 조건 없는 근무일 범위 조회)
+        indexes = [
+            models.Index(fields=['work_date'], name='commute_schedule_date_idx'),
+        ]
 
     def __str__(self):
         """
@@ -301,6 +404,13 @@ class WorkSchedule(models.Model):
         """
         return f"{self.user.username} - {self.work_date} ({self.schedule_type})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB 에서 읽은 인스턴스 생성 (읽을 때의 사용자, 근무일 기억)"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_key = (instance.__dict__.get('user_id'), instance.__dict__.get('work_date'))
+        return instance
+
     # =============================================================================
     # 프로퍼티 메서드들
     # =============================================================================
@@ -346,3 +456,366 @@ class WorkSchedule(models.Model):
             bool: 근무일이 주말이면 True
         """
         return self.work_date.weekday() >= 5  # 5=토요일, 6=일요일
+
+
+# =============================================================================
+# 근무 규칙 모델
+# =============================================================================
+class WorkRule(models.Model):
+    """
+    근무 규칙 모델
+    
+    부서와 근무 유형(WorkSchedule.schedule_type)별 출퇴근 기준과 유예 시간을 정의합니다.
+    부서나 근무 유형을 비워 두면 전체에 적용되며, 더 구체적인 규칙이 우선합니다.
+    활성 규칙은 commute.rules.WorkRuleEngine 이 메모리에 컴파일해 두고 사용하며
+    저장/삭제 시 모든 프로세스의 엔진이 무효화됩니다.
+    이미 있는 기록의 상태는 reevaluate_commute_status 명령으로 다시 판정합니다.
+    
+    Attributes:
+        name (Char): 규칙 이름
+        department (Char): 적용 부서 (비우면 전체)
+        schedule_type (Char): 적용 근무 유형 (비우면 전체, 스케줄이 없는 날 포함)
+        start_time (Time): 기준 출근 시각 (스케줄이 없거나 스케줄 시각을 따르지 않을 때)
+        end_time (Time): 기준 퇴근 시각
+        late_grace_minutes (PositiveSmallInteger): 지각 유예(분)
+        early_leave_grace_minutes (PositiveSmallInteger): 조퇴 유예(분)
+        check_late (Boolean): 지각 판정 여부 (재택근무 등 자율 출근이면 False)
+        check_early_leave (Boolean): 조퇴 판정 여부
+        use_schedule_times (Boolean): 그날 스케줄이 있으면 스케줄 시작/종료 시각 기준
+        is_active (Boolean): 사용 여부
+    """
+    
+    name = models.CharField(max_length=100, verbose_name='규칙 이름')
+    department = models.CharField(max_length=100, blank=True, verbose_name='적용 부서')
+    schedule_type = models.CharField(
+        max_length=20,
+        blank=True,
+        choices=WorkSchedule._meta.get_field('schedule_type').choices,
+        verbose_name='적용 근무 유형'
+    )
+    start_time = models.TimeField(default=STANDARD_START, verbose_name='기준 출근 시각')
+    end_time = models.TimeField(default=STANDARD_END, verbose_name='기준 퇴근 시각')
+    late_grace_minutes = models.PositiveSmallIntegerField(default=0, verbose_name='지각 유예(분)')
+    early_leave_grace_minutes = models.PositiveSmallIntegerField(default=0, verbose_name='조퇴 유예(분)')
+    check_late = models.BooleanField(default=True, verbose_name='지각 판정')
+    check_early_leave = models.BooleanField(default=True, verbose_name='조퇴 판정')
+    use_schedule_times = models.BooleanField(default=True, verbose_name='스케줄 시각 기준')
+    is_active = models.BooleanField(default=True, verbose_name='사용 여부')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        verbose_name = '근무 규칙'
+        verbose_name_plural = '근무 규칙들'
+        ordering = ['department', 'schedule_type']
+        unique_together = ['department', 'schedule_type']
+    
+    def __str__(self):
+        scope = f"{self.department or '전체'} / {self.get_schedule_type_display() or '전체'}"
+        return f"{self.name} ({scope})"
+
+
+# =============================================================================
+# 휴가/출장 신청 모델
+# =============================================================================
+class AbsenceRequest(models.Model):
+    """
+    기간 신청 (추상 모델)
+    
+    휴가와 출장이 공유하는 신청자, 기간(시작일~종료일, 양 끝 포함), 결재 상태를 가집니다.
+    신청/승인 상태인 기간끼리는 같은 사용자에서 겹칠 수 없으며, 겹침 검사와 팀 월간 달력은
+    commute.absences 가 (user, start_date, end_date) 범위 인덱스로 읽어 처리합니다.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', '신청'),
+        ('approved', '승인'),
+        ('rejected', '반려'),
+        ('cancelled', '취소'),
+    ]
+    # 겹침 검사와 달력에 포함하는 상태
+    ACTIVE_STATUSES = ('pending', 'approved')
+    # 한 번에 신청할 수 있는 최대 기간(일, 양 끝 포함) - 기간 조회는 시작일을 이만큼만 거슬러 찾음
+    MAX_PERIOD_DAYS = 180
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='신청자')
+    start_date = models.DateField(verbose_name='시작일')
+    end_date = models.DateField(verbose_name='종료일')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    approver = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name='결재자'
+    )
+    decided_at = models.DateTimeField(null=True, blank=True, verbose_name='결재일시')
+    notes = models.TextField(blank=True, verbose_name='비고')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        abstract = True
+    
+    @property
+    def is_active(self):
+        return self.status in self.ACTIVE_STATUSES
+    
+    @classmethod
+    def active_between(cls, start, end):
+        """
+        [start, end] 와 겹치는 신청/승인 상태 쿼리셋
+        
+        기간은 MAX_PERIOD_DAYS 를 넘지 않으므로 시작일 범위를 양쪽으로 닫아 인덱스 범위 검색이 되게 합니다.
+        """
+        return cls.objects.filter(
+            start_date__gte=start - timedelta(days=cls.MAX_PERIOD_DAYS - 1), start_date__lte=end,
+            end_date__gte=start, status__in=cls.ACTIVE_STATUSES,
+        )
+    
+    def clean(self):
+        """시작일/종료일 순서와 최대 기간 검증 (ModelForm, 관리자 사이트에서 호출)"""
+        if self.start_date and self.end_date:
+            if self.end_date < self.start_date:
+                raise ValidationError('종료일이 시작일보다 빠릅니다.')
+            if (self.end_date - self.start_date).days + 1 > self.MAX_PERIOD_DAYS:
+                raise ValidationError(f'신청 기간은 최대 {self.MAX_PERIOD_DAYS}일입니다.')
+
+
+class LeaveRequest(AbsenceRequest):
+    """
+    휴가 신청 모델
+    
+    days 는 기간 중 영업일 수(주말/공휴일 제외, 반차는 0.5일)로 저장 시 계산합니다.
+    """
+    
+    leave_type = models.CharField(
+        max_length=20,
+        choices=[
+            ('annual', '연차'),
+            ('half_am', '오전 반차'),
+            ('half_pm', '오후 반차'),
+            ('sick', '병가'),
+            ('special', '경조사'),
+            ('unpaid', '무급 휴가'),
+        ],
+        default='annual',
+        verbose_name='휴가 종류'
+    )
+    days = models.DecimalField(max_digits=5, decimal_places=1, default=0, verbose_name='사용 일수')
+    reason = models.TextField(blank=True, verbose_name='사유')
+    
+    # 하루만 신청할 수 있는 반차 종류
+    HALF_DAY_TYPES = ('half_am', 'half_pm')
+    
+    class Meta:
+        verbose_name = '휴가 신청'
+        verbose_name_plural = '휴가 신청들'
+        ordering = ['-start_date']
+        indexes = [
+            # 사용자별 겹침 검사 (시작일 범위 + 종료일 조건)
+            models.Index(fields=['user', 'start_date', 'end_date'], name='commute_leave_user_idx'),
+            # 기간 조회 (팀/전체 월간 달력)
+            models.Index(fields=['start_date', 'end_date'], name='commute_leave_period_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.get_leave_type_display()} ({self.start_date} ~ {self.end_date})"
+    
+    def calculate_days(self):
+        """사용 일수 (영업일 기준, 반차는 0.5일)"""
+        from business_management.business_calendar import BusinessCalendar
+        
+        days = BusinessCalendar.default().business_days(self.start_date, self.end_date)
+        if self.leave_type in self.HALF_DAY_TYPES:
+            return Decimal(days) / 2
+        return Decimal(days)
+    
+    def save(self, *args, **kwargs):
+        self.days = self.calculate_days()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'days'}
+        super().save(*args, **kwargs)
+
+
+class BusinessTrip(AbsenceRequest):
+    """
+    출장 신청 모델
+    
+    출발/복귀 시각은 첫날/마지막 날의 현지 시각입니다 (선택).
+    """
+    
+    destination = models.CharField(max_length=200, verbose_name='출장지')
+    purpose = models.TextField(blank=True, verbose_name='출장 목적')
+    depart_time = models.TimeField(null=True, blank=True, verbose_name='출발 시각')
+    return_time = models.TimeField(null=True, blank=True, verbose_name='복귀 시각')
+    
+    class Meta:
+        verbose_name = '출장 신청'
+        verbose_name_plural = '출장 신청들'
+        ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['user', 'start_date', 'end_date'], name='commute_trip_user_idx'),
+            models.Index(fields=['start_date', 'end_date'], name='commute_trip_period_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.destination} ({self.start_date} ~ {self.end_date})"
+
+
+# =============================================================================
+# 근태 요약 모델
+# =============================================================================
+class AttendanceCounters(models.Model):
+    """
+    근태 요약 카운터 (추상 모델)
+    
+    기록 수, 근무 분, 초과 근무 분, 상태별 건수를 가지며
+    CommuteRecord 저장/삭제 시 증감분만 F() 식으로 더해집니다.
+    """
+    
+    records = models.IntegerField(default=0, verbose_name='기록 수')
+    worked_minutes = models.IntegerField(default=0, verbose_name='근무 시간(분)')
+    overtime_minutes = models.IntegerField(default=0, verbose_name='초과 근무(분)')
+    normal = models.IntegerField(default=0, verbose_name='정상')
+    late = models.IntegerField(default=0, verbose_name='지각')
+    early_leave = models.IntegerField(default=0, verbose_name='조퇴')
+    absence = models.IntegerField(default=0, verbose_name='결근')
+    
+    # 요약 행 키 열
+    KEY_FIELDS = ()
+    
+    class Meta:
+        abstract = True
+    
+    @classmethod
+    def apply_delta(cls, lookup, changes):
+        """
+        요약 행 카운터 증감 (행이 없으면 만든 뒤 증감)
+        
+        빼기만 하는 증감분인데 행이 없으면(사용자 삭제로 요약 행이 먼저 지워진 경우 등) 무시합니다.
+        
+        Args:
+            lookup (dict): 요약 행 키 (예: {'work_date': ...})
+            changes (dict): 카운터 -> 증감값
+        """
+        expressions = {field: F(field) + value for field, value in changes.items()}
+        if not cls.objects.filter(**lookup).update(**expressions):
+            if max(changes.values()) <= 0:
+                return
+            cls.objects.get_or_create(**lookup)
+            cls.objects.filter(**lookup).update(**expressions)
+    
+    @classmethod
+    def apply_deltas(cls, items, batch_size=500):
+        """
+        여러 요약 행 카운터를 묶어서 증감 (대량 처리용)
+        
+        묶음마다 요약 행을 잠근 채 현재 값을 읽고(없는 행은 bulk_create(ignore_conflicts=True) 로
+        만든 뒤 다시 읽음) 증감분을 더해 bulk_create(update_conflicts=True) 로 한 번에 덮어씁니다.
+        빼기만 하는 증감분인데 행이 없으면 apply_delta() 와 같이 무시합니다.
+        
+        Args:
+            items (list): [(요약 행 키 dict, {카운터: 증감}), ...] (키는 서로 달라야 함)
+            batch_size (int): 한 번에 처리하는 요약 행 수
+        """
+        unique_fields = [cls._meta.get_field(field).name for field in cls.KEY_FIELDS]
+        for offset in range(0, len(items), batch_size):
+            chunk = items[offset:offset + batch_size]
+            keys = [tuple(lookup[field] for field in cls.KEY_FIELDS) for lookup, _ in chunk]
+            current = cls.locked_counters(keys)
+            missing = [
+                lookup for key, (lookup, changes) in zip(keys, chunk)
+                if key not in current and max(changes.values()) > 0
+            ]
+            if missing:
+                cls.objects.bulk_create([cls(**lookup) for lookup in missing], ignore_conflicts=True)
+                current.update(cls.locked_counters([key for key in keys if key not in current]))
+            
+            updated = []
+            for key, (lookup, changes) in zip(keys, chunk):
+                if key not in current:
+                    continue
+                counters = dict(zip(COUNTER_FIELDS, current[key]))
+                for field, value in changes.items():
+                    counters[field] += value
+                updated.append(cls(**lookup, **counters))
+            cls.objects.bulk_create(
+                updated, update_conflicts=True, unique_fields=unique_fields, update_fields=list(COUNTER_FIELDS)
+            )
+    
+    @classmethod
+    def locked_counters(cls, keys):
+        """키 목록에 해당하는 요약 행을 잠그고 {키: 카운터 값} 반환"""
+        if not keys:
+            return {}
+        size = len(cls.KEY_FIELDS)
+        rows = cls.objects.select_for_update().filter(**{
+            f'{field}__in': {key[position] for key in keys} for position, field in enumerate(cls.KEY_FIELDS)
+        }).values_list(*cls.KEY_FIELDS, *COUNTER_FIELDS)
+        wanted = set(keys)
+        return {row[:size]: row[size:] for row in rows if row[:size] in wanted}
+
+
+class CommuteDailySummary(AttendanceCounters):
+    """
+    일자별 근태 요약 모델
+    
+    근무일별 전체 직원의 합계입니다. 대시보드는 원본 기록 대신 이 테이블을 읽습니다.
+    """
+    
+    work_date = models.DateField(unique=True, verbose_name='근무일')
+    
+    KEY_FIELDS = ('work_date',)
+    
+    class Meta:
+        verbose_name = '일자별 근태 요약'
+        verbose_name_plural = '일자별 근태 요약들'
+        ordering = ['work_date']
+    
+    def __str__(self):
+        return f"{self.work_date} ({self.records}건)"
+
+
+class CommuteMonthlySummary(AttendanceCounters):
+    """
+    사용자 월별 근태 요약 모델
+    
+    (사용자, 월) 별 합계입니다. month 는 그 달의 1일입니다.
+    """
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='사용자')
+    month = models.DateField(verbose_name='월')
+    
+    KEY_FIELDS = ('user_id', 'month')
+    
+    class Meta:
+        verbose_name = '월별 근태 요약'
+        verbose_name_plural = '월별 근태 요약들'
+        ordering = ['month', 'user']
+        unique_together = ['user', 'month']
+        indexes = [
+            # 기간별 전체 합계 (전년 대비 추이) 인덱스
+            models.Index(fields=['month'], name='commute_summary_month_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.month:%Y-%m}"
+
+
+# 요약 종류 -> 요약 모델
+SUMMARY_MODELS = {'daily': CommuteDailySummary, 'monthly': CommuteMonthlySummary}
+
+
+def apply_summary_deltas(deltas, batch_size=None):
+    """
+    summary_deltas() 결과를 요약 테이블에 반영
+    
+    batch_size 를 주면 요약 종류별로 묶어 apply_deltas() 로 반영합니다 (대량 처리용).
+    """
+    if batch_size is None:
+        for kind, lookup, changes in deltas:
+            SUMMARY_MODELS[kind].apply_delta(lookup, changes)
+        return
+    grouped = {}
+    for kind, lookup, changes in deltas:
+        grouped.setdefault(kind, []).append((lookup, changes))
+    for kind, items in grouped.items():
+        SUMMARY_MODELS[kind].apply_deltas(items, batch_size)
@@ -0,0 +1,246 @@
+# =============================================================================
+# 비즈니스 관리 시스템 출퇴근 타각 일괄 등록
+# =============================================================================
+# 설명: 출입 단말기가 모아서 올리는 타각을 (사용자, 근무일) 별 근태 기록으로 한 번에 upsert
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+출퇴근 타각 일괄 등록 모듈
+
+키오스크/사원증 리더기는 타각(punch)을 한 건씩이 아니라 수천 건씩 묶어서 올립니다.
+이 모듈은 타각을 (사용자, 근무일) 로 묶어 가장 이른 출근과 가장 늦은 퇴근을 정하고,
+이미 있는 기록과 합친 뒤 근무 시간, 근태 상태, 초과 근무를 메모리에서 계산하여
+bulk_create(update_conflicts=True) 로 (user, work_date) 기준 upsert 합니다.
+기록마다 save() 를 호출하지 않으므로 요약 테이블 증감분과 월간 집계 캐시 무효화도
+묶음 단위로 직접 반영합니다.
+
+타각 형식:
+    {"user": 사용자 id, "time": "2024-05-02T08:57:00+09:00", "type": "in" | "out" (생략 가능)}
+    type 을 생략한 타각은 출근/퇴근 양쪽 후보가 되어 그날 첫 타각이 출근, 마지막 타각이 퇴근이 됩니다.
+    시간대가 없는 시각은 settings.TIME_ZONE 기준이며 근무일은 현지 날짜입니다.
+
+주요 기능:
+- 타각 검증 (형식 오류, 없는 사용자는 거부 목록으로 반환하고 나머지는 처리)
+- (사용자, 근무일) 별 출근/퇴근 결정 및 기존 기록과 병합
+- 근무 시간, 근태 상태(근무 규칙 엔진), 초과 근무 일괄 계산 및 upsert
+- 요약 증감분 반영 및 (사용자, 월) 집계 캐시 무효화
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import CommuteRecord, WorkSchedule, apply_summary_deltas
+from .reports import MonthlyAttendance
+from .rules import ANY, SCHEDULE_FIELDS, WorkRuleEngine, load_departments
+from .summaries import batch_deltas, overtime_minutes, worked_minutes
+
+
+class PunchBatchError(ValueError):
+    """잘못된 타각 묶음 요청"""
+
+
+class PunchBatch:
+    """
+    출퇴근 타각 일괄 등록
+
+    사용 예:
+        batch = PunchBatch([{'user': 3, 'time': '2024-05-02T08:57:00+09:00', 'type': 'in'}, ...])
+        result = batch.save()  # {'received': ..., 'records': ..., 'created': ..., 'errors': [...], ...}
+    """
+
+    KINDS = ('in', 'out')
+    # 응답에 담는 거부 타각 수
+    MAX_ERRORS = 100
+    # upsert 시 갱신하는 열 (비고, 생성일은 기존 값 유지)
+    UPDATE_FIELDS = ['check_in_time', 'check_out_time', 'total_work_hours', 'status', 'overtime_minutes', 'updated_at']
+
+    def __init__(self, punches, batch_size=1000):
+        if not isinstance(punches, list):
+            raise PunchBatchError('punches 는 타각 목록이어야 합니다.')
+        limit = self.get_limit()
+        if len(punches) > limit:
+            raise PunchBatchError(f'한 번에 최대 {limit}건까지 등록할 수 있습니다.')
+        self.punches = punches
+        self.batch_size = batch_size
+        self.errors = []
+        self.rejected = 0
+
+    @staticmethod
+    def get_limit():
+        return getattr(settings, 'COMMUTE_PUNCH_BATCH_LIMIT', 20000)
+
+    def reject(self, index, reason):
+        self.rejected += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append({'index': index, 'reason': reason})
+
+    def chunks(self, values):
+        values = list(values)
+        for offset in range(0, len(values), self.batch_size):
+            yield values[offset:offset + self.batch_size]
+
+    # =========================================================================
+    # 검증 및 묶기
+    # =========================================================================
+
+    def parse(self):
+        """
+        타각 검증 및 현지 시각 변환
+
+        Returns:
+            list: [(index, user_id, 현지 시각, 'in' | 'out' | None), ...]
+        """
+        tz = timezone.get_current_timezone()
+        parsed = []
+        for index, item in enumerate(self.punches):
+            if not isinstance(item, dict):
+                self.reject(index, '타각은 객체여야 합니다.')
+                continue
+            user_id = item.get('user')
+            if isinstance(user_id, bool) or not isinstance(user_id, (int, str)) or not str(user_id).isdigit():
+                self.reject(index, 'user 는 사용자 id 여야 합니다.')
+                continue
+            kind = item.get('type')
+            if kind is not None and kind not in self.KINDS:
+                self.reject(index, 'type 은 in 또는 out 이어야 합니다.')
+                continue
+            try:
+                moment = parse_datetime(item.get('time') or '')
+            except (TypeError, ValueError):
+                moment = None
+            if moment is None:
+                self.reject(index, 'time 은 ISO 8601 일시여야 합니다.')
+                continue
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment, tz)
+            parsed.append((index, int(user_id), moment.astimezone(tz), kind))
+
+        user_model = get_user_model()
+        active = set()
+        for chunk in self.chunks({user_id for _, user_id, _, _ in parsed}):
+            active.update(user_model.objects.filter(pk__in=chunk, is_active=True).values_list('pk', flat=True))
+        punches = []
+        for index, user_id, moment, kind in parsed:
+            if user_id in active:
+                punches.append((user_id, moment, kind))
+            else:
+                self.reject(index, '활성 사용자가 아닙니다.')
+        return punches
+
+    @staticmethod
+    def group(punches):
+        """
+        (사용자, 근무일) 별 [가장 이른 출근 후보, 가장 늦은 퇴근 후보]
+
+        type 이 없는 타각은 양쪽 후보가 됩니다.
+        """
+        groups = {}
+        for user_id, moment, kind in punches:
+            key = (user_id, moment.date())
+            times = groups.get(key)
+            if times is None:
+                times = groups[key] = [None, None]
+            if kind != 'out' and (times[0] is None or moment < times[0]):
+                times[0] = moment
+            if kind != 'in' and (times[1] is None or moment > times[1]):
+                times[1] = moment
+        return groups
+
+    # =========================================================================
+    # 저장
+    # =========================================================================
+
+    def load(self, model, fields, keys):
+        """묶음에 해당하는 (사용자, 근무일) 행을 사용자 묶음별 한 번씩 조회"""
+        dates = [work_date for _, work_date in keys]
+        queryset = model.objects.filter(work_date__gte=min(dates), work_date__lte=max(dates)).order_by()
+        if model is CommuteRecord:
+            queryset = queryset.select_for_update()
+        rows = {}
+        for chunk in self.chunks({user_id for user_id, _ in keys}):
+            for row in queryset.filter(user_id__in=chunk).values_list('user_id', 'work_date', *fields):
+                if row[:2] in keys:
+                    rows[row[:2]] = row[2:]
+        return rows
+
+    @staticmethod
+    def merge(existing, times):
+        """기존 (출근, 퇴근) 과 타각 후보를 합친 (출근, 퇴근) - 퇴근이 출근보다 늦지 않으면 퇴근 없음"""
+        check_in = min(filter(None, (existing[0], times[0])), default=None)
+        check_out = max(filter(None, (existing[1], times[1])), default=None)
+        if check_in is not None and check_out is not None and check_out <= check_in:
+            check_out = None
+        return check_in, check_out
+
+    def save(self):
+        """
+        타각 검증, 병합, upsert, 요약 반영
+
+        Returns:
+            dict: received, accepted, rejected (타각 수), records (바뀐 기록 수), created, updated,
+                  unchanged (이미 같은 값인 기록 수), errors (거부 사유, 최대 MAX_ERRORS 건)
+        """
+        punches = self.parse()
+        groups = self.group(punches)
+        result = {
+            'received': len(self.punches), 'accepted': len(punches), 'rejected': self.rejected,
+            'records': 0, 'created': 0, 'updated': 0, 'unchanged': 0, 'errors': self.errors,
+        }
+        if not groups:
+            return result
+
+        with transaction.atomic():
+            existing = self.load(
+                CommuteRecord,
+                ('check_in_time', 'check_out_time', 'status', 'total_work_hours', 'overtime_minutes'),
+                groups,
+            )
+            schedules = self.load(WorkSchedule, SCHEDULE_FIELDS, groups)
+            # 근무 규칙은 묶음당 한 번 가져오고, 부서별 규칙이 있을 때만 부서 조회
+            engine = WorkRuleEngine.current()
+            departments = load_departments({key[0] for key in groups}) if engine.by_department else {}
+            tz = timezone.get_current_timezone()
+            records = []
+            changes = []
+            for key, times in groups.items():
+                user_id, work_date = key
+                previous = existing.get(key)
+                check_in, check_out = self.merge(previous or (None, None), times)
+                if previous is not None and (check_in, check_out) == previous[:2]:
+                    result['unchanged'] += 1
+                    continue
+
+                status, total = (previous[2], previous[3]) if previous else ('normal', None)
+                if check_in is not None and check_out is not None:
+                    total = check_out - check_in
+                schedule = schedules.get(key)
+                status = engine.evaluate(
+                    work_date, check_in, check_out, departments.get(user_id, ANY), schedule, status, tz
+                )
+                worked = worked_minutes(total)
+                overtime = overtime_minutes(worked, schedule[:3] if schedule else None) if worked else 0
+
+                records.append(CommuteRecord(
+                    user_id=user_id, work_date=work_date, check_in_time=check_in, check_out_time=check_out,
+                    total_work_hours=total, status=status, overtime_minutes=overtime,
+                ))
+                changes.append((
+                    (user_id, work_date, previous[2], worked_minutes(previous[3]), previous[4]) if previous else None,
+                    (user_id, work_date, status, worked, overtime),
+                ))
+                result['updated' if previous else 'created'] += 1
+
+            CommuteRecord.objects.bulk_create(
+                records, batch_size=self.batch_size, update_conflicts=True,
+                unique_fields=['user', 'work_date'], update_fields=self.UPDATE_FIELDS,
+            )
+            apply_summary_deltas(batch_deltas(changes), batch_size=self.batch_size)
+
+        MonthlyAttendance.invalidate((record.user_id, record.work_date) for record in records)
+        result['records'] = len(records)
+        return result
@@ -0,0 +1,228 @@
+# =============================================================================
+# 비즈니스 관리 시스템 월간 근태 집계
+# =============================================================================
+# 설명: 출퇴근 기록의 사용자별/부서별 월간 합계를 DB 집계 쿼리로 계산하고 캐시
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+월간 근태 집계 모듈
+
+한 달 치 CommuteRecord 를 파이썬에서 순회하지 않고 사용자별 GROUP BY 쿼리 한 번으로
+근무 시간(total_work_hours 합계)과 근태 상태별 건수를 계산합니다.
+사용자별 결과는 (사용자, 월) 키로 캐시되며, 기록이 저장/삭제되면 그 사용자의 그 달 키만
+무효화되므로 다른 사용자와 다른 달의 캐시는 그대로 재사용됩니다.
+부서별 합계는 사용자별 결과를 UserProfile.department 로 묶어 계산합니다.
+기간별 추이(전년 대비 등)는 원본 기록 대신 미리 계산된 요약 테이블만 읽습니다.
+
+주요 기능:
+- 사용자별 월간 합계 (근무 시간, 출근일, 정상/지각/조퇴/결근 건수)
+- 부서별 월간 합계
+- (사용자, 월) 단위 캐시 및 무효화
+- 요약 테이블 기반 월별/일별 추이
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from utils.cache import CacheManager
+
+from .models import CommuteDailySummary, CommuteMonthlySummary, CommuteRecord
+from .summaries import COUNTER_FIELDS, next_month
+
+
+class AttendanceReportError(ValueError):
+    """잘못된 집계 월 요청"""
+
+
+class MonthlyAttendance:
+    """
+    월간 근태 집계
+
+    사용 예:
+        report = MonthlyAttendance.from_string('2024-05')
+        users = report.user_totals()           # {user_id: {...}, ...}
+        departments = report.department_totals(users)
+    """
+
+    CACHE_PREFIX = 'commute_month'
+    # 집계 대상 근태 상태
+    STATUSES = ('normal', 'late', 'early_leave', 'absence')
+    # 부서가 없는 사용자의 부서명
+    NO_DEPARTMENT = '미지정'
+    # 캐시에 없는 사용자가 이보다 많으면 사용자 조건 없이 그 달 전체를 집계
+    MAX_FILTER_USERS = 500
+
+    def __init__(self, year, month):
+        try:
+            self.start = date(int(year), int(month), 1)
+        except (TypeError, ValueError):
+            raise AttendanceReportError('집계 월이 올바르지 않습니다.')
+        self.end = date(self.start.year + self.start.month // 12, self.start.month % 12 + 1, 1)
+
+    @classmethod
+    def from_string(cls, value):
+        """'YYYY-MM' 형식 문자열로 생성 (없으면 이번 달)"""
+        if not value:
+            today = date.today()
+            return cls(today.year, today.month)
+        year, _, month = value.partition('-')
+        return cls(year, month)
+
+    @property
+    def label(self):
+        return f"{self.start:%Y-%m}"
+
+    # =========================================================================
+    # 캐시
+    # =========================================================================
+
+    @classmethod
+    def cache_key(cls, user_id, month_label):
+        return CacheManager.get_cache_key(cls.CACHE_PREFIX, user_id, month_label)
+
+    @staticmethod
+    def get_timeout():
+        return getattr(settings, 'ATTENDANCE_CACHE_TIMEOUT', 86400)
+
+    @classmethod
+    def invalidate(cls, pairs):
+        """
+        (사용자 id, 근무일) 목록에 해당하는 (사용자, 월) 캐시 삭제
+
+        근무일은 date 또는 'YYYY-MM-DD' 문자열 모두 허용합니다.
+        """
+        keys = {
+            cls.cache_key(user_id, str(work_date)[:7])
+            for user_id, work_date in pairs
+            if user_id is not None and work_date
+        }
+        if keys:
+            cache.delete_many(list(keys))
+
+    # =========================================================================
+    # 집계
+    # =========================================================================
+
+    @classmethod
+    def empty_totals(cls):
+        return {'work_seconds': 0, 'work_days': 0, 'records': 0, **{status: 0 for status in cls.STATUSES}}
+
+    def compute(self, user_ids=None):
+        """
+        사용자별 월간 합계 (캐시 미사용, 사용자별 GROUP BY 쿼리 한 번)
+
+        Args:
+            user_ids (list): 집계할 사용자 id (None 이면 그 달 기록이 있는 모든 사용자)
+
+        Returns:
+            dict: 사용자 id -> 합계 (기록이 없는 사용자는 빠짐)
+        """
+        queryset = CommuteRecord.objects.filter(work_date__gte=self.start, work_date__lt=self.end)
+        if user_ids is not None:
+            queryset = queryset.filter(user_id__in=user_ids)
+        rows = queryset.order_by().values('user_id').annotate(
+            work=Sum('total_work_hours'),
+            work_days=Count('check_in_time'),
+            records=Count('pk'),
+            **{status: Count('pk', filter=Q(status=status)) for status in self.STATUSES},
+        )
+        totals = {}
+        for row in rows:
+            user_id = row.pop('user_id')
+            work = row.pop('work')
+            row['work_seconds'] = int(work.total_seconds()) if work else 0
+            totals[user_id] = row
+        return totals
+
+    def user_totals(self, user_ids=None):
+        """
+        사용자별 월간 합계 (캐시 사용)
+
+        Args:
+            user_ids (list): 집계할 사용자 id (None 이면 활성 사용자 전체)
+
+        Returns:
+            dict: 사용자 id -> 합계 (기록이 없는 사용자는 0)
+        """
+        if user_ids is None:
+            user_ids = list(
+                get_user_model().objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True)
+            )
+        keys = {self.cache_key(user_id, self.label): user_id for user_id in user_ids}
+        cached = cache.get_many(list(keys))
+        totals = {keys[key]: value for key, value in cached.items()}
+
+        missing = [user_id for user_id in user_ids if user_id not in totals]
+        if missing:
+            computed = self.compute(missing if len(missing) <= self.MAX_FILTER_USERS else None)
+            fresh = {user_id: computed.get(user_id) or self.empty_totals() for user_id in missing}
+            cache.set_many(
+                {self.cache_key(user_id, self.label): value for user_id, value in fresh.items()},
+                self.get_timeout(),
+            )
+            totals.update(fresh)
+        return {user_id: totals[user_id] for user_id in user_ids}
+
+    def department_totals(self, user_totals):
+        """
+        부서별 월간 합계
+
+        Args:
+            user_totals (dict): user_totals() 결과
+
+        Returns:
+            dict: 부서명 -> 합계 (employees 는 부서 인원)
+        """
+        departments = dict(
+            get_user_model().objects.filter(pk__in=list(user_totals)).values_list('pk', 'userprofile__department')
+        )
+        result = {}
+        for user_id, values in user_totals.items():
+            name = departments.get(user_id) or self.NO_DEPARTMENT
+            summary = result.setdefault(name, {**self.empty_totals(), 'employees': 0})
+            summary['employees'] += 1
+            for field, value in values.items():
+                summary[field] += value
+        return result
+
+
+class AttendanceTrend:
+    """
+    근태 추이 (요약 테이블 전용)
+
+    CommuteMonthlySummary / CommuteDailySummary 만 읽으므로 여러 해에 걸친 조회도
+    원본 출퇴근 기록을 건드리지 않습니다.
+
+    사용 예:
+        trend = AttendanceTrend(date(2023, 1, 1), date(2024, 12, 1))
+        trend.monthly()  # [{'month': date(2023, 1, 1), 'employees': ..., 'worked_minutes': ..., ...}, ...]
+    """
+
+    PERIODS = ('month', 'day')
+
+    def __init__(self, start, end):
+        if start > end:
+            raise AttendanceReportError('시작 월이 종료 월보다 늦습니다.')
+        self.start = start.replace(day=1)
+        self.stop = next_month(end)
+
+    def monthly(self):
+        """월별 전체 합계 (employees 는 기록이 있는 직원 수)"""
+        return list(
+            CommuteMonthlySummary.objects.filter(month__gte=self.start, month__lt=self.stop)
+            .order_by('month').values('month')
+            .annotate(employees=Count('user_id'), **{field: Sum(field) for field in COUNTER_FIELDS})
+        )
+
+    def daily(self):
+        """일자별 전체 합계"""
+        return list(
+            CommuteDailySummary.objects.filter(work_date__gte=self.start, work_date__lt=self.stop)
+            .order_by('work_date').values('work_date', *COUNTER_FIELDS)
+        )
@@ -0,0 +1,286 @@
+# =============================================================================
+# 비즈니스 관리 시스템 근무 규칙 엔진
+# =============================================================================
+# 설명: 부서/근무 유형별 근무 규칙을 메모리에 한 번 컴파일해 두고 근태 상태를 판정
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+근무 규칙 엔진 모듈
+
+활성 WorkRule 을 (부서, 근무 유형) 키의 사전으로 컴파일해 프로세스 메모리에 두고,
+기록마다 사전 조회 몇 번으로 규칙을 골라 근태 상태를 판정합니다.
+규칙이 바뀌면 트랜잭션 커밋 후 CacheGeneration('work_rule') 세대 번호를 올리므로 다른 워커 프로세스도
+다음 판정 때 규칙을 다시 읽습니다.
+
+규칙 선택 순서 (먼저 찾은 규칙 사용):
+    (부서, 근무 유형) -> (부서, 전체) -> (전체, 근무 유형) -> (전체, 전체) -> 기본 규칙 (9시~18시)
+    근무 유형은 그날 WorkSchedule.schedule_type 이며 스케줄이 없으면 '전체' 규칙만 찾습니다.
+
+판정 기준:
+- 스케줄이 휴일이면 정상
+- 스케줄이 있고 규칙이 스케줄 시각을 따르면 스케줄 시작/종료, 아니면 규칙 시작/종료 기준
+- 시작 + 지각 유예 이후 출근은 지각, 종료 - 조퇴 유예 이전 퇴근은 조퇴 (규칙에서 끌 수 있음)
+
+이 모듈은 모델을 직접 임포트하지 않으므로 모델, 마이그레이션, 관리 명령, 대량 처리 코드가
+함께 사용합니다.
+
+주요 기능:
+- 규칙 컴파일 및 세대 번호 기반 캐시 무효화
+- 기록 한 건 근태 상태 판정
+- 기간 내 기록의 근태 상태/초과 근무 일괄 재판정
+"""
+
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.utils import timezone
+
+from utils.cache import CacheGeneration
+
+from .summaries import STANDARD_END, STANDARD_START, batch_deltas, overtime_minutes, worked_minutes
+
+# 규칙 조회 시 '전체' 를 나타내는 값 (부서/근무 유형이 비어 있는 규칙)
+ANY = ''
+# WorkRule 에서 읽는 열 (CompiledRule 생성 인자 순서)
+RULE_FIELDS = (
+    'department', 'schedule_type', 'start_time', 'end_time', 'late_grace_minutes', 'early_leave_grace_minutes',
+    'check_late', 'check_early_leave', 'use_schedule_times',
+)
+# WorkSchedule 에서 읽는 열 (평가에 쓰는 스케줄 튜플)
+SCHEDULE_FIELDS = ('start_time', 'end_time', 'is_holiday', 'schedule_type')
+
+
+class CompiledRule:
+    """
+    컴파일된 근무 규칙
+
+    유예 시간은 timedelta 로 미리 바꿔 두어 판정 시에는 datetime 비교만 합니다.
+    """
+
+    __slots__ = ('start_time', 'end_time', 'late_grace', 'early_leave_grace',
+                 'check_late', 'check_early_leave', 'use_schedule_times')
+
+    def __init__(self, start_time=STANDARD_START, end_time=STANDARD_END, late_grace_minutes=0,
+                 early_leave_grace_minutes=0, check_late=True, check_early_leave=True, use_schedule_times=True):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.late_grace = timedelta(minutes=late_grace_minutes)
+        self.early_leave_grace = timedelta(minutes=early_leave_grace_minutes)
+        self.check_late = check_late
+        self.check_early_leave = check_early_leave
+        self.use_schedule_times = use_schedule_times
+
+    def evaluate(self, work_date, check_in, check_out, schedule=None, status='normal', tz=None):
+        """
+        근태 상태 판정
+
+        Args:
+            work_date (date): 근무일
+            check_in, check_out (datetime): 출근/퇴근 시각 (하나라도 없으면 status 를 그대로 반환)
+            schedule (tuple): 그날 스케줄 (start_time, end_time, is_holiday, schedule_type) 또는 None
+            status (str): 판정할 수 없을 때 돌려줄 기존 상태
+            tz: 기준 시간대 (기본 현재 시간대)
+        """
+        if check_in is None or check_out is None:
+            return status
+        start_time, end_time = self.start_time, self.end_time
+        if schedule is not None:
+            if schedule[2]:
+                return 'normal'
+            if self.use_schedule_times:
+                start_time, end_time = schedule[0], schedule[1]
+
+        tz = tz or timezone.get_current_timezone()
+        start = datetime.combine(work_date, start_time, tz)
+        end = datetime.combine(work_date, end_time, tz)
+        if end <= start:
+            end += timedelta(days=1)
+        if check_in.tzinfo is None:
+            check_in, check_out = timezone.make_aware(check_in, tz), timezone.make_aware(check_out, tz)
+
+        if self.check_late and check_in > start + self.late_grace:
+            return 'late'
+        if self.check_early_leave and check_out < end - self.early_leave_grace:
+            return 'early_leave'
+        return 'normal'
+
+
+# 규칙이 하나도 맞지 않을 때의 기본 규칙 (9시 출근, 18시 퇴근, 유예 없음)
+DEFAULT_RULE = CompiledRule()
+
+
+class WorkRuleEngine:
+    """
+    근무 규칙 엔진
+
+    사용 예:
+        engine = WorkRuleEngine.current()
+        status = engine.evaluate(record.work_date, record.check_in_time, record.check_out_time,
+                                 department='개발팀', schedule=(time(10), time(19), False, 'remote'))
+    """
+
+    NAMESPACE = 'work_rule'
+    # (세대 번호, 엔진) - 프로세스별 컴파일 결과
+    _cached = None
+
+    def __init__(self, rules=()):
+        """
+        Args:
+            rules (iterable): RULE_FIELDS 순서의 활성 규칙 값 튜플
+        """
+        self.rules = {}
+        for department, schedule_type, *options in rules:
+            self.rules[(department or ANY, schedule_type or ANY)] = CompiledRule(*options)
+        # 부서별 규칙이 없으면 판정 시 사용자 부서를 조회할 필요가 없음
+        self.by_department = any(department != ANY for department, _ in self.rules)
+
+    @classmethod
+    def load(cls, apps=None):
+        """DB 의 활성 규칙으로 엔진 생성"""
+        rule_model = (apps or global_apps).get_model('commute', 'WorkRule')
+        return cls(rule_model.objects.filter(is_active=True).order_by().values_list(*RULE_FIELDS))
+
+    @classmethod
+    def current(cls):
+        """현재 세대의 엔진 (세대 번호가 바뀌었으면 다시 컴파일)"""
+        generation = CacheGeneration.get(cls.NAMESPACE)
+        cached = cls._cached
+        if cached is None or cached[0] != generation:
+            cached = cls._cached = (generation, cls.load())
+        return cached[1]
+
+    @classmethod
+    def invalidate(cls):
+        """규칙 변경 시 모든 프로세스의 엔진 무효화 (커밋 후)"""
+        transaction.on_commit(cls._invalidate)
+
+    @classmethod
+    def _invalidate(cls):
+        cls._cached = None
+        CacheGeneration.bump(cls.NAMESPACE)
+
+    def rule_for(self, department=ANY, schedule_type=ANY):
+        """부서/근무 유형에 맞는 규칙"""
+        rules = self.rules
+        department = department or ANY
+        schedule_type = schedule_type or ANY
+        return (
+            rules.get((department, schedule_type))
+            or rules.get((department, ANY))
+            or rules.get((ANY, schedule_type))
+            or rules.get((ANY, ANY))
+            or DEFAULT_RULE
+        )
+
+    def evaluate(self, work_date, check_in, check_out, department=ANY, schedule=None, status='normal', tz=None):
+        """규칙을 골라 근태 상태 판정 (인자는 CompiledRule.evaluate 참고)"""
+        rule = self.rule_for(department, schedule[3] if schedule else ANY)
+        return rule.evaluate(work_date, check_in, check_out, schedule, status, tz)
+
+
+def load_departments(user_ids, apps=None, batch_size=1000):
+    """사용자 id -> 부서 (프로필이 없거나 부서가 비어 있으면 빠짐)"""
+    profile_model = (apps or global_apps).get_model('login', 'UserProfile')
+    user_ids = list(user_ids)
+    departments = {}
+    for offset in range(0, len(user_ids), batch_size):
+        departments.update(
+            profile_model.objects.filter(user_id__in=user_ids[offset:offset + batch_size])
+            .exclude(department='').values_list('user_id', 'department')
+        )
+    return departments
+
+
+class StatusReevaluator:
+    """
+    근태 상태/초과 근무 일괄 재판정
+
+    규칙이나 스케줄이 바뀐 뒤 기간 내 기록을 pk 순서 묶음으로 읽어 현재 규칙으로 다시 판정하고,
+    값이 바뀐 기록만 상태별 UPDATE 로 고친 뒤 요약 증감분을 반영하고, 집계 캐시는 커밋 후에 무효화합니다.
+
+    사용 예:
+        StatusReevaluator().run(date(2024, 1, 1), date(2024, 12, 31))
+    """
+
+    def __init__(self, apps=None, batch_size=2000, engine=None):
+        self.apps = apps or global_apps
+        self.record_model = self.apps.get_model('commute', 'CommuteRecord')
+        self.schedule_model = self.apps.get_model('commute', 'WorkSchedule')
+        self.batch_size = batch_size
+        self.engine = engine or WorkRuleEngine.current()
+
+    def run(self, start, end, user_ids=None, dry_run=False):
+        """
+        start ~ end (근무일, 양 끝 포함) 기록 재판정
+
+        Args:
+            user_ids (list): 대상 사용자 (None 이면 전체)
+            dry_run (bool): True 면 바뀔 건수만 계산하고 저장하지 않음
+
+        Returns:
+            dict: records (읽은 기록 수), changed (상태나 초과 근무가 바뀐 기록 수),
+                  statuses ({새 상태: 건수})
+        """
+        from commute.models import apply_summary_deltas
+        from commute.reports import MonthlyAttendance
+
+        queryset = self.record_model.objects.filter(work_date__gte=start, work_date__lte=end).order_by('pk')
+        if user_ids is not None:
+            queryset = queryset.filter(user_id__in=user_ids)
+        columns = ('pk', 'user_id', 'work_date', 'check_in_time', 'check_out_time', 'status',
+                   'total_work_hours', 'overtime_minutes')
+        tz = timezone.get_current_timezone()
+        result = {'records': 0, 'changed': 0, 'statuses': {}}
+        last_pk = 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk).values_list(*columns)[:self.batch_size])
+            if not rows:
+                return result
+            last_pk = rows[-1][0]
+            result['records'] += len(rows)
+
+            users = {row[1] for row in rows}
+            dates = [row[2] for row in rows]
+            schedules = {
+                (row[0], row[1]): row[2:]
+                for row in self.schedule_model.objects.filter(
+                    user_id__in=users, work_date__gte=min(dates), work_date__lte=max(dates)
+                ).values_list('user_id', 'work_date', *SCHEDULE_FIELDS)
+            }
+            departments = load_departments(users, self.apps) if self.engine.by_department else {}
+
+            updates = {}
+            changes = []
+            for pk, user_id, work_date, check_in, check_out, status, total, overtime in rows:
+                schedule = schedules.get((user_id, work_date))
+                new_status = self.engine.evaluate(
+                    work_date, check_in, check_out, departments.get(user_id, ANY), schedule, status, tz
+                )
+                worked = worked_minutes(total)
+                new_overtime = overtime_minutes(worked, schedule[:3] if schedule else None) if worked else 0
+                if (new_status, new_overtime) == (status, overtime):
+                    continue
+                updates.setdefault((new_status, new_overtime), []).append(pk)
+                changes.append((
+                    (user_id, work_date, status, worked, overtime),
+                    (user_id, work_date, new_status, worked, new_overtime),
+                ))
+                result['statuses'][new_status] = result['statuses'].get(new_status, 0) + 1
+            result['changed'] += len(changes)
+            if dry_run or not changes:
+                continue
+
+            with transaction.atomic():
+                for (new_status, new_overtime), pks in updates.items():
+                    self.record_model.objects.filter(pk__in=pks).update(
+                        status=new_status, overtime_minutes=new_overtime, updated_at=timezone.now()
+                    )
+                apply_summary_deltas(batch_deltas(changes), batch_size=self.batch_size)
+            transaction.on_commit(
+                partial(MonthlyAttendance.invalidate, [(previous[0], previous[1]) for previous, _ in changes])
+            )
+
@@ -0,0 +1,55 @@
+"""
+근태 관리 앱 시그널
+
+출퇴근 기록이 저장/삭제되면 그 사용자의 그 달 월간 집계 캐시만 무효화합니다.
+수정으로 사용자나 근무일이 바뀐 경우 이전 (사용자, 월) 캐시도 함께 무효화합니다.
+캐시 삭제는 트랜잭션 커밋 후에 실행하므로, 커밋 전에 다른 요청이 이전 데이터로 캐시를 다시 채우지 않습니다.
+기록이 삭제되면 일자별/월별 요약에서 그 기록의 기여분을 빼고,
+근무 스케줄이 바뀌면 같은 날 기록의 근태 상태와 초과 근무를 다시 판정합니다.
+근무 규칙이 바뀌면 모든 프로세스의 규칙 엔진을 무효화합니다.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CommuteRecord, WorkRule, WorkSchedule, apply_summary_deltas
+from .reports import MonthlyAttendance
+from .rules import StatusReevaluator, WorkRuleEngine
+from .summaries import summary_deltas
+
+
+@receiver(post_save, sender=CommuteRecord)
+@receiver(post_delete, sender=CommuteRecord)
+def invalidate_monthly_attendance(sender, instance, using=None, **kwargs):
+    """월간 근태 집계 캐시 무효화 (커밋 후)"""
+    current = (instance.user_id, instance.work_date)
+    loaded = instance.__dict__.get('_loaded_values') or current
+    transaction.on_commit(partial(MonthlyAttendance.invalidate, [current, loaded[:2]]), using=using)
+
+
+@receiver(post_delete, sender=CommuteRecord)
+def subtract_commute_summary(sender, instance, **kwargs):
+    """삭제된 기록의 기여분을 요약에서 제외"""
+    previous = instance.__dict__.get('_loaded_values') or instance.summary_values()
+    apply_summary_deltas(summary_deltas(previous, None))
+
+
+@receiver(post_save, sender=WorkSchedule)
+@receiver(post_delete, sender=WorkSchedule)
+def reevaluate_schedule_day(sender, instance, **kwargs):
+    """스케줄이 바뀐 날(수정 전 날짜 포함) 기록의 근태 상태와 초과 근무 재판정"""
+    keys = {(instance.user_id, instance.work_date), instance.__dict__.get('_loaded_key')}
+    reevaluator = StatusReevaluator()
+    for user_id, work_date in filter(None, keys):
+        reevaluator.run(work_date, work_date, user_ids=[user_id])
+    instance._loaded_key = (instance.user_id, instance.work_date)
+
+
+@receiver(post_save, sender=WorkRule)
+@receiver(post_delete, sender=WorkRule)
+def invalidate_work_rules(sender, instance, **kwargs):
+    """근무 규칙 엔진 무효화 (기존 기록 재판정은 reevaluate_commute_status 명령)"""
+    WorkRuleEngine.invalidate()
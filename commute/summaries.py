@@ -0,0 +1,218 @@
+# =============================================================================
+# 비즈니스 관리 시스템 근태 요약 계산
+# =============================================================================
+# 설명: 출퇴근 기록 한 건이 일자별/월별 요약 테이블에 더하는 값과 증감분 계산
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+근태 요약 계산 모듈
+
+출퇴근 기록 한 건의 기여분(근무 분, 초과 근무 분, 상태별 건수)을 계산하고,
+수정 전후 기여분의 차이를 일자별(CommuteDailySummary) / 사용자 월별(CommuteMonthlySummary)
+요약 행의 증감분으로 바꿉니다. 저장 시에는 이 증감분만 F() 식으로 더하므로
+요약 테이블을 다시 집계하지 않습니다.
+
+이 모듈은 모델을 직접 임포트하지 않으므로 모델, 마이그레이션, 재구성 명령, 대량 처리 코드가
+함께 사용합니다.
+
+주요 기능:
+- 근무 스케줄 대비 초과 근무 계산 (스케줄이 없으면 9시~18시 기준)
+- 기록 기여분 및 수정 전후 증감분 계산
+- 월 범위 요약 일괄 재구성
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, time, timedelta
+
+from django.apps import apps as global_apps
+from django.db import transaction
+
+# 기준 근무 시간 (스케줄이 없는 날)
+STANDARD_START = time(9, 0)
+STANDARD_END = time(18, 0)
+STANDARD_MINUTES = 9 * 60
+
+# 집계 대상 근태 상태
+STATUSES = ('normal', 'late', 'early_leave', 'absence')
+# 요약 테이블 카운터 열
+COUNTER_FIELDS = ('records', 'worked_minutes', 'overtime_minutes', *STATUSES)
+# 값이 바뀌면 요약을 갱신해야 하는 CommuteRecord 필드 (출퇴근 시각은 근무 시간/상태를 바꿈)
+SOURCE_FIELDS = (
+    'user', 'user_id', 'work_date', 'check_in_time', 'check_out_time', 'status', 'total_work_hours',
+    'overtime_minutes',
+)
+# save() 가 계산하는 CommuteRecord 필드 (update_fields 를 주어도 항상 함께 저장)
+DERIVED_FIELDS = ('total_work_hours', 'status', 'overtime_minutes')
+
+
+def worked_minutes(duration):
+    """근무 시간(timedelta)을 분 단위 정수로 변환 (없으면 0)"""
+    return int(duration.total_seconds() // 60) if duration else 0
+
+
+def scheduled_minutes(start_time, end_time, is_holiday=False):
+    """스케줄 근무 분 (휴일은 0, 종료가 시작보다 이르면 다음 날 종료)"""
+    if is_holiday:
+        return 0
+    start = datetime.combine(datetime.min, start_time)
+    end = datetime.combine(datetime.min, end_time)
+    if end < start:
+        end += timedelta(days=1)
+    return int((end - start).total_seconds() // 60)
+
+
+def overtime_minutes(worked, schedule=None):
+    """
+    초과 근무 분
+
+    Args:
+        worked (int): 근무 분
+        schedule (tuple): (start_time, end_time, is_holiday) 또는 None (기준 근무 시간)
+    """
+    planned = scheduled_minutes(*schedule) if schedule else STANDARD_MINUTES
+    return max(worked - planned, 0)
+
+
+def month_start(day):
+    """근무일이 속한 달의 1일"""
+    return day.replace(day=1)
+
+
+def next_month(day):
+    """다음 달 1일"""
+    return datetime(day.year + day.month // 12, day.month % 12 + 1, 1).date()
+
+
+def contribution(status, worked, overtime):
+    """기록 한 건이 요약 행에 더하는 카운터 값"""
+    values = Counter(records=1, worked_minutes=worked, overtime_minutes=overtime)
+    if status in STATUSES:
+        values[status] += 1
+    return values
+
+
+def summary_deltas(previous, current):
+    """
+    수정 전후 기록 값으로 요약 행별 증감분 계산
+
+    Args:
+        previous (tuple): 수정 전 (user_id, work_date, status, 근무 분, 초과 근무 분), 새 기록이면 None
+        current (tuple): 수정 후 값, 삭제면 None
+
+    Returns:
+        list: [('daily', {'work_date': ...}, {카운터: 증감}),
+               ('monthly', {'user_id': ..., 'month': ...}, {카운터: 증감}), ...] (0 인 증감은 제외)
+    """
+    return batch_deltas([(previous, current)])
+
+
+def batch_deltas(changes):
+    """
+    여러 기록의 수정 전후 값으로 요약 행별 증감분을 합쳐 계산
+
+    같은 요약 행에 대한 증감은 하나로 합치므로 대량 처리 시 요약 행마다 UPDATE 한 번이면 됩니다.
+
+    Args:
+        changes (iterable): (수정 전 값, 수정 후 값) 쌍 (summary_deltas 와 같은 형식)
+
+    Returns:
+        list: summary_deltas() 와 같은 형식
+    """
+    deltas = {}
+    for previous, current in changes:
+        for values, sign in ((previous, -1), (current, 1)):
+            if values is None:
+                continue
+            user_id, work_date, status, worked, overtime = values
+            counters = contribution(status, worked, overtime)
+            for key in (('daily', work_date), ('monthly', user_id, month_start(work_date))):
+                target = deltas.setdefault(key, Counter())
+                for field, value in counters.items():
+                    target[field] += sign * value
+
+    result = []
+    for key, counters in deltas.items():
+        counters = {field: value for field, value in counters.items() if value}
+        if not counters:
+            continue
+        if key[0] == 'daily':
+            result.append(('daily', {'work_date': key[1]}, counters))
+        else:
+            result.append(('monthly', {'user_id': key[1], 'month': key[2]}, counters))
+    return result
+
+
+class SummaryRebuilder:
+    """
+    근태 요약 일괄 재구성
+
+    월 범위의 출퇴근 기록과 근무 스케줄을 한 번씩 읽어 초과 근무와 요약 값을 메모리에서 계산한 뒤
+    그 범위의 일자별/월별 요약 행을 지우고 bulk_create 로 다시 만듭니다.
+    (마이그레이션 백필, bulk_create 로 만든 기록, 쿼리셋 update() 등 save() 를 거치지 않은 변경용)
+
+    사용 예:
+        SummaryRebuilder().rebuild(date(2023, 1, 1), date(2024, 12, 1))
+    """
+
+    def __init__(self, apps=None, batch_size=2000):
+        apps = apps or global_apps
+        self.record_model = apps.get_model('commute', 'CommuteRecord')
+        self.schedule_model = apps.get_model('commute', 'WorkSchedule')
+        self.daily_model = apps.get_model('commute', 'CommuteDailySummary')
+        self.monthly_model = apps.get_model('commute', 'CommuteMonthlySummary')
+        self.batch_size = batch_size
+
+    def rebuild(self, start, end):
+        """
+        start 가 속한 달부터 end 가 속한 달까지 요약 재구성
+
+        Returns:
+            dict: months (재구성한 달 수), records (처리한 기록 수), overtime_updated (초과 근무를 고친 기록 수)
+        """
+        start, stop = month_start(start), next_month(end)
+        schedules = {
+            (user_id, work_date): (start_time, end_time, is_holiday)
+            for user_id, work_date, start_time, end_time, is_holiday in self.schedule_model.objects.filter(
+                work_date__gte=start, work_date__lt=stop
+            ).order_by().values_list('user_id', 'work_date', 'start_time', 'end_time', 'is_holiday').iterator(
+                chunk_size=self.batch_size
+            )
+        }
+        rows = self.record_model.objects.filter(work_date__gte=start, work_date__lt=stop).order_by().values_list(
+            'pk', 'user_id', 'work_date', 'status', 'total_work_hours', 'overtime_minutes'
+        )
+
+        daily = defaultdict(Counter)
+        monthly = defaultdict(Counter)
+        overtime_updates = []
+        total = 0
+        for pk, user_id, work_date, status, duration, stored_overtime in rows.iterator(chunk_size=self.batch_size):
+            total += 1
+            worked = worked_minutes(duration)
+            overtime = overtime_minutes(worked, schedules.get((user_id, work_date))) if worked else 0
+            if overtime != stored_overtime:
+                overtime_updates.append(self.record_model(pk=pk, overtime_minutes=overtime))
+            counters = contribution(status, worked, overtime)
+            daily[work_date].update(counters)
+            monthly[(user_id, month_start(work_date))].update(counters)
+
+        with transaction.atomic():
+            self.daily_model.objects.filter(work_date__gte=start, work_date__lt=stop).delete()
+            self.monthly_model.objects.filter(month__gte=start, month__lt=stop).delete()
+            self.daily_model.objects.bulk_create(
+                [self.daily_model(work_date=work_date, **values) for work_date, values in daily.items()],
+                batch_size=self.batch_size,
+            )
+            self.monthly_model.objects.bulk_create(
+                [
+                    self.monthly_model(user_id=user_id, month=month, **values)
+                    for (user_id, month), values in monthly.items()
+                ],
+                batch_size=self.batch_size,
+            )
+            self.record_model.objects.bulk_update(overtime_updates, ['overtime_minutes'], batch_size=self.batch_size)
+
+        months = (stop.year - start.year) * 12 + stop.month - start.month
+        return {'months': months, 'records': total, 'overtime_updated': len(overtime_updates)}
@@ -0,0 +1,165 @@
+# =============================================================================
+# 비즈니스 관리 시스템 캘린더 피드
+# =============================================================================
+# 설명: 근무 스케줄, 휴가, 출장, 공지 마감일을 한 기간의 일정 목록으로 합침
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+캘린더 피드 모듈
+
+원본마다 날짜 열 인덱스를 쓰는 범위 쿼리 한 번씩으로 요청 기간의 일정을 읽고,
+각 원본을 시작일 순 이터레이터로 둔 채 heapq.merge 로 합치므로 전체 목록을 메모리에 올려
+정렬하지 않고 JSON 또는 ICS 로 바로 스트리밍할 수 있습니다.
+ETag 는 원본별 (최종 수정일, 행 수) 집계로 만들어 1분마다 폴링하는 캘린더 클라이언트가
+바뀐 것이 없으면 본문 없이 304 를 받게 합니다.
+
+원본:
+    - schedule: 근무 스케줄 (work_date, 시각 있는 일정)
+    - leave: 신청/승인 상태 휴가 (start_date ~ end_date, 종일)
+    - trip: 신청/승인 상태 출장 (start_date ~ end_date, 종일)
+    - notice: 게시된 공지의 마감일 (deadline, 종일, 전체 공개)
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from heapq import merge
+from operator import itemgetter
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+
+from commute.models import BusinessTrip, LeaveRequest, WorkSchedule
+from utils.cache import ResponseCache
+from 공지사항.models import Notice
+
+
+class CalendarFeedError(ValueError):
+    """잘못된 캘린더 피드 요청"""
+
+
+LEAVE_TYPES = dict(LeaveRequest._meta.get_field('leave_type').choices)
+SCHEDULE_TYPES = dict(WorkSchedule._meta.get_field('schedule_type').choices)
+# 신청 상태 -> ICS STATUS
+ICS_STATUS = {'pending': 'TENTATIVE', 'approved': 'CONFIRMED'}
+
+
+class CalendarFeed:
+    """
+    캘린더 피드
+
+    사용 예:
+        feed = CalendarFeed(date(2024, 5, 1), date(2024, 5, 31), user_ids=[3])
+        etag = feed.etag('json')
+        for event in feed.events():  # 시작일 순
+            ...
+    """
+
+    SOURCES = ('schedule', 'leave', 'trip', 'notice')
+    # 한 번에 조회할 수 있는 최대 기간(일)
+    MAX_DAYS = 366
+    # 원본별 이터레이터가 한 번에 읽는 행 수
+    CHUNK_SIZE = 1000
+
+    def __init__(self, start, end, user_ids=None, sources=None):
+        """
+        Args:
+            start, end (date): 기간 (양 끝 포함)
+            user_ids (list): 근무 스케줄/휴가/출장 대상 사용자 (None 이면 전체)
+            sources (iterable): 포함할 원본 (None 이면 전체)
+        """
+        if end < start:
+            raise CalendarFeedError('종료일이 시작일보다 빠릅니다.')
+        if (end - start).days + 1 > self.MAX_DAYS:
+            raise CalendarFeedError(f'조회 기간은 최대 {self.MAX_DAYS}일입니다.')
+        sources = self.SOURCES if sources is None else tuple(sources)
+        unknown = set(sources) - set(self.SOURCES)
+        if unknown:
+            raise CalendarFeedError(f"알 수 없는 원본입니다: {', '.join(sorted(unknown))}")
+        self.start, self.end = start, end
+        self.user_ids = None if user_ids is None else sorted(user_ids)
+        self.sources = [source for source in self.SOURCES if source in sources]
+        self.tz = ZoneInfo(settings.TIME_ZONE)
+
+    def queryset(self, source):
+        """원본별 기간 쿼리셋 (날짜 열 범위 조건)"""
+        if source == 'notice':
+            return Notice.objects.filter(status='published', deadline__gte=self.start, deadline__lte=self.end)
+        if source == 'schedule':
+            queryset = WorkSchedule.objects.filter(work_date__gte=self.start, work_date__lte=self.end)
+        else:
+            model = LeaveRequest if source == 'leave' else BusinessTrip
+            queryset = model.active_between(self.start, self.end)
+        if self.user_ids is not None:
+            queryset = queryset.filter(user_id__in=self.user_ids)
+        return queryset
+
+    def etag(self, *parts):
+        """원본별 (최종 수정일, 행 수)와 요청 조건으로 만든 약한 ETag"""
+        tags = [ResponseCache.queryset_etag(self.queryset(source))[0] for source in self.sources]
+        raw = ':'.join([
+            *tags, str(self.start), str(self.end), ','.join(self.sources),
+            '*' if self.user_ids is None else ','.join(map(str, self.user_ids)), *map(str, parts),
+        ])
+        return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+    def events(self):
+        """모든 원본 일정 (시작일 순 병합 이터레이터)"""
+        streams = [getattr(self, f'{source}_events')() for source in self.sources]
+        return (event for _, event in merge(*streams, key=itemgetter(0)))
+
+    def schedule_events(self):
+        rows = self.queryset('schedule').order_by('work_date', 'pk').values_list(
+            'pk', 'user_id', 'user__username', 'work_date', 'start_time', 'end_time', 'is_holiday', 'schedule_type'
+        )
+        for pk, user_id, username, work_date, start_time, end_time, is_holiday, schedule_type in rows.iterator(
+            chunk_size=self.CHUNK_SIZE
+        ):
+            start = datetime.combine(work_date, start_time, tzinfo=self.tz)
+            end = datetime.combine(work_date, end_time, tzinfo=self.tz)
+            # 종료 시각이 시작 시각보다 이르면 다음 날 종료 (야간 근무)
+            if end <= start:
+                end += timedelta(days=1)
+            label = SCHEDULE_TYPES.get(schedule_type, schedule_type)
+            yield work_date, {
+                'uid': f'schedule-{pk}@business-management', 'kind': 'schedule', 'id': pk,
+                'title': f"{username} {label}{' (휴일)' if is_holiday else ''}",
+                'start': start, 'end': end, 'all_day': False,
+                'user_id': user_id, 'username': username, 'category': '근무',
+            }
+
+    def leave_events(self):
+        rows = self.queryset('leave').order_by('start_date', 'pk').values_list(
+            'pk', 'user_id', 'user__username', 'start_date', 'end_date', 'status', 'leave_type'
+        )
+        for pk, user_id, username, start, end, status, leave_type in rows.iterator(chunk_size=self.CHUNK_SIZE):
+            yield start, {
+                'uid': f'leave-{pk}@business-management', 'kind': 'leave', 'id': pk,
+                'title': f"{username} {LEAVE_TYPES.get(leave_type, leave_type)}",
+                'start': start, 'end': end, 'all_day': True,
+                'user_id': user_id, 'username': username, 'category': '휴가', 'status': ICS_STATUS[status],
+            }
+
+    def trip_events(self):
+        rows = self.queryset('trip').order_by('start_date', 'pk').values_list(
+            'pk', 'user_id', 'user__username', 'start_date', 'end_date', 'status', 'destination', 'purpose'
+        )
+        for pk, user_id, username, start, end, status, destination, purpose in rows.iterator(
+            chunk_size=self.CHUNK_SIZE
+        ):
+            yield start, {
+                'uid': f'trip-{pk}@business-management', 'kind': 'trip', 'id': pk,
+                'title': f"{username} 출장 - {destination}", 'description': purpose,
+                'start': start, 'end': end, 'all_day': True,
+                'user_id': user_id, 'username': username, 'category': '출장', 'status': ICS_STATUS[status],
+            }
+
+    def notice_events(self):
+        rows = self.queryset('notice').order_by('deadline', 'pk').values_list('pk', 'title', 'deadline', 'importance')
+        for pk, title, deadline, importance in rows.iterator(chunk_size=self.CHUNK_SIZE):
+            yield deadline, {
+                'uid': f'notice-{pk}@business-management', 'kind': 'notice', 'id': pk,
+                'title': f"[마감] {title}", 'start': deadline, 'end': deadline, 'all_day': True,
+                'importance': importance, 'category': '공지',
+            }
@@ -8,6 +8,8 @@
 
 # Django 렌더링 함수 임포트
 from django.shortcuts import render
+# URL 역참조 함수 임포트
+from django.urls import reverse
 
 def home(request):
     """
@@ -41,8 +43,9 @@ def calendar(request):
         - 일정 추가, 수정, 삭제 기능
         - 이전/다음 달로 이동 가능
         - 오늘 날짜 강조 표시
+        - 일정은 캘린더 피드 API(feed_url)에서 월 단위로 읽어 표시
     """
-    return render(request, 'home/calendar.html')
+    return render(request, 'home/calendar.html', {'feed_url': reverse('api_calendar')})
 
 def data(request):
     """
@@ -31,7 +31,8 @@ DATABASES = {
 # 캐시 설정
 CACHES = {
     'default': {
-        'BACKEND': 'django_redis.cache.RedisCache',
+        'BACKEND': 'utils.cache.InstrumentedCache',
+        'WRAPPED_BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': os.environ.get('REDIS_URL', 'redis://redis:6379/0'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
@@ -43,6 +44,12 @@ CACHES = {
     }
 }
 
+# API 응답 캐시 - Redis를 공유하므로 워커 간 캐시 적중 가능
+API_RESPONSE_CACHE_TIMEOUT = int(os.environ.get('API_RESPONSE_CACHE_TIMEOUT', '60'))
+
+# 쿼리 프로파일러 - 운영 환경에서는 일부 요청만 샘플링
+QUERY_PROFILER_SAMPLE_RATE = float(os.environ.get('QUERY_PROFILER_SAMPLE_RATE', '0.01'))
+
 # 세션 설정
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
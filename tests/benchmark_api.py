@@ -0,0 +1,53 @@
+"""
+API 메모리 벤치마크 모듈
+
+이 모듈은 10,000건 규모의 데이터로 모든 v1 API 경로를 호출해 최대 메모리를 측정하고
+저장된 기준선(benchmark_api_baseline.json)보다 25% 이상 늘어나면 실패합니다.
+일반 테스트보다 오래 걸리므로 이름을 test_ 로 시작하지 않고 직접 지정해서 실행합니다.
+
+실행:
+    python manage.py test tests.benchmark_api
+    BENCHMARK_UPDATE_BASELINE=1 python manage.py test tests.benchmark_api  (기준선 갱신)
+"""
+
+import json
+import os
+
+from django.test import TestCase
+
+from utils.benchmark import APIBenchmark, BenchmarkDataGenerator, compare_results, load_baseline, save_results
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_api_baseline.json')
+ROW_COUNT = 10000
+
+
+class APIMemoryBenchmark(TestCase):
+    """API 경로별 메모리 회귀 벤치마크"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """10,000건 규모 테스트 데이터 생성"""
+        generator = BenchmarkDataGenerator(seed=42)
+        authors = generator.users(20)
+        generator.clients(ROW_COUNT)
+        generator.notices(ROW_COUNT, authors)
+        generator.technologies(ROW_COUNT, authors)
+        cls.admin = authors[0]
+        cls.admin.is_staff = True
+        cls.admin.is_superuser = True
+        cls.admin.save()
+
+    def test_api_memory_against_baseline(self):
+        """기준선 대비 API 최대 메모리 비교"""
+        self.client.force_login(self.admin)
+        results = APIBenchmark(self.client, iterations=3).run()
+
+        for name, result in results.items():
+            self.assertEqual(result['status'], 200, name)
+
+        if os.environ.get('BENCHMARK_UPDATE_BASELINE'):
+            save_results(BASELINE_PATH, results)
+            return
+
+        regressions = compare_results(results, load_baseline(BASELINE_PATH), tolerance=0.25)
+        self.assertEqual(regressions, [], json.dumps(regressions, ensure_ascii=False, indent=2))
@@ -0,0 +1,40 @@
+"""
+JSON 인코딩 벤치마크 모듈
+
+이 모듈은 공지사항 목록 응답(1,000건)을 기존 JsonResponse 경로와 JSON 렌더러 백엔드로
+각각 인코딩해 본문 크기와 인코딩 시간을 비교합니다.
+일반 테스트보다 오래 걸리므로 이름을 test_ 로 시작하지 않고 직접 지정해서 실행합니다.
+
+실행:
+    python manage.py test tests.benchmark_json
+"""
+
+import json
+
+from django.test import TestCase
+
+from utils.benchmark import BenchmarkDataGenerator, benchmark_json_encoding
+from 공지사항.models import Notice
+
+ROW_COUNT = 1000
+
+
+class JSONEncodingBenchmark(TestCase):
+    """JSON 인코더별 크기/시간 비교 벤치마크"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """테스트 데이터 생성"""
+        generator = BenchmarkDataGenerator(seed=42)
+        generator.notices(ROW_COUNT, generator.users(5))
+
+    def test_encoding_before_after(self):
+        """기존 경로 대비 본문 크기 및 인코딩 시간 비교"""
+        payload = {'items': list(Notice.objects.values()), 'total': ROW_COUNT}
+        results = benchmark_json_encoding(payload)
+        print('\n' + json.dumps(results, indent=2))
+
+        # 한글이 이스케이프되지 않으므로 본문이 작아야 함
+        self.assertLess(results['stdlib']['bytes'], results['django']['bytes'] * 0.6)
+        if 'orjson' in results:
+            self.assertLess(results['orjson']['time_ms'], results['django']['time_ms'])
@@ -0,0 +1,191 @@
+"""
+휴가/출장 신청 테스트 모듈
+
+이 모듈은 commute.absences 와 휴가/출장/팀 달력 API 를 테스트합니다.
+
+주요 기능:
+- 구간 색인 겹침 조회와 전수 비교 결과 일치 테스트
+- 휴가/출장/근무 스케줄 겹침 차단 테스트
+- 결재 상태 변경, API 권한 및 페이지 값 검사 테스트
+- 팀 월간 달력 쿼리 수 및 일자별 인원 테스트
+"""
+
+import json
+import random
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from commute.absences import AbsenceConflict, ConflictChecker, IntervalIndex, TeamCalendar, change_status, save_request
+from commute.models import BusinessTrip, LeaveRequest, WorkSchedule
+from commute.reports import MonthlyAttendance
+from login.models import UserProfile
+
+User = get_user_model()
+
+
+def leave(user, start, end, **fields):
+    """겹침 검사 후 휴가 신청 저장"""
+    return save_request(LeaveRequest(user=user, start_date=start, end_date=end, **fields))
+
+
+class IntervalIndexTest(TestCase):
+    """구간 색인 테스트"""
+
+    def test_matches_brute_force(self):
+        """bisect 후보 조회와 전수 비교 결과 일치 테스트"""
+        rng = random.Random(47)
+        base = date(2024, 1, 1)
+        entries = []
+        for number in range(400):
+            start = base + timedelta(days=rng.randrange(365))
+            entries.append({'id': number, 'start': start, 'end': start + timedelta(days=rng.choice([0, 0, 1, 4, 30]))})
+        index = IntervalIndex(entries)
+        self.assertEqual(len(index), 400)
+        for _ in range(200):
+            start = base + timedelta(days=rng.randrange(-10, 380))
+            end = start + timedelta(days=rng.randrange(10))
+            expected = {entry['id'] for entry in entries if entry['start'] <= end and entry['end'] >= start}
+            self.assertEqual({entry['id'] for entry in index.overlapping(start, end)}, expected)
+        self.assertEqual(IntervalIndex().overlapping(base, base), [])
+
+
+class AbsenceConflictTest(TestCase):
+    """겹침 검사 및 결재 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+        cls.boss = User.objects.create_user(username='boss', is_staff=True)
+
+    def test_conflicts(self):
+        """휴가/출장/근무 스케줄 겹침 차단 테스트"""
+        annual = leave(self.kim, date(2024, 5, 2), date(2024, 5, 8))
+        # 5/4~5/5 주말, 5/6 대체공휴일
+        self.assertEqual(annual.days, Decimal('4'))
+
+        with self.assertRaises(AbsenceConflict) as raised:
+            save_request(BusinessTrip(user=self.kim, destination='부산', start_date=date(2024, 5, 8), end_date=date(2024, 5, 9)))
+        self.assertEqual([(entry['kind'], entry['id']) for entry in raised.exception.conflicts], [('leave', annual.pk)])
+        # 다른 사용자, 인접 기간은 허용
+        leave(self.lee, date(2024, 5, 2), date(2024, 5, 8))
+        trip = save_request(BusinessTrip(user=self.kim, destination='부산', start_date=date(2024, 5, 9), end_date=date(2024, 5, 10)))
+
+        # 근무 스케줄: 휴가만 막고 휴일 스케줄은 막지 않음
+        WorkSchedule.objects.create(user=self.kim, work_date=date(2024, 5, 20), start_time=time(9), end_time=time(18))
+        WorkSchedule.objects.create(
+            user=self.kim, work_date=date(2024, 5, 21), start_time=time(9), end_time=time(18), is_holiday=True
+        )
+        with self.assertRaises(AbsenceConflict):
+            leave(self.kim, date(2024, 5, 20), date(2024, 5, 20))
+        half = leave(self.kim, date(2024, 5, 21), date(2024, 5, 21), leave_type='half_am')
+        self.assertEqual(half.days, Decimal('0.5'))
+        save_request(BusinessTrip(user=self.kim, destination='대전', start_date=date(2024, 5, 20), end_date=date(2024, 5, 20)))
+
+        # 수정 시 자기 자신은 제외, 취소/반려된 기간은 다시 신청 가능
+        trip.end_date = date(2024, 5, 13)
+        save_request(trip)
+        change_status(annual, 'cancel', self.kim)
+        self.assertEqual(annual.status, 'cancelled')
+        leave(self.kim, date(2024, 5, 3), date(2024, 5, 3))
+
+        checker = ConflictChecker([self.kim.pk, self.lee.pk], date(2024, 5, 1), date(2024, 5, 31))
+        self.assertEqual(len(checker.conflicts(self.lee.pk, 'trip', date(2024, 5, 1), date(2024, 5, 31))), 1)
+        self.assertEqual(checker.conflicts(self.kim.pk, 'leave', date(2024, 5, 14), date(2024, 5, 17)), [])
+
+    def test_api(self):
+        """신청/겹침/결재 API 테스트"""
+        url = reverse('api_commute_leaves')
+        self.client.force_login(self.kim)
+        response = self.client.post(url, json.dumps({
+            'leave_type': 'annual', 'start_date': '2024-06-03', 'end_date': '2024-06-07', 'reason': '여행',
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        created = response.json()['data']
+        self.assertEqual((created['status'], created['days']), ('pending', '4.0'))  # 6/6 현충일
+
+        response = self.client.post(reverse('api_commute_trips'), json.dumps({
+            'destination': '부산', 'start_date': '2024-06-07', 'end_date': '2024-06-07',
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['error_code'], 'CONFLICT')
+        self.assertEqual(response.json()['details'][0]['id'], created['id'])
+
+        response = self.client.post(url, json.dumps({
+            'leave_type': 'half_pm', 'start_date': '2024-06-10', 'end_date': '2024-06-11',
+        }), content_type='application/json')
+        self.assertEqual(response.json()['error_code'], 'INVALID_REQUEST')
+
+        detail = reverse('api_commute_leave_detail', args=[created['id']])
+        response = self.client.put(detail, json.dumps({'end_date': '2024-06-04'}), content_type='application/json')
+        self.assertEqual(response.json()['data']['days'], '2.0')
+        response = self.client.put(detail, json.dumps({'action': 'approve'}), content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_login(self.lee)
+        self.assertEqual(self.client.get(detail).status_code, 404)
+        self.assertEqual(self.client.get(url).json()['data']['pagination']['total_items'], 0)
+
+        self.client.force_login(self.boss)
+        response = self.client.put(detail, json.dumps({'action': 'approve'}), content_type='application/json')
+        self.assertEqual(response.json()['data']['status'], 'approved')
+        self.assertEqual(response.json()['data']['approver_id'], self.boss.pk)
+        response = self.client.put(detail, json.dumps({'action': 'reject'}), content_type='application/json')
+        self.assertEqual(response.json()['error_code'], 'INVALID_ACTION')
+        response = self.client.get(url, {'user': 'kim', 'from': '2024-06-04', 'to': '2024-06-30'})
+        self.assertEqual(response.json()['data']['pagination']['total_items'], 1)
+        self.assertEqual(self.client.get(url, {'from': '06/04'}).json()['error_code'], 'INVALID_DATE')
+
+        # 페이지 값 검사와 범위 보정
+        self.assertEqual(self.client.get(url, {'page': 'x'}).json()['error_code'], 'INVALID_PAGE')
+        self.assertEqual(self.client.get(url, {'per_page': '1.5'}).status_code, 400)
+        pagination = self.client.get(url, {'page': -3, 'per_page': 100000}).json()['data']['pagination']
+        self.assertEqual((pagination['current_page'], pagination['per_page']), (1, 100))
+        pagination = self.client.get(url, {'page': 99, 'per_page': 0}).json()['data']['pagination']
+        self.assertEqual((pagination['current_page'], pagination['per_page']), (1, 1))
+
+
+class TeamCalendarTest(TestCase):
+    """팀 월간 달력 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = []
+        for number in range(5):
+            user = User.objects.create_user(username=f'dev{number}')
+            UserProfile.objects.create(user=user, department='개발팀')
+            cls.members.append(user)
+        cls.other = User.objects.create_user(username='sales')
+        UserProfile.objects.create(user=cls.other, department='영업팀')
+
+    def test_month_calendar(self):
+        """그 달과 겹치는 일정, 일자별 인원, 쿼리 수 테스트"""
+        first, second = self.members[:2]
+        leave(first, date(2024, 4, 29), date(2024, 5, 3))
+        leave(second, date(2024, 5, 2), date(2024, 5, 2))
+        save_request(BusinessTrip(user=second, destination='제주', start_date=date(2024, 5, 30), end_date=date(2024, 6, 2)))
+        leave(self.members[2], date(2024, 5, 7), date(2024, 5, 7), status='rejected')
+        leave(self.other, date(2024, 5, 2), date(2024, 5, 2))
+        WorkSchedule.objects.create(user=first, work_date=date(2024, 5, 20), start_time=time(9), end_time=time(18))
+
+        # 팀원 1 + 휴가 1 + 출장 1 + 근무 스케줄 1
+        with self.assertNumQueries(4):
+            result = TeamCalendar(MonthlyAttendance(2024, 5), '개발팀').build()
+        self.assertEqual(len(result['members']), 5)
+        self.assertEqual([event['kind'] for event in result['events']], ['leave', 'leave', 'schedule', 'trip'])
+        days = {day['date']: day for day in result['days']}
+        self.assertEqual(len(days), 31)
+        self.assertEqual((days[date(2024, 5, 1)]['leave'], days[date(2024, 5, 2)]['leave']), (1, 2))
+        self.assertEqual((days[date(2024, 5, 4)]['leave'], days[date(2024, 5, 31)]['trip']), (0, 1))
+        self.assertFalse(days[date(2024, 5, 6)]['business_day'])
+
+        self.client.force_login(first)
+        response = self.client.get(reverse('api_commute_team_calendar'), {'month': '2024-05', 'department': '영업팀'})
+        self.assertEqual(response.json()['data']['department'], '개발팀')
+        self.client.force_login(User.objects.create_user(username='nobody'))
+        response = self.client.get(reverse('api_commute_team_calendar'), {'month': '2024-05'})
+        self.assertEqual(response.json()['error_code'], 'NO_DEPARTMENT')
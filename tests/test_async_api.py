@@ -0,0 +1,127 @@
+"""
+비동기 API 뷰 테스트 모듈
+
+이 모듈은 공지사항/기술/통합 검색/통계 API 를 AsyncClient(ASGI 요청 처리)로 테스트합니다.
+비동기 컨텍스트에서 지연 평가되는 request.user 나 외래키 접근이 남아 있으면
+SynchronousOnlyOperation 으로 실패합니다.
+
+주요 기능:
+- 로그인 확인 및 공지사항 목록/상세/304/생성/수정/삭제 테스트
+- 기술 상세 권한 필드 테스트
+- 원본별 검색 병행 실행 및 최신순 병합 테스트
+- 통계 분포 집계 테스트
+"""
+
+import json
+from datetime import date
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from api.views import NoticeAPIView, SearchAPIView, StatsAPIView, TechnologyAPIView
+from client_inform.models import customer_information
+from 기술.models import Technology
+from 공지사항.models import Notice
+
+User = get_user_model()
+
+
+def create_client(**kwargs):
+    values = {
+        'company_name': 'Hanbit Soft 주식회사', 'representative': '김민준',
+        'business_registration_number': '101-81-00340', 'phone_number': '02-1234-5678',
+        'region': '서울', 'groupware': False,
+    }
+    values.update(kwargs)
+    return customer_information.objects.create(**values)
+
+
+class AsyncAPIViewTest(TestCase):
+    """비동기 API 뷰 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author')
+        cls.other = User.objects.create_user(username='other')
+        cls.notice = Notice.objects.create(
+            title='비동기 공지', content='비동기 내용', author=cls.author, status='published'
+        )
+        cls.tech = Technology.objects.create(
+            name='비동기 Django', category='backend', author=cls.author, tags='Django, ASGI'
+        )
+        create_client(company_name='비동기 상사', registration_date=date(2000, 1, 1))
+
+    async def login(self, user):
+        # Django 4.2 의 AsyncClient 에는 aforce_login 이 없음
+        await sync_to_async(self.async_client.force_login)(user)
+
+    def test_views_are_async(self):
+        """모든 메서드 핸들러가 코루틴 함수인지 테스트"""
+        for view in (NoticeAPIView, TechnologyAPIView, SearchAPIView, StatsAPIView):
+            self.assertTrue(view.view_is_async, view.__name__)
+
+    async def test_notice_crud(self):
+        """로그인 확인, 목록/상세/304, 생성/수정/삭제 테스트"""
+        url = reverse('api_notice_list')
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 302)
+
+        await self.login(self.other)
+        response = await self.async_client.get(url)
+        self.assertEqual(response.json()['data']['pagination']['total_items'], 1)
+
+        detail = reverse('api_notice_detail', args=[self.notice.pk])
+        response = await self.async_client.get(detail)
+        self.assertEqual((response.json()['data']['author'], response.json()['data']['can_edit']), ('author', False))
+        response = await self.async_client.get(detail, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+        response = await self.async_client.get(reverse('api_notice_detail', args=[99999]))
+        self.assertEqual(response.json()['error_code'], 'NOTICE_NOT_FOUND')
+
+        response = await self.async_client.put(detail, json.dumps({'title': '수정'}), content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+
+        response = await self.async_client.post(url, json.dumps({
+            'title': '새 공지', 'content': '내용', 'auto_publish': True, 'deadline': '2024-05-31',
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        created = await Notice.objects.aget(pk=response.json()['data']['id'])
+        self.assertEqual((created.author_id, created.status, created.deadline), (self.other.pk, 'published', date(2024, 5, 31)))
+
+        mine = reverse('api_notice_detail', args=[created.pk])
+        response = await self.async_client.put(mine, json.dumps({'title': '수정'}), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((await Notice.objects.aget(pk=created.pk)).title, '수정')
+        response = await self.async_client.delete(mine)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(await Notice.objects.filter(pk=created.pk).aexists())
+
+    async def test_technology_detail(self):
+        """기술 상세/목록 테스트"""
+        await self.login(self.author)
+        response = await self.async_client.get(reverse('api_technology_detail', args=[self.tech.pk]))
+        data = response.json()['data']
+        self.assertEqual((data['author'], data['can_edit'], data['tag_list']), ('author', True, ['Django', 'ASGI']))
+        response = await self.async_client.get(reverse('api_technology_list'), {'tag': 'asgi'})
+        self.assertEqual(response.json()['data']['pagination']['total_items'], 1)
+
+    async def test_search_and_stats(self):
+        """원본별 검색 병합 및 통계 테스트"""
+        await self.login(self.other)
+        response = await self.async_client.get(reverse('api_search'), {'q': '비동기'})
+        data = response.json()['data']
+        self.assertEqual(data['total'], 3)
+        # 최신순 - 등록일이 오래된 거래처가 마지막
+        self.assertEqual([result['type'] for result in data['results']][-1], 'client')
+        response = await self.async_client.get(reverse('api_search'), {'q': 'asgi', 'type': 'technology'})
+        self.assertEqual([result['id'] for result in response.json()['data']['results']], [self.tech.pk])
+
+        response = await self.async_client.get(reverse('api_stats'))
+        stats = response.json()['data']
+        self.assertEqual((stats['notices']['total'], stats['notices']['published']), (1, 1))
+        categories = dict(Technology.CATEGORY_CHOICES)
+        self.assertEqual(len(stats['technologies']['by_category']), len(categories))
+        self.assertEqual(stats['technologies']['by_category'][categories['backend']], 1)
+        self.assertEqual(stats['clients']['by_region'], {'서울': 1})
@@ -0,0 +1,153 @@
+"""
+월간 근태 집계 테스트 모듈
+
+이 모듈은 commute.reports 와 /api/v1/commute/monthly/ 를 테스트합니다.
+
+주요 기능:
+- 사용자별/부서별 월간 합계 테스트
+- (사용자, 월) 캐시 및 기록 변경 시 해당 키만 무효화 테스트
+- 월간 근태 집계 API 권한 및 파라미터 테스트
+"""
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from commute.models import CommuteRecord
+from commute.reports import AttendanceReportError, MonthlyAttendance
+from login.models import UserProfile
+
+User = get_user_model()
+TZ = ZoneInfo(settings.TIME_ZONE)
+
+
+def punch(user, work_date, check_in=(9, 0), check_out=(18, 0)):
+    """출퇴근 기록 생성 (None 이면 결근)"""
+    if check_in is None:
+        return CommuteRecord.objects.create(user=user, work_date=work_date, status='absence')
+    return CommuteRecord.objects.create(
+        user=user, work_date=work_date,
+        check_in_time=datetime.combine(work_date, time(*check_in), tzinfo=TZ),
+        check_out_time=datetime.combine(work_date, time(*check_out), tzinfo=TZ),
+    )
+
+
+class MonthlyAttendanceTest(TestCase):
+    """월간 근태 집계 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+        cls.park = User.objects.create_user(username='park')
+        UserProfile.objects.create(user=cls.kim, department='개발팀')
+        UserProfile.objects.create(user=cls.lee, department='개발팀')
+
+        punch(cls.kim, date(2024, 5, 1))                         # 정상 9시간
+        punch(cls.kim, date(2024, 5, 2), check_in=(9, 30))       # 지각 8.5시간
+        punch(cls.kim, date(2024, 5, 3), check_out=(17, 0))      # 조퇴 8시간
+        punch(cls.kim, date(2024, 5, 6), check_in=None)          # 결근
+        punch(cls.kim, date(2024, 6, 3))                         # 다른 달
+        punch(cls.lee, date(2024, 5, 1), check_in=(8, 30))       # 정상 9.5시간
+
+    def setUp(self):
+        cache.clear()
+
+    def test_user_and_department_totals(self):
+        """사용자별/부서별 합계 테스트"""
+        report = MonthlyAttendance(2024, 5)
+        totals = report.user_totals()
+        self.assertEqual(totals[self.kim.pk], {
+            'work_seconds': int(timedelta(hours=25.5).total_seconds()), 'work_days': 3, 'records': 4,
+            'normal': 1, 'late': 1, 'early_leave': 1, 'absence': 1,
+        })
+        self.assertEqual(totals[self.park.pk], MonthlyAttendance.empty_totals())
+
+        departments = report.department_totals(totals)
+        self.assertEqual(departments['개발팀']['employees'], 2)
+        self.assertEqual(departments['개발팀']['work_seconds'], 35 * 3600)
+        self.assertEqual(departments['개발팀']['late'], 1)
+        self.assertEqual(departments[MonthlyAttendance.NO_DEPARTMENT]['employees'], 1)
+
+        self.assertEqual(MonthlyAttendance.from_string('2024-12').end, date(2025, 1, 1))
+        with self.assertRaises(AttendanceReportError):
+            MonthlyAttendance.from_string('2024-13')
+
+    def test_cache_invalidated_per_user_month(self):
+        """기록 변경 시 해당 (사용자, 월) 캐시만 무효화 테스트"""
+        report = MonthlyAttendance(2024, 5)
+        user_ids = [self.kim.pk, self.lee.pk, self.park.pk]
+        report.user_totals(user_ids)
+        with self.assertNumQueries(0):
+            report.user_totals(user_ids)
+
+        # 캐시는 커밋 후에 무효화
+        with self.captureOnCommitCallbacks() as callbacks:
+            punch(self.lee, date(2024, 5, 2), check_in=(10, 0))
+        with self.assertNumQueries(0):
+            report.user_totals(user_ids)
+        for callback in callbacks:
+            callback()
+        with self.assertNumQueries(1):  # lee 의 5월만 다시 집계
+            totals = report.user_totals(user_ids)
+        self.assertEqual(totals[self.lee.pk]['late'], 1)
+
+        # 6월 기록을 5월로 옮기면 두 달 모두 무효화
+        june = MonthlyAttendance(2024, 6)
+        june.user_totals([self.kim.pk])
+        record = CommuteRecord.objects.get(user=self.kim, work_date=date(2024, 6, 3))
+        record.work_date = date(2024, 5, 31)
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save()
+        self.assertEqual(june.user_totals([self.kim.pk])[self.kim.pk]['records'], 0)
+        self.assertEqual(report.user_totals([self.kim.pk])[self.kim.pk]['records'], 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delete()
+        self.assertEqual(report.user_totals([self.kim.pk])[self.kim.pk]['records'], 4)
+
+
+class AttendanceReportAPITest(TestCase):
+    """월간 근태 집계 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        cls.staff = User.objects.create_user(username='staff', password='testpass123', is_staff=True)
+        UserProfile.objects.create(user=cls.user, department='영업팀')
+        punch(cls.user, date(2024, 5, 1), check_in=(9, 10))
+        punch(cls.staff, date(2024, 5, 1))
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, **params):
+        return self.client.get(reverse('api_commute_monthly'), params)
+
+    def test_user_sees_own_totals_only(self):
+        """일반 사용자 본인 합계 및 권한 테스트"""
+        self.client.force_login(self.user)
+        body = self.get(month='2024-05').json()
+        self.assertEqual([row['username'] for row in body['data']['results']], ['user'])
+        self.assertEqual(body['data']['results'][0]['late'], 1)
+        self.assertEqual(body['data']['results'][0]['work_hours'], 8.83)
+
+        self.assertEqual(self.get(group='department').status_code, 403)
+        self.assertEqual(self.get(month='2024-5x').json()['error_code'], 'INVALID_MONTH')
+        self.assertEqual(self.get(group='team').json()['error_code'], 'INVALID_GROUP')
+
+    def test_staff_department_totals(self):
+        """관리자 부서별 합계 테스트"""
+        self.client.force_login(self.staff)
+        body = self.get(month='2024-05', group='department').json()
+        self.assertEqual(
+            [(row['department'], row['employees'], row['records']) for row in body['data']['results']],
+            [('미지정', 1, 1), ('영업팀', 1, 1)],
+        )
+        body = self.get(month='2024-05', user='user').json()
+        self.assertEqual([row['username'] for row in body['data']['results']], ['user'])
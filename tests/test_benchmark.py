@@ -0,0 +1,178 @@
+"""
+벤치마크 유틸리티 테스트 모듈
+
+이 모듈은 utils.benchmark 와 loadbench 관리 명령을 테스트합니다.
+
+주요 기능:
+- 합성 데이터 생성 테스트
+- 기준선 비교 테스트
+- loadbench 명령 실행 및 회귀 검출 테스트
+- httpbench 명령의 동시 요청 측정 테스트
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import time
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from client_inform.models import customer_information
+from commute.models import CommuteRecord, WorkRule, WorkSchedule
+from commute.rules import WorkRuleEngine
+from utils.benchmark import APIBenchmark, BenchmarkDataGenerator, ViewBenchmark, compare_results
+
+User = get_user_model()
+
+
+class BenchmarkDataGeneratorTest(TestCase):
+    """합성 데이터 생성기 테스트"""
+
+    def test_commute_records_match_model_rules(self):
+        """출퇴근 기록 근태 상태가 근무 규칙 엔진 판정과 일치하는지 테스트"""
+        cache.clear()
+        WorkRuleEngine._cached = None
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkRule.objects.create(name='유연 출근', late_grace_minutes=10)
+
+        generator = BenchmarkDataGenerator(seed=1)
+        users = generator.users(2)
+        generator.commute_records(users, days=30)
+        generator.work_schedules(users, days=30)
+
+        records = CommuteRecord.objects.exclude(status='absence')
+        self.assertTrue(records.exists())
+        self.assertEqual(WorkSchedule.objects.count(), CommuteRecord.objects.count())
+        for record in records:
+            self.assertEqual(record.status, record.evaluate_status())
+            self.assertEqual(record.total_work_hours, record.check_out_time - record.check_in_time)
+        # 유예 시간 안의 지각은 정상
+        self.assertTrue(any(
+            time(9, 0) < timezone.localtime(record.check_in_time).time() <= time(9, 10) and record.status == 'normal'
+            for record in records
+        ))
+
+        # 유일 제약(user, work_date) 충돌은 무시
+        generator.commute_records(users, days=30)
+        self.assertEqual(WorkSchedule.objects.count(), CommuteRecord.objects.count())
+
+
+class CompareResultsTest(TestCase):
+    """기준선 비교 테스트"""
+
+    def test_nested_metric_regression(self):
+        """점 표기 지표 회귀 검출 테스트"""
+        baseline = {'/': {'time_ms': {'median': 10.0}, 'peak_bytes': 1000}}
+        results = {'/': {'time_ms': {'median': 20.0}, 'peak_bytes': 1100}, '/new/': {'peak_bytes': 1}}
+
+        regressions = compare_results(results, baseline, tolerance=0.25, metrics=('time_ms.median', 'peak_bytes'))
+        self.assertEqual([(item['route'], item['metric']) for item in regressions], [('/', 'time_ms.median')])
+        self.assertEqual(regressions[0]['ratio'], 2.0)
+
+
+class LoadBenchCommandTest(TestCase):
+    """loadbench 관리 명령 테스트"""
+
+    def setUp(self):
+        """임시 디렉터리 설정"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmpdir, 'results.json')
+        self.baseline = os.path.join(self.tmpdir, 'baseline.json')
+
+    def tearDown(self):
+        """임시 디렉터리 삭제"""
+        shutil.rmtree(self.tmpdir)
+
+    def loadbench(self, *args):
+        call_command('loadbench', *args, stdout=StringIO())
+
+    def test_generate_only(self):
+        """데이터 생성 테스트"""
+        self.loadbench(
+            '--users', '3', '--clients', '20', '--notices', '10', '--technologies', '10',
+            '--commute-days', '14', '--skip-run',
+        )
+        self.assertEqual(User.objects.filter(username__startswith='bench_user').count(), 3)
+        self.assertEqual(customer_information.objects.count(), 20)
+        self.assertEqual(CommuteRecord.objects.values('user').distinct().count(), 3)
+
+        # 재실행 시 거래처 일련번호가 이어지고, --flush 는 이전 데이터를 지움
+        self.loadbench('--users', '3', '--clients', '20', '--notices', '0', '--technologies', '0',
+                       '--commute-days', '0', '--skip-run')
+        self.assertEqual(customer_information.objects.count(), 40)
+        self.loadbench('--users', '3', '--clients', '5', '--notices', '0', '--technologies', '0',
+                       '--commute-days', '0', '--skip-run', '--flush')
+        self.assertEqual(customer_information.objects.count(), 5)
+
+    def test_run_writes_results_and_flags_regressions(self):
+        """측정 결과 저장과 기준선 회귀 검출 테스트"""
+        self.loadbench(
+            '--users', '2', '--clients', '10', '--notices', '5', '--technologies', '5',
+            '--commute-days', '7', '--iterations', '1', '--no-memory',
+            '--output', self.output, '--baseline', self.baseline, '--update-baseline',
+        )
+        with open(self.output, encoding='utf-8') as results_file:
+            results = json.load(results_file)
+        self.assertIn('/', results)
+        self.assertIn('/client_inform/', results)
+        self.assertNotIn('/client/', results)
+        self.assertIn('api_notice_list', results)
+        self.assertEqual(results['api_notice_list']['status'], 200)
+
+        # 기준선을 인위적으로 낮춰 회귀 발생
+        for entry in results.values():
+            entry['bytes'] = 1
+        with open(self.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file)
+        with self.assertRaises(CommandError):
+            self.loadbench('--skip-generate', '--iterations', '1', '--no-memory', '--output', self.output,
+                           '--baseline', self.baseline, '--metrics', 'bytes')
+
+    def test_view_routes_skip_mutating_and_api_paths(self):
+        """화면 뷰 경로 수집 테스트"""
+        urls = [url for _, url in ViewBenchmark(client=None).get_routes()]
+        self.assertIn('/commute/', urls)
+        self.assertFalse(any(url.startswith(('/api/', '/admin/', '/health/')) for url in urls))
+        self.assertFalse(any('delete' in url for url in urls))
+        self.assertEqual(len(urls), len(set(urls)))
+
+    def test_api_routes_skip_post_only_views(self):
+        """API 경로 수집 시 GET 을 받지 않는 경로 제외 테스트"""
+        names = [name for name, _ in APIBenchmark(client=None).get_routes()]
+        self.assertIn('api_search', names)
+        self.assertNotIn('api_commute_punches', names)
+
+
+class HttpBenchCommandTest(LiveServerTestCase):
+    """httpbench 관리 명령 테스트"""
+
+    def test_measures_logged_in_requests(self):
+        """로그인 세션으로 동시 요청을 보내고 결과를 저장하는지 테스트"""
+        User.objects.create_user(username='bench_admin')
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        output = os.path.join(tmpdir, 'httpbench.json')
+
+        call_command(
+            'httpbench', f"{self.live_server_url}{reverse('api_search')}?q=검색", '--user', 'bench_admin',
+            '--concurrency', '2', '--duration', '0.5', '--output', output, stdout=StringIO(),
+        )
+        with open(output, encoding='utf-8') as results_file:
+            result = json.load(results_file)
+        # 로그인 세션이 없으면 로그인 페이지로 302
+        self.assertEqual(result['statuses'], {'200': result['requests']})
+        self.assertGreater(result['requests'], 0)
+        self.assertEqual(result['errors'], {})
+        self.assertGreater(result['bytes'], 0)
+        self.assertLessEqual(result['time_ms']['p50'], result['time_ms']['max'])
+
+        with self.assertRaises(CommandError):
+            call_command('httpbench', self.live_server_url, '--user', 'nobody', stdout=StringIO())
@@ -0,0 +1,95 @@
+"""
+영업일 달력 테스트 모듈
+
+이 모듈은 business_management.business_calendar 를 테스트합니다.
+
+주요 기능:
+- 닫힌 식 영업일 수와 하루씩 센 결과 일치 테스트
+- 공휴일/회사 지정 휴일 제외 테스트
+- 일괄 계산 및 영업일 더하기 테스트
+"""
+
+import random
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, override_settings
+
+from business_management import business_calendar
+from business_management.business_calendar import BusinessCalendar, business_day_range
+
+
+def count_days(start, end, holidays=()):
+    """하루씩 세는 기준 구현"""
+    count = 0
+    while start <= end:
+        if start.weekday() < 5 and start not in holidays:
+            count += 1
+        start += timedelta(days=1)
+    return count
+
+
+class BusinessCalendarTest(SimpleTestCase):
+    """영업일 계산 테스트"""
+
+    def setUp(self):
+        BusinessCalendar.reset_default()
+        self.addCleanup(BusinessCalendar.reset_default)
+
+    def test_matches_day_by_day_count(self):
+        """임의 구간에서 하루씩 센 결과와 일치 테스트"""
+        holidays = set(business_calendar.KOREAN_PUBLIC_HOLIDAYS)
+        calendar = BusinessCalendar(holidays)
+        plain = BusinessCalendar()
+        rng = random.Random(46)
+        ranges = []
+        for _ in range(300):
+            start = date(2022, 12, 1) + timedelta(days=rng.randrange(1600))
+            ranges.append((start, start + timedelta(days=rng.randrange(-3, 500))))
+        for start, end in ranges:
+            self.assertEqual(calendar.business_days(start, end), count_days(start, end, holidays))
+            self.assertEqual(plain.business_days(start, end), count_days(start, end))
+
+        expected = [count_days(start, end, holidays) for start, end in ranges]
+        self.assertEqual(calendar.business_days_batch(ranges, use_numpy=False), expected)
+        if business_calendar.np is not None:
+            self.assertEqual(calendar.business_days_batch(ranges, use_numpy=True), expected)
+        else:
+            with self.assertRaises(ImportError):
+                calendar.business_days_batch(ranges, use_numpy=True)
+
+    def test_public_and_company_holidays(self):
+        """공휴일과 회사 지정 휴일 제외 테스트"""
+        calendar = BusinessCalendar.default()
+        # 2024년 5월: 평일 23일 - 대체공휴일(6일), 부처님오신날(15일)
+        self.assertEqual(calendar.business_days('2024-05-01', '2024-05-31'), 21)
+        self.assertFalse(calendar.is_business_day(date(2024, 9, 17)))
+        self.assertFalse(calendar.is_business_day(date(2024, 5, 4)))
+        self.assertTrue(calendar.is_business_day(date(2024, 5, 7)))
+        self.assertEqual(business_day_range('2024-09-13', '2024-09-20'), [date(2024, 9, 13), date(2024, 9, 19), date(2024, 9, 20)])
+
+        with override_settings(BUSINESS_HOLIDAYS=['2024-05-02', '2024-05-04']):
+            BusinessCalendar.reset_default()
+            self.assertEqual(BusinessCalendar.default().business_days('2024-05-01', '2024-05-31'), 20)
+
+    def test_add_business_days(self):
+        """영업일 더하기/빼기 테스트"""
+        calendar = BusinessCalendar.default()
+        self.assertEqual(calendar.add_business_days(date(2024, 5, 3), 1), date(2024, 5, 7))
+        self.assertEqual(calendar.add_business_days(date(2024, 5, 7), -1), date(2024, 5, 3))
+        self.assertEqual(calendar.add_business_days(date(2024, 9, 13), 1), date(2024, 9, 19))
+        self.assertEqual(calendar.add_business_days(date(2024, 5, 4), 0), date(2024, 5, 4))
+        self.assertEqual(calendar.business_days(date(2024, 5, 31), date(2024, 5, 1)), 0)
+        self.assertEqual(calendar.business_days(date(2024, 1, 1), date(2024, 12, 31)), 246)
+
+        holidays = set(business_calendar.KOREAN_PUBLIC_HOLIDAYS)
+        rng = random.Random(7)
+        for _ in range(200):
+            start = date(2023, 1, 1) + timedelta(days=rng.randrange(1000))
+            count = rng.randrange(-60, 60)
+            result = calendar.add_business_days(start, count)
+            if count > 0:
+                self.assertTrue(calendar.is_business_day(result))
+                self.assertEqual(count_days(start + timedelta(days=1), result, holidays), count)
+            elif count < 0:
+                self.assertTrue(calendar.is_business_day(result))
+                self.assertEqual(count_days(result, start - timedelta(days=1), holidays), -count)
@@ -0,0 +1,96 @@
+"""
+캐시 유틸리티 테스트 모듈
+
+이 모듈은 utils.cache 의 캐시 백엔드와 통계 기능을 테스트합니다.
+
+주요 기능:
+- 계측 캐시 백엔드 적중/미스 집계 테스트
+- 네임스페이스별 통계 테스트
+"""
+
+from django.test import TestCase
+from django.core.cache import cache
+
+from utils.cache import InstrumentedCache
+from utils.metrics import registry
+from utils.monitoring import SystemMonitor
+
+
+class InstrumentedCacheTest(TestCase):
+    """계측 캐시 백엔드 테스트"""
+
+    def setUp(self):
+        """캐시 및 메트릭 초기화"""
+        cache.clear()
+        registry.reset(InstrumentedCache.METRIC_PREFIX)
+
+    def test_default_cache_is_instrumented(self):
+        """기본 캐시가 계측 백엔드로 설정되었는지 테스트"""
+        self.assertTrue(hasattr(cache, 'get_stats'))
+
+    def test_hit_and_miss_counting(self):
+        """적중/미스 집계 테스트"""
+        self.assertIsNone(cache.get('notice:1'))
+        cache.set('notice:1', 'value')
+        self.assertEqual(cache.get('notice:1'), 'value')
+        self.assertEqual(cache.get('notice:1'), 'value')
+
+        stats = InstrumentedCache.get_stats()['notice']
+        self.assertEqual(stats['gets'], 3)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['sets'], 1)
+        self.assertEqual(stats['bytes_written'], len('value'))
+        self.assertAlmostEqual(stats['hit_ratio'], 0.6667)
+        self.assertEqual(stats['latency_us']['get']['count'], 3)
+
+    def test_get_many_counts_each_key(self):
+        """get_many 가 키 단위로 집계되는지 테스트"""
+        cache.set_many({'tech:1': 1, 'tech:2': 2})
+        cache.get_many(['tech:1', 'tech:2', 'tech:3'])
+
+        stats = InstrumentedCache.get_stats()['tech']
+        self.assertEqual(stats['gets'], 3)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['sets'], 2)
+
+    def test_multi_key_operations_group_by_namespace(self):
+        """다중 키 연산이 키마다 자기 네임스페이스로 집계되는지 테스트"""
+        cache.set_many({'tech:1': 'abc', 'notice:1': 'de'})
+        cache.get_many(['tech:1', 'notice:1', 'notice:2'])
+        cache.delete_many(['tech:1', 'notice:1', 'notice:2'])
+
+        stats = InstrumentedCache.get_stats()
+        self.assertEqual((stats['tech']['sets'], stats['tech']['bytes_written']), (1, 3))
+        self.assertEqual((stats['notice']['sets'], stats['notice']['bytes_written']), (1, 2))
+        self.assertEqual((stats['tech']['gets'], stats['tech']['hits'], stats['tech']['misses']), (1, 1, 0))
+        self.assertEqual((stats['notice']['gets'], stats['notice']['hits'], stats['notice']['misses']), (2, 1, 1))
+        self.assertEqual((stats['tech']['deletes'], stats['notice']['deletes']), (1, 2))
+
+    def test_namespaces_are_separated(self):
+        """네임스페이스 분리 테스트"""
+        cache.get('notice:list')
+        cache.get('template.cache.sidebar.abc')
+        cache.delete('notice:list')
+
+        stats = InstrumentedCache.get_stats()
+        self.assertIn('notice', stats)
+        self.assertIn('template', stats)
+        self.assertEqual(stats['notice']['deletes'], 1)
+
+    def test_default_value_on_miss(self):
+        """미스 시 기본값 반환 테스트"""
+        self.assertEqual(cache.get('missing:key', 'fallback'), 'fallback')
+        cache.set('falsy:key', None)
+        self.assertIsNone(cache.get('falsy:key', 'fallback'))
+        self.assertEqual(InstrumentedCache.get_stats()['falsy']['hits'], 1)
+
+    def test_system_monitor_reports_hit_ratio(self):
+        """시스템 모니터 캐시 통계 테스트"""
+        cache.set('stats:key', 1)
+        cache.get('stats:key')
+
+        info = SystemMonitor.get_cache_stats()
+        self.assertEqual(info['hit_ratio'], 1.0)
+        self.assertIn('stats', info['namespaces'])
+        self.assertIn('key_count', info)
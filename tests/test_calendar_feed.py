@@ -0,0 +1,122 @@
+"""
+캘린더 피드 테스트 모듈
+
+이 모듈은 home.calendar_feed 와 /api/v1/calendar/ 를 테스트합니다.
+
+주요 기능:
+- 원본별 범위 조회와 시작일 순 병합 테스트
+- JSON/ICS 스트리밍 출력 테스트
+- ETag/304 및 데이터 변경 시 ETag 변경 테스트
+- 조회 범위, 권한 테스트
+"""
+
+import json
+from datetime import date, time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from commute.models import BusinessTrip, LeaveRequest, WorkSchedule
+from home.calendar_feed import CalendarFeed, CalendarFeedError
+from login.models import UserProfile
+from 공지사항.models import Notice
+
+User = get_user_model()
+
+
+class CalendarFeedTest(TestCase):
+    """캘린더 피드 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+        cls.boss = User.objects.create_user(username='boss', is_staff=True)
+        for user in (cls.kim, cls.lee):
+            UserProfile.objects.create(user=user, department='개발팀')
+
+        WorkSchedule.objects.create(user=cls.kim, work_date=date(2024, 5, 3), start_time=time(22), end_time=time(6))
+        WorkSchedule.objects.create(user=cls.kim, work_date=date(2024, 6, 3), start_time=time(9), end_time=time(18))
+        LeaveRequest.objects.create(user=cls.kim, start_date=date(2024, 4, 29), end_date=date(2024, 5, 2))
+        LeaveRequest.objects.create(
+            user=cls.kim, start_date=date(2024, 5, 20), end_date=date(2024, 5, 20), status='cancelled'
+        )
+        BusinessTrip.objects.create(
+            user=cls.lee, destination='부산, 해운대', start_date=date(2024, 5, 9), end_date=date(2024, 5, 10),
+            status='approved',
+        )
+        Notice.objects.create(
+            title='하반기 교육 신청', content='내용', author=cls.boss, status='published', deadline=date(2024, 5, 9)
+        )
+        Notice.objects.create(title='초안 공지 마감', content='내용', author=cls.boss, deadline=date(2024, 5, 9))
+
+    def test_merged_events(self):
+        """원본별 범위 조회 한 번씩, 시작일 순 병합 테스트"""
+        feed = CalendarFeed(date(2024, 5, 1), date(2024, 5, 31))
+        with self.assertNumQueries(4):
+            events = list(feed.events())
+        self.assertEqual(
+            [(event['kind'], event['start']) for event in events],
+            [('leave', date(2024, 4, 29)), ('schedule', events[1]['start']), ('trip', date(2024, 5, 9)),
+             ('notice', date(2024, 5, 9))],
+        )
+        night = events[1]
+        self.assertEqual((night['start'].hour, night['end'].day, night['end'].hour), (22, 4, 6))
+        self.assertEqual(events[3]['title'], '[마감] 하반기 교육 신청')
+
+        mine = list(CalendarFeed(date(2024, 5, 1), date(2024, 5, 31), user_ids=[self.lee.pk], sources=['trip']).events())
+        self.assertEqual([event['uid'] for event in mine], [f'trip-{BusinessTrip.objects.get().pk}@business-management'])
+        with self.assertRaises(CalendarFeedError):
+            CalendarFeed(date(2024, 1, 1), date(2025, 6, 1))
+        with self.assertRaises(CalendarFeedError):
+            CalendarFeed(date(2024, 5, 1), date(2024, 5, 31), sources=['birthday'])
+
+    def test_api_json_ics_and_etag(self):
+        """JSON/ICS 출력과 ETag/304 테스트"""
+        url = reverse('api_calendar')
+        self.client.force_login(self.kim)
+        params = {'from': '2024-05-01', 'to': '2024-05-31', 'scope': 'team'}
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([event['kind'] for event in body['data']['events']], ['leave', 'schedule', 'trip', 'notice'])
+        etag = response['ETag']
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # 본인 일정만 보면 다른 ETag
+        self.assertNotEqual(self.client.get(url, {**params, 'scope': 'me'})['ETag'], etag)
+
+        # 기간 안의 일정이 바뀌면 ETag 변경
+        trip = BusinessTrip.objects.get()
+        trip.status = 'cancelled'
+        trip.save()
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, {**params, 'format': 'ics'})
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        ics = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(ics.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(ics.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(ics.count('BEGIN:VEVENT'), 3)
+        self.assertIn('DTSTART;VALUE=DATE:20240429\r\nDTEND;VALUE=DATE:20240503\r\n', ics)
+        self.assertIn('DTSTART:20240503T130000Z\r\nDTEND:20240503T210000Z\r\n', ics)
+        self.assertIn('STATUS:TENTATIVE', ics)
+        self.assertTrue(all(len(line.encode('utf-8')) <= 75 for line in ics.split('\r\n')))
+
+    def test_api_validation(self):
+        """파라미터 및 권한 테스트"""
+        url = reverse('api_calendar')
+        self.client.force_login(self.kim)
+        self.assertEqual(self.client.get(url, {'scope': 'all'}).status_code, 403)
+        self.assertEqual(self.client.get(url, {'format': 'xml'}).json()['error_code'], 'INVALID_FORMAT')
+        self.assertEqual(self.client.get(url, {'from': '2024-13-01'}).json()['error_code'], 'INVALID_DATE')
+        response = self.client.get(url, {'from': '2024-05-01', 'to': '2024-04-01'})
+        self.assertEqual(response.json()['error_code'], 'INVALID_RANGE')
+
+        self.client.force_login(self.boss)
+        response = self.client.get(url, {'from': '2024-05-01', 'to': '2024-05-31', 'scope': 'all', 'sources': 'notice'})
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,109 @@
+"""
+거래처 목록 엔진 테스트 모듈
+
+이 모듈은 client_inform.listing 과 거래처 목록 페이지/JSON 뷰를 테스트합니다.
+
+주요 기능:
+- 키셋 페이지네이션 순회 테스트
+- 검색 폼 필터 및 열 선택 테스트
+- 목록 페이지 첫 페이지 렌더링 테스트
+"""
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.urls import reverse
+
+from client_inform.listing import ClientListEngine, ClientListError
+from client_inform.models import customer_information
+from utils.benchmark import BenchmarkDataGenerator
+
+
+class ClientListEngineTest(TestCase):
+    """거래처 목록 엔진 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        BenchmarkDataGenerator(seed=5).clients(120)
+
+    def test_keyset_walk_matches_ordering(self):
+        """커서로 끝까지 순회한 결과가 정렬 순서와 같은지 테스트"""
+        engine = ClientListEngine()
+        seen, cursor = [], None
+        while True:
+            page = engine.page(cursor=cursor, limit=25, fields='company_name')
+            self.assertEqual(page['columns'], ['company_name'])
+            self.assertEqual(set(page['results'][0]), {'company_name'})
+            seen.extend(row['company_name'] for row in page['results'])
+            cursor = page['next_cursor']
+            if not page['has_more']:
+                self.assertIsNone(cursor)
+                break
+        expected = list(
+            customer_information.objects.order_by('-registration_date', '-id').values_list('company_name', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_filters(self):
+        """검색 폼 필터 테스트"""
+        client = customer_information.objects.order_by('pk').first()
+        engine = ClientListEngine({'region': client.region, 'sectors': client.sectors})
+        rows = engine.page(limit=200, fields=['region', 'sectors'])['results']
+        self.assertTrue(rows)
+        self.assertEqual({(row['region'], row['sectors']) for row in rows}, {(client.region, client.sectors)})
+
+        rows = ClientListEngine({'search': client.business_registration_number[:6]}).page(limit=200)['results']
+        self.assertIn(client.id, [row['id'] for row in rows])
+
+        rows = ClientListEngine({'search': client.company_name.upper()}).page()['results']
+        self.assertEqual([row['id'] for row in rows], [client.id])
+
+    def test_invalid_requests(self):
+        """잘못된 커서/열/필터 테스트"""
+        engine = ClientListEngine()
+        with self.assertRaises(ClientListError):
+            engine.page(cursor='not-a-cursor')
+        with self.assertRaises(ClientListError):
+            engine.page(fields='id,annual_sales')
+        with self.assertRaises(ClientListError):
+            ClientListEngine({'search': 'x' * 101}).page()
+
+    def test_cursor_query_uses_index(self):
+        """커서 조회가 (등록일, id) 인덱스를 쓰는지 확인 (SQLite 실행 계획)"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 실행 계획 전용')
+        engine = ClientListEngine()
+        cursor = engine.page(limit=10)['next_cursor']
+        registration_date, pk = engine.decode_cursor(cursor)
+        plan = engine.get_queryset().filter(registration_date__lte=registration_date).filter(
+            Q(registration_date__lt=registration_date) | Q(id__lt=pk)
+        ).explain()
+        self.assertIn('client_reg_date_id_idx', plan)
+
+
+class ClientListViewTest(TestCase):
+    """거래처 목록 페이지/JSON 뷰 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        BenchmarkDataGenerator(seed=6).clients(60)
+
+    def test_index_renders_first_page_only(self):
+        """목록 페이지 첫 페이지 렌더링 테스트"""
+        response = self.client.get('/client_inform/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['clients']), ClientListEngine.DEFAULT_LIMIT)
+        self.assertTrue(response.context['next_cursor'])
+        self.assertContains(response, 'data-next-cursor="%s"' % response.context['next_cursor'])
+
+    def test_json_pages(self):
+        """JSON 목록 이어 불러오기 테스트"""
+        first = self.client.get('/client_inform/').context
+        body = self.client.get(reverse('client_list'), {'cursor': first['next_cursor'], 'limit': 200}).json()
+        self.assertEqual(len(first['clients']) + len(body['results']), 60)
+        self.assertFalse(body['has_more'])
+        self.assertIsNone(body['next_cursor'])
+
+        response = self.client.get(reverse('client_list'), {'fields': 'password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
@@ -0,0 +1,129 @@
+"""
+거래처 조회 열 및 조회 API 테스트 모듈
+
+이 모듈은 customer_information 의 조회용 정규화 열과 /api/v1/clients/lookup/ 을 테스트합니다.
+
+주요 기능:
+- save/대량 가져오기/마이그레이션의 정규화 열 동기화 테스트
+- 정확/접두어 조회 및 인덱스 사용 테스트
+"""
+
+import importlib
+import io
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from client_inform.importer import ClientImporter
+from client_inform.models import customer_information
+from utils.benchmark import BenchmarkDataGenerator
+
+User = get_user_model()
+
+
+def create_client(**kwargs):
+    values = {
+        'company_name': 'Hanbit Soft 주식회사', 'representative': '김민준',
+        'business_registration_number': '101-81-00340', 'phone_number': '02-1234-5678',
+        'region': '서울', 'groupware': False,
+    }
+    values.update(kwargs)
+    return customer_information.objects.create(**values)
+
+
+class LookupFieldsTest(TestCase):
+    """조회용 정규화 열 동기화 테스트"""
+
+    def test_save_syncs_lookup_fields(self):
+        """저장 시 정규화 열 갱신 테스트"""
+        client = create_client()
+        client.refresh_from_db()
+        self.assertEqual(client.brn_digits, '1018100340')
+        self.assertEqual(client.phone_digits, '0212345678')
+        self.assertEqual(client.company_name_folded, 'hanbitsoft주식회사')
+
+        client.phone_number = '010-9876-5432'
+        client.save(update_fields=['phone_number'])
+        client.refresh_from_db()
+        self.assertEqual(client.phone_digits, '01098765432')
+
+    def test_import_and_generator_sync_lookup_fields(self):
+        """대량 가져오기/벤치마크 데이터 생성 시 정규화 열 갱신 테스트"""
+        number = BenchmarkDataGenerator.business_registration_number(1)
+        upload = io.BytesIO(
+            f"기업명,대표자명,사업자등록번호,전화번호\nACME  Korea,김민준,{number.replace('-', '')},031-123-4567\n".encode()
+        )
+        ClientImporter().run(upload, 'clients.csv')
+        client = customer_information.objects.get()
+        self.assertEqual((client.brn_digits, client.phone_digits), (number.replace('-', ''), '0311234567'))
+        self.assertEqual(client.company_name_folded, 'acmekorea')
+
+        BenchmarkDataGenerator(seed=1).clients(3, start=10)
+        self.assertFalse(customer_information.objects.filter(brn_digits='').exists())
+
+    def test_migration_backfill(self):
+        """마이그레이션 백필 테스트"""
+        create_client()
+        customer_information.objects.update(brn_digits='', phone_digits='', company_name_folded='')
+        migration = importlib.import_module('client_inform.migrations.0002_lookup_fields')
+        migration.backfill_lookup_fields(apps, mock.Mock(connection=connection))
+        self.assertEqual(customer_information.objects.get().brn_digits, '1018100340')
+
+
+class ClientLookupAPITest(TestCase):
+    """거래처 조회 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        create_client()
+        create_client(
+            company_name='한빛상사', business_registration_number='101-86-00345', phone_number='031-555-0000'
+        )
+        create_client(company_name='새롬테크', business_registration_number='220-81-62517', phone_number='02-1234-0000')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def lookup(self, **params):
+        response = self.client.get(reverse('api_client_lookup'), params)
+        return response.status_code, response.json()
+
+    def test_prefix_and_exact(self):
+        """접두어/정확 조회 및 입력 정규화 테스트"""
+        status, body = self.lookup(brn='101-8')
+        self.assertEqual(status, 200)
+        self.assertEqual(body['data']['count'], 2)
+
+        _, body = self.lookup(brn='1018100340', match='exact')
+        self.assertEqual([row['company_name'] for row in body['data']['results']], ['Hanbit Soft 주식회사'])
+
+        _, body = self.lookup(phone='02-1234')
+        self.assertEqual(body['data']['count'], 2)
+
+        _, body = self.lookup(name='HANBIT soft')
+        self.assertEqual(body['data']['count'], 1)
+
+        _, body = self.lookup(brn='101', phone='031')
+        self.assertEqual([row['company_name'] for row in body['data']['results']], ['한빛상사'])
+
+    def test_invalid_requests(self):
+        """잘못된 요청 테스트"""
+        self.assertEqual(self.lookup()[1]['error_code'], 'MISSING_QUERY')
+        self.assertEqual(self.lookup(brn='---')[1]['error_code'], 'MISSING_QUERY')
+        self.assertEqual(self.lookup(brn='1', match='contains')[1]['error_code'], 'INVALID_MATCH')
+        self.assertEqual(self.lookup(brn='1', limit='many')[1]['error_code'], 'INVALID_LIMIT')
+
+    def test_prefix_query_uses_index(self):
+        """접두어 조회가 인덱스 탐색인지 확인 (SQLite 실행 계획)"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 실행 계획 전용')
+        lower, upper = '1018', '1019'
+        plan = customer_information.objects.filter(brn_digits__gte=lower, brn_digits__lt=upper).explain()
+        self.assertIn('client_brn_digits_idx', plan)
+        plan = customer_information.objects.filter(phone_digits='0212345678').explain()
+        self.assertIn('client_phone_digits_idx', plan)
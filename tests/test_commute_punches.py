@@ -0,0 +1,161 @@
+"""
+출퇴근 타각 일괄 등록 테스트 모듈
+
+이 모듈은 commute.punches 와 /api/v1/commute/punches/ 를 테스트합니다.
+
+주요 기능:
+- (사용자, 근무일) 별 출근/퇴근 결정 및 기존 기록 병합 테스트
+- 일괄 upsert 결과의 근태 상태, 초과 근무, 요약 테이블 일치 테스트
+- 잘못된 타각 거부 및 재전송 시 변경 없음 테스트
+- 타각 일괄 등록 API 권한 및 파라미터 테스트
+"""
+
+import json
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from commute.models import CommuteDailySummary, CommuteMonthlySummary, CommuteRecord, WorkSchedule
+from commute.punches import PunchBatch, PunchBatchError
+from commute.reports import MonthlyAttendance
+from commute.summaries import COUNTER_FIELDS, SummaryRebuilder
+
+User = get_user_model()
+TZ = ZoneInfo(settings.TIME_ZONE)
+
+
+def stamp(user, day, hour, minute=0, kind=None):
+    """타각 한 건 (현지 시각)"""
+    item = {'user': user.pk, 'time': datetime.combine(day, time(hour, minute), tzinfo=TZ).isoformat()}
+    if kind:
+        item['type'] = kind
+    return item
+
+
+def summaries():
+    """일자별/월별 요약 테이블 전체"""
+    return (
+        list(CommuteDailySummary.objects.order_by('work_date').values('work_date', *COUNTER_FIELDS)),
+        list(CommuteMonthlySummary.objects.order_by('user_id', 'month').values('user_id', 'month', *COUNTER_FIELDS)),
+    )
+
+
+class PunchBatchTest(TestCase):
+    """타각 일괄 등록 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+        cls.gone = User.objects.create_user(username='gone', is_active=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_groups_and_upserts(self):
+        """출근/퇴근 결정, 기존 기록 병합, 요약 반영 테스트"""
+        day = date(2024, 5, 2)
+        WorkSchedule.objects.create(user=self.lee, work_date=day, start_time=time(9), end_time=time(17))
+        existing = CommuteRecord.objects.create(
+            user=self.kim, work_date=day, check_in_time=datetime.combine(day, time(8, 50), tzinfo=TZ), notes='메모'
+        )
+        MonthlyAttendance(2024, 5).user_totals([self.kim.pk])
+
+        result = PunchBatch([
+            stamp(self.kim, day, 9, 5, 'in'),         # 기존 8:50 출근이 더 이름
+            stamp(self.kim, day, 12, 0),              # type 없는 중간 타각
+            stamp(self.kim, day, 18, 30, 'out'),
+            stamp(self.lee, day, 9, 30),              # 첫 타각 = 출근 (지각)
+            stamp(self.lee, day, 19, 0),              # 마지막 타각 = 퇴근
+            stamp(self.lee, date(2024, 5, 3), 8, 55, 'in'),
+            {'user': self.lee.pk, 'time': '2024-05-02T23:30:00Z'},  # 현지 5월 3일 08:30
+            stamp(self.gone, day, 9),
+            {'user': 'x', 'time': '2024-05-02T09:00:00'},
+            {'user': self.kim.pk, 'time': 'yesterday'},
+            {'user': self.kim.pk, 'time': '2024-05-02T09:00:00', 'type': 'lunch'},
+        ]).save()
+
+        self.assertEqual(
+            {key: result[key] for key in ('received', 'accepted', 'rejected', 'records', 'created', 'updated')},
+            {'received': 11, 'accepted': 7, 'rejected': 4, 'records': 3, 'created': 2, 'updated': 1},
+        )
+        self.assertEqual([error['index'] for error in result['errors']], [8, 9, 10, 7])
+
+        kim = CommuteRecord.objects.get(pk=existing.pk)
+        self.assertEqual(kim.check_in_time, datetime.combine(day, time(8, 50), tzinfo=TZ))
+        self.assertEqual((kim.status, kim.overtime_minutes, kim.notes), ('normal', 40, '메모'))
+        lee = CommuteRecord.objects.get(user=self.lee, work_date=day)
+        self.assertEqual((lee.status, lee.overtime_minutes), ('late', 90))  # 8시간 스케줄 대비 9.5시간
+        lee_next = CommuteRecord.objects.get(user=self.lee, work_date=date(2024, 5, 3))
+        self.assertEqual((lee_next.check_in_time.astimezone(TZ).time(), lee_next.check_out_time), (time(8, 30), None))
+
+        # 요약은 재구성 결과와 같고 kim 의 5월 캐시는 무효화됨
+        expected = summaries()
+        SummaryRebuilder().rebuild(day, day)
+        self.assertEqual(summaries(), expected)
+        self.assertEqual(CommuteMonthlySummary.objects.get(user=self.lee, month=date(2024, 5, 1)).late, 1)
+        self.assertEqual(MonthlyAttendance(2024, 5).user_totals([self.kim.pk])[self.kim.pk]['work_days'], 1)
+
+    def test_resend_and_later_punch(self):
+        """같은 묶음 재전송은 변경 없음, 이후 퇴근 타각은 기존 기록 갱신 테스트"""
+        day = date(2024, 5, 6)
+        batch = [stamp(self.kim, day, 8, 40)]
+        self.assertEqual(PunchBatch(batch).save()['created'], 1)
+        with self.assertNumQueries(5):  # 사용자, 기록, 스케줄 조회와 savepoint 만 (저장 없음)
+            self.assertEqual(PunchBatch(batch).save()['unchanged'], 1)
+
+        self.assertEqual(PunchBatch([stamp(self.kim, day, 17, 0)]).save()['updated'], 1)
+        record = CommuteRecord.objects.get(user=self.kim, work_date=day)
+        self.assertEqual((record.status, record.total_work_hours.seconds), ('early_leave', 8 * 3600 + 20 * 60))
+
+    def test_status_uses_local_time(self):
+        """DB 에서 읽은 기록을 다시 저장해도 현지 시각 기준 상태 유지 테스트"""
+        day = date(2024, 5, 7)
+        record = CommuteRecord.objects.create(
+            user=self.kim, work_date=day,
+            check_in_time=datetime.combine(day, time(9, 30), tzinfo=TZ),
+            check_out_time=datetime.combine(day, time(18, 0), tzinfo=TZ),
+        )
+        self.assertEqual(record.status, 'late')
+        record = CommuteRecord.objects.get(pk=record.pk)
+        record.save()
+        self.assertEqual(record.status, 'late')
+
+    @override_settings(COMMUTE_PUNCH_BATCH_LIMIT=2)
+    def test_batch_limit(self):
+        """묶음 크기 및 형식 검증 테스트"""
+        with self.assertRaises(PunchBatchError):
+            PunchBatch([stamp(self.kim, date(2024, 5, 2), 9)] * 3)
+        with self.assertRaises(PunchBatchError):
+            PunchBatch({'user': self.kim.pk})
+
+
+class PunchBatchAPITest(TestCase):
+    """타각 일괄 등록 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        cls.kiosk = User.objects.create_user(username='kiosk', password='testpass123', is_staff=True)
+
+    def post(self, body):
+        return self.client.post(reverse('api_commute_punches'), json.dumps(body), content_type='application/json')
+
+    def test_post_punches(self):
+        """권한, 본문 형식, 등록 결과 테스트"""
+        self.client.force_login(self.user)
+        self.assertEqual(self.post([]).status_code, 403)
+
+        self.client.force_login(self.kiosk)
+        body = self.post({'punches': [stamp(self.user, date(2024, 5, 2), 9), stamp(self.user, date(2024, 5, 2), 18)]})
+        self.assertEqual(body.json()['data']['created'], 1)
+        self.assertEqual(CommuteRecord.objects.get(user=self.user).status, 'normal')
+
+        self.assertEqual(self.post({'punches': 'x'}).json()['error_code'], 'INVALID_PUNCHES')
+        response = self.client.post(reverse('api_commute_punches'), '{', content_type='application/json')
+        self.assertEqual(response.json()['error_code'], 'INVALID_JSON')
@@ -0,0 +1,173 @@
+"""
+근태 요약 테이블 테스트 모듈
+
+이 모듈은 CommuteDailySummary / CommuteMonthlySummary 의 증분 갱신과
+rebuild_commute_summary 명령, /api/v1/commute/trend/ 를 테스트합니다.
+
+주요 기능:
+- 기록 생성/수정/삭제 시 증감분 반영 테스트
+- 근무 스케줄 대비 초과 근무 및 스케줄 변경 반영 테스트
+- 일괄 재구성 결과와 증분 결과 일치 테스트
+- 요약 테이블만 읽는 추이 API 테스트
+"""
+
+from datetime import date, datetime, time
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from commute.models import CommuteDailySummary, CommuteMonthlySummary, CommuteRecord, WorkSchedule
+from commute.summaries import COUNTER_FIELDS, overtime_minutes, scheduled_minutes
+
+User = get_user_model()
+TZ = ZoneInfo(settings.TIME_ZONE)
+
+
+def punch(user, work_date, check_in=(9, 0), check_out=(18, 0)):
+    """출퇴근 기록 생성 (None 이면 결근)"""
+    if check_in is None:
+        return CommuteRecord.objects.create(user=user, work_date=work_date, status='absence')
+    return CommuteRecord.objects.create(
+        user=user, work_date=work_date,
+        check_in_time=datetime.combine(work_date, time(*check_in), tzinfo=TZ),
+        check_out_time=datetime.combine(work_date, time(*check_out), tzinfo=TZ),
+    )
+
+
+def snapshot():
+    """요약 테이블 전체 (0 인 행 제외)"""
+    daily = {
+        row.pop('work_date'): row
+        for row in CommuteDailySummary.objects.values('work_date', *COUNTER_FIELDS)
+        if row['records']
+    }
+    monthly = {
+        (row.pop('user_id'), row.pop('month')): row
+        for row in CommuteMonthlySummary.objects.values('user_id', 'month', *COUNTER_FIELDS)
+        if row['records']
+    }
+    return daily, monthly
+
+
+class CommuteSummaryTest(TestCase):
+    """근태 요약 증분 갱신 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+
+    def test_overtime_rules(self):
+        """스케줄 근무 분 및 초과 근무 계산 테스트"""
+        self.assertEqual(scheduled_minutes(time(22, 0), time(6, 0)), 480)
+        self.assertEqual(scheduled_minutes(time(9, 0), time(18, 0), is_holiday=True), 0)
+        self.assertEqual(overtime_minutes(600), 60)
+        self.assertEqual(overtime_minutes(600, (time(9, 0), time(21, 0), False)), 0)
+
+    def test_incremental_updates(self):
+        """기록 생성/수정/이동/삭제 시 증감분 반영 테스트"""
+        WorkSchedule.objects.create(user=self.kim, work_date=date(2024, 5, 1), start_time=time(9), end_time=time(17))
+        record = punch(self.kim, date(2024, 5, 1), check_in=(8, 30), check_out=(19, 30))
+        punch(self.lee, date(2024, 5, 1), check_in=(9, 30))
+        punch(self.lee, date(2024, 5, 2), check_in=None)
+
+        day = CommuteDailySummary.objects.get(work_date=date(2024, 5, 1))
+        self.assertEqual((day.records, day.worked_minutes, day.normal, day.late), (2, 660 + 510, 1, 1))
+        self.assertEqual(record.overtime_minutes, 180)  # 8시간 스케줄 대비 11시간 근무
+        lee = CommuteMonthlySummary.objects.get(user=self.lee, month=date(2024, 5, 1))
+        self.assertEqual((lee.records, lee.late, lee.absence), (2, 1, 1))
+
+        # 다시 읽어 수정 (읽을 때 값으로 증감분 계산)
+        record = CommuteRecord.objects.get(pk=record.pk)
+        record.check_out_time = datetime(2024, 5, 1, 16, 0, tzinfo=TZ)
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(record.previous_summary_values())
+
+        # 다른 달로 이동
+        record.work_date = date(2024, 6, 3)
+        record.save()
+        kim_may = CommuteMonthlySummary.objects.get(user=self.kim, month=date(2024, 5, 1))
+        self.assertEqual((kim_may.records, kim_may.worked_minutes, kim_may.overtime_minutes), (0, 0, 0))
+        self.assertEqual(CommuteMonthlySummary.objects.get(user=self.kim, month=date(2024, 6, 1)).records, 1)
+
+        # 요약과 관계없는 필드만 저장하면 요약 쿼리 없음
+        with self.assertNumQueries(1):
+            record.save(update_fields=['notes'])
+
+        record.delete()
+        self.assertEqual(CommuteMonthlySummary.objects.get(user=self.kim, month=date(2024, 6, 1)).records, 0)
+        self.assertEqual(CommuteDailySummary.objects.get(work_date=date(2024, 6, 3)).worked_minutes, 0)
+
+    def test_schedule_change_updates_overtime(self):
+        """근무 스케줄 변경 시 초과 근무 재계산 테스트"""
+        record = punch(self.kim, date(2024, 5, 4), check_in=(8, 0), check_out=(18, 0))
+        self.assertEqual(record.overtime_minutes, 60)
+
+        schedule = WorkSchedule.objects.create(
+            user=self.kim, work_date=date(2024, 5, 4), start_time=time(9), end_time=time(18), is_holiday=True
+        )
+        record.refresh_from_db()
+        self.assertEqual(record.overtime_minutes, 600)
+        self.assertEqual(record.status, 'normal')
+        self.assertEqual(CommuteDailySummary.objects.get(work_date=date(2024, 5, 4)).overtime_minutes, 600)
+
+        schedule.delete()
+        self.assertEqual(CommuteDailySummary.objects.get(work_date=date(2024, 5, 4)).overtime_minutes, 60)
+
+    def test_rebuild_matches_incremental(self):
+        """일괄 재구성 결과와 증분 결과 일치 테스트"""
+        WorkSchedule.objects.create(user=self.kim, work_date=date(2024, 5, 2), start_time=time(9), end_time=time(21))
+        punch(self.kim, date(2024, 5, 1), check_in=(8, 0), check_out=(20, 0))
+        punch(self.kim, date(2024, 5, 2), check_in=(8, 0), check_out=(20, 0))
+        punch(self.lee, date(2024, 5, 31), check_out=(17, 0))
+        punch(self.lee, date(2024, 6, 3), check_in=None)
+        expected = snapshot()
+
+        CommuteDailySummary.objects.all().delete()
+        CommuteMonthlySummary.objects.update(records=99)
+        CommuteRecord.objects.update(overtime_minutes=0)
+
+        out = StringIO()
+        call_command('rebuild_commute_summary', '--from', '2024-05', '--to', '2024-06', stdout=out)
+        self.assertIn('(2개월) - 기록 4건, 초과 근무 수정 1건', out.getvalue())
+        self.assertEqual(snapshot(), expected)
+
+
+class AttendanceTrendAPITest(TestCase):
+    """근태 추이 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        cls.staff = User.objects.create_user(username='staff', password='testpass123', is_staff=True)
+        punch(cls.user, date(2023, 5, 2), check_in=(9, 30))
+        punch(cls.user, date(2024, 5, 2))
+        punch(cls.staff, date(2024, 5, 2), check_out=(19, 0))
+
+    def test_trend_reads_summaries_only(self):
+        """요약 테이블만 읽는 월별/일별 추이 테스트"""
+        self.client.force_login(self.staff)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('api_commute_trend'), {'from': '2023-05', 'to': '2024-05'})
+        self.assertFalse(any('commute_commuterecord' in query['sql'] for query in queries.captured_queries))
+
+        results = response.json()['data']['results']
+        self.assertEqual([row['month'] for row in results], ['2023-05-01', '2024-05-01'])
+        self.assertEqual([(row['employees'], row['late']) for row in results], [(1, 1), (2, 0)])
+        self.assertEqual(results[1]['overtime_minutes'], 60)
+
+        response = self.client.get(reverse('api_commute_trend'), {'from': '2024-05', 'to': '2024-05', 'period': 'day'})
+        self.assertEqual([row['records'] for row in response.json()['data']['results']], [2])
+
+        response = self.client.get(reverse('api_commute_trend'), {'from': '2024-06', 'to': '2024-05'})
+        self.assertEqual(response.json()['error_code'], 'INVALID_MONTH')
+
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(reverse('api_commute_trend')).status_code, 403)
@@ -0,0 +1,126 @@
+"""
+내보내기 API 테스트 모듈
+
+이 모듈은 /api/v1/export/<resource>/ 스트리밍 내보내기를 테스트합니다.
+
+주요 기능:
+- NDJSON/CSV 형식 테스트
+- 목록 API 와 같은 필터 및 권한 테스트
+- 행 수와 무관한 메모리 사용량 테스트
+"""
+
+import csv
+import io
+import json
+import tracemalloc
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from api.views import ExportAPIView
+from client_inform.models import customer_information
+from commute.models import CommuteRecord
+from utils.benchmark import BenchmarkDataGenerator
+from 공지사항.models import Notice
+
+User = get_user_model()
+
+
+def read_body(response):
+    """스트리밍 응답 본문"""
+    return b''.join(response.streaming_content).decode('utf-8')
+
+
+class ExportAPITest(TestCase):
+    """내보내기 API 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """테스트 데이터 설정"""
+        cls.admin = User.objects.create_superuser(username='admin', password='testpass123')
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        generator = BenchmarkDataGenerator(seed=7)
+        generator.clients(30)
+        Notice.objects.create(title='정기 점검 안내', content='내용', author=cls.admin, status='published')
+        Notice.objects.create(title='작성 중', content='내용', author=cls.admin, status='draft')
+        today = date.today()
+        for offset in range(3):
+            CommuteRecord.objects.create(user=cls.user, work_date=today - timedelta(days=offset), status='normal')
+        CommuteRecord.objects.create(user=cls.admin, work_date=today, status='late')
+
+    def export(self, resource, **params):
+        return self.client.get(reverse('api_export', kwargs={'resource': resource}), params)
+
+    def test_clients_ndjson_with_filter(self):
+        """거래처 NDJSON 및 지역 필터 테스트"""
+        self.client.force_login(self.user)
+        response = self.export('clients')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in read_body(response).splitlines()]
+        self.assertEqual(len(rows), 30)
+        self.assertIn('business_registration_number', rows[0])
+
+        region = rows[0]['region']
+        rows = read_body(self.export('clients', region=region)).splitlines()
+        self.assertEqual(len(rows), customer_information.objects.filter(region=region).count())
+
+    def test_notices_csv_respects_visibility(self):
+        """공지사항 CSV 및 게시 상태 권한 테스트"""
+        self.client.force_login(self.user)
+        response = self.export('notices', format='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('.csv', response['Content-Disposition'])
+        body = read_body(response)
+        self.assertTrue(body.startswith('\ufeff'))
+        rows = list(csv.DictReader(io.StringIO(body.lstrip('\ufeff'))))
+        self.assertEqual([row['title'] for row in rows], ['정기 점검 안내'])
+        self.assertEqual(rows[0]['author'], 'admin')
+
+        self.client.force_login(self.admin)
+        self.assertEqual(len(read_body(self.export('notices')).splitlines()), 2)
+
+    def test_commute_is_limited_to_own_records(self):
+        """출퇴근 기록 본인 제한 및 기간 필터 테스트"""
+        self.client.force_login(self.user)
+        rows = [json.loads(line) for line in read_body(self.export('commute')).splitlines()]
+        self.assertEqual({row['user'] for row in rows}, {'user'})
+        self.assertEqual(len(rows), 3)
+
+        rows = read_body(self.export('commute', date_from=date.today().isoformat())).splitlines()
+        self.assertEqual(len(rows), 1)
+
+        self.client.force_login(self.admin)
+        self.assertEqual(len(read_body(self.export('commute')).splitlines()), 4)
+        self.assertEqual(len(read_body(self.export('commute', user='admin')).splitlines()), 1)
+
+    def test_invalid_requests(self):
+        """잘못된 요청 테스트"""
+        self.client.force_login(self.user)
+        self.assertEqual(self.export('unknown').status_code, 404)
+        self.assertEqual(self.export('clients', format='xml').status_code, 400)
+        self.assertEqual(self.export('commute', date_from='not-a-date').status_code, 400)
+
+    def test_memory_is_constant(self):
+        """행 수와 무관한 최대 메모리 테스트"""
+        self.client.force_login(self.admin)
+
+        def peak_for(count):
+            customer_information.objects.all().delete()
+            BenchmarkDataGenerator(seed=count).clients(count)
+            response = self.export('clients')
+            tracemalloc.start()
+            try:
+                for _ in response.streaming_content:
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        with mock.patch.object(ExportAPIView, 'CHUNK_SIZE', 100):
+            # 출력 배치(500행)가 찬 뒤로는 행 수가 늘어도 최대 메모리가 같아야 함
+            small, large = peak_for(1000), peak_for(4000)
+        self.assertLess(large, small * 1.5)
@@ -0,0 +1,188 @@
+"""
+병렬 조회(fan-out) 테스트 모듈
+
+이 모듈은 utils.fanout 과 통합 검색 API 의 원본별 병렬 조회를 테스트합니다.
+
+주요 기능:
+- 스레드 풀 동시 실행, 원본별 제한 시간, 예외 격리 및 메트릭 기록 테스트
+- 트랜잭션 안에서는 호출한 스레드에서 차례로 실행하는지 테스트
+- 통합 검색의 top-K 병합(최신순/관련도순), 페이지, 전체 건수, 부분 결과 테스트
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from api.views import SearchAPIView
+from client_inform.models import customer_information
+from utils.fanout import FanOut
+from utils.metrics import registry
+from 기술.models import Technology
+from 공지사항.models import Notice
+
+User = get_user_model()
+
+
+def create_client(**kwargs):
+    values = {
+        'company_name': 'Hanbit Soft 주식회사', 'representative': '김민준',
+        'business_registration_number': '101-81-00340', 'phone_number': '02-1234-5678',
+        'region': '서울', 'groupware': False,
+    }
+    values.update(kwargs)
+    return customer_information.objects.create(**values)
+
+
+class FanOutTest(SimpleTestCase):
+    """스레드 풀 병렬 조회 테스트"""
+
+    def setUp(self):
+        registry.reset('fanout.')
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_runs_concurrently(self):
+        """세 작업이 동시에 실행되는지 테스트"""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def task(value):
+            # 세 작업이 모두 시작해야 통과 (차례로 실행하면 BrokenBarrierError)
+            barrier.wait()
+            return value
+
+        results = FanOut('test', self.executor).run({
+            key: (lambda key=key: task(key), 2.0) for key in ('a', 'b', 'c')
+        })
+        self.assertEqual([(key, result.status, result.value) for key, result in results.items()],
+                         [('a', 'ok', 'a'), ('b', 'ok', 'b'), ('c', 'ok', 'c')])
+        self.assertEqual(registry.get_counter('fanout.calls', 'test.b'), 1)
+        self.assertEqual(registry.snapshot('fanout.latency_us')['histograms']['fanout.latency_us']['test.c']['count'], 1)
+
+    def test_timeout_and_error(self):
+        """제한 시간 초과와 예외가 다른 원본 결과에 영향을 주지 않는지 테스트"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fail():
+            raise ValueError('원본 오류')
+
+        started = time.perf_counter()
+        results = FanOut('test', self.executor).run({
+            'slow': (lambda: release.wait(5), 0.05),
+            'broken': (fail, 1.0),
+            'fast': (lambda: [1, 2], 1.0),
+        })
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(
+            {key: result.status for key, result in results.items()},
+            {'slow': 'timeout', 'broken': 'error', 'fast': 'ok'},
+        )
+        self.assertEqual((results['broken'].error, results['fast'].value), ('원본 오류', [1, 2]))
+        self.assertEqual(registry.get_counter('fanout.timeouts', 'test.slow'), 1)
+        self.assertEqual(registry.get_counter('fanout.errors', 'test.broken'), 1)
+
+
+class FanOutAtomicTest(TransactionTestCase):
+    """트랜잭션 안의 인라인 실행 테스트"""
+
+    def test_inline_inside_atomic(self):
+        """트랜잭션 안에서는 아직 커밋되지 않은 행이 보이도록 호출한 스레드에서 실행"""
+        user = User.objects.create_user(username='writer')
+        with transaction.atomic():
+            Notice.objects.create(title='미커밋', content='내용', author=user)
+            threads = []
+            results = FanOut('test').run({
+                'count': (lambda: threads.append(threading.current_thread()) or Notice.objects.count(), 0.5),
+            })
+            self.assertTrue(connection.in_atomic_block)
+        self.assertEqual(results['count'].value, 1)
+        self.assertEqual(threads, [threading.current_thread()])
+
+
+class SearchFanOutTest(TransactionTestCase):
+    """통합 검색 병렬 조회 테스트 (풀 스레드가 커밋된 데이터를 읽도록 TransactionTestCase)"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='searcher')
+        self.client.force_login(self.user)
+        base = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        for number in range(6):
+            notice = Notice.objects.create(
+                title=f'검색 공지 {number}', content='내용', author=self.user, status='published'
+            )
+            tech = Technology.objects.create(name=f'검색 기술 {number}', author=self.user)
+            # 공지는 짝수 시각, 기술은 홀수 시각
+            Notice.objects.filter(pk=notice.pk).update(created_at=base + timedelta(hours=2 * number))
+            Technology.objects.filter(pk=tech.pk).update(created_at=base + timedelta(hours=2 * number + 1))
+        Technology.objects.create(name='검색', author=self.user)
+        Technology.objects.filter(name='검색').update(created_at=base - timedelta(days=30))
+        create_client(company_name='검색 상사', registration_date=date(2023, 1, 1))
+
+    def search(self, **params):
+        return self.client.get(reverse('api_search'), {'q': '검색', **params}).json()
+
+    def test_top_k_merge(self):
+        """원본별 상위 결과를 병합한 순서가 전체 정렬 결과와 같은지 테스트"""
+        data = self.search(per_page=4)['data']
+        titles = [result['title'] for result in data['results']]
+        self.assertEqual(titles, ['검색 기술 5', '검색 공지 5', '검색 기술 4', '검색 공지 4'])
+        self.assertFalse(data['partial'])
+        # 읽은 건수가 아니라 원본별 전체 건수
+        self.assertEqual({source: info['count'] for source, info in data['sources'].items()},
+                         {'notice': 6, 'technology': 7, 'client': 1})
+        self.assertEqual((data['total'], data['max_window']), (14, SearchAPIView.MAX_WINDOW))
+
+        second = self.search(per_page=4, page=2)['data']
+        self.assertEqual([result['title'] for result in second['results']],
+                         ['검색 기술 3', '검색 공지 3', '검색 기술 2', '검색 공지 2'])
+
+        # 관련도순 - 제목이 검색어와 같은 기술이 가장 오래됐어도 먼저
+        data = self.search(sort='score', per_page=3)['data']
+        self.assertEqual([result['title'] for result in data['results']], ['검색', '검색 기술 5', '검색 공지 5'])
+        self.assertEqual(data['results'][0]['score'], 3)
+        self.assertEqual(self.search(sort='size')['error_code'], 'INVALID_SORT')
+
+    def test_missing_dates_sort_last(self):
+        """날짜가 없는 행을 DB 와 상관없이 맨 뒤에 두는지 테스트 (heapq.merge 의 내림차순 전제)"""
+        for sort in SearchAPIView.SORTS:
+            queryset = SearchAPIView.ranked(
+                customer_information.objects.all(), '검색', 'company_name', 'registration_date', sort, 10
+            )
+            self.assertIn('"registration_date" DESC NULLS LAST', str(queryset.query))
+
+    def test_window_and_invalid_page(self):
+        """MAX_WINDOW 를 넘는 페이지와 정수가 아닌 페이지는 400 으로 응답하는지 테스트"""
+        self.assertEqual(len(self.search(per_page=20, page=5)['data']['results']), 0)
+        response = self.client.get(reverse('api_search'), {'q': '검색', 'per_page': 20, 'page': 6})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error_code'], 'WINDOW_EXCEEDED')
+        self.assertEqual(response.json()['details'], {'max_window': SearchAPIView.MAX_WINDOW})
+        response = self.client.get(reverse('api_search'), {'q': '검색', 'page': 'x'})
+        self.assertEqual((response.status_code, response.json()['error_code']), (400, 'INVALID_PAGE'))
+
+    @override_settings(SEARCH_SOURCE_TIMEOUTS={'client': 50})
+    def test_partial_results(self):
+        """제한 시간을 넘긴 원본과 실패한 원본을 빼고 응답하는지 테스트"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        registry.reset('fanout.')
+
+        def slow_clients(view, query, sort, limit):
+            release.wait(5)
+            return [], 0
+
+        with mock.patch.object(SearchAPIView, 'search_clients', slow_clients), \
+                mock.patch.object(SearchAPIView, 'search_technologies', side_effect=RuntimeError('down')):
+            data = self.search(per_page=20)['data']
+        self.assertTrue(data['partial'])
+        self.assertEqual({source: info['status'] for source, info in data['sources'].items()},
+                         {'notice': 'ok', 'technology': 'error', 'client': 'timeout'})
+        self.assertEqual({result['type'] for result in data['results']}, {'notice'})
+        self.assertEqual(registry.get_counter('fanout.timeouts', 'search.client'), 1)
@@ -0,0 +1,217 @@
+"""
+거래처 대량 가져오기 테스트 모듈
+
+이 모듈은 client_inform.importer 와 import_clients 관리 명령을 테스트합니다.
+
+주요 기능:
+- 사업자등록번호 검증 함수 및 일괄 검증 테스트
+- CSV 가져오기 및 upsert 테스트 (일부 열만 있는 파일 포함)
+- 행별 오류 보고 테스트
+- audit_brn 점검 명령 테스트
+"""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from client_inform import validators
+from client_inform.forms import CustomerInformationForm
+from client_inform.importer import ClientImporter, ClientImportError, openpyxl
+from client_inform.models import customer_information
+from utils.benchmark import BenchmarkDataGenerator
+
+HEADER = ['기업명', '대표자명', '사업자등록번호', '지역', '종업원수', '전화번호', '이메일', '그룹웨어 사용', '등록일']
+
+
+def brn(serial):
+    """검증번호가 올바른 사업자등록번호"""
+    return BenchmarkDataGenerator.business_registration_number(serial)
+
+
+def make_csv(rows, header=HEADER):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return io.BytesIO(('\ufeff' + buffer.getvalue()).encode('utf-8'))
+
+
+class BRNValidatorTest(TestCase):
+    """사업자등록번호 검증 테스트"""
+
+    def test_checksum(self):
+        """검증번호 확인 테스트"""
+        self.assertTrue(validators.validate_brn_10('1018100340'))
+        self.assertFalse(validators.validate_brn_10('1018100341'))
+        self.assertIsNone(validators.brn_error('101-81-00340'))
+        self.assertEqual(validators.brn_error('123-45-67890'), '유효하지 않은 사업자등록번호입니다.')
+        self.assertEqual(validators.normalize_brn('1018100340'), '101-81-00340')
+
+    def test_batch_matches_single(self):
+        """일괄 검증과 개별 검증 결과 일치 테스트"""
+        values = [brn(serial) for serial in range(1, 200)]
+        values += ['1018100341', '101-81-00340', '', None, '12345', '１０１８１００３４０', 'abcdefghij']
+        expected = [validators.brn_error(value) is None for value in values]
+        self.assertEqual(validators.validate_brn_batch(values, use_numpy=False), expected)
+        if validators.np is not None:
+            self.assertEqual(validators.validate_brn_batch(values, use_numpy=True), expected)
+        else:
+            with self.assertRaises(ImportError):
+                validators.validate_brn_batch(values, use_numpy=True)
+
+    def test_form_uses_shared_validator(self):
+        """폼 검증 공유 테스트"""
+        form = CustomerInformationForm(data={'business_registration_number': '101-81-00341'})
+        form.is_valid()
+        self.assertIn('business_registration_number', form.errors)
+        form = CustomerInformationForm(data={'business_registration_number': '101-81-00340'})
+        form.is_valid()
+        self.assertNotIn('business_registration_number', form.errors)
+
+
+class ClientImporterTest(TestCase):
+    """대량 가져오기 테스트"""
+
+    def test_import_and_upsert(self):
+        """생성 후 같은 사업자등록번호로 갱신 테스트"""
+        rows = [
+            ['한빛상사', '김민준', brn(1), '서울', '1,200', '02-1234-5678', 'A@Example.com', 'O', '2024.01.02'],
+            ['새롬테크', '이서연', brn(2).replace('-', ''), '부산', '', '', '', '', ''],
+        ]
+        result = ClientImporter(chunk_size=1).run(make_csv(rows), 'clients.csv')
+        self.assertEqual((result.total, result.created, result.updated), (2, 2, 0))
+        self.assertEqual(result.errors, [])
+
+        client = customer_information.objects.get(company_name='한빛상사')
+        self.assertEqual(client.number_of_employees, 1200)
+        self.assertEqual(client.e_mail, 'a@example.com')
+        self.assertTrue(client.groupware)
+        self.assertEqual(client.registration_date.isoformat(), '2024-01-02')
+        # 하이픈 없는 번호도 저장 형식으로 정규화
+        self.assertTrue(customer_information.objects.filter(business_registration_number=brn(2)).exists())
+
+        rows[0][0] = '한빛상사 본사'
+        result = ClientImporter().run(make_csv(rows[:1]), 'clients.csv')
+        self.assertEqual((result.created, result.updated), (0, 1))
+        self.assertEqual(customer_information.objects.get(business_registration_number=brn(1)).company_name, '한빛상사 본사')
+        self.assertEqual(customer_information.objects.count(), 2)
+
+    def test_partial_columns_keep_existing_values(self):
+        """파일에 없는 열은 기존 거래처 값을 유지하고 새 거래처에만 기본값을 채우는지 테스트"""
+        rows = [['한빛상사', '김민준', brn(1), '서울', '10', '02-1234-5678', 'a@example.com', 'O', '2020-03-04']]
+        ClientImporter().run(make_csv(rows), 'clients.csv')
+
+        result = ClientImporter().run(make_csv(
+            [['한빛상사 본사', '김민준', brn(1)], ['새롬테크', '이서연', brn(2)]],
+            header=['기업명', '대표자명', '사업자등록번호'],
+        ), 'clients.csv')
+        self.assertEqual((result.created, result.updated, result.errors), (1, 1, []))
+
+        client = customer_information.objects.get(business_registration_number=brn(1))
+        self.assertEqual(client.company_name, '한빛상사 본사')
+        self.assertEqual((client.region, client.phone_number, client.phone_digits), ('서울', '02-1234-5678', '0212345678'))
+        self.assertEqual((client.number_of_employees, client.groupware), (10, True))
+        self.assertEqual(client.registration_date.isoformat(), '2020-03-04')
+        created = customer_information.objects.get(business_registration_number=brn(2))
+        self.assertEqual((created.region, created.number_of_employees, created.groupware), ('', 0, False))
+
+    def test_row_errors_do_not_abort(self):
+        """오류 행만 건너뛰고 나머지 저장 테스트"""
+        rows = [
+            ['정상기업', '박도윤', brn(10), '서울', '10', '', '', '', ''],
+            ['검증번호오류', '최하은', '123-45-67890', '서울', '10', '', '', '', ''],
+            ['숫자오류', '정시우', brn(11), '서울', '많음', '', '', '', ''],
+            ['대표자오류', '<script>', brn(12), '서울', '', '', '', '', ''],
+            ['', '강지우', brn(13), '서울', '', '', '', '', ''],
+            ['중복앞', '조예준', brn(14), '서울', '', '', '', '', ''],
+            ['중복뒤', '윤수아', brn(14), '서울', '', '', '', '', ''],
+        ]
+        result = ClientImporter().run(make_csv(rows), 'clients.csv')
+        self.assertEqual(result.total, 7)
+        self.assertEqual(result.created, 2)
+        self.assertEqual({error['row'] for error in result.errors}, {3, 4, 5, 6, 7})
+        self.assertEqual(
+            sorted(customer_information.objects.values_list('company_name', flat=True)), ['정상기업', '중복뒤']
+        )
+
+    def test_missing_required_column(self):
+        """필수 열 누락 테스트"""
+        with self.assertRaises(ClientImportError):
+            ClientImporter().run(make_csv([['a']], header=['기업명']), 'clients.csv')
+        with self.assertRaises(ClientImportError):
+            ClientImporter().run(io.BytesIO(b''), 'clients.txt')
+
+    @unittest.skipIf(openpyxl is None, 'openpyxl 미설치')
+    def test_xlsx(self):
+        """XLSX 가져오기 테스트"""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(HEADER)
+        sheet.append(['한빛상사', '김민준', brn(1), '서울', 12, '', '', True, None])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+
+        result = ClientImporter().run(buffer, 'clients.xlsx')
+        self.assertEqual(result.created, 1)
+
+
+class ImportClientsCommandTest(TestCase):
+    """import_clients 관리 명령 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_command_writes_errors(self):
+        """dry-run 및 오류 파일 저장 테스트"""
+        path = os.path.join(self.tmpdir, 'clients.csv')
+        errors_path = os.path.join(self.tmpdir, 'errors.csv')
+        with open(path, 'wb') as source:
+            source.write(make_csv([
+                ['정상기업', '박도윤', brn(10), '서울', '', '', '', '', ''],
+                ['오류기업', '최하은', '1', '서울', '', '', '', '', ''],
+            ]).getvalue())
+
+        out = StringIO()
+        call_command('import_clients', path, '--dry-run', '--errors', errors_path, stdout=out)
+        self.assertIn('생성 1', out.getvalue())
+        self.assertEqual(customer_information.objects.count(), 0)
+        with open(errors_path, encoding='utf-8-sig') as errors_file:
+            self.assertEqual([row['row'] for row in csv.DictReader(errors_file)], ['3'])
+
+        with self.assertRaises(CommandError):
+            call_command('import_clients', os.path.join(self.tmpdir, 'missing.csv'), stdout=StringIO())
+
+
+class AuditBRNCommandTest(TestCase):
+    """audit_brn 관리 명령 테스트"""
+
+    def test_reports_invalid_and_duplicates(self):
+        """검증번호 오류와 정규화 중복 보고 테스트"""
+        BenchmarkDataGenerator(seed=3).clients(5)
+        customer_information.objects.create(
+            company_name='오류기업', business_registration_number='123-45-67890', groupware=False
+        )
+        number = customer_information.objects.order_by('pk').first().business_registration_number
+        customer_information.objects.create(
+            company_name='중복기업', business_registration_number=number.replace('-', ''), groupware=False
+        )
+
+        out = StringIO()
+        call_command('audit_brn', '--batch-size', '2', stdout=out)
+        self.assertIn('전체 7행 - 검증번호 오류 1건, 정규화 중복 1그룹', out.getvalue())
+        self.assertIn('[duplicate]', out.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command('audit_brn', '--strict', stdout=StringIO())
@@ -0,0 +1,403 @@
+"""
+모니터링 테스트 모듈
+
+이 모듈은 utils.monitoring 의 프로파일링 기능을 테스트합니다.
+
+주요 기능:
+- SQL 지문 정규화 테스트
+- 쿼리 프로파일링 미들웨어 테스트
+- 느린 쿼리 로그 테스트
+- 스택 샘플링 프로파일러 테스트
+- 함수 성능 모니터링 데코레이터 테스트
+- 메모리 할당 프로파일러 테스트
+"""
+
+from asgiref.sync import iscoroutinefunction
+from django.core.handlers.asgi import ASGIHandler
+from django.test import TestCase, RequestFactory, override_settings
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.urls import reverse
+from collections import deque
+from unittest import mock
+import json
+import signal
+import threading
+import time
+import unittest
+
+from client_inform.models import customer_information
+from utils.cache import PerformanceMonitor as QueryPerformanceMonitor
+from utils.models import SlowQueryLog
+from utils.metrics import registry
+from utils.monitoring import (
+    AllocationProfiler, PerformanceMonitor, QueryProfilerMiddleware, SlowQueryLogger, StackSampler,
+    allocation_profiler, sql_fingerprint, stack_sampler,
+)
+
+User = get_user_model()
+
+
+class SQLFingerprintTest(TestCase):
+    """SQL 지문 테스트"""
+
+    def test_literals_and_placeholders_are_normalized(self):
+        """리터럴과 파라미터 제거 테스트"""
+        self.assertEqual(
+            sql_fingerprint("SELECT * FROM t WHERE id = 10 AND name = 'a''b'"),
+            'SELECT * FROM t WHERE id = ? AND name = ?',
+        )
+        self.assertEqual(
+            sql_fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s)'),
+            sql_fingerprint('SELECT * FROM t WHERE id IN (%s)'),
+        )
+
+
+class QueryProfilerMiddlewareTest(TestCase):
+    """쿼리 프로파일링 미들웨어 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.factory = RequestFactory()
+
+    def make_middleware(self, query_count):
+        """지정한 횟수만큼 같은 형태의 쿼리를 실행하는 뷰로 미들웨어 생성"""
+        def view(request):
+            for pk in range(query_count):
+                list(User.objects.filter(pk=pk))
+            return HttpResponse('ok')
+        return QueryProfilerMiddleware(view)
+
+    @override_settings(DEBUG=True)
+    def test_debug_headers(self):
+        """DEBUG 모드 응답 헤더 테스트"""
+        response = self.make_middleware(2)(self.factory.get('/'))
+        self.assertEqual(response['X-DB-Queries'], '2')
+        self.assertTrue(response['X-DB-Time'].endswith('ms'))
+
+    def test_no_headers_without_debug(self):
+        """운영 모드에서 헤더 미노출 테스트"""
+        response = self.make_middleware(2)(self.factory.get('/'))
+        self.assertNotIn('X-DB-Queries', response)
+
+    @override_settings(QUERY_PROFILER_N_PLUS_ONE_THRESHOLD=3)
+    def test_n_plus_one_is_logged(self):
+        """N+1 경고 로깅 테스트"""
+        with self.assertLogs('performance', 'WARNING') as logs:
+            self.make_middleware(5)(self.factory.get('/clients/'))
+        self.assertIn('N+1', logs.output[0])
+        self.assertIn('5회', logs.output[0])
+
+    @override_settings(QUERY_PROFILER_SAMPLE_RATE=0.0)
+    def test_sampling_disabled(self):
+        """샘플링 비율 0 일 때 프로파일링 생략 테스트"""
+        middleware = self.make_middleware(1)
+        with override_settings(DEBUG=False):
+            self.assertFalse(middleware.should_profile(self.factory.get('/')))
+
+    def test_request_time_per_view(self):
+        """요청 시간을 캐시가 아닌 registry 에 뷰 이름별로 기록하는지 테스트"""
+        registry.reset('http.')
+        request = self.factory.get('/clients/')
+        request.resolver_match = mock.Mock(view_name='client_list')
+        with mock.patch('utils.monitoring.cache') as cache:
+            self.make_middleware(1)(request)
+        self.assertFalse(cache.method_calls)
+        histogram = registry.snapshot('http.')['histograms']['http.request_time_us']['client_list']
+        self.assertEqual(histogram['count'], 1)
+
+    @override_settings(DEBUG=True)
+    async def test_async_view_is_profiled(self):
+        """비동기 뷰 앞에서는 코루틴으로 동작하고 ORM 쿼리를 수집하는지 테스트"""
+        async def view(request):
+            await User.objects.acount()
+            await User.objects.filter(pk=1).aexists()
+            return HttpResponse('ok')
+
+        middleware = QueryProfilerMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(self.factory.get('/'))
+        self.assertEqual(response['X-DB-Queries'], '2')
+
+    def test_asgi_chain_is_not_adapted(self):
+        """ASGI 핸들러가 미들웨어 체인을 스레드로 감싸지 않는지 테스트"""
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            ASGIHandler()
+
+    @override_settings(QUERY_PROFILER_SAMPLE_RATE=0.0, DEBUG=False)
+    def test_unsampled_request_is_not_recorded(self):
+        """샘플링되지 않은 요청은 요청 시간을 기록하지 않는지 테스트"""
+        registry.reset('http.')
+        self.make_middleware(1)(self.factory.get('/'))
+        self.assertEqual(registry.snapshot('http.')['histograms'], {})
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_LOG_ASYNC=False)
+class SlowQueryLogTest(TestCase):
+    """느린 쿼리 로그 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.factory = RequestFactory()
+
+    def test_slow_query_is_stored_with_plan_and_location(self):
+        """SQL, 파라미터, 호출 위치, 실행 계획 저장 테스트"""
+        def view(request):
+            list(customer_information.objects.filter(company_name='테스트상사'))
+            return HttpResponse('ok')
+
+        with self.assertLogs('performance', 'WARNING'):
+            QueryProfilerMiddleware(view)(self.factory.get('/clients/'))
+
+        log = SlowQueryLog.objects.get()
+        self.assertIn('company_name', log.sql)
+        self.assertIn('테스트상사', log.params)
+        self.assertIn('tests/test_monitoring.py', log.location)
+        self.assertIn('in view', log.location)
+        self.assertEqual(log.request_path, '/clients/')
+        self.assertTrue(log.explain)
+
+    @override_settings(SLOW_QUERY_LOG_MAX_ROWS=2)
+    def test_log_is_bounded(self):
+        """보관 행 수 제한 테스트"""
+        @QueryPerformanceMonitor.monitor_query_performance
+        def run_queries():
+            for pk in range(5):
+                list(customer_information.objects.filter(pk=pk))
+
+        with self.assertLogs('performance', 'WARNING'):
+            run_queries()
+        self.assertEqual(SlowQueryLog.objects.count(), 2)
+
+
+def slow_query_entry(sql='SELECT 1'):
+    """느린 쿼리 항목 생성"""
+    return {
+        'database': 'default', 'sql': sql, 'params': (), 'many': False,
+        'duration_ms': 600.0, 'location': 'tests/test_monitoring.py:1 in view', 'request_path': '/clients/',
+    }
+
+
+@override_settings(SLOW_QUERY_LOG_ASYNC=True)
+class SlowQueryLoggerQueueTest(TestCase):
+    """느린 쿼리 저장 버퍼 테스트"""
+
+    def setUp(self):
+        """저장 스레드 없이 버퍼만 사용"""
+        for name, value in (('ensure_worker', mock.DEFAULT), ('_pending', deque()), ('_wakeup', threading.Event())):
+            patcher = mock.patch.object(SlowQueryLogger, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_write_waits_for_commit(self):
+        """트랜잭션 안에서 제출한 항목은 커밋 뒤에 저장을 시작하는지 테스트"""
+        with self.captureOnCommitCallbacks() as callbacks:
+            SlowQueryLogger.submit(slow_query_entry())
+        self.assertFalse(SlowQueryLogger._wakeup.is_set())
+        self.assertEqual(len(SlowQueryLogger._pending), 1)
+
+        for callback in callbacks:
+            callback()
+        self.assertTrue(SlowQueryLogger._wakeup.is_set())
+
+    def test_queue_is_bounded(self):
+        """버퍼가 가득 차면 가장 오래된 항목을 버리는지 테스트"""
+        registry.reset('db.slow_queries.')
+        with mock.patch.object(SlowQueryLogger, 'QUEUE_SIZE', 2):
+            for index in range(3):
+                SlowQueryLogger.submit(slow_query_entry(f'SELECT {index}'))
+        self.assertEqual([entry['sql'] for entry in SlowQueryLogger._pending], ['SELECT 1', 'SELECT 2'])
+        self.assertEqual(registry.get_counter('db.slow_queries.dropped'), 1)
+
+    def test_flush_saves_batch(self):
+        """버퍼의 항목을 한 번에 저장하는지 테스트"""
+        SlowQueryLogger.submit(slow_query_entry('SELECT 1'))
+        SlowQueryLogger.submit(slow_query_entry('SELECT 2'))
+        SlowQueryLogger.flush()
+        self.assertEqual(SlowQueryLog.objects.count(), 2)
+        self.assertEqual(len(SlowQueryLogger._pending), 0)
+
+    def test_failed_flush_keeps_entries(self):
+        """저장에 실패한 항목은 버퍼에 남아 다시 시도되는지 테스트"""
+        SlowQueryLogger.submit(slow_query_entry())
+        with mock.patch.object(SlowQueryLogger, 'save', return_value=False):
+            SlowQueryLogger.flush()
+        self.assertEqual(len(SlowQueryLogger._pending), 1)
+
+        SlowQueryLogger.flush()
+        self.assertEqual(SlowQueryLog.objects.count(), 1)
+
+
+def busy_work(seconds):
+    """프로파일링 대상 CPU 작업"""
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+class StackSamplerTest(TestCase):
+    """스택 샘플링 프로파일러 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.sampler = StackSampler()
+
+    def tearDown(self):
+        """샘플러 종료"""
+        self.sampler.stop()
+
+    def test_thread_mode_collapsed_output(self):
+        """스레드 모드 collapsed-stack 출력 테스트"""
+        self.assertTrue(self.sampler.start(interval_ms=1, duration=5, mode='thread'))
+        self.assertFalse(self.sampler.start(mode='thread'))
+        busy_work(0.2)
+        self.sampler.stop()
+
+        self.assertGreater(self.sampler.samples, 0)
+        line = self.sampler.collapsed().splitlines()[0]
+        _, count = line.rsplit(' ', 1)
+        self.assertTrue(count.isdigit())
+        self.assertIn('busy_work (test_monitoring.py', self.sampler.collapsed())
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), 'POSIX 전용')
+    def test_signal_mode_samples_cpu_time(self):
+        """시그널 모드 샘플링 테스트"""
+        self.assertTrue(self.sampler.start(interval_ms=1, duration=5, mode='signal'))
+        busy_work(0.2)
+        self.sampler.stop()
+
+        self.assertEqual(self.sampler.mode, 'signal')
+        self.assertIn('busy_work', self.sampler.top_functions()[0]['function'])
+
+
+class ProfilerAPITest(TestCase):
+    """CPU 프로파일러 API 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.admin = User.objects.create_superuser(username='admin', password='testpass123')
+        self.user = User.objects.create_user(username='user', password='testpass123')
+        self.url = reverse('api_profiler')
+
+    def tearDown(self):
+        """샘플러 종료"""
+        stack_sampler.stop()
+
+    def test_requires_superuser(self):
+        """관리자 권한 확인 테스트"""
+        self.client.force_login(self.user)
+        response = self.client.post(self.url, json.dumps({'action': 'start'}), content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(stack_sampler.running)
+
+    def test_start_stop_and_collapsed(self):
+        """시작, 종료, collapsed 결과 조회 테스트"""
+        self.client.force_login(self.admin)
+        response = self.client.post(
+            self.url, json.dumps({'action': 'start', 'interval_ms': 1, 'mode': 'thread'}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['data']['running'])
+
+        busy_work(0.05)
+        response = self.client.post(self.url, json.dumps({'action': 'stop'}), content_type='application/json')
+        self.assertFalse(response.json()['data']['running'])
+
+        response = self.client.get(self.url, {'format': 'collapsed'})
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertIn('busy_work', response.content.decode('utf-8'))
+
+
+class PerformanceMonitorTest(TestCase):
+    """함수 성능 모니터링 데코레이터 테스트"""
+
+    def setUp(self):
+        """메트릭 초기화"""
+        registry.reset(PerformanceMonitor.METRIC_PREFIX)
+
+    def test_decorated_function_returns_result(self):
+        """데코레이터 적용 후 반환값 및 호출 기록 테스트"""
+        @PerformanceMonitor.monitor_performance
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(2, 3), 5)
+
+        report = PerformanceMonitor.get_performance_report()
+        name = f"{add.__module__}.{add.__qualname__}"
+        self.assertEqual(report['functions'][name]['count'], 2)
+        self.assertIsNone(report['functions'][name]['avg_memory'])
+
+    def test_sampling_rate_zero_skips_recording(self):
+        """샘플링 비율 0 테스트"""
+        @PerformanceMonitor.monitor_performance(sample_rate=0.0)
+        def noop():
+            return 'ok'
+
+        self.assertEqual(noop(), 'ok')
+        self.assertEqual(PerformanceMonitor.get_performance_report()['functions'], {})
+
+    def test_memory_sampling_and_errors(self):
+        """할당량 측정 및 예외 집계 테스트"""
+        @PerformanceMonitor.monitor_performance(memory_sample_rate=1.0)
+        def allocate(fail=False):
+            data = [bytearray(1024) for _ in range(100)]
+            if fail:
+                raise ValueError('실패')
+            return len(data)
+
+        self.assertEqual(allocate(), 100)
+        with self.assertRaises(ValueError):
+            allocate(fail=True)
+
+        name = f"{allocate.__module__}.{allocate.__qualname__}"
+        stats = PerformanceMonitor.get_performance_report()['functions'][name]
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['memory_samples'], 2)
+        self.assertGreater(stats['avg_memory'], 100 * 1024)
+
+
+class AllocationProfilerTest(TestCase):
+    """메모리 할당 프로파일러 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.factory = RequestFactory()
+        allocation_profiler.reset()
+
+    def test_trace_attributes_sites_to_project_code(self):
+        """할당 위치 귀속 테스트"""
+        profiler = AllocationProfiler()
+        with profiler.trace() as result:
+            data = [bytearray(1024) for _ in range(200)]
+
+        self.assertTrue(result['traced'])
+        self.assertGreaterEqual(result['peak'], 200 * 1024)
+        top_site = max(result['sites'].items(), key=lambda item: item[1][0])[0]
+        self.assertTrue(top_site.startswith('tests/test_monitoring.py:'))
+        self.assertEqual(len(data), 200)
+
+    @override_settings(ALLOCATION_PROFILER_SAMPLE_RATE=1.0)
+    def test_middleware_records_per_view(self):
+        """미들웨어 뷰별 집계 테스트"""
+        def view(request):
+            return HttpResponse(b'x' * 50000)
+
+        middleware = QueryProfilerMiddleware(view)
+        middleware(self.factory.get('/'))
+        middleware(self.factory.get('/'))
+
+        report = allocation_profiler.get_report()['unresolved']
+        self.assertEqual(report['requests'], 2)
+        self.assertGreaterEqual(report['peak_max'], 50000)
+        self.assertTrue(report['top_sites'])
+
+    def test_disabled_by_default(self):
+        """기본 설정에서 비활성화 테스트"""
+        QueryProfilerMiddleware(lambda request: HttpResponse('ok'))(self.factory.get('/'))
+        self.assertEqual(allocation_profiler.get_report(), {})
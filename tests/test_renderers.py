@@ -0,0 +1,125 @@
+"""
+JSON 렌더러 테스트 모듈
+
+이 모듈은 utils.renderers 와 APIResponse 의 JSON 직렬화를 테스트합니다.
+
+주요 기능:
+- 한글 UTF-8 출력 테스트
+- 날짜/시간, Decimal 등 타입 직렬화 테스트
+- 백엔드 간 출력 일치 테스트
+- 스트리밍 응답 테스트
+"""
+
+import json
+import unittest
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from api.views import APIResponse
+from utils.renderers import STREAM_PLACEHOLDER, ChunkedStreamingHttpResponse, JSONRenderer, orjson
+from 공지사항.models import Notice
+
+User = get_user_model()
+
+PAYLOAD = {
+    'title': '정기 점검 안내',
+    'created_at': datetime(2024, 3, 1, 9, 30, 15, 123456, tzinfo=dt_timezone.utc),
+    'date': date(2024, 3, 1),
+    'time': time(18, 0),
+    'amount': Decimal('1234.50'),
+    'duration': timedelta(hours=8, minutes=30),
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'by_region': {1: '서울'},
+    'tags': ('웹', '백엔드'),
+}
+
+
+class JSONRendererTest(TestCase):
+    """JSON 렌더러 테스트"""
+
+    def test_stdlib_output(self):
+        """표준 라이브러리 백엔드 직렬화 테스트"""
+        body = JSONRenderer('stdlib').render(PAYLOAD)
+        self.assertIn('정기 점검 안내'.encode('utf-8'), body)
+        data = json.loads(body)
+        self.assertEqual(data['created_at'], '2024-03-01T09:30:15.123456+00:00')
+        self.assertEqual(data['date'], '2024-03-01')
+        self.assertEqual(data['amount'], '1234.50')
+        self.assertEqual(data['duration'], 'P0DT08H30M00S')
+        self.assertEqual(data['by_region'], {'1': '서울'})
+
+    @unittest.skipIf(orjson is None, 'orjson 미설치')
+    def test_backends_produce_same_document(self):
+        """orjson 과 표준 라이브러리 결과 일치 테스트"""
+        self.assertEqual(
+            json.loads(JSONRenderer('orjson').render(PAYLOAD)),
+            json.loads(JSONRenderer('stdlib').render(PAYLOAD)),
+        )
+
+    def test_unknown_type_raises(self):
+        """직렬화할 수 없는 타입 예외 테스트"""
+        with self.assertRaises(TypeError):
+            JSONRenderer().render({'value': object()})
+
+    def test_stream_produces_valid_json(self):
+        """스트리밍 출력이 올바른 JSON 인지 테스트"""
+        renderer = JSONRenderer()
+        for count in (0, 1, 5, 7):
+            body = b''.join(renderer.stream(
+                {'items': STREAM_PLACEHOLDER, 'total': count}, ({'n': n} for n in range(count)), chunk_size=3
+            ))
+            self.assertEqual(json.loads(body), {'items': [{'n': n} for n in range(count)], 'total': count})
+
+    async def test_chunked_response_is_not_buffered_under_asgi(self):
+        """ASGI 로 보낼 때 동기 이터레이터를 끝까지 읽지 않고 조각 단위로 보내는지 테스트"""
+        pulled = []
+
+        def chunks():
+            for n in range(3):
+                pulled.append(n)
+                yield str(n).encode()
+
+        content = ChunkedStreamingHttpResponse(chunks()).__aiter__()
+        self.assertEqual(await content.__anext__(), b'0')
+        self.assertEqual(pulled, [0])
+        self.assertEqual([part async for part in content], [b'1', b'2'])
+
+
+class APIResponseRenderingTest(TestCase):
+    """APIResponse 렌더링 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_superuser(username='admin', password='testpass123')
+        Notice.objects.bulk_create([
+            Notice(title=f'공지 {index}', content='내용', author=self.user, status='published')
+            for index in range(5)
+        ])
+        self.client.force_login(self.user)
+
+    def test_korean_is_not_escaped(self):
+        """한글 비이스케이프 및 타임스탬프 형식 테스트"""
+        response = APIResponse.error('권한이 없습니다.', 403, 'PERMISSION_DENIED')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('권한이 없습니다.'.encode('utf-8'), response.content)
+        datetime.fromisoformat(json.loads(response.content)['timestamp'])
+
+    @override_settings(API_JSON_STREAM_THRESHOLD=3)
+    def test_large_page_is_streamed(self):
+        """큰 페이지 스트리밍 응답 테스트"""
+        response = self.client.get(reverse('api_notice_list'), {'per_page': 3})
+        self.assertIsInstance(response, ChunkedStreamingHttpResponse)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertTrue(data['success'])
+        self.assertEqual(len(data['data']['items']), 3)
+        self.assertEqual(data['data']['pagination']['total_items'], 5)
+
+        response = self.client.get(reverse('api_notice_list'), {'per_page': 2})
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()['data']['items']), 2)
@@ -0,0 +1,152 @@
+"""
+기술 태그 정규화 테스트 모듈
+
+이 모듈은 Tag / TechnologyTag 색인과 태그 API 를 테스트합니다.
+
+주요 기능:
+- 태그 파싱 및 저장/수정/삭제 시 색인과 태그 수 증감 테스트
+- 마이그레이션 백필 및 벤치마크 데이터 생성 시 재구성 테스트
+- 태그 필터/태그 클라우드/태그 공유 기술 조회 및 인덱스 사용 테스트
+"""
+
+import importlib
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from utils.benchmark import BenchmarkDataGenerator
+from 기술.models import Tag, Technology, TechnologyTag
+from 기술.tagging import parse_tags
+
+User = get_user_model()
+
+
+def counts():
+    return dict(Tag.objects.values_list('name', 'technology_count'))
+
+
+class TagIndexTest(TestCase):
+    """태그 색인 동기화 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+
+    def test_parse_tags(self):
+        """태그 파싱 (공백/대소문자/전각 문자 통일, 중복 제거) 테스트"""
+        self.assertEqual(
+            parse_tags(' Web ,web,  Machine   Learning,,ＡＰＩ'),
+            {'web': 'Web', 'machine learning': 'Machine Learning', 'api': 'ＡＰＩ'},
+        )
+        self.assertEqual(parse_tags(''), {})
+
+    def test_save_update_delete_maintain_counts(self):
+        """저장/수정/삭제 시 태그 수 증감 테스트"""
+        django = Technology.objects.create(name='Django', tags='Python, Web', author=self.user)
+        Technology.objects.create(name='Flask', tags='python', author=self.user)
+        self.assertEqual(counts(), {'python': 2, 'web': 1})
+        self.assertEqual(Tag.objects.get(name='python').label, 'Python')
+
+        django.tags = 'python, orm'
+        django.save()
+        self.assertEqual(counts(), {'python': 2, 'web': 0, 'orm': 1})
+
+        # tags 를 저장하지 않는 부분 저장은 색인을 건드리지 않음
+        with self.assertNumQueries(1):
+            django.save(update_fields=['status'])
+
+        django.delete()
+        self.assertEqual(counts(), {'python': 1, 'web': 0, 'orm': 0})
+        self.assertEqual(TechnologyTag.objects.count(), 1)
+        self.assertEqual([tag.name for tag in Tag.cloud()], ['python'])
+
+    def test_tag_list(self):
+        """tag_list 파싱 재사용 및 prefetch 사용 테스트"""
+        tech = Technology.objects.create(name='React', tags='JavaScript, web, Web', author=self.user)
+        self.assertEqual(tech.tag_list, ['JavaScript', 'web'])
+        tech.tags = 'ui'
+        self.assertEqual(tech.tag_list, ['ui'])
+
+        tech.save()
+        tech = Technology.objects.prefetch_related('tag_set').get(pk=tech.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(tech.tag_list, ['ui'])
+
+    def test_migration_backfill_and_generator(self):
+        """마이그레이션 백필 및 벤치마크 데이터 생성 시 색인 재구성 테스트"""
+        Technology.objects.create(name='Django', tags='python,web', author=self.user)
+        Technology.objects.create(name='Flask', tags='Python', author=self.user)
+        TechnologyTag.objects.all().delete()
+        Tag.objects.update(technology_count=0)
+
+        migration = importlib.import_module('기술.migrations.0002_tags')
+        migration.backfill_tags(apps, None)
+        self.assertEqual(counts(), {'python': 2, 'web': 1})
+
+        BenchmarkDataGenerator(seed=1).technologies(20, [self.user])
+        self.assertEqual(TechnologyTag.objects.count(), sum(counts().values()))
+        for tech in Technology.objects.all():
+            self.assertEqual(
+                sorted(tech.tag_set.values_list('name', flat=True)), sorted(parse_tags(tech.tags))
+            )
+
+
+class TagQueryTest(TestCase):
+    """태그 조회 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='testpass123')
+        cls.django = Technology.objects.create(name='Django', tags='python,web,orm', author=cls.user)
+        cls.flask = Technology.objects.create(name='Flask', tags='python,web', author=cls.user)
+        cls.go = Technology.objects.create(name='Go', tags='go,server', author=cls.user)
+        cls.sqlalchemy = Technology.objects.create(name='SQLAlchemy', tags='python,ORM', author=cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_related_by_tags(self):
+        """태그 공유 기술 (공유 태그 수 순) 테스트"""
+        related = list(self.django.related_by_tags())
+        self.assertEqual([tech.name for tech in related], ['SQLAlchemy', 'Flask'])
+        self.assertEqual([tech.shared_tags for tech in related], [2, 2])
+        self.assertEqual(list(self.go.related_by_tags()), [])
+
+    def test_api(self):
+        """태그 필터/태그 클라우드/태그 공유 기술 API 테스트"""
+        response = self.client.get(reverse('api_technology_list'), {'tag': 'GO'})
+        self.assertEqual([item['name'] for item in response.json()['data']['items']], ['Go'])
+
+        # 'go' 검색이 'django' 태그/이름에 걸리지 않도록 태그는 정확 일치
+        response = self.client.get(reverse('api_technology_list'), {'search': 'orm'})
+        self.assertEqual({item['name'] for item in response.json()['data']['items']}, {'Django', 'SQLAlchemy'})
+
+        response = self.client.get(reverse('api_technology_tags'), {'limit': 2})
+        self.assertEqual(
+            response.json()['data']['tags'],
+            [{'name': 'python', 'label': 'python', 'count': 3},
+             {'name': 'orm', 'label': 'orm', 'count': 2}],
+        )
+
+        response = self.client.get(reverse('api_technology_related', kwargs={'pk': self.flask.pk}))
+        self.assertEqual(
+            [(item['name'], item['shared_tags']) for item in response.json()['data']['results']],
+            [('Django', 2), ('SQLAlchemy', 1)],
+        )
+        response = self.client.get(reverse('api_technology_related', kwargs={'pk': 0}))
+        self.assertEqual(response.json()['error_code'], 'TECHNOLOGY_NOT_FOUND')
+        response = self.client.get(reverse('api_technology_tags'), {'limit': 'many'})
+        self.assertEqual(response.json()['error_code'], 'INVALID_LIMIT')
+
+    def test_tag_queries_use_indexes(self):
+        """태그 필터/클라우드가 인덱스 탐색인지 확인 (SQLite 실행 계획)"""
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite 실행 계획 전용')
+        plan = Technology.objects.filter(pk__in=TechnologyTag.technology_ids('python')).explain()
+        self.assertIn('technology_tag_tag_idx', plan)
+        self.assertNotIn('SCAN 기술_technologytag', plan)
+        plan = Tag.cloud().explain()
+        self.assertIn('tag_count_name_idx', plan)
@@ -0,0 +1,99 @@
+"""
+기술 목록 엔진 테스트 모듈
+
+이 모듈은 기술.listing 과 기술 목록 페이지를 테스트합니다.
+
+주요 기능:
+- 검색 폼 필터 및 태그 정확 일치 테스트
+- 페이지네이션 및 등록자 N+1 방지 테스트
+- 목록 조각 캐시 및 세대 번호 무효화 테스트
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from utils.cache import CacheGeneration
+from utils.listing import ListError
+from 기술.listing import TechnologyListEngine
+from 기술.models import Technology
+
+User = get_user_model()
+
+
+class TechnologyListEngineTest(TestCase):
+    """기술 목록 엔진 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [User.objects.create_user(username=f'author{index}') for index in range(3)]
+        Technology.objects.create(name='Django', category='backend', tags='python, web', author=cls.authors[0])
+        Technology.objects.create(name='Go', category='backend', tags='go,server', author=cls.authors[1])
+        Technology.objects.create(name='React', category='frontend', tags='JavaScript,web', author=cls.authors[2])
+
+    def names(self, params=None):
+        return [technology.name for technology in TechnologyListEngine(params).paginate().object_list]
+
+    def test_filters(self):
+        """검색어/분류/태그 필터 테스트"""
+        self.assertEqual(self.names(), ['React', 'Go', 'Django'])
+        self.assertEqual(self.names({'category': 'backend'}), ['Go', 'Django'])
+        self.assertEqual(self.names({'search': 'reac'}), ['React'])
+        # 태그는 정확히 일치 ('go' 가 'django' 에 걸리지 않음), 대소문자/공백 무시
+        self.assertEqual(self.names({'tag': 'go'}), ['Go'])
+        self.assertEqual(self.names({'tag': 'WEB'}), ['React', 'Django'])
+        with self.assertRaises(ListError):
+            TechnologyListEngine({'category': 'unknown'}).paginate()
+
+    def test_pagination_without_n_plus_one(self):
+        """페이지네이션 및 등록자 함께 조회 테스트"""
+        engine = TechnologyListEngine()
+        with self.assertNumQueries(2):  # count + 목록
+            page = engine.paginate(page_number=2, per_page=2)
+            self.assertEqual([technology.author.username for technology in page.object_list], ['author0'])
+        self.assertEqual(engine.paginate(page_number=99, per_page=2).number, 2)
+
+    def test_filters_key_ignores_parameter_order(self):
+        """캐시 키가 파라미터 순서와 무관한지 테스트"""
+        first = TechnologyListEngine({'category': 'backend', 'tag': 'go'})
+        second = TechnologyListEngine({'tag': 'go', 'category': 'backend'})
+        self.assertEqual(first.filters_key(), second.filters_key())
+
+
+class TechnologyListViewTest(TestCase):
+    """기술 목록 페이지 및 조각 캐시 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author')
+        Technology.objects.create(name='Django', category='backend', tags='python', author=cls.author)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_fragment_cache_and_generation(self):
+        """반복 조회 캐시 적중 및 저장 시 무효화 테스트"""
+        response = self.client.get('/technology/', {'category': 'backend'})
+        self.assertContains(response, 'Django')
+
+        # 같은 조건의 반복 조회는 목록 쿼리 없이 응답
+        with self.assertNumQueries(0):
+            response = self.client.get('/technology/', {'category': 'backend'})
+        self.assertContains(response, 'Django')
+
+        # 세대는 커밋 후에 올라감
+        generation = CacheGeneration.get('technology')
+        with self.captureOnCommitCallbacks() as callbacks:
+            Technology.objects.create(name='Flask', category='backend', tags='python', author=self.author)
+        self.assertEqual(CacheGeneration.get('technology'), generation)
+        for callback in callbacks:
+            callback()
+        self.assertGreater(CacheGeneration.get('technology'), generation)
+        self.assertContains(self.client.get('/technology/', {'category': 'backend'}), 'Flask')
+
+    def test_invalid_filter(self):
+        """잘못된 필터 테스트"""
+        response = self.client.get('/technology/', {'status': 'unknown'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['technology_list'], '')
+        self.assertIsNotNone(response.context['error'])
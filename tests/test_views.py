@@ -441,6 +441,96 @@ class APIViewTest(TestCase):
         self.assertEqual(data['error_code'], 'INVALID_JSON')
 
 
+class APIConditionalGetTest(TestCase):
+    """API 조건부 GET(ETag/304) 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+        self.notice = Notice.objects.create(
+            title='ETag 테스트 공지',
+            content='ETag 테스트 내용',
+            author=self.user,
+            importance='medium',
+            status='published'
+        )
+        self.client.login(username='testuser', password='testpass123')
+
+    def test_list_not_modified(self):
+        """변경이 없으면 304 응답"""
+        response = self.client.get('/api/v1/notices/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/'))
+
+        response = self.client.get('/api/v1/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_etag_changes_on_update(self):
+        """데이터가 바뀌면 ETag도 바뀜"""
+        etag = self.client.get('/api/v1/notices/')['ETag']
+
+        Notice.objects.create(
+            title='새로운 공지사항',
+            content='새 내용',
+            author=self.user,
+            status='published'
+        )
+
+        response = self.client.get('/api/v1/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_depends_on_query_params(self):
+        """쿼리 파라미터가 다르면 다른 ETag"""
+        first = self.client.get('/api/v1/notices/', {'page': 1})['ETag']
+        second = self.client.get('/api/v1/notices/', {'per_page': 5})['ETag']
+        self.assertNotEqual(first, second)
+
+    def test_detail_not_modified(self):
+        """상세 조회 304 응답"""
+        url = f'/api/v1/notices/{self.notice.id}/'
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_server_side_cache(self):
+        """서버측 응답 캐시 적중"""
+        from django.core.cache import cache
+        cache.clear()
+
+        with self.settings(API_RESPONSE_CACHE_TIMEOUT=60):
+            first = self.client.get('/api/v1/technologies/')
+            second = self.client.get('/api/v1/technologies/')
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.content, second.content)
+
+    def test_streaming_response_is_not_cached(self):
+        """스트리밍 응답은 ETag만 붙이고 서버측 캐시에 저장하지 않음"""
+        from django.core.cache import cache
+        from django.http import StreamingHttpResponse
+        from utils.cache import ResponseCache
+        cache.clear()
+
+        with self.settings(API_RESPONSE_CACHE_TIMEOUT=60):
+            response = ResponseCache.finalize('notices', 'W/"stream"', StreamingHttpResponse(iter([b'a', b'b'])))
+
+        self.assertEqual(response['ETag'], 'W/"stream"')
+        self.assertNotIn('X-Cache', response)
+        self.assertIsNone(cache.get(ResponseCache.make_key('notices', 'W/"stream"')))
+        self.assertEqual(b''.join(response.streaming_content), b'ab')
+
+
 class ViewIntegrationTest(TestCase):
     """뷰 통합 테스트"""
     
@@ -0,0 +1,163 @@
+"""
+근무 규칙 엔진 테스트 모듈
+
+이 모듈은 commute.rules 와 WorkRule, reevaluate_commute_status 명령을 테스트합니다.
+
+주요 기능:
+- 부서/근무 유형별 규칙 선택 및 유예/스케줄 기준 판정 테스트
+- 규칙 캐시 및 변경 시 무효화 테스트
+- 스케줄 변경 시 같은 날 기록 재판정 테스트
+- 규칙 변경 후 일괄 재판정 명령 테스트
+"""
+
+from datetime import date, datetime, time
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from commute.models import CommuteMonthlySummary, CommuteRecord, WorkRule, WorkSchedule
+from commute.reports import MonthlyAttendance
+from commute.rules import WorkRuleEngine
+from login.models import UserProfile
+
+User = get_user_model()
+TZ = ZoneInfo(settings.TIME_ZONE)
+
+
+def punch(user, work_date, check_in=(9, 0), check_out=(18, 0)):
+    """출퇴근 기록 생성"""
+    return CommuteRecord.objects.create(
+        user=user, work_date=work_date,
+        check_in_time=datetime.combine(work_date, time(*check_in), tzinfo=TZ),
+        check_out_time=datetime.combine(work_date, time(*check_out), tzinfo=TZ),
+    )
+
+
+def at(work_date, hour, minute=0):
+    return datetime.combine(work_date, time(hour, minute), tzinfo=TZ)
+
+
+class WorkRuleEngineTest(TestCase):
+    """규칙 선택 및 판정 테스트"""
+
+    def test_rule_selection_and_evaluation(self):
+        """구체적인 규칙 우선, 유예/스케줄/휴일/야간 판정 테스트"""
+        day = date(2024, 5, 2)
+        engine = WorkRuleEngine([
+            ('', '', time(9), time(18), 10, 0, True, True, True),
+            ('개발팀', '', time(10), time(19), 0, 0, True, True, True),
+            ('', 'remote', time(9), time(18), 0, 0, False, True, True),
+        ])
+        self.assertTrue(engine.by_department)
+
+        # 기본 규칙: 10분 유예
+        self.assertEqual(engine.evaluate(day, at(day, 9, 10), at(day, 18)), 'normal')
+        self.assertEqual(engine.evaluate(day, at(day, 9, 11), at(day, 18)), 'late')
+        # 부서 규칙: 10시 출근
+        self.assertEqual(engine.evaluate(day, at(day, 9, 50), at(day, 19), department='개발팀'), 'normal')
+        self.assertEqual(engine.evaluate(day, at(day, 9, 50), at(day, 18), department='개발팀'), 'early_leave')
+        # 재택근무 스케줄: 지각 판정 없음, 스케줄 종료 기준 조퇴 판정
+        remote = (time(8), time(17), False, 'remote')
+        self.assertEqual(engine.evaluate(day, at(day, 11), at(day, 17), schedule=remote), 'normal')
+        self.assertEqual(engine.evaluate(day, at(day, 11), at(day, 16), schedule=remote), 'early_leave')
+        # 휴일, 야간 스케줄, 퇴근 없음
+        holiday = (time(9), time(18), True, 'holiday')
+        self.assertEqual(engine.evaluate(day, at(day, 12), at(day, 13), schedule=holiday), 'normal')
+        night = (time(22), time(6), False, 'regular')
+        self.assertEqual(engine.evaluate(day, at(day, 21, 55), at(date(2024, 5, 3), 6), schedule=night), 'normal')
+        self.assertEqual(engine.evaluate(day, at(day, 9), None, status='absence'), 'absence')
+
+        self.assertFalse(WorkRuleEngine().by_department)
+        self.assertEqual(WorkRuleEngine().evaluate(day, at(day, 9, 1), at(day, 18)), 'late')
+
+
+class WorkRuleModelTest(TestCase):
+    """규칙 저장, 캐시, 재판정 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kim = User.objects.create_user(username='kim')
+        cls.lee = User.objects.create_user(username='lee')
+        UserProfile.objects.create(user=cls.lee, department='영업팀')
+
+    def setUp(self):
+        cache.clear()
+        WorkRuleEngine._cached = None
+
+    def test_rules_cached_and_invalidated(self):
+        """규칙은 한 번만 읽고 변경 시 다시 컴파일 테스트"""
+        self.assertEqual(punch(self.kim, date(2024, 5, 1), check_in=(9, 5)).status, 'late')
+        with CaptureQueriesContext(connection) as queries:
+            punch(self.kim, date(2024, 5, 2), check_in=(9, 5))
+        self.assertFalse(any('commute_workrule' in query['sql'] for query in queries.captured_queries))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            WorkRule.objects.create(name='유연 출근', late_grace_minutes=10)
+        # 커밋 전에는 이전 규칙 유지
+        self.assertEqual(punch(self.kim, date(2024, 5, 9), check_in=(9, 5)).status, 'late')
+        for callback in callbacks:
+            callback()
+        self.assertEqual(punch(self.kim, date(2024, 5, 3), check_in=(9, 5)).status, 'normal')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkRule.objects.create(name='영업팀', department='영업팀', start_time=time(8), end_time=time(17))
+        self.assertEqual(punch(self.lee, date(2024, 5, 3), check_in=(8, 30), check_out=(17, 0)).status, 'late')
+        self.assertEqual(punch(self.kim, date(2024, 5, 6), check_in=(9, 5)).status, 'normal')
+
+        # 다른 프로세스에서 규칙이 바뀐 경우 (세대 번호만 바뀜)
+        WorkRule.objects.filter(department='').update(late_grace_minutes=0)
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkRuleEngine.invalidate()
+        self.assertEqual(punch(self.kim, date(2024, 5, 7), check_in=(9, 5)).status, 'late')
+
+    def test_schedule_change_reevaluates_day(self):
+        """스케줄 변경 시 같은 날 기록 상태 재판정 테스트"""
+        record = punch(self.kim, date(2024, 5, 8), check_in=(9, 30), check_out=(19, 0))
+        self.assertEqual(record.status, 'late')
+
+        cache_key = MonthlyAttendance.cache_key(self.kim.pk, '2024-05')
+        cache.set(cache_key, 'stale')
+        with self.captureOnCommitCallbacks() as callbacks:
+            schedule = WorkSchedule.objects.create(
+                user=self.kim, work_date=date(2024, 5, 8), start_time=time(10), end_time=time(19)
+            )
+        # 집계 캐시는 커밋 후에 무효화
+        self.assertEqual(cache.get(cache_key), 'stale')
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(cache_key))
+        record.refresh_from_db()
+        self.assertEqual(record.status, 'normal')
+        summary = CommuteMonthlySummary.objects.get(user=self.kim, month=date(2024, 5, 1))
+        self.assertEqual((summary.late, summary.normal), (0, 1))
+
+        schedule.delete()
+        record.refresh_from_db()
+        self.assertEqual(record.status, 'late')
+
+    def test_reevaluate_command(self):
+        """규칙 변경 후 일괄 재판정 명령 테스트"""
+        for day in (1, 2, 3):
+            punch(self.kim, date(2024, 5, day), check_in=(9, 10))
+        punch(self.kim, date(2024, 6, 3), check_in=(9, 10))
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkRule.objects.create(name='유연 출근', late_grace_minutes=15)
+
+        out = StringIO()
+        call_command('reevaluate_commute_status', '--from', '2024-05', '--to', '2024-05', '--dry-run', stdout=out)
+        self.assertIn('[미저장] 2024-05-01 ~ 2024-05-31 - 기록 3건 중 3건 변경 (normal 3건)', out.getvalue())
+        self.assertEqual(CommuteRecord.objects.filter(status='late').count(), 4)
+
+        out = StringIO()
+        call_command('reevaluate_commute_status', '--batch-size', '2', stdout=out)
+        self.assertIn('기록 4건 중 4건 변경', out.getvalue())
+        self.assertFalse(CommuteRecord.objects.filter(status='late').exists())
+        may = CommuteMonthlySummary.objects.get(user=self.kim, month=date(2024, 5, 1))
+        self.assertEqual((may.late, may.normal), (0, 3))
@@ -0,0 +1,516 @@
+"""
+벤치마크 유틸리티
+
+이 모듈은 성능 측정을 위한 합성 데이터 생성기와 API 벤치마크 실행기를 제공합니다.
+측정 결과는 JSON 으로 저장해 기준선(baseline)과 비교할 수 있습니다.
+
+주요 기능:
+- 한국어 합성 데이터 대량 생성 (사용자, 거래처, 공지사항, 기술, 출퇴근 기록, 근무 일정)
+- 화면 뷰 및 API 엔드포인트별 응답 시간 및 메모리 할당 측정
+- JSON 인코더별 본문 크기 및 인코딩 시간 비교
+- 기준선 대비 회귀 검사
+"""
+
+import functools
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from zoneinfo import ZoneInfo
+
+try:
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.urls import URLPattern, URLResolver, get_resolver, reverse
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
+from .cache import CacheGeneration
+from .monitoring import AllocationProfiler
+from .renderers import JSONRenderer, orjson
+
+
+# =============================================================================
+# 합성 데이터 생성기
+# =============================================================================
+
+class BenchmarkDataGenerator:
+    """
+    한국어 합성 데이터 생성기
+
+    시드가 같으면 같은 데이터를 만들며, 모든 모델은 bulk_create 로 배치 단위 저장합니다.
+    """
+
+    SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권']
+    GIVEN_NAMES = ['민준', '서연', '도윤', '하은', '시우', '지우', '예준', '수아', '주원', '지민',
+                   '현우', '채원', '준서', '다은', '건우', '소윤', '우진', '예린', '선우', '유진']
+    REGIONS = ['서울', '경기', '인천', '부산', '대구', '대전', '광주', '울산', '세종', '강원',
+               '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+    DISTRICTS = ['중구', '동구', '서구', '남구', '북구', '강남구', '송파구', '해운대구', '수성구', '유성구']
+    COMPANY_WORDS = ['한빛', '새롬', '미래', '대한', '동방', '누리', '가온', '다온', '으뜸', '푸른', '하나', '세움']
+    COMPANY_SUFFIXES = ['상사', '산업', '테크', '시스템', '솔루션', '정보통신', '물산', '엔지니어링']
+    SECTORS = ['제조업', '도소매업', '서비스업', '정보통신업', '건설업', '운수업', '전문과학기술']
+    EVENTS = ['소프트웨어 개발', '전자부품', '기계장비', '식료품', '컨설팅', '유통', '인테리어']
+    DIVISIONS = ['내부', '외부', '파트너', '협력사']
+    CONTRACT_STATUSES = ['진행중', '완료', '만료', '해지']
+    NOTICE_TOPICS = ['정기 점검', '보안 업데이트', '인사 발령', '교육 일정', '시스템 개편', '휴무 안내', '행사 안내']
+    TECH_NAMES = ['Python', 'Django', 'React', 'Vue', 'PostgreSQL', 'Redis', 'Docker', 'Kubernetes',
+                  'TypeScript', 'Kotlin', 'Swift', 'PyTorch', 'Nginx', 'Celery', 'Elasticsearch']
+    TAGS = ['웹', '백엔드', '프론트엔드', '데이터', '인프라', '보안', '모바일', '자동화', '클라우드', 'AI']
+
+    # 사업자등록번호 검증 가중치
+    BRN_WEIGHTS = (1, 3, 7, 1, 3, 7, 1, 3, 5)
+
+    def __init__(self, seed=0, batch_size=1000):
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+
+    def person_name(self):
+        return self.random.choice(self.SURNAMES) + self.random.choice(self.GIVEN_NAMES)
+
+    def company_name(self, index):
+        return f"{self.random.choice(self.COMPANY_WORDS)}{self.random.choice(self.COMPANY_SUFFIXES)} {index}"
+
+    @classmethod
+    def business_registration_number(cls, serial):
+        """일련번호로 검증 숫자가 올바른 사업자등록번호(XXX-XX-XXXXX) 생성"""
+        digits = [int(char) for char in f"{100000000 + serial % 900000000:09d}"]
+        total = sum(digit * weight for digit, weight in zip(digits, cls.BRN_WEIGHTS))
+        total += digits[8] * 5 // 10
+        digits.append((10 - total % 10) % 10)
+        text = ''.join(str(digit) for digit in digits)
+        return f"{text[:3]}-{text[3:5]}-{text[5:]}"
+
+    def _bulk_create(self, model, objects, **kwargs):
+        model.objects.bulk_create(objects, batch_size=self.batch_size, **kwargs)
+
+    def users(self, count, prefix='bench_user'):
+        """사용자 생성 (비밀번호 해시는 한 번만 계산)"""
+        User = get_user_model()
+        password = make_password('benchmark-pass')
+        self._bulk_create(User, [
+            User(username=f"{prefix}{index}", first_name=self.person_name(), password=password)
+            for index in range(count)
+        ], ignore_conflicts=True)
+        return list(User.objects.filter(username__startswith=prefix).order_by('pk'))
+
+    def clients(self, count, start=0):
+        """거래처 생성"""
+        from client_inform.models import customer_information
+
+        today = date.today()
+        objects = []
+        for index in range(start, start + count):
+            region = self.random.choice(self.REGIONS)
+            objects.append(customer_information(
+                registration_date=today - timedelta(days=self.random.randint(0, 3650)),
+                region=region,
+                division=self.random.choice(self.DIVISIONS),
+                company_name=self.company_name(index),
+                representative=self.person_name(),
+                business_registration_number=self.business_registration_number(index),
+                number_of_employees=self.random.randint(1, 2000),
+                annual_sales=self.random.randint(100, 2_000_000_000),
+                sectors=self.random.choice(self.SECTORS),
+                event=self.random.choice(self.EVENTS),
+                outsourcing_work_type=self.random.choice(['개발', '유지보수', '컨설팅']),
+                main_business=self.random.choice(self.EVENTS),
+                contract_status=self.random.choice(self.CONTRACT_STATUSES),
+                v3_contract_status=self.random.choice(['O', 'X']),
+                staff_in_charge=self.person_name(),
+                phone_number=f"0{self.random.randint(2, 70)}-{self.random.randint(200, 9999)}-{self.random.randint(0, 9999):04d}",
+                business_address=f"{region} {self.random.choice(self.DISTRICTS)} {self.random.randint(1, 300)}번길 {self.random.randint(1, 99)}",
+                e_mail=f"contact{index}@example.co.kr",
+                erp_maintenance=self.random.choice(['정상', '만료', '미계약']),
+                erp_usage_status=self.random.choice(['사용중', '미사용', '도입예정']),
+                groupware=self.random.random() < 0.5,
+                company_evaluation=self.random.choice(['A', 'B', 'C']),
+                note='',
+            ))
+            objects[-1].sync_lookup_fields()
+        self._bulk_create(customer_information, objects, ignore_conflicts=True)
+
+    def notices(self, count, authors):
+        """공지사항 생성"""
+        from 공지사항.models import Notice
+
+        importances = [choice for choice, _ in Notice.IMPORTANCE_CHOICES]
+        statuses = ['published'] * 8 + ['draft', 'archived']
+        objects = []
+        for index in range(count):
+            topic = self.random.choice(self.NOTICE_TOPICS)
+            objects.append(Notice(
+                title=f"[{topic}] {index}번째 공지사항입니다",
+                content=f"{topic} 관련 안내입니다. " * self.random.randint(5, 40),
+                author=self.random.choice(authors),
+                importance=self.random.choice(importances),
+                status=self.random.choice(statuses),
+                view_count=self.random.randint(0, 5000),
+            ))
+        self._bulk_create(Notice, objects)
+
+    def technologies(self, count, authors):
+        """기술 생성"""
+        from 기술.models import Tag, Technology, TechnologyTag
+        from 기술.tagging import rebuild_tag_index
+
+        categories = [choice for choice, _ in Technology.CATEGORY_CHOICES]
+        proficiencies = [choice for choice, _ in Technology.PROFICIENCY_CHOICES]
+        statuses = [choice for choice, _ in Technology.STATUS_CHOICES]
+        objects = []
+        for index in range(count):
+            name = self.random.choice(self.TECH_NAMES)
+            objects.append(Technology(
+                name=f"{name} {index}",
+                category=self.random.choice(categories),
+                description=f"{name} 학습 및 실무 적용 기록입니다. " * self.random.randint(2, 20),
+                proficiency=self.random.choice(proficiencies),
+                status=self.random.choice(statuses),
+                author=self.random.choice(authors),
+                tags=','.join(self.random.sample(self.TAGS, self.random.randint(1, 4))),
+            ))
+        self._bulk_create(Technology, objects)
+        # bulk_create 는 save() 와 post_save 시그널을 거치지 않으므로 태그 색인을 다시 만들고 목록 캐시를 직접 무효화
+        rebuild_tag_index(Technology, Tag, TechnologyTag, batch_size=self.batch_size)
+        CacheGeneration.bump('technology')
+
+    def _workdays(self, days):
+        """오늘 이전 days 일 중 평일 목록"""
+        today = date.today()
+        return [
+            today - timedelta(days=offset)
+            for offset in range(days, 0, -1)
+            if (today - timedelta(days=offset)).weekday() < 5
+        ]
+
+    def commute_records(self, users, days):
+        """
+        출퇴근 기록 생성
+
+        bulk_create 는 save() 를 거치지 않으므로 근무 시간은 직접 계산하고, 근태 상태는
+        CommuteRecord.save() 와 같은 근무 규칙 엔진(commute.rules)으로 판정합니다.
+        스케줄은 기록 뒤에 생성하므로 스케줄 없이 판정합니다. 약 3% 는 결근으로 생성합니다.
+        """
+        from commute.models import CommuteRecord
+        from commute.reports import MonthlyAttendance
+        from commute.rules import ANY, WorkRuleEngine, load_departments
+        from commute.summaries import SummaryRebuilder
+
+        tz = ZoneInfo(settings.TIME_ZONE)
+        engine = WorkRuleEngine.current()
+        departments = load_departments([user.pk for user in users]) if engine.by_department else {}
+        workdays = self._workdays(days)
+        objects = []
+        for user in users:
+            for work_date in workdays:
+                if self.random.random() < 0.03:
+                    objects.append(CommuteRecord(user=user, work_date=work_date, status='absence'))
+                    continue
+                day_start = datetime.combine(work_date, dt_time(0, 0), tzinfo=tz)
+                check_in = day_start + timedelta(minutes=self.random.randint(500, 560))
+                check_out = day_start + timedelta(minutes=self.random.randint(1050, 1200))
+                status = engine.evaluate(work_date, check_in, check_out, departments.get(user.pk, ANY), tz=tz)
+                objects.append(CommuteRecord(
+                    user=user,
+                    work_date=work_date,
+                    check_in_time=check_in,
+                    check_out_time=check_out,
+                    total_work_hours=check_out - check_in,
+                    status=status,
+                ))
+            if len(objects) >= self.batch_size * 10:
+                self._bulk_create(CommuteRecord, objects, ignore_conflicts=True)
+                objects = []
+        self._bulk_create(CommuteRecord, objects, ignore_conflicts=True)
+        # bulk_create 는 save() 와 post_save 시그널을 거치지 않으므로 월간 집계 캐시 무효화와 요약 재구성을 직접 수행
+        MonthlyAttendance.invalidate(
+            (user.pk, work_date) for user in users for work_date in {day.replace(day=1) for day in workdays}
+        )
+        if workdays:
+            SummaryRebuilder(batch_size=self.batch_size).rebuild(workdays[0], workdays[-1])
+
+    def work_schedules(self, users, days):
+        """근무 일정 생성 (평일 정규 근무, 일부 재택/연장 근무)"""
+        from commute.models import WorkSchedule
+        from commute.summaries import SummaryRebuilder
+
+        workdays = self._workdays(days)
+        objects = []
+        for user in users:
+            for work_date in workdays:
+                schedule_type = self.random.choices(['regular', 'remote', 'overtime'], weights=(85, 10, 5))[0]
+                objects.append(WorkSchedule(
+                    user=user,
+                    work_date=work_date,
+                    start_time=dt_time(9, 0),
+                    end_time=dt_time(21, 0) if schedule_type == 'overtime' else dt_time(18, 0),
+                    schedule_type=schedule_type,
+                ))
+            if len(objects) >= self.batch_size * 10:
+                self._bulk_create(WorkSchedule, objects)
+                objects = []
+        self._bulk_create(WorkSchedule, objects)
+        # 초과 근무는 스케줄 기준이므로 요약 재구성
+        if workdays:
+            SummaryRebuilder(batch_size=self.batch_size).rebuild(workdays[0], workdays[-1])
+
+
+# =============================================================================
+# 벤치마크 실행기
+# =============================================================================
+
+class RouteBenchmark:
+    """
+    경로 벤치마크 실행기 기본 클래스
+
+    get_routes() 가 돌려준 경로를 테스트 클라이언트로 호출해 응답 시간과
+    최대 메모리, 주요 할당 위치를 측정합니다.
+    """
+
+    # 경로 이름별 추가 쿼리 파라미터
+    ROUTE_PARAMS = {}
+
+    def __init__(self, client, iterations=5, trace_memory=True):
+        self.client = client
+        self.iterations = max(1, iterations)
+        self.trace_memory = trace_memory
+        self.allocations = AllocationProfiler()
+
+    def get_routes(self):
+        """(이름, URL) 목록 반환"""
+        raise NotImplementedError
+
+    def fetch(self, url, params):
+        """요청 후 (응답, 본문) 반환 - 스트리밍 응답은 끝까지 읽어 본문 생성 비용까지 측정"""
+        response = self.client.get(url, params)
+        if response.streaming:
+            return response, b''.join(response.streaming_content)
+        return response, response.content
+
+    def run_route(self, name, url):
+        """경로 하나 측정"""
+        params = self.ROUTE_PARAMS.get(name, {})
+        # 첫 호출은 워밍업 (쿼리/템플릿/임포트 캐시)
+        self.fetch(url, params)
+        timings = []
+        for _ in range(self.iterations):
+            started = time.perf_counter_ns()
+            response, body = self.fetch(url, params)
+            timings.append((time.perf_counter_ns() - started) / 1_000_000)
+
+        result = {
+            'url': url,
+            'status': response.status_code,
+            'bytes': len(body),
+            'time_ms': {
+                'min': round(min(timings), 3),
+                'median': round(statistics.median(timings), 3),
+                'max': round(max(timings), 3),
+            },
+        }
+
+        if self.trace_memory:
+            with self.allocations.trace() as allocations:
+                self.fetch(url, params)
+            self.allocations.record(name, allocations)
+            report = self.allocations.get_report(limit=5)[name]
+            result['peak_bytes'] = report['peak_max']
+            result['top_sites'] = report['top_sites']
+        return result
+
+    def run(self):
+        """모든 경로 측정"""
+        return {name: self.run_route(name, url) for name, url in self.get_routes()}
+
+
+class APIBenchmark(RouteBenchmark):
+    """
+    API 벤치마크 실행기
+
+    api/urls.py 의 v1 경로 중 GET 을 받는 경로를 측정합니다. 상세 경로(<pk>)는 첫 번째 객체로 호출합니다.
+    """
+
+    ROUTE_PARAMS = {
+        'api_search': {'q': '안내'},
+        'api_notice_list': {'per_page': 100},
+        'api_technology_list': {'per_page': 100},
+        # brn/phone/name 중 하나가 없으면 400 - 생성기 기업명 접두어로 조회
+        'api_client_lookup': {'name': '한빛'},
+    }
+    # 경로 이름별 URL 인자 (<pk> 외의 인자가 있는 경로)
+    ROUTE_KWARGS = {
+        'api_export': {'resource': 'clients'},
+    }
+
+    def get_routes(self):
+        """(이름, URL) 목록 반환"""
+        from api.urls import urlpatterns_v1
+        from 공지사항.models import Notice
+        from 기술.models import Technology
+
+        detail_models = {
+            'api_notice_detail': Notice,
+            'api_technology_detail': Technology,
+            'api_technology_related': Technology,
+        }
+        routes = []
+        for pattern in urlpatterns_v1:
+            if not isinstance(pattern, URLPattern) or not pattern.name:
+                continue
+            # POST 전용 뷰(타각 일괄 업로드 등)는 제외
+            view_class = getattr(pattern.callback, 'view_class', None)
+            if view_class is not None and not hasattr(view_class, 'get'):
+                continue
+            kwargs = dict(self.ROUTE_KWARGS.get(pattern.name, {}))
+            if 'pk' in pattern.pattern.converters:
+                model = detail_models.get(pattern.name)
+                obj = model.objects.order_by('pk').first() if model else None
+                if obj is None:
+                    continue
+                kwargs['pk'] = obj.pk
+            routes.append((pattern.name, reverse(pattern.name, kwargs=kwargs)))
+        return routes
+
+
+class ViewBenchmark(RouteBenchmark):
+    """
+    화면 뷰 벤치마크 실행기
+
+    루트 URLconf 를 순회해 GET 으로 열 수 있는 화면 뷰를 측정합니다.
+    같은 뷰가 여러 접두어로 연결된 경우(client/, client_inform/ 등) 처음 경로만 측정하고,
+    결과 키는 URL 경로입니다. API/관리자/정적 파일 경로와 상태를 바꾸는 경로는 제외합니다.
+    """
+
+    EXCLUDED_PREFIXES = ('admin/', 'api/', 'health/', 'static/', 'media/')
+
+    def get_routes(self):
+        """(URL, URL) 목록 반환"""
+        from 공지사항.models import Notice
+
+        detail_models = {'notice_detail': Notice}
+        routes, seen = [], set()
+        for prefix, pattern in self._iter_patterns(get_resolver().url_patterns):
+            if prefix.startswith(self.EXCLUDED_PREFIXES) or pattern.callback in seen:
+                continue
+            route = prefix + str(pattern.pattern)
+            if '<' in route:
+                model = detail_models.get(pattern.name)
+                obj = model.objects.order_by('pk').first() if model else None
+                if obj is None or route.count('<') > 1:
+                    continue
+                route = route.replace('<int:pk>', str(obj.pk))
+            seen.add(pattern.callback)
+            url = '/' + route
+            routes.append((url, url))
+        return routes
+
+    @classmethod
+    def _iter_patterns(cls, patterns, prefix=''):
+        """(접두어, URLPattern) 을 재귀적으로 순회"""
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from cls._iter_patterns(pattern.url_patterns, prefix + str(pattern.pattern))
+            elif isinstance(pattern, URLPattern):
+                yield prefix, pattern
+
+
+# =============================================================================
+# JSON 인코딩 벤치마크
+# =============================================================================
+
+def benchmark_json_encoding(payload, iterations=20):
+    """
+    JSON 인코더별 본문 크기와 인코딩 시간 비교
+
+    'django' 는 기존 APIResponse 경로(JsonResponse + DjangoJSONEncoder, ensure_ascii=True)이며
+    날짜를 미리 isoformat() 으로 바꾼 사본을 인코딩합니다.
+
+    Args:
+        payload (object): datetime 등을 그대로 포함한 응답 데이터
+        iterations (int): 반복 횟수
+
+    Returns:
+        dict: {인코더: {'bytes': 본문 크기, 'time_ms': 1회 인코딩 중앙값}}
+    """
+    from django.core.serializers.json import DjangoJSONEncoder
+
+    prepared = json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+    encoders = {'django': lambda: json.dumps(prepared, cls=DjangoJSONEncoder).encode('utf-8')}
+    for backend in ('stdlib', 'orjson'):
+        if backend == 'orjson' and orjson is None:
+            continue
+        encoders[backend] = functools.partial(JSONRenderer(backend).render, payload)
+
+    results = {}
+    for name, encode in encoders.items():
+        body = encode()
+        timings = []
+        for _ in range(max(1, iterations)):
+            started = time.perf_counter_ns()
+            encode()
+            timings.append((time.perf_counter_ns() - started) / 1_000_000)
+        results[name] = {'bytes': len(body), 'time_ms': round(statistics.median(timings), 3)}
+    return results
+
+
+# =============================================================================
+# 기준선 비교
+# =============================================================================
+
+def load_baseline(path):
+    """기준선 JSON 로드 (없으면 빈 딕셔너리)"""
+    try:
+        with open(path, encoding='utf-8') as baseline_file:
+            return json.load(baseline_file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_results(path, results):
+    """결과를 JSON 으로 저장"""
+    with open(path, 'w', encoding='utf-8') as results_file:
+        json.dump(results, results_file, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def compare_results(results, baseline, tolerance=0.25, metrics=('peak_bytes',)):
+    """
+    기준선 대비 회귀 검사
+
+    Args:
+        results (dict): 이번 측정 결과 {경로: {지표: 값}}
+        baseline (dict): 기준선 결과
+        tolerance (float): 허용 증가율 (0.25 = 25%)
+        metrics (tuple): 비교할 지표 ('peak_bytes', 'time_ms.median' 처럼 점으로 중첩 표기)
+
+    Returns:
+        list: 회귀 항목 [{'route', 'metric', 'baseline', 'current', 'ratio'}]
+    """
+    def lookup(entry, metric):
+        for part in metric.split('.'):
+            if not isinstance(entry, dict) or part not in entry:
+                return None
+            entry = entry[part]
+        return entry
+
+    regressions = []
+    for route, entry in results.items():
+        base_entry = baseline.get(route)
+        if not base_entry:
+            continue
+        for metric in metrics:
+            current, base = lookup(entry, metric), lookup(base_entry, metric)
+            if not current or not base:
+                continue
+            ratio = current / base
+            if ratio > 1 + tolerance:
+                regressions.append({
+                    'route': route,
+                    'metric': metric,
+                    'baseline': base,
+                    'current': current,
+                    'ratio': round(ratio, 3),
+                })
+    return regressions
@@ -9,22 +9,40 @@
 - 데이터베이스 쿼리 최적화
 - 캐시 무효화 및 관리
 - 성능 모니터링
+- 조건부 GET (ETag/304) 및 API 응답 캐시
+- 캐시 연산 계측 (적중률, 지연 시간)
+- 네임스페이스 세대(generation) 번호로 관련 캐시 일괄 무효화
 """
 
 try:
     from django.core.cache import cache
-    from django.db import models
+    from django.db import connection, models
     from django.core.cache.utils import make_template_fragment_key
     from django.template import loader
     from django.utils.decorators import method_decorator
     from django.views.decorators.cache import cache_page
     from django.views.decorators.vary import vary_on_headers, vary_on_cookie
+    from django.conf import settings
+    from django.db.models import Max, Count
+    from django.http import HttpResponse, HttpResponseNotModified
+    from django.utils.cache import parse_etags
+    from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+    from django.utils.module_loading import import_string
     DJANGO_AVAILABLE = True
 except ImportError:
     DJANGO_AVAILABLE = False
 
 import time
 import functools
+import logging
+import hashlib
+import re
+import sys
+
+from .metrics import registry
+
+# 로거 설정
+performance_logger = logging.getLogger('performance')
 
 
 class CacheManager:
@@ -160,18 +178,27 @@ class PerformanceMonitor:
         """쿼리 성능 모니터링 데코레이터"""
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            from .monitoring import SlowQueryRecorder
+            
             start_time = time.time()
             
+            # 요청 미들웨어가 이미 감지기를 등록했다면 중복 등록하지 않음
+            recorder = None
+            if not any(isinstance(installed, SlowQueryRecorder) for installed in connection.execute_wrappers):
+                recorder = SlowQueryRecorder()
+            
             try:
-                result = func(*args, **kwargs)
-                return result
+                if recorder is None:
+                    return func(*args, **kwargs)
+                # 함수 안에서 실행된 개별 느린 쿼리는 SQL, 호출 위치, 실행 계획과 함께 기록
+                with connection.execute_wrapper(recorder):
+                    return func(*args, **kwargs)
             finally:
                 end_time = time.time()
                 duration = end_time - start_time
                 
-                # 성능 기록 (실제로는 로그 파일이나 데이터베이스에 저장)
-                if duration > 1.0:  # 1초 이상 걸리는 쿼리만 기록
-                    print(f"느린 쿼리 감지: {func.__name__} - {duration:.2f}초")
+                if duration > 1.0:  # 1초 이상 걸린 함수 기록
+                    performance_logger.warning(f"느린 쿼리 함수: {func.__name__} - {duration:.2f}초")
                 
                 # 성능 통계 수집
                 PerformanceMonitor.record_performance_stats(func.__name__, duration)
@@ -201,6 +228,427 @@ class PerformanceMonitor:
         cache.set('performance_stats', stats, 3600)  # 1시간 동안 캐시
 
 
+
+class ResponseCache:
+    """
+    API 응답 캐시 및 조건부 GET 처리 클래스
+
+    쿼리셋의 최종 수정일(updated_at 최대값)과 행 수로 약한 ETag를 만들고,
+    클라이언트의 If-None-Match 헤더가 일치하면 본문을 만들지 않고 304를 반환합니다.
+    서버측 응답 캐시는 ETag를 키에 포함하므로 데이터가 바뀌면 자동으로 무효화됩니다.
+
+    Settings:
+        API_RESPONSE_CACHE_TIMEOUT (int): 서버측 응답 캐시 시간(초), 0이면 사용 안 함
+    """
+
+    KEY_PREFIX = 'api_response'
+
+    @staticmethod
+    def get_role(user):
+        """캐시 키에 사용할 사용자 역할 반환"""
+        if user.is_superuser:
+            return 'superuser'
+        return 'staff' if user.is_staff else 'user'
+
+    @staticmethod
+    def queryset_etag(queryset, *parts, field='updated_at'):
+        """
+        쿼리셋 기반 약한 ETag 생성
+
+        Args:
+            queryset: 필터링된 쿼리셋 (정렬은 무시됨)
+            *parts: ETag에 함께 반영할 값 (역할, 쿼리 파라미터 등)
+            field (str): 최종 수정일 필드명
+
+        Returns:
+            tuple: (ETag 문자열, 행 수)
+        """
+        aggregate = queryset.order_by().aggregate(last_modified=Max(field), total=Count('pk'))
+        return ResponseCache.aggregate_etag(aggregate, parts)
+
+    @staticmethod
+    def aggregate_etag(aggregate, parts):
+        """(최종 수정일, 행 수) 집계와 추가 값으로 약한 ETag 생성"""
+        last_modified = aggregate['last_modified']
+        raw = ':'.join(
+            [last_modified.isoformat() if last_modified else '-', str(aggregate['total'])]
+            + [str(part) for part in parts]
+        )
+        return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"', aggregate['total']
+
+    @staticmethod
+    def etag_matches(request, etag):
+        """If-None-Match 헤더와 ETag 비교 (약한 비교)"""
+        header = request.META.get('HTTP_IF_NONE_MATCH')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        target = etag[2:] if etag.startswith('W/') else etag
+        for candidate in parse_etags(header):
+            if (candidate[2:] if candidate.startswith('W/') else candidate) == target:
+                return True
+        return False
+
+    @staticmethod
+    def get_timeout():
+        """서버측 응답 캐시 시간 반환 (0이면 비활성화)"""
+        return getattr(settings, 'API_RESPONSE_CACHE_TIMEOUT', 0)
+
+    @staticmethod
+    def make_key(namespace, etag):
+        """응답 캐시 키 생성 (ETag에 역할/파라미터가 이미 반영되어 있음)"""
+        return CacheManager.get_cache_key(ResponseCache.KEY_PREFIX, namespace, etag)
+
+    @staticmethod
+    def conditional_response(request, namespace, etag):
+        """
+        조건부 GET 처리
+
+        ETag가 일치하면 304 응답을, 서버측 캐시에 응답이 있으면 캐시된 응답을 반환합니다.
+        둘 다 아니면 None을 반환하여 뷰가 본문을 생성하도록 합니다.
+        """
+        if ResponseCache.etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        if ResponseCache.get_timeout():
+            cached = cache.get(ResponseCache.make_key(namespace, etag))
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response['ETag'] = etag
+                response['X-Cache'] = 'HIT'
+                return response
+        return None
+
+    @staticmethod
+    def finalize(namespace, etag, response):
+        """성공 응답에 ETag를 붙이고 서버측 캐시에 저장 (스트리밍 응답은 저장하지 않음)"""
+        if response.status_code != 200:
+            return response
+
+        response['ETag'] = etag
+        timeout = ResponseCache.get_timeout()
+        if timeout and not response.streaming:
+            cache.set(
+                ResponseCache.make_key(namespace, etag),
+                (response.content, response['Content-Type']),
+                timeout,
+            )
+            response['X-Cache'] = 'MISS'
+        return response
+
+    # ------------------------------------------------------------------
+    # 비동기 뷰용 (async ORM / cache.aget, aset)
+    # ------------------------------------------------------------------
+    @staticmethod
+    async def aqueryset_etag(queryset, *parts, field='updated_at'):
+        """queryset_etag 의 비동기 버전"""
+        aggregate = await queryset.order_by().aaggregate(last_modified=Max(field), total=Count('pk'))
+        return ResponseCache.aggregate_etag(aggregate, parts)
+
+    @staticmethod
+    async def aconditional_response(request, namespace, etag):
+        """conditional_response 의 비동기 버전"""
+        if ResponseCache.etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        if ResponseCache.get_timeout():
+            cached = await cache.aget(ResponseCache.make_key(namespace, etag))
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response['ETag'] = etag
+                response['X-Cache'] = 'HIT'
+                return response
+        return None
+
+    @staticmethod
+    async def afinalize(namespace, etag, response):
+        """finalize 의 비동기 버전"""
+        if response.status_code != 200:
+            return response
+
+        response['ETag'] = etag
+        timeout = ResponseCache.get_timeout()
+        if timeout and not response.streaming:
+            await cache.aset(
+                ResponseCache.make_key(namespace, etag),
+                (response.content, response['Content-Type']),
+                timeout,
+            )
+            response['X-Cache'] = 'MISS'
+        return response
+
+
+
+class CacheGeneration:
+    """
+    네임스페이스 세대 번호
+
+    캐시 키에 네임스페이스의 세대 번호를 넣어 두고, 데이터가 바뀌면 번호만 올려
+    해당 네임스페이스의 캐시를 한 번에 무효화합니다 (키 패턴 삭제가 없는 백엔드에서도 동작).
+    이전 세대의 항목은 더 이상 조회되지 않고 만료 시간에 따라 정리됩니다.
+
+    사용 예:
+        key = CacheManager.get_cache_key('technology_list', CacheGeneration.get('technology'), params_hash)
+        CacheGeneration.bump('technology')  # 기술 저장/삭제 시
+    """
+
+    KEY_PREFIX = 'generation'
+
+    @staticmethod
+    def make_key(namespace):
+        return CacheManager.get_cache_key(CacheGeneration.KEY_PREFIX, namespace)
+
+    @staticmethod
+    def get(namespace):
+        """현재 세대 번호 (없으면 생성)"""
+        key = CacheGeneration.make_key(namespace)
+        generation = cache.get(key)
+        if generation is None:
+            # 축출 후 다시 만들어져도 이전 번호와 겹치지 않도록 시각 기반 초기값 사용
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        return generation
+
+    @staticmethod
+    def bump(namespace):
+        """세대 번호 증가 (해당 네임스페이스 캐시 전체 무효화)"""
+        key = CacheGeneration.make_key(namespace)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
+            return cache.get(key)
+
+
+_NAMESPACE_SEPARATOR = re.compile(r'[:.]')
+_MISSING = object()
+_OPERATION_METRICS = {
+    operation: (f'cache.{operation}', f'cache.{operation}.latency_us')
+    for operation in ('get', 'set', 'delete')
+}
+
+
+def _estimate_size(value):
+    """
+    캐시 값의 크기 추정 (바이트)
+
+    직렬화 비용을 피하기 위해 bytes/str은 길이를, 튜플/리스트는 한 단계만
+    합산하고, 그 외 객체는 sys.getsizeof 얕은 크기를 사용합니다.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(
+            len(item) if isinstance(item, (bytes, bytearray, str)) else sys.getsizeof(item)
+            for item in value
+        )
+    return sys.getsizeof(value)
+
+
+class InstrumentedCache(BaseCache if DJANGO_AVAILABLE else object):
+    """
+    계측 캐시 백엔드
+
+    실제 캐시 백엔드를 감싸서 키 네임스페이스(첫 번째 ':' 또는 '.' 앞부분)별로
+    get/hit/miss/set/delete 횟수와 바이트 수를 세고, 연산 시간을
+    마이크로초 히스토그램으로 공유 메트릭 레지스트리에 기록합니다.
+
+    Settings 예시:
+        'default': {
+            'BACKEND': 'utils.cache.InstrumentedCache',
+            'WRAPPED_BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
+    """
+
+    METRIC_PREFIX = 'cache.'
+
+    def __init__(self, location, params):
+        params = dict(params)
+        backend_path = params.pop('WRAPPED_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+        super().__init__(params)
+        self.backend = import_string(backend_path)(location, params)
+        self.backend_path = backend_path
+
+    @staticmethod
+    def _namespace(key):
+        # CacheManager 키는 ':'로, Django 내부 키(세션, 템플릿 프래그먼트)는 '.'으로 구분되므로
+        # 둘 중 앞선 구분자까지를 네임스페이스로 사용해 레이블 수가 무한히 늘지 않게 합니다.
+        return _NAMESPACE_SEPARATOR.split(str(key), 1)[0]
+
+    @classmethod
+    def _group(cls, keys):
+        """키를 네임스페이스별로 묶음 (다중 키 연산은 네임스페이스마다 따로 기록)"""
+        groups = {}
+        for key in keys:
+            groups.setdefault(cls._namespace(key), []).append(key)
+        return groups
+
+    @staticmethod
+    def _record_groups(operation, started, groups):
+        """
+        네임스페이스별 횟수/카운터와 연산 시간 기록
+
+        Args:
+            groups (dict): 네임스페이스 -> (횟수, ((카운터 이름, 값), ...))
+        """
+        elapsed_us = (time.perf_counter_ns() - started) // 1000
+        counter_name, histogram_name = _OPERATION_METRICS[operation]
+        for namespace, (count, counters) in groups.items():
+            registry.record(
+                ((counter_name, count),) + tuple(counters),
+                histogram_name,
+                namespace,
+                elapsed_us,
+            )
+
+    @classmethod
+    def _record(cls, operation, namespace, started, counters=(), count=1):
+        cls._record_groups(operation, started, {namespace: (count, counters)})
+
+    # ------------------------------------------------------------------
+    # 조회 연산
+    # ------------------------------------------------------------------
+    def get(self, key, default=None, version=None):
+        started = time.perf_counter_ns()
+        value = self.backend.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._record('get', self._namespace(key), started, (('cache.misses', 1),))
+            return default
+        self._record('get', self._namespace(key), started,
+                     (('cache.hits', 1), ('cache.bytes_read', _estimate_size(value))))
+        return value
+
+    def get_many(self, keys, version=None):
+        started = time.perf_counter_ns()
+        keys = list(keys)
+        found = self.backend.get_many(keys, version=version)
+        groups = {}
+        for namespace, group in self._group(keys).items():
+            values = [found[key] for key in group if key in found]
+            groups[namespace] = (len(group), (
+                ('cache.hits', len(values)),
+                ('cache.misses', len(group) - len(values)),
+                ('cache.bytes_read', sum(_estimate_size(value) for value in values)),
+            ))
+        self._record_groups('get', started, groups)
+        return found
+
+    def has_key(self, key, version=None):
+        return self.backend.has_key(key, version=version)
+
+    # ------------------------------------------------------------------
+    # 쓰기 연산
+    # ------------------------------------------------------------------
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        started = time.perf_counter_ns()
+        self.backend.set(key, value, timeout=timeout, version=version)
+        self._record('set', self._namespace(key), started,
+                     (('cache.bytes_written', _estimate_size(value)),))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        started = time.perf_counter_ns()
+        added = self.backend.add(key, value, timeout=timeout, version=version)
+        self._record('set', self._namespace(key), started,
+                     (('cache.bytes_written', _estimate_size(value) if added else 0),))
+        return added
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        started = time.perf_counter_ns()
+        failed = self.backend.set_many(data, timeout=timeout, version=version)
+        self._record_groups('set', started, {
+            namespace: (len(group), (('cache.bytes_written', sum(_estimate_size(data[key]) for key in group)),))
+            for namespace, group in self._group(data).items()
+        })
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.backend.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        started = time.perf_counter_ns()
+        value = self.backend.incr(key, delta, version=version)
+        self._record('set', self._namespace(key), started)
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        started = time.perf_counter_ns()
+        value = self.backend.decr(key, delta, version=version)
+        self._record('set', self._namespace(key), started)
+        return value
+
+    # ------------------------------------------------------------------
+    # 삭제 연산
+    # ------------------------------------------------------------------
+    def delete(self, key, version=None):
+        started = time.perf_counter_ns()
+        deleted = self.backend.delete(key, version=version)
+        self._record('delete', self._namespace(key), started)
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        started = time.perf_counter_ns()
+        keys = list(keys)
+        self.backend.delete_many(keys, version=version)
+        self._record_groups('delete', started, {
+            namespace: (len(group), ()) for namespace, group in self._group(keys).items()
+        })
+
+    def clear(self):
+        self.backend.clear()
+
+    def close(self, **kwargs):
+        self.backend.close(**kwargs)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_stats():
+        """
+        네임스페이스별 캐시 통계 반환
+
+        Returns:
+            dict: {네임스페이스: {gets, hits, misses, hit_ratio, sets, deletes,
+                   bytes_read, bytes_written, latency_us: {get, set, delete}}}
+        """
+        snapshot = registry.snapshot(InstrumentedCache.METRIC_PREFIX)
+        counters = snapshot['counters']
+        histograms = snapshot['histograms']
+
+        namespaces = set()
+        for values in counters.values():
+            namespaces.update(values)
+
+        stats = {}
+        for namespace in sorted(namespaces):
+            gets = counters.get('cache.get', {}).get(namespace, 0)
+            hits = counters.get('cache.hits', {}).get(namespace, 0)
+            stats[namespace] = {
+                'gets': gets,
+                'hits': hits,
+                'misses': counters.get('cache.misses', {}).get(namespace, 0),
+                'hit_ratio': round(hits / gets, 4) if gets else None,
+                'sets': counters.get('cache.set', {}).get(namespace, 0),
+                'deletes': counters.get('cache.delete', {}).get(namespace, 0),
+                'bytes_read': counters.get('cache.bytes_read', {}).get(namespace, 0),
+                'bytes_written': counters.get('cache.bytes_written', {}).get(namespace, 0),
+                'latency_us': {
+                    operation: histograms[f'cache.{operation}.latency_us'][namespace]
+                    for operation in ('get', 'set', 'delete')
+                    if namespace in histograms.get(f'cache.{operation}.latency_us', {})
+                },
+            }
+        return stats
+
+
 # 캐싱 데코레이터들
 def cache_view(timeout=300):
     """뷰 캐싱 데코레이터"""
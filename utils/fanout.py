@@ -0,0 +1,150 @@
+"""
+병렬 조회(fan-out) 모듈
+
+여러 원본 조회를 프로세스 공유 스레드 풀에서 동시에 실행하고 원본마다 제한 시간을 둡니다.
+제한 시간 안에 끝나지 않았거나 예외가 난 원본은 상태만 기록하고 나머지 결과는 그대로 돌려주므로
+호출하는 쪽에서 부분 결과로 응답할 수 있습니다.
+
+각 작업은 풀 스레드의 자체 DB 연결로 실행되고, 끝나면 close_old_connections() 로
+CONN_MAX_AGE 가 지난 연결을 닫습니다 (요청 종료 시 연결 정리가 풀 스레드에는 적용되지 않음).
+호출한 스레드가 트랜잭션(atomic 블록) 안이면 다른 연결에서는 아직 커밋되지 않은 데이터가 보이지 않으므로
+스레드 풀을 쓰지 않고 호출한 스레드에서 차례로 실행합니다.
+
+메트릭 (레이블: '<이름>.<원본>'):
+    - fanout.calls / fanout.errors: 실행/예외 횟수
+    - fanout.timeouts: 제한 시간 초과 횟수
+    - fanout.latency_us: 제출부터 완료까지 시간 (초과한 작업도 끝난 뒤 실제 시간을 기록)
+
+Settings:
+    FANOUT_MAX_WORKERS (int): 공유 스레드 풀 크기 (기본값 8)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .metrics import registry
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """프로세스 공유 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'FANOUT_MAX_WORKERS', 8), thread_name_prefix='fanout'
+            )
+        return _executor
+
+
+class FanOutResult:
+    """
+    원본 하나의 조회 결과
+
+    Attributes:
+        status (str): ok | timeout | error
+        value: 조회 결과 (ok 일 때만)
+        error (str): 예외 메시지 (error 일 때만)
+        elapsed_ms (float): 제출부터 완료(또는 제한 시간)까지 시간
+    """
+
+    __slots__ = ('status', 'value', 'error', 'elapsed_ms')
+
+    def __init__(self, status, value=None, error=None, elapsed_ms=0.0):
+        self.status = status
+        self.value = value
+        self.error = error
+        self.elapsed_ms = elapsed_ms
+
+    @property
+    def ok(self):
+        return self.status == 'ok'
+
+
+class FanOut:
+    """
+    병렬 조회
+
+    사용 예:
+        results = FanOut('search').run({
+            'notice': (search_notices, 1.0),   # (인자 없는 함수, 제한 시간(초))
+            'client': (search_clients, 2.0),
+        })
+        results['notice'].status  # ok | timeout | error
+    """
+
+    def __init__(self, name, executor=None):
+        """
+        Args:
+            name (str): 메트릭 레이블 접두사
+            executor (Executor): 사용할 스레드 풀 (None 이면 프로세스 공유 풀)
+        """
+        self.name = name
+        self.executor = executor
+
+    def label(self, key):
+        return f'{self.name}.{key}'
+
+    def call(self, key, func, submitted, pooled=True):
+        """
+        작업 하나 실행 후 시간/예외 기록
+
+        Args:
+            pooled (bool): 풀 스레드에서 실행 중인지 (인라인 실행이면 호출한 스레드의 연결을 닫지 않음)
+        """
+        value = error = None
+        try:
+            value = func()
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        finally:
+            if pooled:
+                close_old_connections()
+        elapsed_ns = time.perf_counter_ns() - submitted
+        registry.record(
+            (('fanout.calls', 1), ('fanout.errors', 1 if error is not None else 0)),
+            'fanout.latency_us',
+            self.label(key),
+            elapsed_ns // 1000,
+        )
+        if error is not None:
+            return FanOutResult('error', error=error, elapsed_ms=elapsed_ns / 1e6)
+        return FanOutResult('ok', value, elapsed_ms=elapsed_ns / 1e6)
+
+    def run(self, tasks):
+        """
+        모든 작업을 동시에 실행하고 각자의 제한 시간까지 기다림
+
+        Args:
+            tasks (dict): {키: (인자 없는 함수, 제한 시간(초))}
+
+        Returns:
+            dict: {키: FanOutResult} (tasks 와 같은 순서)
+        """
+        if connection.in_atomic_block:
+            # 다른 연결에서는 이 트랜잭션의 변경이 보이지 않으므로 차례로 실행 (제한 시간 미적용)
+            return {
+                key: self.call(key, func, time.perf_counter_ns(), pooled=False) for key, (func, _) in tasks.items()
+            }
+
+        executor = self.executor or get_executor()
+        submitted = time.perf_counter_ns()
+        futures = {key: executor.submit(self.call, key, func, submitted) for key, (func, _) in tasks.items()}
+        results = {}
+        for key, (_, timeout) in tasks.items():
+            # 제한 시간은 모두 제출 시각 기준이므로 앞 작업을 기다린 시간이 뒤 작업의 제한 시간을 늘리지 않음
+            remaining = timeout - (time.perf_counter_ns() - submitted) / 1e9
+            try:
+                results[key] = futures[key].result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                # 아직 시작하지 않은 작업은 취소, 실행 중인 작업은 끝까지 실행된 뒤 결과만 버림
+                futures[key].cancel()
+                registry.incr('fanout.timeouts', self.label(key))
+                results[key] = FanOutResult('timeout', elapsed_ms=timeout * 1000)
+        return results
@@ -0,0 +1,106 @@
+"""
+목록 엔진 모듈
+
+이 모듈은 목록 페이지들이 함께 쓰는 서버측 필터/페이지 처리 기반 클래스를 제공합니다.
+검색 폼으로 요청 파라미터를 검증한 뒤 하위 클래스가 정의한 필터를 적용하고,
+번호 페이지네이션(page) 또는 하위 클래스의 키셋 페이지네이션으로 필요한 행만 읽습니다.
+
+주요 기능:
+- 검색 폼 기반 파라미터 검증 (빈 값 제외, 앞뒤 공백 제거)
+- 필터 적용 훅 (apply_filters)
+- 번호 페이지네이션 및 캐시 키용 파라미터 정규화
+"""
+
+import hashlib
+
+try:
+    from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
+
+class ListError(ValueError):
+    """잘못된 필터, 페이지, 커서, 열 요청"""
+
+
+class ListEngine:
+    """
+    목록 엔진 기반 클래스
+
+    하위 클래스는 form_class 와 get_base_queryset(), apply_filters() 를 정의합니다.
+
+    사용 예:
+        engine = TechnologyListEngine(request.GET)
+        page = engine.paginate(request.GET.get('page'))
+    """
+
+    form_class = None
+    DEFAULT_PER_PAGE = 20
+    MAX_PER_PAGE = 100
+
+    def __init__(self, params=None):
+        self.form = self.form_class(params or None)
+
+    @property
+    def filters(self):
+        """검증된 검색 폼 값 (빈 값 제외)"""
+        if not self.form.is_bound:
+            return {}
+        if not self.form.is_valid():
+            raise ListError(
+                '; '.join(f"{field}: {' '.join(errors)}" for field, errors in self.form.errors.items())
+            )
+        filters = {}
+        for name, value in self.form.cleaned_data.items():
+            if isinstance(value, str):
+                value = value.strip()
+            if value not in (None, ''):
+                filters[name] = value
+        return filters
+
+    def filters_key(self):
+        """필터 값의 짧은 해시 (캐시 키용, 파라미터 순서와 무관)"""
+        raw = '&'.join(f"{name}={value}" for name, value in sorted(self.filters.items()))
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def get_base_queryset(self):
+        """필터 적용 전 쿼리셋 (select_related, 정렬 포함)"""
+        raise NotImplementedError
+
+    def apply_filters(self, queryset, filters):
+        """검증된 필터를 쿼리셋에 적용"""
+        return queryset
+
+    def get_queryset(self):
+        """필터가 적용된 쿼리셋"""
+        return self.apply_filters(self.get_base_queryset(), self.filters)
+
+    def paginate(self, page_number=None, per_page=None):
+        """
+        번호 페이지네이션
+
+        Args:
+            page_number: 페이지 번호 (없거나 숫자가 아니면 1, 범위를 넘으면 마지막 페이지)
+            per_page: 페이지 크기 (최대 MAX_PER_PAGE)
+
+        Returns:
+            Page: Django Page 객체 (object_list 는 이미 평가된 목록)
+
+        Raises:
+            ListError: 필터나 페이지 크기가 잘못된 경우
+        """
+        try:
+            per_page = min(max(int(per_page or self.DEFAULT_PER_PAGE), 1), self.MAX_PER_PAGE)
+        except (TypeError, ValueError):
+            raise ListError('per_page 는 숫자여야 합니다.')
+
+        paginator = Paginator(self.get_queryset(), per_page)
+        try:
+            page = paginator.page(page_number or 1)
+        except PageNotAnInteger:
+            page = paginator.page(1)
+        except EmptyPage:
+            page = paginator.page(paginator.num_pages)
+        page.object_list = list(page.object_list)
+        return page
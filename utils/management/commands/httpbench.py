@@ -0,0 +1,183 @@
+"""
+HTTP 동시 부하 측정 관리 명령
+
+실행 중인 서버에 동시 연결 N개로 정해진 시간 동안 요청을 보내고 처리량(RPS), 응답 시간 백분위수,
+첫 바이트까지 시간(TTFB)을 출력합니다. WSGI(gunicorn sync) 와 ASGI(uvicorn 워커) 프로필을
+같은 워커 수로 띄운 뒤 같은 명령으로 측정해 비교합니다. 외부 부하 도구 없이 표준 라이브러리만 사용합니다.
+
+--user 를 주면 서버와 같은 세션 저장소에 해당 사용자의 로그인 세션을 만들어 쿠키로 보내므로
+서버와 같은 설정/DB 로 실행해야 합니다 (예: docker compose exec web python manage.py httpbench ...).
+
+사용 예:
+    python manage.py httpbench http://localhost:8000/api/v1/search/?q=서울 --user bench_user0 \\
+        --concurrency 200 --duration 30 --output asgi.json
+    python manage.py httpbench http://localhost:8000/api/v1/export/clients/ --user bench_user0 \\
+        --concurrency 20 --duration 30 --output export_asgi.json
+"""
+
+import threading
+import time
+from http.client import HTTPConnection, HTTPSConnection
+from importlib import import_module
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.benchmark import save_results
+
+READ_SIZE = 64 * 1024
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = '실행 중인 서버에 동시 요청을 보내 처리량과 응답 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='측정할 URL (쿼리스트링 포함)')
+        parser.add_argument('--concurrency', '-c', type=int, default=50, help='동시 연결 수')
+        parser.add_argument('--duration', '-z', type=float, default=30.0, help='측정 시간(초)')
+        parser.add_argument('--timeout', type=float, default=30.0, help='요청별 제한 시간(초)')
+        parser.add_argument('--user', help='로그인 세션을 만들 사용자 이름')
+        parser.add_argument('--cookie', help='그대로 보낼 Cookie 헤더 (--user 대신)')
+        parser.add_argument('--output', help='결과 JSON 경로')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError('--concurrency 는 1 이상, --duration 은 0 보다 커야 합니다.')
+
+        parts = urlsplit(options['url'])
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise CommandError(f"http(s) URL 이어야 합니다: {options['url']}")
+        path = quote(parts.path or '/', safe='/%')
+        if parts.query:
+            path += '?' + quote(parts.query, safe='=&%+')
+
+        headers = {'Accept': '*/*'}
+        cookie = options['cookie'] or (self.login_cookie(options['user']) if options['user'] else None)
+        if cookie:
+            headers['Cookie'] = cookie
+
+        connection_class = HTTPSConnection if parts.scheme == 'https' else HTTPConnection
+        samples = []
+        statuses = {}
+        errors = {}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['duration']
+
+        def worker():
+            connection = None
+            local_samples = []
+            local_statuses = {}
+            local_errors = {}
+            while time.perf_counter() < deadline:
+                if connection is None:
+                    connection = connection_class(parts.hostname, parts.port, timeout=options['timeout'])
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', path, headers=headers)
+                    response = connection.getresponse()
+                    first_byte = time.perf_counter()
+                    size = 0
+                    while True:
+                        chunk = response.read(READ_SIZE)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                    finished = time.perf_counter()
+                except Exception as e:
+                    key = type(e).__name__
+                    local_errors[key] = local_errors.get(key, 0) + 1
+                    connection.close()
+                    connection = None
+                    continue
+                key = str(response.status)
+                local_statuses[key] = local_statuses.get(key, 0) + 1
+                local_samples.append(((finished - started) * 1000, (first_byte - started) * 1000, size))
+                if response.will_close:
+                    connection.close()
+                    connection = None
+            if connection is not None:
+                connection.close()
+            with lock:
+                samples.extend(local_samples)
+                for key, count in local_statuses.items():
+                    statuses[key] = statuses.get(key, 0) + count
+                for key, count in local_errors.items():
+                    errors[key] = errors.get(key, 0) + count
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(options['concurrency'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        result = self.summarize(samples, statuses, errors, elapsed, options)
+        self.report(result)
+        if options['output']:
+            save_results(options['output'], result)
+            self.stdout.write(f"결과 저장: {options['output']}")
+
+    def login_cookie(self, username):
+        """서버 세션 저장소에 로그인 세션을 만들고 Cookie 헤더 값 반환 (Client.force_login 과 같은 방식)"""
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f"사용자가 없습니다: {username}")
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+
+    @staticmethod
+    def summarize(samples, statuses, errors, elapsed, options):
+        """측정 결과 집계"""
+        durations = sorted(sample[0] for sample in samples)
+        first_bytes = sorted(sample[1] for sample in samples)
+        return {
+            'url': options['url'],
+            'concurrency': options['concurrency'],
+            'elapsed_s': round(elapsed, 2),
+            'requests': len(samples),
+            'rps': round(len(samples) / elapsed, 1) if elapsed else 0.0,
+            'bytes': sum(sample[2] for sample in samples),
+            'statuses': statuses,
+            'errors': errors,
+            'time_ms': {
+                'p50': round(percentile(durations, 0.50), 2),
+                'p95': round(percentile(durations, 0.95), 2),
+                'p99': round(percentile(durations, 0.99), 2),
+                'max': round(durations[-1], 2) if durations else 0.0,
+            },
+            'ttfb_ms': {
+                'p50': round(percentile(first_bytes, 0.50), 2),
+                'p95': round(percentile(first_bytes, 0.95), 2),
+            },
+        }
+
+    def report(self, result):
+        """측정 결과 출력"""
+        self.stdout.write(
+            f"{result['requests']}건 / {result['elapsed_s']}초 - {result['rps']} req/s "
+            f"(동시 {result['concurrency']})"
+        )
+        self.stdout.write(
+            "응답 시간(ms) p50 {p50} / p95 {p95} / p99 {p99} / 최대 {max}".format(**result['time_ms'])
+        )
+        self.stdout.write("첫 바이트(ms) p50 {p50} / p95 {p95}".format(**result['ttfb_ms']))
+        self.stdout.write(f"상태 코드: {result['statuses']}")
+        if result['errors']:
+            self.stdout.write(self.style.WARNING(f"연결 오류: {result['errors']}"))
@@ -0,0 +1,164 @@
+"""
+부하 벤치마크 관리 명령
+
+합성 데이터를 대량 생성한 뒤 모든 화면 뷰와 API 엔드포인트를 측정하고,
+결과를 JSON 으로 저장해 기준선과 비교합니다. 회귀가 있으면 오류로 종료합니다.
+
+사용 예:
+    python manage.py loadbench --clients 100000 --notices 50000 --technologies 20000 \\
+        --commute-days 365 --users 500
+    python manage.py loadbench --skip-generate --baseline benchmarks/baseline.json
+    python manage.py loadbench --skip-generate --baseline benchmarks/baseline.json --update-baseline
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+
+from utils.benchmark import (
+    APIBenchmark, BenchmarkDataGenerator, ViewBenchmark, compare_results, load_baseline, save_results,
+)
+
+USER_PREFIX = 'bench_user'
+ADMIN_USERNAME = 'bench_admin'
+# 생성기가 만드는 거래처 이메일 도메인 (--flush 대상 식별용)
+CLIENT_EMAIL_DOMAIN = '@example.co.kr'
+
+
+class Command(BaseCommand):
+    help = '합성 데이터를 생성하고 화면 뷰/API 성능을 측정해 기준선과 비교합니다.'
+
+    def add_arguments(self, parser):
+        # 데이터 생성
+        parser.add_argument('--users', type=int, default=500, help='생성할 사용자 수')
+        parser.add_argument('--clients', type=int, default=100000, help='생성할 거래처 수')
+        parser.add_argument('--notices', type=int, default=50000, help='생성할 공지사항 수')
+        parser.add_argument('--technologies', type=int, default=20000, help='생성할 기술 수')
+        parser.add_argument('--commute-days', type=int, default=365, help='사용자별 출퇴근 기록/근무 일정 기간(일)')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 배치 크기')
+        parser.add_argument('--flush', action='store_true', help='이전에 생성한 벤치마크 데이터를 먼저 삭제')
+        parser.add_argument('--skip-generate', action='store_true', help='데이터 생성 생략')
+
+        # 측정
+        parser.add_argument('--skip-run', action='store_true', help='측정 생략 (데이터만 생성)')
+        parser.add_argument('--iterations', type=int, default=5, help='경로별 반복 측정 횟수')
+        parser.add_argument('--no-memory', action='store_true', help='메모리 할당 측정 생략')
+        parser.add_argument('--output', default='loadbench_results.json', help='결과 JSON 경로')
+        parser.add_argument('--baseline', help='비교할 기준선 JSON 경로')
+        parser.add_argument('--tolerance', type=float, default=0.25, help='허용 증가율 (0.25 = 25%%)')
+        parser.add_argument(
+            '--metrics', default='time_ms.median,peak_bytes',
+            help='비교할 지표 (쉼표 구분, 점으로 중첩 표기)'
+        )
+        parser.add_argument('--update-baseline', action='store_true', help='측정 결과로 기준선 갱신')
+
+    def handle(self, *args, **options):
+        if not options['skip_generate']:
+            if options['flush']:
+                self.flush()
+            self.generate(options)
+
+        if options['skip_run']:
+            return
+
+        results = self.run_benchmarks(options)
+        save_results(options['output'], results)
+        self.stdout.write(f"결과 저장: {options['output']}")
+
+        baseline_path = options['baseline']
+        if not baseline_path:
+            return
+        if options['update_baseline']:
+            save_results(baseline_path, results)
+            self.stdout.write(self.style.SUCCESS(f"기준선 갱신: {baseline_path}"))
+            return
+
+        baseline = load_baseline(baseline_path)
+        if not baseline:
+            self.stdout.write(self.style.WARNING(f"기준선이 없습니다: {baseline_path}"))
+            return
+
+        metrics = tuple(metric.strip() for metric in options['metrics'].split(',') if metric.strip())
+        regressions = compare_results(results, baseline, tolerance=options['tolerance'], metrics=metrics)
+        if regressions:
+            for item in regressions:
+                self.stdout.write(self.style.ERROR(
+                    f"  {item['route']} {item['metric']}: {item['baseline']} -> {item['current']} (x{item['ratio']})"
+                ))
+            raise CommandError(f"성능 회귀 {len(regressions)}건")
+        self.stdout.write(self.style.SUCCESS('기준선 대비 회귀 없음'))
+
+    # =========================================================================
+    # 데이터 생성
+    # =========================================================================
+
+    def flush(self):
+        """이전 벤치마크 데이터 삭제 (사용자 삭제 시 공지사항/기술/근태는 함께 삭제)"""
+        from client_inform.models import customer_information
+
+        User = get_user_model()
+        User.objects.filter(username__startswith=USER_PREFIX).delete()
+        customer_information.objects.filter(e_mail__endswith=CLIENT_EMAIL_DOMAIN).delete()
+        self.stdout.write('이전 벤치마크 데이터 삭제 완료')
+
+    def generate(self, options):
+        """합성 데이터 생성"""
+        from client_inform.models import customer_information
+
+        generator = BenchmarkDataGenerator(seed=options['seed'], batch_size=options['batch_size'])
+
+        def run_step(label, func):
+            started = time.perf_counter()
+            with transaction.atomic():
+                result = func()
+            self.stdout.write(f"{label} 생성 완료 ({time.perf_counter() - started:.1f}초)")
+            return result
+
+        users = run_step('사용자', lambda: generator.users(options['users'], prefix=USER_PREFIX))
+        if not users:
+            raise CommandError('--users 는 1 이상이어야 합니다.')
+
+        start = customer_information.objects.count()
+        run_step('거래처', lambda: generator.clients(options['clients'], start=start))
+        run_step('공지사항', lambda: generator.notices(options['notices'], users))
+        run_step('기술', lambda: generator.technologies(options['technologies'], users))
+        run_step('출퇴근 기록', lambda: generator.commute_records(users, options['commute_days']))
+        run_step('근무 일정', lambda: generator.work_schedules(users, options['commute_days']))
+
+    # =========================================================================
+    # 측정
+    # =========================================================================
+
+    def get_client(self):
+        """벤치마크 관리자 계정으로 로그인한 테스트 클라이언트"""
+        User = get_user_model()
+        admin, created = User.objects.get_or_create(
+            username=ADMIN_USERNAME, defaults={'is_staff': True, 'is_superuser': True}
+        )
+        if created:
+            admin.set_unusable_password()
+            admin.save()
+        # 템플릿 누락 등 뷰 오류는 예외 대신 500 상태로 기록
+        client = Client(raise_request_exception=False)
+        client.force_login(admin)
+        return client
+
+    def run_benchmarks(self, options):
+        """화면 뷰와 API 측정"""
+        client = self.get_client()
+        kwargs = {'iterations': options['iterations'], 'trace_memory': not options['no_memory']}
+        results = {}
+        for benchmark_class in (ViewBenchmark, APIBenchmark):
+            results.update(benchmark_class(client, **kwargs).run())
+
+        for name, result in results.items():
+            peak = result.get('peak_bytes')
+            peak_text = f"{peak / 1024:10.1f}KB" if peak is not None else ''
+            self.stdout.write(
+                f"{name:<45} {result['status']:>3} {result['time_ms']['median']:>10.2f}ms {peak_text}"
+            )
+        return results
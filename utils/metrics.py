@@ -0,0 +1,155 @@
+"""
+메트릭 레지스트리 모듈
+
+이 모듈은 프로세스 단위로 공유되는 경량 메트릭 저장소를 제공합니다.
+캐시, 쿼리, 함수 실행 시간 등의 계측값을 한 곳에 모아 모니터링 화면에서 사용합니다.
+
+주요 기능:
+- 카운터 (레이블별 누적값)
+- 히스토그램 (고정 버킷, 지연 시간 분포)
+- 스냅샷 및 초기화
+
+모든 연산은 락 하나로 보호되며 호출당 수 마이크로초 이내로 동작하도록
+문자열 포맷팅이나 동적 할당을 최소화합니다.
+"""
+
+import threading
+from bisect import bisect_left
+
+
+# 지연 시간 히스토그램 기본 버킷 (마이크로초 단위 상한값)
+LATENCY_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 50000, 100000)
+
+
+class Histogram:
+    """고정 버킷 히스토그램"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, buckets=LATENCY_BUCKETS_US):
+        self.buckets = tuple(buckets)
+        # 마지막 칸은 가장 큰 버킷을 넘는 값 (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def observe(self, value):
+        """값 기록"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """버킷 상한값 기준 백분위수 추정"""
+        if not self.count:
+            return 0
+        target = self.count * fraction
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self):
+        """히스토그램 상태를 딕셔너리로 반환"""
+        labels = [f"le_{bucket}" for bucket in self.buckets] + ['le_inf']
+        return {
+            'count': self.count,
+            'total': self.total,
+            'avg': self.total / self.count if self.count else 0,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+    프로세스 공유 메트릭 레지스트리
+
+    메트릭은 (이름, 레이블) 쌍으로 구분됩니다.
+    레이블은 캐시 키 네임스페이스, 함수 이름 등 단일 문자열입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def incr(self, name, label='', value=1):
+        """카운터 증가"""
+        key = (name, label)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, label, value, buckets=LATENCY_BUCKETS_US):
+        """히스토그램에 값 기록"""
+        key = (name, label)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def record(self, counters, histogram_name, label, value):
+        """
+        여러 카운터와 히스토그램 하나를 한 번의 락 획득으로 기록
+
+        Args:
+            counters: (이름, 증가값) 쌍의 시퀀스
+            histogram_name (str): 히스토그램 이름
+            label (str): 공통 레이블
+            value: 히스토그램 값
+        """
+        with self._lock:
+            for name, increment in counters:
+                key = (name, label)
+                self._counters[key] = self._counters.get(key, 0) + increment
+            key = (histogram_name, label)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def get_counter(self, name, label=''):
+        """카운터 현재값 반환"""
+        with self._lock:
+            return self._counters.get((name, label), 0)
+
+    def snapshot(self, prefix=''):
+        """
+        메트릭 스냅샷 반환
+
+        Args:
+            prefix (str): 이 접두사로 시작하는 메트릭만 포함
+
+        Returns:
+            dict: {'counters': {이름: {레이블: 값}}, 'histograms': {이름: {레이블: 요약}}}
+        """
+        counters = {}
+        histograms = {}
+        with self._lock:
+            for (name, label), value in self._counters.items():
+                if name.startswith(prefix):
+                    counters.setdefault(name, {})[label] = value
+            for (name, label), histogram in self._histograms.items():
+                if name.startswith(prefix):
+                    histograms.setdefault(name, {})[label] = histogram.snapshot()
+        return {'counters': counters, 'histograms': histograms}
+
+    def reset(self, prefix=''):
+        """접두사에 해당하는 메트릭 초기화"""
+        with self._lock:
+            for store in (self._counters, self._histograms):
+                for key in [key for key in store if key[0].startswith(prefix)]:
+                    del store[key]
+
+
+# 프로세스 전역 레지스트리
+registry = MetricsRegistry()
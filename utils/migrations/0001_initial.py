@@ -0,0 +1,96 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ErrorLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('error_type', models.CharField(max_length=100)),
+                ('error_message', models.TextField()),
+                ('traceback', models.TextField()),
+                ('context', models.JSONField(default=dict)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('user', models.CharField(max_length=150)),
+                ('request_path', models.CharField(blank=True, max_length=255, null=True)),
+                ('request_method', models.CharField(blank=True, max_length=10, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': '오류 로그',
+                'verbose_name_plural': '오류 로그들',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserActivityLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activity_type', models.CharField(choices=[('LOGIN', '로그인'), ('LOGOUT', '로그아웃'), ('DATA_CREATE', '데이터 생성'), ('DATA_UPDATE', '데이터 수정'), ('DATA_DELETE', '데이터 삭제'), ('DATA_VIEW', '데이터 조회'), ('FILE_UPLOAD', '파일 업로드'), ('FILE_DOWNLOAD', '파일 다운로드')], max_length=20)),
+                ('details', models.JSONField(default=dict)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('request_path', models.CharField(blank=True, max_length=255, null=True)),
+                ('request_method', models.CharField(blank=True, max_length=10, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '사용자 활동 로그',
+                'verbose_name_plural': '사용자 활동 로그들',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SlowQueryLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(auto_now_add=True, verbose_name='발생 시간')),
+                ('database', models.CharField(default='default', max_length=50, verbose_name='데이터베이스')),
+                ('duration_ms', models.FloatField(verbose_name='실행 시간(ms)')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='SQL 지문 해시')),
+                ('sql', models.TextField(verbose_name='SQL')),
+                ('params', models.TextField(blank=True, verbose_name='파라미터')),
+                ('location', models.CharField(blank=True, max_length=500, verbose_name='호출 위치')),
+                ('request_path', models.CharField(blank=True, max_length=255, null=True, verbose_name='요청 경로')),
+                ('explain', models.TextField(blank=True, verbose_name='실행 계획')),
+            ],
+            options={
+                'verbose_name': '느린 쿼리 로그',
+                'verbose_name_plural': '느린 쿼리 로그들',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['fingerprint', 'timestamp'], name='utils_slowq_fingerp_09dc37_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SecurityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('LOGIN_SUCCESS', '로그인 성공'), ('LOGIN_FAILED', '로그인 실패'), ('LOGOUT', '로그아웃'), ('PERMISSION_DENIED', '권한 거부'), ('ADMIN_ACCESS_DENIED', '관리자 접근 거부'), ('OWNER_ACCESS_DENIED', '소유자 접근 거부'), ('CSRF_TOKEN_MISSING', 'CSRF 토큰 누락'), ('RATE_LIMIT_EXCEEDED', '속도 제한 초과'), ('SUSPICIOUS_ACTIVITY', '의심스러운 활동'), ('DATA_ACCESS', '데이터 접근'), ('DATA_MODIFICATION', '데이터 수정')], max_length=50, verbose_name='이벤트 타입')),
+                ('user', models.CharField(max_length=150, verbose_name='사용자')),
+                ('timestamp', models.DateTimeField(auto_now_add=True, verbose_name='발생 시간')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP 주소')),
+                ('user_agent', models.TextField(blank=True, verbose_name='사용자 에이전트')),
+                ('details', models.JSONField(default=dict, verbose_name='상세 정보')),
+            ],
+            options={
+                'verbose_name': '보안 이벤트',
+                'verbose_name_plural': '보안 이벤트들',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['event_type', 'timestamp'], name='utils_secur_event_t_ef7264_idx'), models.Index(fields=['user', 'timestamp'], name='utils_secur_user_5d417f_idx'), models.Index(fields=['ip_address'], name='utils_secur_ip_addr_baed21_idx')],
+            },
+        ),
+    ]
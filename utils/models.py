@@ -95,3 +95,33 @@ class UserActivityLog(models.Model):
         verbose_name = '사용자 활동 로그'
         verbose_name_plural = '사용자 활동 로그들'
         ordering = ['-timestamp']
+
+
+class SlowQueryLog(models.Model):
+    """
+    느린 쿼리 로그 모델
+
+    임계값을 넘은 쿼리의 SQL, 파라미터, 호출 위치, 실행 계획을 저장합니다.
+    행 수는 SLOW_QUERY_LOG_MAX_ROWS 로 제한되며 오래된 행부터 삭제됩니다.
+    """
+    
+    timestamp = models.DateTimeField(auto_now_add=True, verbose_name='발생 시간')
+    database = models.CharField(max_length=50, default='default', verbose_name='데이터베이스')
+    duration_ms = models.FloatField(verbose_name='실행 시간(ms)')
+    fingerprint = models.CharField(max_length=64, verbose_name='SQL 지문 해시')
+    sql = models.TextField(verbose_name='SQL')
+    params = models.TextField(blank=True, verbose_name='파라미터')
+    location = models.CharField(max_length=500, blank=True, verbose_name='호출 위치')
+    request_path = models.CharField(max_length=255, null=True, blank=True, verbose_name='요청 경로')
+    explain = models.TextField(blank=True, verbose_name='실행 계획')
+    
+    class Meta:
+        verbose_name = '느린 쿼리 로그'
+        verbose_name_plural = '느린 쿼리 로그들'
+        ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['fingerprint', 'timestamp']),
+        ]
+    
+    def __str__(self):
+        return f"{self.duration_ms:.1f}ms - {self.location} ({self.timestamp})"
@@ -10,15 +10,32 @@
 - 사용자 활동 모니터링
 - 데이터베이스 쿼리 모니터맅
 - 시스템 리소스 모니터링
+- 캐시 네임스페이스별 적중률 및 지연 시간 조회
+- 요청 단위 쿼리 프로파일링 및 N+1 탐지
+- 느린 쿼리 로그 (호출 위치, 실행 계획)
+- 스택 샘플링 CPU 프로파일러 (collapsed-stack 출력)
+- 뷰별 메모리 할당 프로파일러 (tracemalloc)
 """
 
 import logging
 import time
 import json
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import wraps, lru_cache
 import traceback
 import threading
+import random
+import re
+import os
+import sys
+import queue
+import hashlib
+import signal
+import tracemalloc
+from collections import deque
+from contextlib import ExitStack, contextmanager
+
+from .metrics import registry
 
 try:
     import psutil
@@ -26,9 +43,10 @@ except ImportError:
     psutil = None
 
 try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
     from django.conf import settings
     from django.core.cache import cache
-    from django.db import connection
+    from django.db import connection, connections, close_old_connections, transaction
     from django.contrib.auth import get_user_model
     from django.http import HttpRequest
     User = get_user_model()
@@ -37,6 +55,9 @@ except ImportError:
     DJANGO_AVAILABLE = False
     User = None
 
+# tracemalloc 은 프로세스 전역이므로 한 번에 한 곳에서만 추적
+_tracemalloc_lock = threading.Lock()
+
 # 로거 설정
 system_logger = logging.getLogger('system')
 performance_logger = logging.getLogger('performance')
@@ -110,9 +131,24 @@ class SystemMonitor:
                 'timestamp': datetime.now().isoformat()
             }
             
+            # 계측 백엔드로 감싼 경우 실제 백엔드 기준으로 정보 수집
+            backend = getattr(cache, 'backend', None)
+            if backend is not None:
+                cache_info['wrapped_backend'] = cache.backend_path
+            else:
+                backend = cache
+            
             # 캐시 키 개수 (LocMemCache의 경우)
-            if hasattr(cache, '_cache'):
-                cache_info['key_count'] = len(cache._cache)
+            if hasattr(backend, '_cache'):
+                cache_info['key_count'] = len(backend._cache)
+            
+            # 네임스페이스별 적중률 및 지연 시간 (계측 백엔드 사용 시)
+            if hasattr(cache, 'get_stats'):
+                namespaces = cache.get_stats()
+                gets = sum(item['gets'] for item in namespaces.values())
+                hits = sum(item['hits'] for item in namespaces.values())
+                cache_info['hit_ratio'] = round(hits / gets, 4) if gets else None
+                cache_info['namespaces'] = namespaces
             
             return cache_info
         except Exception as e:
@@ -123,115 +159,137 @@ class SystemMonitor:
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
     
+    METRIC_PREFIX = 'function.'
+    SLOW_THRESHOLD = 1.0  # 초
+    MEMORY_THRESHOLD = 10 * 1024 * 1024  # 10MB
+    
     @staticmethod
-    def monitor_performance(func):
-        """성능 모니터링 데코레이터"""
+    def monitor_performance(func=None, *, sample_rate=1.0, memory_sample_rate=0.0):
+        """
+        성능 모니터링 데코레이터
+        
+        perf_counter_ns 로 실행 시간을 재고 공유 메트릭 레지스트리에 기록합니다.
+        샘플링되지 않은 호출은 난수 하나만 뽑고 그대로 실행되므로 자주 호출되는
+        함수에도 붙일 수 있습니다.
+        
+        Args:
+            sample_rate (float): 시간을 측정할 호출 비율 (0.0 ~ 1.0)
+            memory_sample_rate (float): 측정 호출 중 tracemalloc 으로 할당량을 잴 비율.
+                추적 중에는 모든 할당이 느려지고 다른 스레드의 할당도 함께 잡히므로
+                운영 환경에서는 낮게 유지해야 합니다.
+        
+        Usage:
+            @PerformanceMonitor.monitor_performance
+            def func(): ...
+            
+            @PerformanceMonitor.monitor_performance(sample_rate=0.01, memory_sample_rate=0.1)
+            def hot_func(): ...
+        """
+        if func is None:
+            return lambda f: PerformanceMonitor.monitor_performance(
+                f, sample_rate=sample_rate, memory_sample_rate=memory_sample_rate
+            )
+        
+        name = f"{func.__module__}.{func.__qualname__}"
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-            start_memory = psutil.Process().memory_info().rss
+            if sample_rate < 1.0 and random.random() >= sample_rate:
+                return func(*args, **kwargs)
             
+            trace_memory = (
+                memory_sample_rate > 0
+                and random.random() < memory_sample_rate
+                and PerformanceMonitor._start_memory_trace()
+            )
+            counters = [('function.calls', 1)]
+            start_time = time.perf_counter_ns()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
+            except Exception:
+                counters.append(('function.errors', 1))
+                raise
             finally:
-                end_time = time.time()
-                end_memory = psutil.Process().memory_info().rss
-                
-                duration = end_time - start_time
-                memory_diff = end_memory - start_memory
-                
-                # 성능 데이터 기록
-                performance_data = {
-                    'function': func.__name__,
-                    'duration': duration,
-                    'memory_usage': memory_diff,
-                    'timestamp': datetime.now().isoformat(),
-                    'args_count': len(args),
-                    'kwargs_count': len(kwargs)
-                }
+                elapsed_ns = time.perf_counter_ns() - start_time
+                if trace_memory:
+                    allocated, peak = PerformanceMonitor._stop_memory_trace()
+                    counters.append(('function.memory_samples', 1))
+                    counters.append(('function.memory_allocated', allocated))
+                    counters.append(('function.memory_peak', peak))
+                    if peak > PerformanceMonitor.MEMORY_THRESHOLD:
+                        performance_logger.warning(f"메모리 사용량 많은 함수: {name} - {peak / 1024 / 1024:.2f}MB")
                 
-                # 느린 함수 기록
-                if duration > 1.0:
-                    performance_logger.warning(f"느린 함수: {func.__name__} - {duration:.2f}초")
+                registry.record(counters, 'function.duration_us', name, elapsed_ns // 1000)
                 
-                # 메모리 사용량 많은 함수 기록
-                if memory_diff > 10 * 1024 * 1024:  # 10MB 이상
-                    performance_logger.warning(f"메모리 사용량 많은 함수: {func.__name__} - {memory_diff / 1024 / 1024:.2f}MB")
-                
-                # 성능 통계 저장
-                PerformanceMonitor.save_performance_stats(performance_data)
-            
-            return wrapper
+                if elapsed_ns > PerformanceMonitor.SLOW_THRESHOLD * 1_000_000_000:
+                    performance_logger.warning(f"느린 함수: {name} - {elapsed_ns / 1_000_000_000:.2f}초")
+        
         return wrapper
     
     @staticmethod
-    def save_performance_stats(data):
-        """성능 통계 저장"""
+    def _start_memory_trace():
+        """할당 추적 시작 (다른 곳에서 이미 추적 중이면 측정하지 않음)"""
+        if tracemalloc.is_tracing() or not _tracemalloc_lock.acquire(blocking=False):
+            return False
+        tracemalloc.start()
+        return True
+    
+    @staticmethod
+    def _stop_memory_trace():
+        """할당 추적 종료, (호출 종료 시점 잔여 할당량, 최대 할당량) 반환"""
         try:
-            stats = cache.get('performance_stats', {})
-            
-            function_name = data['function']
-            if function_name not in stats:
-                stats[function_name] = {
-                    'count': 0,
-                    'total_duration': 0,
-                    'avg_duration': 0,
-                    'max_duration': 0,
-                    'min_duration': float('inf'),
-                    'total_memory': 0,
-                    'avg_memory': 0,
-                    'max_memory': 0,
-                    'min_memory': float('inf')
-                }
-            
-            stats[function_name]['count'] += 1
-            stats[function_name]['total_duration'] += data['duration']
-            stats[function_name]['avg_duration'] = stats[function_name]['total_duration'] / stats[function_name]['count']
-            stats[function_name]['max_duration'] = max(stats[function_name]['max_duration'], data['duration'])
-            stats[function_name]['min_duration'] = min(stats[function_name]['min_duration'], data['duration'])
-            
-            stats[function_name]['total_memory'] += data['memory_usage']
-            stats[function_name]['avg_memory'] = stats[function_name]['total_memory'] / stats[function_name]['count']
-            stats[function_name]['max_memory'] = max(stats[function_name]['max_memory'], data['memory_usage'])
-            stats[function_name]['min_memory'] = min(stats[function_name]['min_memory'], data['memory_usage'])
-            
-            cache.set('performance_stats', stats, 3600)  # 1시간 동안 캐시
-            
-        except Exception as e:
-            error_logger.error(f"성능 통계 저장 오류: {str(e)}")
+            return tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            _tracemalloc_lock.release()
     
     @staticmethod
     def get_performance_report():
         """성능 보고서 생성"""
         try:
-            stats = cache.get('performance_stats', {})
+            snapshot = registry.snapshot(PerformanceMonitor.METRIC_PREFIX)
+            counters = snapshot['counters']
+            durations = snapshot['histograms'].get('function.duration_us', {})
             
             report = {
                 'timestamp': datetime.now().isoformat(),
                 'functions': {},
                 'summary': {
-                    'total_functions': len(stats),
+                    'total_functions': len(durations),
                     'slow_functions': [],
                     'memory_intensive_functions': []
                 }
             }
             
-            for func_name, func_stats in stats.items():
+            for func_name, histogram in durations.items():
+                memory_samples = counters.get('function.memory_samples', {}).get(func_name, 0)
+                avg_memory = (
+                    counters['function.memory_peak'][func_name] / memory_samples
+                    if memory_samples else None
+                )
+                func_stats = {
+                    'count': histogram['count'],
+                    'errors': counters.get('function.errors', {}).get(func_name, 0),
+                    'avg_duration': histogram['avg'] / 1_000_000,
+                    'max_duration': histogram['max'] / 1_000_000,
+                    'p95_duration': histogram['p95'] / 1_000_000,
+                    'memory_samples': memory_samples,
+                    'avg_memory': avg_memory,
+                }
                 report['functions'][func_name] = func_stats
                 
                 # 느린 함수 식별
-                if func_stats['avg_duration'] > 1.0:
+                if func_stats['avg_duration'] > PerformanceMonitor.SLOW_THRESHOLD:
                     report['summary']['slow_functions'].append({
                         'function': func_name,
                         'avg_duration': func_stats['avg_duration']
                     })
                 
                 # 메모리 사용량 많은 함수 식별
-                if func_stats['avg_memory'] > 10 * 1024 * 1024:  # 10MB
+                if avg_memory and avg_memory > PerformanceMonitor.MEMORY_THRESHOLD:
                     report['summary']['memory_intensive_functions'].append({
                         'function': func_name,
-                        'avg_memory': func_stats['avg_memory']
+                        'avg_memory': avg_memory
                     })
             
             return report
@@ -586,49 +644,734 @@ class MonitoringMiddleware:
             error_logger.error(f"요청 통계 저장 오류: {str(e)}")
 
 
-# 모델 정의 (utils/models.py에 추가해야 함)
-class ErrorLog(models.Model):
-    """오류 로그 모델"""
-    error_type = models.CharField(max_length=100)
-    error_message = models.TextField()
-    traceback = models.TextField()
-    context = models.JSONField(default=dict)
-    timestamp = models.DateTimeField(auto_now_add=True)
-    user = models.CharField(max_length=150)
-    request_path = models.CharField(max_length=255, null=True, blank=True)
-    request_method = models.CharField(max_length=10, null=True, blank=True)
-    user_agent = models.TextField(blank=True)
-    ip_address = models.GenericIPAddressField(null=True, blank=True)
-    
-    class Meta:
-        verbose_name = '오류 로그'
-        verbose_name_plural = '오류 로그들'
-        ordering = ['-timestamp']
-
-
-class UserActivityLog(models.Model):
-    """사용자 활동 로그 모델"""
-    ACTIVITY_TYPES = [
-        ('LOGIN', '로그인'),
-        ('LOGOUT', '로그아웃'),
-        ('DATA_CREATE', '데이터 생성'),
-        ('DATA_UPDATE', '데이터 수정'),
-        ('DATA_DELETE', '데이터 삭제'),
-        ('DATA_VIEW', '데이터 조회'),
-        ('FILE_UPLOAD', '파일 업로드'),
-        ('FILE_DOWNLOAD', '파일 다운로드'),
-    ]
-    
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
-    activity_type = models.CharField(max_length=20, choices=ACTIVITY_TYPES)
-    details = models.JSONField(default=dict)
-    timestamp = models.DateTimeField(auto_now_add=True)
-    ip_address = models.GenericIPAddressField(null=True, blank=True)
-    user_agent = models.TextField(blank=True)
-    request_path = models.CharField(max_length=255, null=True, blank=True)
-    request_method = models.CharField(max_length=10, null=True, blank=True)
-    
-    class Meta:
-        verbose_name = '사용자 활동 로그'
-        verbose_name_plural = '사용자 활동 로그들'
-        ordering = ['-timestamp']
+
+# =============================================================================
+# 요청 단위 쿼리 프로파일러 및 느린 쿼리 로그
+# =============================================================================
+
+# SQL 지문 생성용 정규식 (파라미터와 리터럴 제거)
+_SQL_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_SQL_PLACEHOLDER_LIST = re.compile(r'\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)')
+_SQL_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def sql_fingerprint(sql):
+    """
+    SQL 지문 생성
+
+    문자열/숫자 리터럴을 '?'로 바꾸고 IN (...) 목록을 하나로 접어
+    파라미터만 다른 같은 형태의 쿼리를 동일하게 취급합니다.
+
+    Args:
+        sql (str): 실행된 SQL (파라미터 치환 전)
+
+    Returns:
+        str: 정규화된 SQL
+    """
+    fingerprint = _SQL_STRING_LITERAL.sub('?', sql)
+    fingerprint = _SQL_NUMBER_LITERAL.sub('?', fingerprint)
+    fingerprint = _SQL_PLACEHOLDER_LIST.sub('(?)', fingerprint)
+    fingerprint = fingerprint.replace('%s', '?')
+    return _SQL_WHITESPACE.sub(' ', fingerprint).strip()
+
+
+class SlowQueryLogger:
+    """
+    느린 쿼리 저장기
+
+    느린 쿼리 항목은 크기 제한이 있는 메모리 버퍼에 모아 두고, 백그라운드 스레드가
+    FLUSH_DELAY 초 동안 모인 항목의 실행 계획을 수집해 bulk_create 한 번으로 저장합니다.
+    항목을 제출한 연결이 트랜잭션 안이면 커밋(또는 롤백) 뒤에 저장을 시작하므로
+    요청 트랜잭션과 테이블 잠금을 두고 경쟁하지 않습니다 (SQLite 'database table is locked' 방지).
+    버퍼가 가득 차면 가장 오래된 항목을 버리고 'db.slow_queries.dropped' 카운터를 올리며,
+    저장에 실패한 항목은 버퍼에 되돌려 다음 저장 때 다시 시도합니다.
+
+    Settings:
+        SLOW_QUERY_LOG_ASYNC: False 이면 호출한 스레드에서 바로 저장 (테스트용)
+        SLOW_QUERY_LOG_MAX_ROWS: 보관할 최대 행 수
+        SLOW_QUERY_EXPLAIN: 실행 계획 수집 여부
+    """
+
+    QUEUE_SIZE = 100
+    FLUSH_DELAY = 1.0
+    _pending = deque()
+    _wakeup = threading.Event()
+    _worker = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, entry):
+        """느린 쿼리 항목 제출"""
+        if not getattr(settings, 'SLOW_QUERY_LOG_ASYNC', True):
+            cls.save([entry])
+            return
+
+        cls.ensure_worker()
+        with cls._lock:
+            if len(cls._pending) >= cls.QUEUE_SIZE:
+                cls._pending.popleft()
+                registry.incr('db.slow_queries.dropped')
+            cls._pending.append(entry)
+        # 롤백되면 콜백은 버려지지만 항목은 버퍼에 남아 다음 저장 때 함께 저장됨
+        transaction.on_commit(cls._wakeup.set, using=entry['database'])
+
+    @classmethod
+    def ensure_worker(cls):
+        """저장 스레드 시작 (처음 제출할 때)"""
+        with cls._lock:
+            if cls._worker is None or not cls._worker.is_alive():
+                cls._worker = threading.Thread(target=cls._run, name='slow-query-logger', daemon=True)
+                cls._worker.start()
+
+    @classmethod
+    def _run(cls):
+        while True:
+            cls._wakeup.wait()
+            # 잠시 기다려 같은 시기의 항목을 한 번에 저장
+            time.sleep(cls.FLUSH_DELAY)
+            cls._wakeup.clear()
+            try:
+                cls.flush()
+            finally:
+                close_old_connections()
+
+    @classmethod
+    def flush(cls):
+        """버퍼의 항목을 모두 저장 (실패하면 버퍼에 되돌림)"""
+        with cls._lock:
+            batch = list(cls._pending)
+            cls._pending.clear()
+        if not batch or cls.save(batch):
+            return
+        with cls._lock:
+            room = max(cls.QUEUE_SIZE - len(cls._pending), 0)
+            keep = batch[len(batch) - room:] if room else []
+            if len(batch) > len(keep):
+                registry.incr('db.slow_queries.dropped', value=len(batch) - len(keep))
+            cls._pending.extendleft(reversed(keep))
+
+    @staticmethod
+    def explain(alias, sql, params):
+        """
+        실행 계획 조회
+
+        SELECT 문만 대상으로 하며, 데이터베이스에 맞는 EXPLAIN 접두사를 사용합니다.
+        (SQLite: EXPLAIN QUERY PLAN, PostgreSQL/MySQL: EXPLAIN)
+        """
+        if not sql.lstrip()[:6].upper() == 'SELECT':
+            return ''
+        db_connection = connections[alias]
+        prefix = db_connection.ops.explain_query_prefix()
+        with db_connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            return '\n'.join(' | '.join(str(column) for column in row) for row in cursor.fetchall())
+
+    @classmethod
+    def save(cls, entries):
+        """
+        실행 계획 수집 후 한 번에 저장하고 보관 한도를 넘는 오래된 행 삭제
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            from .models import SlowQueryLog
+
+            logs = []
+            for entry in entries:
+                plan = ''
+                if getattr(settings, 'SLOW_QUERY_EXPLAIN', True) and not entry['many']:
+                    try:
+                        plan = cls.explain(entry['database'], entry['sql'], entry['params'])
+                    except Exception as e:
+                        plan = f"EXPLAIN 실패: {str(e)}"
+                logs.append(SlowQueryLog(
+                    database=entry['database'],
+                    duration_ms=entry['duration_ms'],
+                    fingerprint=hashlib.md5(sql_fingerprint(entry['sql']).encode('utf-8')).hexdigest(),
+                    sql=entry['sql'],
+                    params=repr(entry['params'])[:2000],
+                    location=entry['location'][:500],
+                    request_path=entry['request_path'],
+                    explain=plan,
+                ))
+
+            max_rows = getattr(settings, 'SLOW_QUERY_LOG_MAX_ROWS', 1000)
+            with transaction.atomic():
+                SlowQueryLog.objects.bulk_create(logs)
+                cutoff = SlowQueryLog.objects.order_by('-id').values_list('id', flat=True)[max_rows:max_rows + 1]
+                if cutoff:
+                    SlowQueryLog.objects.filter(id__lte=cutoff[0]).delete()
+            return True
+        except Exception as e:
+            error_logger.error(f"느린 쿼리 저장 오류: {str(e)}")
+            return False
+
+
+def find_call_site():
+    """
+    쿼리를 실행한 프로젝트 코드 위치 반환
+
+    스택을 안쪽부터 거슬러 올라가 Django/서드파티와 이 모듈을 제외한
+    첫 번째 프로젝트 프레임을 찾습니다.
+
+    Returns:
+        str: '경로:줄번호 in 함수명', 찾지 못하면 빈 문자열
+    """
+    root = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(root) and filename != __file__
+                and 'site-packages' not in filename):
+            return f"{os.path.relpath(filename, root)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return ''
+
+
+class SlowQueryRecorder:
+    """
+    느린 쿼리 감지기
+
+    connection.execute_wrapper 로 등록되어 SLOW_QUERY_THRESHOLD_MS 이상 걸린 쿼리의
+    SQL, 파라미터, 호출 위치를 성능 로거에 남기고 SlowQueryLogger 에 넘깁니다.
+    """
+
+    def __init__(self, request_path=None):
+        threshold_ms = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 500)
+        self.threshold_ns = None if threshold_ms is None else int(threshold_ms * 1_000_000)
+        self.request_path = request_path
+        self._capturing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter_ns()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.observe(sql, params, many, context, time.perf_counter_ns() - started)
+
+    def observe(self, sql, params, many, context, elapsed_ns):
+        """쿼리 1건 실행 결과 처리"""
+        if self.threshold_ns is not None and elapsed_ns >= self.threshold_ns and not self._capturing:
+            self.capture(sql, params, many, context, elapsed_ns)
+
+    def capture(self, sql, params, many, context, elapsed_ns):
+        """느린 쿼리 기록"""
+        # 저장/EXPLAIN 쿼리가 같은 연결을 지나며 다시 감지되지 않도록 막음
+        self._capturing = True
+        try:
+            duration_ms = elapsed_ns / 1_000_000
+            location = find_call_site()
+            registry.incr('db.slow_queries', location)
+            performance_logger.warning(f"느린 쿼리: {duration_ms:.1f}ms - {location} - {sql[:300]}")
+            SlowQueryLogger.submit({
+                'database': context['connection'].alias,
+                'duration_ms': duration_ms,
+                'sql': sql,
+                'params': params,
+                'many': many,
+                'location': location,
+                'request_path': self.request_path,
+            })
+        except Exception as e:
+            error_logger.error(f"느린 쿼리 기록 오류: {str(e)}")
+        finally:
+            self._capturing = False
+
+
+class QueryProfiler(SlowQueryRecorder):
+    """
+    쿼리 프로파일러
+
+    connection.execute_wrapper 에 등록되어 실행된 쿼리 수와 DB 시간을 기록합니다.
+    쿼리마다 하는 일은 시간 측정과 SQL 문자열 카운트뿐이며,
+    지문 계산은 요청이 끝난 뒤 고유 SQL 에 대해서만 수행합니다.
+    """
+
+    def __init__(self, request_path=None):
+        super().__init__(request_path)
+        self.query_count = 0
+        self.total_ns = 0
+        self.sql_counts = {}
+
+    def observe(self, sql, params, many, context, elapsed_ns):
+        self.total_ns += elapsed_ns
+        self.query_count += 1
+        self.sql_counts[sql] = self.sql_counts.get(sql, 0) + 1
+        super().observe(sql, params, many, context, elapsed_ns)
+
+    @property
+    def total_ms(self):
+        return self.total_ns / 1_000_000
+
+    def get_duplicates(self):
+        """
+        지문별 중복 실행 횟수 반환
+
+        Returns:
+            dict: {지문: 실행 횟수} (2회 이상 실행된 지문만)
+        """
+        fingerprints = {}
+        for sql, count in self.sql_counts.items():
+            fingerprint = sql_fingerprint(sql)
+            fingerprints[fingerprint] = fingerprints.get(fingerprint, 0) + count
+        return {fingerprint: count for fingerprint, count in fingerprints.items() if count > 1}
+
+    def get_n_plus_one(self, threshold):
+        """
+        N+1 의심 쿼리 반환
+
+        Args:
+            threshold (int): 같은 지문이 이 횟수를 넘으면 N+1 로 판단
+
+        Returns:
+            list: (지문, 실행 횟수) 목록, 실행 횟수 내림차순
+        """
+        suspects = [
+            (fingerprint, count)
+            for fingerprint, count in self.get_duplicates().items()
+            if count > threshold
+        ]
+        return sorted(suspects, key=lambda item: item[1], reverse=True)
+
+
+class QueryProfilerMiddleware:
+    """
+    쿼리 프로파일링 미들웨어
+
+    샘플링된 요청의 처리 시간, 쿼리 수, DB 시간, 중복 SQL 지문을 뷰 이름별로 registry 에 기록하고
+    N+1 패턴을 성능 로거에 경고합니다. DEBUG 모드에서는 X-DB-Queries, X-DB-Time 응답 헤더를 추가합니다.
+    느린 쿼리와 느린 요청(2초 초과) 감지는 샘플링과 관계없이 모든 요청에 적용됩니다.
+    요청 시간은 캐시의 공유 통계(MonitoringMiddleware.save_request_stats)가 아니라
+    프로세스 내 registry 에만 기록하므로 요청마다 캐시를 읽고 쓰지 않습니다.
+
+    동기/비동기 모두 지원하므로 ASGI 에서 비동기 뷰를 스레드로 감싸지 않습니다.
+    DB 연결은 스레드별이므로 비동기 모드에서는 ORM 이 쿼리를 실행하는 요청 스레드
+    (thread_sensitive sync_to_async)에서 execute_wrapper 를 설치/해제합니다.
+
+    메트릭 (레이블: 뷰 이름):
+        - http.request_time_us: 요청 처리 시간 (샘플링된 요청만)
+        - db.requests / db.queries / db.n_plus_one, db.request_time_us: 요청별 쿼리 집계
+
+    Settings:
+        QUERY_PROFILER_SAMPLE_RATE: 프로파일링할 요청 비율 (0.0 ~ 1.0)
+        QUERY_PROFILER_N_PLUS_ONE_THRESHOLD: N+1 판단 기준 실행 횟수
+        ALLOCATION_PROFILER_SAMPLE_RATE: 메모리 할당을 추적할 요청 비율 (기본값 0, 사용 안 함)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    SLOW_REQUEST_SECONDS = 2.0
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'QUERY_PROFILER_SAMPLE_RATE', 1.0)
+        self.threshold = getattr(settings, 'QUERY_PROFILER_N_PLUS_ONE_THRESHOLD', 5)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def should_profile(self, request):
+        """샘플링 여부 결정"""
+        if settings.DEBUG or self.sample_rate >= 1.0:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        # 샘플링되지 않은 요청도 느린 쿼리는 항상 감지
+        sampled = self.should_profile(request)
+        profiler = QueryProfiler(request.path) if sampled else SlowQueryRecorder(request.path)
+        started = time.perf_counter_ns()
+        with ExitStack() as stack:
+            allocations = self.instrument(stack, profiler)
+            response = self.get_response(request)
+        return self.finish(request, response, sampled, profiler, allocations, time.perf_counter_ns() - started)
+
+    async def __acall__(self, request):
+        sampled = self.should_profile(request)
+        profiler = QueryProfiler(request.path) if sampled else SlowQueryRecorder(request.path)
+        started = time.perf_counter_ns()
+        stack = ExitStack()
+        allocations = await sync_to_async(self.instrument)(stack, profiler)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, sampled, profiler, allocations, time.perf_counter_ns() - started)
+
+    def instrument(self, stack, profiler):
+        """
+        현재 스레드의 모든 DB 연결에 프로파일러 설치 (샘플링되면 할당 추적 시작)
+
+        Returns:
+            dict: 할당 추적 결과 (추적하지 않으면 None)
+        """
+        for db_connection in connections.all():
+            stack.enter_context(db_connection.execute_wrapper(profiler))
+        if self.should_trace_allocations():
+            return stack.enter_context(allocation_profiler.trace())
+        return None
+
+    def finish(self, request, response, sampled, profiler, allocations, elapsed_ns):
+        """느린 요청 경고와 프로파일링 결과 기록"""
+        if elapsed_ns > self.SLOW_REQUEST_SECONDS * 1e9:
+            performance_logger.warning(
+                f"느린 요청: {request.method} {request.path} - {elapsed_ns / 1e9:.2f}초"
+            )
+        if allocations is not None:
+            allocation_profiler.record(self.get_label(request), allocations)
+        if sampled:
+            self.report(request, response, profiler, elapsed_ns)
+        return response
+
+    def should_trace_allocations(self):
+        """할당 추적 여부 결정 (ALLOCATION_PROFILER_SAMPLE_RATE, 기본값 0 = 사용 안 함)"""
+        rate = getattr(settings, 'ALLOCATION_PROFILER_SAMPLE_RATE', 0.0)
+        return rate > 0 and (rate >= 1.0 or random.random() < rate)
+
+    @staticmethod
+    def get_label(request):
+        """메트릭 레이블로 쓸 뷰 이름"""
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match and match.view_name else 'unresolved'
+
+    def report(self, request, response, profiler, elapsed_ns):
+        """프로파일링 결과 기록"""
+        try:
+            label = self.get_label(request)
+            registry.observe('http.request_time_us', label, elapsed_ns // 1000)
+            suspects = profiler.get_n_plus_one(self.threshold)
+
+            registry.record(
+                (
+                    ('db.requests', 1),
+                    ('db.queries', profiler.query_count),
+                    ('db.n_plus_one', 1 if suspects else 0),
+                ),
+                'db.request_time_us',
+                label,
+                profiler.total_ns // 1000,
+            )
+
+            for fingerprint, count in suspects:
+                performance_logger.warning(
+                    f"N+1 쿼리 의심: {request.method} {request.path} - {count}회 실행: {fingerprint[:300]}"
+                )
+
+            performance_logger.debug(
+                f"쿼리 프로파일: {request.method} {request.path} - "
+                f"{profiler.query_count}건, {profiler.total_ms:.2f}ms"
+            )
+
+            if settings.DEBUG:
+                response['X-DB-Queries'] = str(profiler.query_count)
+                response['X-DB-Time'] = f"{profiler.total_ms:.2f}ms"
+        except Exception as e:
+            error_logger.error(f"쿼리 프로파일 기록 오류: {str(e)}")
+
+
+# =============================================================================
+# 통계적 CPU 프로파일러 (스택 샘플링)
+# =============================================================================
+
+class StackSampler:
+    """
+    스택 샘플링 프로파일러
+
+    sys.setprofile 없이 일정 간격으로 실행 중인 스택만 수집하므로
+    운영 중인 워커에 켜도 오버헤드가 작습니다. 결과는 flamegraph.pl,
+    speedscope 등에서 바로 읽을 수 있는 collapsed-stack 형식으로 출력합니다.
+
+    모드:
+        signal: SIGPROF 타이머(ITIMER_PROF)로 메인 스레드의 CPU 시간을 샘플링.
+                메인 스레드에서 시작한 경우에만 사용 가능 (gunicorn sync 워커)
+        thread: 백그라운드 스레드가 sys._current_frames()로 모든 스레드를 샘플링.
+                gthread 워커나 개발 서버처럼 요청이 다른 스레드에서 처리될 때 사용
+    """
+
+    DEFAULT_INTERVAL_MS = 10
+    MAX_DURATION = 300
+    MAX_DEPTH = 64
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._labels = {}
+        self._thread = None
+        self._timer = None
+        self._signal_installed = False
+        self.stacks = {}
+        self.samples = 0
+        self.running = False
+        self.mode = None
+        self.interval_ms = self.DEFAULT_INTERVAL_MS
+        self.started_at = None
+        self.stopped_at = None
+
+    def start(self, interval_ms=DEFAULT_INTERVAL_MS, duration=30, mode='auto'):
+        """
+        샘플링 시작
+
+        Args:
+            interval_ms (int): 샘플링 간격 (밀리초)
+            duration (int): 자동 종료까지의 시간 (초), MAX_DURATION 으로 제한
+            mode (str): 'auto', 'signal', 'thread'
+
+        Returns:
+            bool: 시작 여부 (이미 실행 중이면 False)
+        """
+        with self._lock:
+            if self.running:
+                return False
+
+            in_main_thread = threading.current_thread() is threading.main_thread()
+            if mode == 'auto':
+                mode = 'signal' if hasattr(signal, 'setitimer') and in_main_thread else 'thread'
+            if mode == 'signal' and not (hasattr(signal, 'setitimer') and in_main_thread):
+                raise ValueError("signal 모드는 POSIX 메인 스레드에서만 사용할 수 있습니다.")
+
+            self.stacks = {}
+            self.samples = 0
+            self.mode = mode
+            self.interval_ms = max(1, int(interval_ms))
+            self.started_at = datetime.now()
+            self.stopped_at = None
+            self.running = True
+
+            if mode == 'signal':
+                if not self._signal_installed:
+                    signal.signal(signal.SIGPROF, self._handle_signal)
+                    self._signal_installed = True
+                interval = self.interval_ms / 1000
+                signal.setitimer(signal.ITIMER_PROF, interval, interval)
+            else:
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+
+            self._timer = threading.Timer(min(duration, self.MAX_DURATION), self.stop)
+            self._timer.daemon = True
+            self._timer.start()
+
+        system_logger.info(f"스택 샘플링 시작: {mode}, {self.interval_ms}ms 간격, {duration}초")
+        return True
+
+    def stop(self):
+        """샘플링 종료"""
+        with self._lock:
+            if not self.running:
+                return False
+            self.running = False
+            self.stopped_at = datetime.now()
+            if self.mode == 'signal':
+                # 타이머만 끄고 핸들러는 남겨 둠 (핸들러 교체는 메인 스레드에서만 가능)
+                signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            if self._timer is not None and self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+        system_logger.info(f"스택 샘플링 종료: {self.samples}개 샘플")
+        return True
+
+    def _handle_signal(self, signum, frame):
+        if self.running and frame is not None:
+            self._record(frame)
+
+    def _run(self):
+        own_id = threading.get_ident()
+        interval = self.interval_ms / 1000
+        while self.running:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(frame)
+            time.sleep(interval)
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _record(self, frame):
+        labels = []
+        depth = 0
+        while frame is not None and depth < self.MAX_DEPTH:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+            depth += 1
+        key = ';'.join(reversed(labels))
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+        self.samples += 1
+
+    def collapsed(self):
+        """
+        collapsed-stack 형식 결과 반환
+
+        Returns:
+            str: '함수;함수;함수 샘플수' 줄 목록 (샘플 수 내림차순)
+        """
+        # 샘플링 도중에도 안전하도록 복사본 사용 (dict 복사는 GIL 아래에서 원자적)
+        stacks = sorted(dict(self.stacks).items(), key=lambda item: item[1], reverse=True)
+        return '\n'.join(f"{stack} {count}" for stack, count in stacks)
+
+    def top_functions(self, limit=20):
+        """가장 많이 샘플링된 최상단(실행 중인) 함수 목록"""
+        counts = {}
+        for stack, count in dict(self.stacks).items():
+            leaf = stack.rsplit(';', 1)[-1]
+            counts[leaf] = counts.get(leaf, 0) + count
+        top = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [{'function': function, 'samples': count} for function, count in top]
+
+    def status(self):
+        """프로파일러 상태 반환"""
+        return {
+            'pid': os.getpid(),
+            'running': self.running,
+            'mode': self.mode,
+            'interval_ms': self.interval_ms,
+            'samples': self.samples,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'stopped_at': self.stopped_at.isoformat() if self.stopped_at else None,
+            'top_functions': self.top_functions(),
+        }
+
+
+# 워커 프로세스 전역 샘플러
+stack_sampler = StackSampler()
+
+
+# =============================================================================
+# 뷰별 메모리 할당 프로파일러
+# =============================================================================
+
+class AllocationProfiler:
+    """
+    메모리 할당 프로파일러
+
+    tracemalloc 으로 요청 하나를 추적해 최대 메모리와 할당 위치를 뷰 이름별로 누적합니다.
+    할당 위치는 트레이스백에서 가장 안쪽의 프로젝트 코드 줄로 귀속시키므로
+    json, Django 내부에서 일어난 할당도 그 할당을 일으킨 우리 코드 줄로 집계됩니다.
+
+    할당 위치 통계는 요청이 끝난 시점에 살아 있는 메모리 기준이며, 처리 중에 생겼다가
+    사라진 임시 객체는 최대 메모리(peak)에만 반영됩니다.
+    """
+
+    TRACE_FRAMES = 25
+    TOP_SITES = 10
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites = {}
+        self.views = {}
+
+    def _attribute(self, traceback_frames):
+        # 가장 안쪽 프레임부터 프로젝트 코드 줄을 찾음 (없으면 가장 안쪽 프레임)
+        root = str(settings.BASE_DIR)
+        for frame in reversed(traceback_frames):
+            filename = frame.filename
+            if (filename.startswith(root) and filename != __file__
+                    and 'site-packages' not in filename):
+                key = (filename, frame.lineno)
+                site = self._sites.get(key)
+                if site is None:
+                    site = self._sites[key] = f"{os.path.relpath(filename, root)}:{frame.lineno}"
+                return site
+        frame = traceback_frames[-1]
+        filename = frame.filename
+        if 'site-packages' in filename:
+            filename = filename.rsplit('site-packages', 1)[1].lstrip('/\\')
+        return f"{filename}:{frame.lineno}"
+
+    @contextmanager
+    def trace(self):
+        """
+        블록 실행 동안 할당 추적
+
+        다른 곳에서 이미 tracemalloc 을 쓰고 있으면 추적하지 않고 result['traced'] 가 False 로 남습니다.
+
+        Yields:
+            dict: 블록 종료 후 'traced', 'peak', 'current', 'sites' ({위치: (바이트, 개수)}) 가 채워짐
+        """
+        result = {'traced': False, 'peak': 0, 'current': 0, 'sites': {}}
+        if tracemalloc.is_tracing() or not _tracemalloc_lock.acquire(blocking=False):
+            yield result
+            return
+
+        try:
+            tracemalloc.start(self.TRACE_FRAMES)
+            try:
+                yield result
+            finally:
+                result['current'], result['peak'] = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+        finally:
+            _tracemalloc_lock.release()
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ))
+        sites = {}
+        for stat in snapshot.statistics('traceback'):
+            site = self._attribute(stat.traceback)
+            size, count = sites.get(site, (0, 0))
+            sites[site] = (size + stat.size, count + stat.count)
+        result['sites'] = sites
+        result['traced'] = True
+
+    def record(self, label, result):
+        """추적 결과를 뷰 이름별로 누적"""
+        if not result['traced']:
+            return
+        with self._lock:
+            view = self.views.get(label)
+            if view is None:
+                view = self.views[label] = {'requests': 0, 'peak_total': 0, 'peak_max': 0, 'sites': {}}
+            view['requests'] += 1
+            view['peak_total'] += result['peak']
+            view['peak_max'] = max(view['peak_max'], result['peak'])
+            for site, (size, count) in result['sites'].items():
+                total_size, total_count = view['sites'].get(site, (0, 0))
+                view['sites'][site] = (total_size + size, total_count + count)
+
+    def get_report(self, limit=TOP_SITES):
+        """
+        뷰별 할당 보고서
+
+        Returns:
+            dict: {뷰 이름: {requests, peak_avg, peak_max, top_sites: [{site, avg_size, avg_count}]}}
+        """
+        report = {}
+        with self._lock:
+            for label, view in self.views.items():
+                requests = view['requests']
+                top = sorted(view['sites'].items(), key=lambda item: item[1][0], reverse=True)[:limit]
+                report[label] = {
+                    'requests': requests,
+                    'peak_avg': view['peak_total'] // requests,
+                    'peak_max': view['peak_max'],
+                    'top_sites': [
+                        {'site': site, 'avg_size': size // requests, 'avg_count': count // requests}
+                        for site, (size, count) in top
+                    ],
+                }
+        return report
+
+    def reset(self):
+        """누적 결과 초기화"""
+        with self._lock:
+            self.views = {}
+
+
+# 워커 프로세스 전역 할당 프로파일러
+allocation_profiler = AllocationProfiler()
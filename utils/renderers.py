@@ -0,0 +1,346 @@
+"""
+JSON 렌더러 모듈
+
+이 모듈은 API 응답 본문을 직렬화하는 JSON 렌더러를 제공합니다.
+orjson 이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json 으로 대체합니다.
+
+주요 기능:
+- 한글을 \\uXXXX 로 이스케이프하지 않고 UTF-8 로 바로 출력
+- datetime/date/time/UUID 를 필드별 isoformat() 호출 없이 직렬화
+- Decimal, timedelta, 지연 번역 문자열, 쿼리셋 직렬화
+- 대용량 배열의 청크 단위 스트리밍 응답
+- NDJSON/CSV 행 단위 스트리밍 응답 (내보내기용)
+- iCalendar(ICS) 일정 스트리밍 응답 (캘린더 구독용)
+- ASGI 에서도 조각 단위로 보내는 스트리밍 응답
+"""
+
+import csv
+import json
+import datetime
+import decimal
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from asgiref.sync import sync_to_async
+    from django.conf import settings
+    from django.db.models.query import QuerySet
+    from django.http import HttpResponse, StreamingHttpResponse
+    from django.utils.duration import duration_iso_string
+    from django.utils.functional import Promise
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
+
+# 스트리밍 응답에서 배열이 들어갈 자리를 표시하는 값
+STREAM_PLACEHOLDER = '\x00__stream_items__\x00'
+
+# 동기 이터레이터 끝 표시
+_END = object()
+
+if DJANGO_AVAILABLE:
+    class ChunkedStreamingHttpResponse(StreamingHttpResponse):
+        """
+        ASGI 에서도 조각 단위로 보내는 스트리밍 응답
+
+        Django 4.2 의 StreamingHttpResponse 는 ASGI 서버에서 동기 이터레이터를
+        sync_to_async(list) 로 끝까지 읽은 뒤 보내므로 내보내기/대용량 목록 전체가 메모리에 쌓이고
+        첫 바이트도 늦어집니다. 이 클래스는 조각 하나씩 스레드에서 읽어 바로 보냅니다.
+        쿼리셋 iterator() 의 DB 연결이 뷰와 같은 스레드에 있도록 thread_sensitive 로 읽으며,
+        WSGI 에서는 StreamingHttpResponse 와 같습니다.
+        """
+
+        async def __aiter__(self):
+            if self.is_async:
+                async for part in super().__aiter__():
+                    yield part
+                return
+            iterator = iter(self.streaming_content)
+            pull = sync_to_async(next, thread_sensitive=True)
+            while True:
+                part = await pull(iterator, _END)
+                if part is _END:
+                    return
+                yield part
+
+
+def _default(obj):
+    """두 백엔드가 기본으로 처리하지 못하는 타입 직렬화"""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return duration_iso_string(obj)
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, (QuerySet, set, frozenset)):
+        return list(obj)
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+class _StdlibEncoder(json.JSONEncoder):
+    """
+    표준 라이브러리 인코더
+
+    날짜/시간은 orjson 과 같은 결과가 나오도록 isoformat() 그대로 출력합니다.
+    (DjangoJSONEncoder 는 마이크로초를 밀리초로 자르고 UTC 를 Z 로 바꿉니다.)
+    """
+
+    def default(self, obj):
+        if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+            return obj.isoformat()
+        if isinstance(obj, uuid.UUID):
+            return str(obj)
+        return _default(obj)
+
+
+class JSONRenderer:
+    """
+    JSON 렌더러
+
+    backend 는 'orjson', 'stdlib', 'auto'(orjson 이 있으면 사용) 중 하나입니다.
+    """
+
+    BACKENDS = ('auto', 'orjson', 'stdlib')
+    content_type = 'application/json'
+
+    def __init__(self, backend='auto'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"알 수 없는 JSON 렌더러 백엔드: {backend}")
+        if backend == 'auto':
+            backend = 'orjson' if orjson is not None else 'stdlib'
+        if backend == 'orjson' and orjson is None:
+            raise ImportError("orjson 이 설치되어 있지 않습니다.")
+        self.backend = backend
+        self._encoder = _StdlibEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def render(self, data):
+        """데이터를 UTF-8 JSON 바이트로 직렬화"""
+        if self.backend == 'orjson':
+            return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return self._encoder.encode(data).encode('utf-8')
+
+    def stream(self, data, items, chunk_size=500):
+        """
+        대용량 배열 스트리밍 직렬화
+
+        data 안의 STREAM_PLACEHOLDER 자리에 items 를 chunk_size 개씩 나눠 출력합니다.
+        전체 배열을 메모리에 올리지 않으므로 items 에는 이터레이터를 넘길 수 있습니다.
+
+        Yields:
+            bytes: JSON 본문 조각
+        """
+        head, tail = self.render(data).split(self.render(STREAM_PLACEHOLDER), 1)
+        yield head + b'['
+
+        chunk, first = [], True
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield (b'' if first else b',') + self.render(chunk)[1:-1]
+                chunk, first = [], False
+        if chunk:
+            yield (b'' if first else b',') + self.render(chunk)[1:-1]
+
+        yield b']' + tail
+
+
+_renderers = {}
+
+
+def get_renderer(backend=None):
+    """설정(API_JSON_RENDERER)에 맞는 렌더러 반환 (백엔드별로 하나만 생성)"""
+    if backend is None:
+        backend = getattr(settings, 'API_JSON_RENDERER', 'auto')
+    renderer = _renderers.get(backend)
+    if renderer is None:
+        renderer = _renderers[backend] = JSONRenderer(backend)
+    return renderer
+
+
+def render_json_response(data, status=200, renderer=None):
+    """JSON 응답 생성"""
+    renderer = renderer or get_renderer()
+    return HttpResponse(renderer.render(data), content_type=renderer.content_type, status=status)
+
+
+def stream_json_response(data, items, status=200, chunk_size=500, renderer=None):
+    """대용량 배열을 포함한 JSON 스트리밍 응답 생성"""
+    renderer = renderer or get_renderer()
+    return ChunkedStreamingHttpResponse(
+        renderer.stream(data, items, chunk_size), content_type=renderer.content_type, status=status
+    )
+
+
+# =============================================================================
+# NDJSON/CSV 스트리밍
+# =============================================================================
+
+class _Echo:
+    """csv.writer 가 쓴 문자열을 그대로 돌려주는 가짜 파일 객체"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    """CSV 셀 값 변환 (날짜/시간은 JSON 렌더러와 같은 형식)"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return duration_iso_string(value)
+    return value
+
+
+def ndjson_lines(columns, rows, renderer=None, batch_size=500):
+    """
+    NDJSON 직렬화
+
+    rows 의 각 튜플을 columns 를 키로 하는 JSON 객체 한 줄로 출력하며,
+    batch_size 행씩 묶어 내보냅니다.
+
+    Yields:
+        bytes: NDJSON 본문 조각
+    """
+    renderer = renderer or get_renderer()
+    batch = []
+    for row in rows:
+        batch.append(renderer.render(dict(zip(columns, row))))
+        if len(batch) >= batch_size:
+            yield b'\n'.join(batch) + b'\n'
+            batch = []
+    if batch:
+        yield b'\n'.join(batch) + b'\n'
+
+
+def csv_lines(columns, rows, batch_size=500):
+    """
+    CSV 직렬화
+
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 을 붙이며, batch_size 행씩 묶어 내보냅니다.
+
+    Yields:
+        bytes: CSV 본문 조각
+    """
+    writer = csv.writer(_Echo())
+    yield ('\ufeff' + writer.writerow(columns)).encode('utf-8')
+    batch = []
+    for row in rows:
+        batch.append(writer.writerow([_csv_value(value) for value in row]))
+        if len(batch) >= batch_size:
+            yield ''.join(batch).encode('utf-8')
+            batch = []
+    if batch:
+        yield ''.join(batch).encode('utf-8')
+
+
+def stream_export_response(columns, rows, output_format='ndjson', filename='export'):
+    """
+    내보내기 스트리밍 응답 생성
+
+    Args:
+        columns (list): 열 이름
+        rows (iterable): 값 튜플 이터레이터 (queryset.values_list().iterator() 등)
+        output_format (str): 'ndjson' 또는 'csv'
+        filename (str): 확장자를 뺀 다운로드 파일 이름
+    """
+    if output_format == 'csv':
+        response = ChunkedStreamingHttpResponse(csv_lines(columns, rows), content_type='text/csv; charset=utf-8')
+    else:
+        response = ChunkedStreamingHttpResponse(ndjson_lines(columns, rows), content_type='application/x-ndjson')
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{output_format}"'
+    return response
+
+
+# =============================================================================
+# iCalendar(ICS) 스트리밍
+# =============================================================================
+
+def _ics_text(value):
+    """ICS TEXT 값 이스케이프 (RFC 5545 3.3.11)"""
+    return (
+        str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _ics_fold(line):
+    """75 옥텟을 넘는 줄을 접어 CRLF 로 끝나는 문자열로 반환 (UTF-8 문자 중간에서 자르지 않음)"""
+    if len(line.encode('utf-8')) <= 75:
+        return line + '\r\n'
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        # 이어지는 줄은 앞의 공백 한 칸을 포함해 75 옥텟
+        if size + width > (75 if not parts else 74):
+            parts.append(''.join(current))
+            current, size = [], 0
+        current.append(char)
+        size += width
+    parts.append(''.join(current))
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _ics_datetime(name, value, exclusive_end=False):
+    """DTSTART/DTEND 속성 (date 는 종일 일정, datetime 은 UTC)"""
+    if isinstance(value, datetime.datetime):
+        return f"{name}:{value.astimezone(datetime.timezone.utc):%Y%m%dT%H%M%SZ}"
+    if exclusive_end:
+        value += datetime.timedelta(days=1)
+    return f"{name};VALUE=DATE:{value:%Y%m%d}"
+
+
+def ics_lines(events, name='calendar', batch_size=200):
+    """
+    ICS 직렬화
+
+    events 의 각 일정을 VEVENT 로 출력하며 batch_size 건씩 묶어 내보냅니다.
+    종일 일정(date)의 end 는 마지막 날(포함)이며 DTEND 에는 다음 날로 출력합니다.
+
+    일정 키: uid, title, start, end (date 또는 aware datetime), 선택 키 description, category, status
+
+    Yields:
+        bytes: ICS 본문 조각
+    """
+    stamp = f"{datetime.datetime.now(datetime.timezone.utc):%Y%m%dT%H%M%SZ}"
+    header = [
+        'BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//business-management//calendar//KO',
+        'CALSCALE:GREGORIAN', 'METHOD:PUBLISH', f'X-WR-CALNAME:{_ics_text(name)}',
+    ]
+    yield ''.join(_ics_fold(line) for line in header).encode('utf-8')
+    batch = []
+    for event in events:
+        lines = [
+            'BEGIN:VEVENT',
+            f"UID:{event['uid']}",
+            f'DTSTAMP:{stamp}',
+            _ics_datetime('DTSTART', event['start']),
+            _ics_datetime('DTEND', event['end'], exclusive_end=True),
+            f"SUMMARY:{_ics_text(event['title'])}",
+        ]
+        if event.get('description'):
+            lines.append(f"DESCRIPTION:{_ics_text(event['description'])}")
+        if event.get('category'):
+            lines.append(f"CATEGORIES:{_ics_text(event['category'])}")
+        if event.get('status'):
+            lines.append(f"STATUS:{event['status']}")
+        lines.append('END:VEVENT')
+        batch.append(''.join(_ics_fold(line) for line in lines))
+        if len(batch) >= batch_size:
+            yield ''.join(batch).encode('utf-8')
+            batch = []
+    batch.append(_ics_fold('END:VCALENDAR'))
+    yield ''.join(batch).encode('utf-8')
+
+
+def stream_ics_response(events, name='calendar', filename='calendar'):
+    """ICS 스트리밍 응답 생성 (캘린더 앱 구독용 text/calendar)"""
+    response = ChunkedStreamingHttpResponse(ics_lines(events, name), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'inline; filename="{filename}.ics"'
+    return response
@@ -56,7 +56,7 @@ class NoticeForm(forms.ModelForm):
         폼의 기본 설정과 위젯 커스터마이징을 정의합니다.
         """
         model = Notice  # 연결할 모델
-        fields = ['title', 'content', 'importance', 'status']  # 포함할 필드 목록
+        fields = ['title', 'content', 'importance', 'status', 'deadline']  # 포함할 필드 목록
         
         # 필드별 위젯 커스터마이징
         widgets = {
@@ -93,6 +93,14 @@ class NoticeForm(forms.ModelForm):
                     'class': 'form-select'  # Bootstrap CSS 클래스
                 }
             ),
+            
+            # 마감일 필드: 날짜 입력 위젯 (선택사항)
+            'deadline': forms.DateInput(
+                attrs={
+                    'class': 'form-control',  # Bootstrap CSS 클래스
+                    'type': 'date'  # HTML5 날짜 선택기
+                }
+            ),
         }
     
     # =============================================================================
@@ -115,12 +123,14 @@ class NoticeForm(forms.ModelForm):
         self.fields['content'].label = '내용'
         self.fields['importance'].label = '중요도'
         self.fields['status'].label = '상태'
+        self.fields['deadline'].label = '마감일'
         
         # 필드 헬프 텍스트 설정 (사용자 안내)
         self.fields['title'].help_text = '공지사항 제목을 입력하세요. 최소 5자 이상이어야 합니다.'
         self.fields['content'].help_text = '공지사항 내용을 상세하게 입력하세요.'
         self.fields['importance'].help_text = '공지사항의 중요도를 선택하세요.'
         self.fields['status'].help_text = '공지사항의 상태를 선택하세요.'
+        self.fields['deadline'].help_text = '마감일이 있으면 캘린더에 표시됩니다.'
     
     # =============================================================================
     # 개별 필드 검증 메서드들
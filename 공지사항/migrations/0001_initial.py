@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:23
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, validators=[django.core.validators.MinLengthValidator(5, '제목은 최소 5자 이상이어야 합니다.')], verbose_name='제목')),
+                ('content', models.TextField(help_text='공지사항 내용을 입력하세요.', verbose_name='내용')),
+                ('importance', models.CharField(choices=[('low', '낮음'), ('medium', '보통'), ('high', '높음'), ('urgent', '긴급')], default='medium', max_length=10, verbose_name='중요도')),
+                ('status', models.CharField(choices=[('draft', '작성중'), ('published', '게시됨'), ('archived', '보관됨')], default='draft', max_length=10, verbose_name='상태')),
+                ('view_count', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='작성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('published_at', models.DateTimeField(blank=True, null=True, verbose_name='게시일')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='작성자')),
+            ],
+            options={
+                'verbose_name': '공지사항',
+                'verbose_name_plural': '공지사항들',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='공지사항_notice_status_503994_idx'), models.Index(fields=['importance'], name='공지사항_notice_importa_5f5318_idx'), models.Index(fields=['author'], name='공지사항_notice_author__cf8f31_idx')],
+            },
+        ),
+    ]
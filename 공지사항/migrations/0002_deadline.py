@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('공지사항', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notice',
+            name='deadline',
+            field=models.DateField(blank=True, null=True, verbose_name='마감일'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['status', 'deadline'], name='notice_deadline_idx'),
+        ),
+    ]
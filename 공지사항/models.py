@@ -45,6 +45,7 @@ class Notice(models.Model):
         created_at (DateTime): 작성일 (자동 설정)
         updated_at (DateTime): 수정일 (자동 업데이트)
         published_at (DateTime): 게시일 (게시 시 자동 설정)
+        deadline (Date): 마감일 (선택, 게시된 공지의 마감일은 캘린더에 표시)
     """
     
     # 중요도 선택지 - 공지사항의 중요도를 정의
@@ -122,6 +123,13 @@ class Notice(models.Model):
         blank=True,  # 폼에서 비워도 됨
         verbose_name="게시일"  # 관리자 사이트 등에서 표시될 필드명
     )
+    
+    # 마감일 필드 - 신청/제출 마감 등 (게시된 공지의 마감일은 캘린더에 표시)
+    deadline = models.DateField(
+        null=True,  # 마감일 없는 공지 허용
+        blank=True,  # 폼에서 비워도 됨
+        verbose_name="마감일"  # 관리자 사이트 등에서 표시될 필드명
+    )
 
     class Meta:
         """
@@ -139,6 +147,7 @@ class Notice(models.Model):
             models.Index(fields=['status', 'created_at']),  # 상태와 작성일 조합 인덱스
             models.Index(fields=['importance']),              # 중요도 인덱스
             models.Index(fields=['author']),                  # 작성자 인덱스
+            models.Index(fields=['status', 'deadline'], name='notice_deadline_idx'),  # 캘린더 마감일 범위 인덱스
         ]
 
     def __str__(self):
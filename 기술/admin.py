@@ -9,7 +9,7 @@
 # Django 관리자 모듈 임포트
 from django.contrib import admin
 # 현재 앱의 모델 임포트
-from .models import Technology
+from .models import Tag, Technology
 
 # =============================================================================
 # 관리자 클래스 정의
@@ -139,3 +139,19 @@ class TechnologyAdmin(admin.ModelAdmin):
         updated = queryset.update(status='inactive')
         self.message_user(request, f'{updated}개의 기술이 비활성화되었습니다.')
     deactivate_technologies.short_description = '선택된 기술 비활성화'
+
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    """
+    태그 관리자 클래스
+
+    태그는 기술 저장 시 tags 문자열에서 자동 생성되며,
+    기술 수는 저장/삭제 시 증감되므로 읽기 전용으로 표시합니다.
+    """
+
+    list_display = ['label', 'name', 'technology_count']
+    search_fields = ['name', 'label']
+    ordering = ('-technology_count', 'name')
+    readonly_fields = ('name', 'technology_count')
@@ -230,6 +230,17 @@ class TechnologySearchForm(forms.Form):
         )
     )
     
+    tag = forms.CharField(
+        max_length=50,
+        required=False,
+        widget=forms.TextInput(
+            attrs={
+                'class': 'form-control',
+                'placeholder': '태그 (정확히 일치)'
+            }
+        )
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
@@ -238,3 +249,4 @@ class TechnologySearchForm(forms.Form):
         self.fields['category'].label = '분류'
         self.fields['proficiency'].label = '숙련도'
         self.fields['status'].label = '상태'
+        self.fields['tag'].label = '태그'
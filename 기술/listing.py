@@ -0,0 +1,83 @@
+# =============================================================================
+# 비즈니스 관리 시스템 기술 목록 엔진
+# =============================================================================
+# 설명: 기술 목록 페이지의 서버측 필터/페이지 처리
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+기술 목록 엔진 모듈
+
+TechnologySearchForm 으로 검증한 필터를 적용하고, 등록자를 select_related 로 함께 읽어
+목록 템플릿에서 author 를 참조해도 추가 쿼리가 발생하지 않습니다.
+태그 필터와 검색어의 태그 일치는 TechnologyTag 인덱스 서브쿼리로 처리합니다.
+목록 HTML 조각은 (기술 네임스페이스 세대, 필터, 페이지) 키로 캐시됩니다.
+
+주요 기능:
+- 검색어/분류/숙련도/상태/태그 필터
+- 번호 페이지네이션
+- 목록 조각 캐시 키 생성
+"""
+
+from django.db.models import Q
+
+from utils.cache import CacheGeneration, CacheManager
+from utils.listing import ListEngine
+
+from .forms import TechnologySearchForm
+from .models import Technology, TechnologyTag
+
+
+class TechnologyListEngine(ListEngine):
+    """
+    기술 목록 엔진
+
+    사용 예:
+        engine = TechnologyListEngine(request.GET)
+        page = engine.paginate(request.GET.get('page'))
+    """
+
+    form_class = TechnologySearchForm
+    # 캐시 세대 네임스페이스 (기술 저장/삭제 시 증가)
+    CACHE_NAMESPACE = 'technology'
+    FRAGMENT_PREFIX = 'technology_list'
+    # 목록에 표시하는 열 (설명 등 긴 본문은 읽지 않음)
+    LIST_FIELDS = (
+        'id', 'name', 'category', 'proficiency', 'status', 'tags', 'created_at',
+        'author__id', 'author__username',
+    )
+    # 분류/숙련도/상태는 인덱스가 있는 정확 일치 필터
+    EXACT_FILTERS = ('category', 'proficiency', 'status')
+
+    def get_base_queryset(self):
+        """생성일 최신순, 등록자 함께 조회"""
+        return Technology.objects.select_related('author').only(*self.LIST_FIELDS).order_by('-created_at', '-id')
+
+    def apply_filters(self, queryset, filters):
+        """검색어/분류/숙련도/상태/태그 필터"""
+        search = filters.get('search')
+        if search:
+            queryset = queryset.filter(
+                Q(name__icontains=search) | Q(pk__in=TechnologyTag.technology_ids(search))
+            )
+
+        for name in self.EXACT_FILTERS:
+            if name in filters:
+                queryset = queryset.filter(**{name: filters[name]})
+
+        if 'tag' in filters:
+            queryset = self.filter_tag(queryset, filters['tag'])
+        return queryset
+
+    @staticmethod
+    def filter_tag(queryset, tag):
+        """정규화 태그와 정확히 일치 (대소문자/공백 무시, 'go' 가 'django' 에 걸리지 않음)"""
+        return queryset.filter(pk__in=TechnologyTag.technology_ids(tag))
+
+    def fragment_key(self, page_number, per_page):
+        """목록 조각 캐시 키 (세대 번호가 바뀌면 이전 조각은 자동으로 무효)"""
+        return CacheManager.get_cache_key(
+            self.FRAGMENT_PREFIX, CacheGeneration.get(self.CACHE_NAMESPACE),
+            self.filters_key(), page_number or 1, per_page or self.DEFAULT_PER_PAGE,
+        )
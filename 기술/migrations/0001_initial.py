@@ -0,0 +1,42 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:52
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, validators=[django.core.validators.MinLengthValidator(2, '기술명은 최소 2자 이상이어야 합니다.')], verbose_name='기술명')),
+                ('category', models.CharField(choices=[('frontend', '프론트엔드'), ('backend', '백엔드'), ('database', '데이터베이스'), ('devops', '데브옵스'), ('mobile', '모바일'), ('ai', '인공지능'), ('etc', '기타')], default='etc', max_length=20, verbose_name='분류')),
+                ('description', models.TextField(blank=True, help_text='기술에 대한 상세 설명을 입력하세요.', verbose_name='설명')),
+                ('proficiency', models.CharField(choices=[('beginner', '초급'), ('intermediate', '중급'), ('advanced', '고급'), ('expert', '전문가')], default='beginner', max_length=20, verbose_name='숙련도')),
+                ('status', models.CharField(choices=[('learning', '학습중'), ('completed', '학습완료'), ('certified', '자격증보유'), ('archived', '보관됨')], default='learning', max_length=20, verbose_name='상태')),
+                ('official_document', models.URLField(blank=True, help_text='기술의 공식 문서 URL을 입력하세요.', verbose_name='공식 문서')),
+                ('learning_resources', models.TextField(blank=True, help_text='학습 자료나 참고 링크를 입력하세요.', verbose_name='학습 자료')),
+                ('tags', models.CharField(blank=True, help_text='쉼표로 구분하여 태그를 입력하세요.', max_length=200, verbose_name='태그')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='등록자')),
+            ],
+            options={
+                'verbose_name': '기술',
+                'verbose_name_plural': '기술들',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['category', 'proficiency'], name='기술_technolo_categor_077c13_idx'), models.Index(fields=['status'], name='기술_technolo_status_21fda4_idx'), models.Index(fields=['author'], name='기술_technolo_author__fae81a_idx')],
+                'unique_together': {('name', 'author')},
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from 기술.tagging import rebuild_tag_index
+
+
+def backfill_tags(apps, schema_editor):
+    """기존 쉼표 구분 tags 문자열로 Tag / TechnologyTag 채우기"""
+    rebuild_tag_index(
+        apps.get_model('기술', 'Technology'),
+        apps.get_model('기술', 'Tag'),
+        apps.get_model('기술', 'TechnologyTag'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('기술', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='태그')),
+                ('label', models.CharField(max_length=50, verbose_name='표시 이름')),
+                ('technology_count', models.PositiveIntegerField(default=0, verbose_name='기술 수')),
+            ],
+            options={
+                'verbose_name': '태그',
+                'verbose_name_plural': '태그들',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TechnologyTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='technology_tags', to='기술.tag')),
+                ('technology', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='technology_tags', to='기술.technology')),
+            ],
+            options={
+                'verbose_name': '기술 태그',
+                'verbose_name_plural': '기술 태그들',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['-technology_count', 'name'], name='tag_count_name_idx'),
+        ),
+        migrations.AddField(
+            model_name='technology',
+            name='tag_set',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='technologies', through='기술.TechnologyTag', to='기술.tag', verbose_name='정규화 태그'),
+        ),
+        migrations.AddIndex(
+            model_name='technologytag',
+            index=models.Index(fields=['tag', 'technology'], name='technology_tag_tag_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='technologytag',
+            constraint=models.UniqueConstraint(fields=('technology', 'tag'), name='technology_tag_unique'),
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -8,12 +8,14 @@ Technology 모델은 기술 정보, 분류, 숙련도, 학습 상태 등을 관
 - 기술 기본 정보 저장 (이름, 설명, 분류)
 - 숙련도 및 학습 상태 관리
 - 기술 등록자 및 학습 자료 관리
-- 태그 및 메타데이터 관리
+- 태그 및 메타데이터 관리 (Tag / TechnologyTag 정규화 색인)
 - 자동화된 데이터 검증 및 처리
 """
 
 # Django의 데이터베이스 모델 관련 기능 임포트
-from django.db import models
+from django.db import models, transaction
+# 태그 수 증감/공유 태그 집계용 표현식 임포트
+from django.db.models import Count, F
 # Django의 내장 사용자 모델 임포트 (등록자 연결용)
 from django.contrib.auth.models import User
 # 최소 길이 검증기 임포트 (기술명 최소 길이 검증용)
@@ -21,6 +23,9 @@ from django.core.validators import MinLengthValidator
 # URL 리버스 기능 임포트 (상세 페이지 URL 생성용)
 from django.urls import reverse
 
+# 태그 문자열 파싱 함수 임포트 (마이그레이션과 공유)
+from .tagging import ensure_tags, normalize_tag, parse_tags
+
 
 class Technology(models.Model):
     """
@@ -38,7 +43,8 @@ class Technology(models.Model):
         author (ForeignKey): 등록자 (User 모델과 연결)
         official_document (URLField): 공식 문서 URL
         learning_resources (TextField): 학습 자료
-        tags (Char): 검색용 태그
+        tags (Char): 검색용 태그 (쉼표 구분 입력 원본)
+        tag_set (ManyToMany): 정규화된 태그 (저장 시 tags 에서 동기화)
         created_at (DateTime): 생성일 (자동 설정)
         updated_at (DateTime): 수정일 (자동 업데이트)
     """
@@ -136,6 +142,16 @@ class Technology(models.Model):
         verbose_name="태그",  # 관리자 사이트 등에서 표시될 필드명
         help_text="쉼표로 구분하여 태그를 입력하세요."  # 입력 도움말
     )
+
+    # 정규화 태그 필드 - tags 문자열에서 파생되는 태그 색인 (직접 편집하지 않음)
+    tag_set = models.ManyToManyField(
+        'Tag',
+        through='TechnologyTag',  # 태그별 기술 수 관리를 위해 중간 모델 사용
+        related_name='technologies',
+        blank=True,
+        editable=False,
+        verbose_name="정규화 태그"
+    )
     
     # 생성일 필드 - 기술 정보 최초 등록 시간 (자동 설정)
     created_at = models.DateTimeField(
@@ -192,17 +208,78 @@ class Technology(models.Model):
         """
         return reverse('technology_detail', kwargs={'pk': self.pk})
 
+    def save(self, *args, **kwargs):
+        """
+        저장 시 정규화 태그 동기화
+
+        tags 를 저장하지 않는 부분 저장(update_fields 에 tags 가 없음)은 동기화를 건너뜁니다.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'tags' not in update_fields:
+            super().save(*args, **kwargs)
+            return
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.sync_tags()
+
+    def sync_tags(self):
+        """
+        tags 문자열과 TechnologyTag 행을 맞추고 태그별 기술 수를 증감
+
+        바뀐 태그만 추가/삭제하고 technology_count 는 F() 식으로 증감하므로
+        태그 수 전체를 다시 세지 않습니다.
+        """
+        wanted = parse_tags(self.tags)
+        current = dict(
+            TechnologyTag.objects.filter(technology=self).values_list('tag__name', 'tag_id')
+        )
+        removed = [tag_id for name, tag_id in current.items() if name not in wanted]
+        added = {name: label for name, label in wanted.items() if name not in current}
+
+        if removed:
+            TechnologyTag.objects.filter(technology=self, tag_id__in=removed).delete()
+            Tag.objects.filter(pk__in=removed).update(technology_count=F('technology_count') - 1)
+        if added:
+            tag_ids = ensure_tags(Tag, added)
+            TechnologyTag.objects.bulk_create(
+                [TechnologyTag(technology=self, tag_id=tag_id) for tag_id in tag_ids.values()]
+            )
+            Tag.objects.filter(pk__in=tag_ids.values()).update(technology_count=F('technology_count') + 1)
+
+    def related_by_tags(self, limit=5):
+        """
+        태그를 공유하는 다른 기술 (공유 태그 수가 많은 순)
+
+        TechnologyTag 의 (tag, technology) 인덱스로 조인하며,
+        각 기술에 shared_tags (공유 태그 수) 가 annotate 됩니다.
+        """
+        tag_ids = TechnologyTag.objects.filter(technology_id=self.pk).values('tag_id')
+        return (
+            Technology.objects.filter(technology_tags__tag_id__in=tag_ids)
+            .exclude(pk=self.pk)
+            .annotate(shared_tags=Count('technology_tags'))
+            .order_by('-shared_tags', '-created_at', '-id')[:limit]
+        )
+
     @property
     def tag_list(self):
         """
         태그를 리스트로 반환하는 프로퍼티
         
-        쉼표로 구분된 태그 문자열을 리스트로 변환하여 반환합니다.
+        tag_set 을 prefetch_related 로 읽었으면 그 결과를 쓰고,
+        아니면 쉼표로 구분된 태그 문자열을 한 번만 파싱해 재사용합니다.
         
         Returns:
             list: 태그 문자열 리스트
         """
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()] if self.tags else []
+        prefetched = getattr(self, '_prefetched_objects_cache', {}).get('tag_set')
+        if prefetched is not None:
+            return [tag.label for tag in prefetched]
+        cached = self.__dict__.get('_tag_list_cache')
+        if cached is None or cached[0] != self.tags:
+            cached = (self.tags, list(parse_tags(self.tags).values()))
+            self._tag_list_cache = cached
+        return list(cached[1])
 
     @property
     def is_completed(self):
@@ -228,3 +305,66 @@ class Technology(models.Model):
         """
         levels = {'beginner': 1, 'intermediate': 2, 'advanced': 3, 'expert': 4}
         return levels.get(self.proficiency, 1)
+
+
+
+class Tag(models.Model):
+    """
+    정규화 태그 모델
+
+    name 은 대소문자/공백을 접은 정규화 이름(고유 인덱스), label 은 처음 입력된 표시 이름입니다.
+    technology_count 는 이 태그를 가진 기술 수로, 기술 저장/삭제 시 증감됩니다.
+    """
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="태그")
+    label = models.CharField(max_length=50, verbose_name="표시 이름")
+    technology_count = models.PositiveIntegerField(default=0, verbose_name="기술 수")
+
+    class Meta:
+        verbose_name = '태그'
+        verbose_name_plural = '태그들'
+        ordering = ['name']
+        indexes = [
+            # 태그 클라우드 (기술 수 많은 순) 인덱스
+            models.Index(fields=['-technology_count', 'name'], name='tag_count_name_idx'),
+        ]
+
+    def __str__(self):
+        return self.label
+
+    @classmethod
+    def cloud(cls, limit=30):
+        """태그 클라우드 (기술 수 많은 순, 기술이 없는 태그 제외)"""
+        return cls.objects.filter(technology_count__gt=0).order_by('-technology_count', 'name')[:limit]
+
+
+class TechnologyTag(models.Model):
+    """
+    기술-태그 중간 모델
+
+    (technology, tag) 고유 제약이 기술별 태그 조회 인덱스를,
+    (tag, technology) 인덱스가 태그별 기술 조회 인덱스를 겸합니다.
+    """
+
+    technology = models.ForeignKey(
+        Technology, on_delete=models.CASCADE, related_name='technology_tags', db_index=False
+    )
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='technology_tags', db_index=False)
+
+    class Meta:
+        verbose_name = '기술 태그'
+        verbose_name_plural = '기술 태그들'
+        constraints = [
+            models.UniqueConstraint(fields=['technology', 'tag'], name='technology_tag_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['tag', 'technology'], name='technology_tag_tag_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.technology_id} - {self.tag_id}"
+
+    @classmethod
+    def technology_ids(cls, tag):
+        """태그가 정확히 일치하는 기술 id 서브쿼리 (대소문자/공백 무시)"""
+        return cls.objects.filter(tag__name=normalize_tag(tag)).values('technology_id')
@@ -0,0 +1,32 @@
+"""
+기술 관리 앱 시그널
+
+기술이 저장/삭제되면 기술 네임스페이스 캐시 세대를 올려
+목록 조각 캐시를 한 번에 무효화합니다. 세대는 트랜잭션 커밋 후에 올리므로
+커밋 전에 다른 요청이 이전 목록을 새 세대로 캐시하지 않습니다.
+기술이 삭제되면 그 기술이 가진 태그의 기술 수를 하나씩 줄입니다.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from utils.cache import CacheGeneration
+
+from .models import Tag, Technology
+
+
+@receiver(post_save, sender=Technology)
+@receiver(post_delete, sender=Technology)
+def bump_technology_generation(sender, using=None, **kwargs):
+    """기술 목록 캐시 무효화 (커밋 후)"""
+    transaction.on_commit(lambda: CacheGeneration.bump('technology'), using=using)
+
+
+@receiver(pre_delete, sender=Technology)
+def decrement_tag_counts(sender, instance, **kwargs):
+    """삭제되는 기술의 태그 수 감소 (TechnologyTag 행은 CASCADE 로 삭제됨)"""
+    Tag.objects.filter(technology_tags__technology=instance).update(
+        technology_count=F('technology_count') - 1
+    )
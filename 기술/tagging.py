@@ -0,0 +1,113 @@
+# =============================================================================
+# 비즈니스 관리 시스템 기술 태그 정규화
+# =============================================================================
+# 설명: Technology.tags (쉼표 구분 문자열) 를 Tag / TechnologyTag 색인으로 옮기는 함수
+# 작성자: 비즈니스 관리 시스템 개발팀
+# 버전: 1.0.0
+# =============================================================================
+
+"""
+기술 태그 정규화 모듈
+
+Technology.tags 는 입력 원본(쉼표 구분 문자열)으로 그대로 두고,
+태그 필터/태그 클라우드/태그 공유 기술 조회는 정규화된 Tag, TechnologyTag 테이블의
+인덱스 조인으로 처리합니다.
+
+이 모듈의 함수는 모델 클래스를 인자로 받으므로 마이그레이션(과거 모델)과
+대량 생성 코드가 함께 사용할 수 있습니다.
+
+주요 기능:
+- 태그 문자열 정규화 및 파싱 (중복 제거, 대소문자/전각 문자 통일)
+- 태그 색인 전체 재구성 및 태그별 기술 수 재계산
+"""
+
+import unicodedata
+
+from django.db.models import Count
+
+# Tag.name / Tag.label 최대 길이
+MAX_TAG_LENGTH = 50
+
+
+def normalize_tag(value):
+    """NFKC 정규화, 대소문자 접기, 연속 공백을 하나로 줄인 태그 이름 (Tag.name)"""
+    return ' '.join(unicodedata.normalize('NFKC', value or '').casefold().split())[:MAX_TAG_LENGTH]
+
+
+def parse_tags(value):
+    """
+    쉼표 구분 태그 문자열 파싱
+
+    Returns:
+        dict: 정규화 이름 -> 화면 표시 이름 (입력 순서 유지, 같은 태그는 처음 것만)
+    """
+    tags = {}
+    for label in (value or '').split(','):
+        label = ' '.join(label.split())[:MAX_TAG_LENGTH]
+        name = normalize_tag(label)
+        if name and name not in tags:
+            tags[name] = label
+    return tags
+
+
+def ensure_tags(tag_model, labels):
+    """
+    태그 행 확보 (없는 태그만 생성)
+
+    Args:
+        tag_model: Tag 모델 클래스
+        labels (dict): 정규화 이름 -> 화면 표시 이름
+
+    Returns:
+        dict: 정규화 이름 -> Tag pk
+    """
+    if not labels:
+        return {}
+    ids = dict(tag_model.objects.filter(name__in=list(labels)).values_list('name', 'pk'))
+    missing = [tag_model(name=name, label=labels[name]) for name in labels if name not in ids]
+    if missing:
+        # 동시에 같은 태그가 생성될 수 있으므로 충돌은 무시하고 다시 읽음
+        tag_model.objects.bulk_create(missing, ignore_conflicts=True)
+        ids = dict(tag_model.objects.filter(name__in=list(labels)).values_list('name', 'pk'))
+    return ids
+
+
+def rebuild_tag_index(technology_model, tag_model, through_model, batch_size=2000):
+    """
+    태그 색인 전체 재구성
+
+    모든 기술의 tags 문자열을 다시 파싱해 TechnologyTag 를 새로 만들고
+    Tag.technology_count 를 집계 쿼리 한 번으로 다시 계산합니다.
+    (마이그레이션 백필, bulk_create 로 만든 기술 등 save() 를 거치지 않은 데이터용)
+
+    Returns:
+        int: 처리한 기술 수
+    """
+    wanted = {}
+    labels = {}
+    rows = technology_model.objects.order_by().values_list('pk', 'tags')
+    for pk, tags in rows.iterator(chunk_size=batch_size):
+        parsed = parse_tags(tags)
+        wanted[pk] = list(parsed)
+        for name, label in parsed.items():
+            labels.setdefault(name, label)
+
+    tag_ids = ensure_tags(tag_model, labels)
+    through_model.objects.all().delete()
+    through_model.objects.bulk_create(
+        [
+            through_model(technology_id=pk, tag_id=tag_ids[name])
+            for pk, names in wanted.items()
+            for name in names
+        ],
+        batch_size=batch_size,
+    )
+
+    counts = dict(
+        through_model.objects.order_by().values('tag_id').annotate(total=Count('pk')).values_list('tag_id', 'total')
+    )
+    tags = list(tag_model.objects.only('pk', 'technology_count'))
+    for tag in tags:
+        tag.technology_count = counts.get(tag.pk, 0)
+    tag_model.objects.bulk_update(tags, ['technology_count'], batch_size=batch_size)
+    return len(wanted)
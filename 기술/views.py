@@ -6,17 +6,26 @@
 # 버전: 1.0.0
 # =============================================================================
 
+# 표준 라이브러리 임포트
+from urllib.parse import urlencode
+# Django 캐시 임포트
+from django.core.cache import cache
 # Django 렌더링 함수 임포트
 from django.shortcuts import render
-# 현재 앱의 모델 임포트
-from .models import Technology
+from django.template.loader import render_to_string
+# 목록 엔진 임포트
+from utils.listing import ListError
+from .listing import TechnologyListEngine
+
+# 목록 조각 캐시 시간(초) - 기술이 바뀌면 세대 번호로 즉시 무효화되므로 길게 두어도 됨
+LIST_FRAGMENT_TIMEOUT = 600
 
 def index(request):
     """
     기술 관리 메인 페이지 뷰 함수
     
     기술 관리 메인 페이지를 렌더링합니다.
-    모든 기술 목록을 생성일 최신순으로 표시합니다.
+    검색 폼 필터를 적용한 기술 목록을 생성일 최신순으로 페이지 단위로 표시합니다.
     
     Args:
         request (HttpRequest): 클라이언트의 HTTP 요청 객체
@@ -25,34 +34,43 @@ def index(request):
         HttpResponse: 렌더링된 기술 관리 페이지 HTML 응답
         
     Description:
-        - 기술 관리 메인 페이지를 렌더링
-        - 모든 기술 목록을 데이터베이스에서 조회
-        - 생성일 기준 내림차순 정렬 (최신순)
-        - 기술 정보 템플릿에 데이터 전달
-        - 검색, 필터링, 정렬 기능 지원
-        - 기술 카테고리별 분류 표시
-        - 기술 난이도 및 상태 표시
-        
-    Database Query:
-        - Technology.objects.all(): 모든 기술 레코드 조회
-        - order_by('-created_at'): 생성일 내림차순 정렬
+        - TechnologySearchForm 필터 (검색어, 분류, 숙련도, 상태, 태그)
+        - 번호 페이지네이션 (?page=, ?per_page=)
+        - 등록자 select_related 로 N+1 쿼리 방지
+        - 목록 HTML 조각을 (기술 세대, 필터, 페이지) 키로 캐시하여
+          같은 조건의 반복 조회는 쿼리 없이 응답
         
     Template Context:
-        - technologies: 정렬된 기술 목록 객체
-        
-    Features:
-        - 기술 목록 표시
-        - 기술 검색 기능
-        - 카테고리별 필터링
-        - 기술 상태 관리
-        - 기술 상세 정보 표시
-        - 기술 관련 문서 링크
+        - form: 검색 폼
+        - technology_list: 렌더링된 목록 HTML 조각
+        - error: 필터 오류 메시지
         
     Template:
         - technology.html: 기술 관리 메인 템플릿
+        - technology_list.html: 목록 조각 템플릿
     """
-    # 모든 기술을 데이터베이스에서 조회하여 생성일 최신순으로 정렬
-    technologies = Technology.objects.all().order_by('-created_at')
+    engine = TechnologyListEngine(request.GET)
+    page_number = request.GET.get('page')
+    per_page = request.GET.get('per_page')
+    technology_list, error = '', None
+    
+    try:
+        key = engine.fragment_key(page_number, per_page)
+        technology_list = cache.get(key)
+        if technology_list is None:
+            page = engine.paginate(page_number, per_page)
+            # 조각은 사용자와 무관하게 공유되므로 request 없이 렌더링
+            technology_list = render_to_string('technology_list.html', {
+                'page': page,
+                'query': urlencode({**engine.filters, **({'per_page': per_page} if per_page else {})}),
+            })
+            cache.set(key, technology_list, LIST_FRAGMENT_TIMEOUT)
+    except ListError as e:
+        error = str(e)
     
-    # 기술 관리 템플릿에 기술 목록 데이터를 전달하여 렌더링
-    return render(request, 'technology.html', {'technologies': technologies})
+    # 기술 관리 템플릿에 검색 폼과 목록 조각을 전달하여 렌더링
+    return render(request, 'technology.html', {
+        'form': engine.form,
+        'technology_list': technology_list,
+        'error': error,
+    })